@@ -0,0 +1,122 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Throughput of AsyncWatsonxDataV2 against a local stub server.
+
+Starts an aiohttp stub that answers GET /presto_engines/{engine_id} after a
+fixed simulated latency, then issues `--calls` get_presto_engine() requests
+at each concurrency level and reports requests per second. With `--threads`
+the synchronous WatsonxDataV2 is measured with a thread pool of the same
+size for comparison.
+
+    python benchmarks/bench_async_throughput.py --latency-ms 20 --threads
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import asyncio
+import threading
+import time
+
+from aiohttp import web
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_watsonxdata import WatsonxDataV2
+from ibm_watsonxdata.async_watsonx_data_v2 import AsyncWatsonxDataV2
+
+CONCURRENCY_LEVELS = (1, 10, 100, 1000)
+ENGINE = {
+    'engine_id': 'presto1',
+    'display_name': 'sample',
+    'status': 'running',
+    'coordinator': {'node_type': 'bx2.4x16', 'quantity': 1},
+    'worker': {'node_type': 'bx2.4x16', 'quantity': 3},
+}
+
+
+def start_stub_server(latency: float) -> (str, threading.Event):
+    """Run the stub server on its own event loop thread; return its base URL and a stop event."""
+    ready = threading.Event()
+    stop = threading.Event()
+    address = {}
+
+    async def get_engine(request):
+        await asyncio.sleep(latency)
+        return web.json_response(dict(ENGINE, engine_id=request.match_info['engine_id']))
+
+    async def serve():
+        app = web.Application()
+        app.add_routes([web.get('/api/v2/presto_engines/{engine_id}', get_engine)])
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0, backlog=4096)
+        await site.start()
+        address['url'] = 'http://127.0.0.1:{0}/api/v2'.format(runner.addresses[0][1])
+        ready.set()
+        while not stop.is_set():
+            await asyncio.sleep(0.05)
+        await runner.cleanup()
+
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    ready.wait()
+    return address['url'], stop
+
+
+async def run_async(url: str, calls: int, concurrency: int) -> float:
+    async with AsyncWatsonxDataV2(authenticator=NoAuthAuthenticator(), connection_limit=concurrency) as service:
+        service.set_service_url(url)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(i):
+            async with semaphore:
+                await service.get_presto_engine('presto{0}'.format(i))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(calls)))
+        return time.perf_counter() - start
+
+
+def run_threads(url: str, calls: int, concurrency: int) -> float:
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(url)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda i: service.get_presto_engine('presto{0}'.format(i)), range(calls)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=2000, help='requests per concurrency level')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='simulated server latency')
+    parser.add_argument('--threads', action='store_true', help='also measure the synchronous client on a thread pool')
+    args = parser.parse_args()
+
+    url, stop = start_stub_server(args.latency_ms / 1000.0)
+    print('{0:>12} {1:>14} {2:>14}'.format('concurrency', 'async req/s', 'threads req/s'))
+    for concurrency in CONCURRENCY_LEVELS:
+        calls = max(args.calls, concurrency)
+        elapsed = asyncio.run(run_async(url, calls, concurrency))
+        threaded = '-'
+        if args.threads:
+            threaded = '{0:.0f}'.format(calls / run_threads(url, calls, concurrency))
+        print('{0:>12} {1:>14.0f} {2:>14}'.format(concurrency, calls / elapsed, threaded))
+    stop.set()
+
+
+if __name__ == '__main__':
+    main()
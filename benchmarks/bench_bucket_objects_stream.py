@@ -0,0 +1,104 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory and time of listing a huge bucket, decoded whole or streamed.
+
+A local HTTP server generates a synthetic `list_bucket_objects` response of
+`--objects` keys without materializing it. Each client runs in a fresh
+interpreter and walks every key, either through `list_bucket_objects()`
+(the whole collection is decoded into one dict) or `iter_bucket_objects()`
+(the response is parsed incrementally). The growth of the peak resident set
+size (RSS) shows the memory each approach needs.
+
+    python benchmarks/bench_bucket_objects_stream.py --objects 5000000
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+BATCH = 10000
+
+
+def serve(objects: int) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.end_headers()
+            # HTTP/1.0: the body ends when the connection is closed.
+            self.wfile.write(b'{"objects": [')
+            for start in range(0, objects, BATCH):
+                keys = (
+                    '"warehouse/sales/part-{0:09d}.parquet"'.format(i)
+                    for i in range(start, min(start + BATCH, objects))
+                )
+                self.wfile.write((',' if start else '').encode('ascii') + ','.join(keys).encode('ascii'))
+            self.wfile.write(b']}')
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_client(mode: str, url: str) -> None:
+    from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+    from ibm_watsonxdata import WatsonxDataV2
+
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(url)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == 'list':
+        keys = iter(service.list_bucket_objects('bucket1').get_result()['objects'])
+    else:
+        keys = service.iter_bucket_objects('bucket1')
+    count = sum(1 for _ in keys)
+    elapsed = time.perf_counter() - start
+    rss_growth = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before
+    print('{0:<22} {1:>10} {2:>10.2f} {3:>16.1f}'.format(mode + '_bucket_objects', count, elapsed, rss_growth / 1024.0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--objects', type=int, default=2000000, help='object keys in the response')
+    parser.add_argument('--client', choices=['list', 'iter'], help=argparse.SUPPRESS)
+    parser.add_argument('--url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.client:
+        run_client(args.client, args.url)
+        return
+
+    server = serve(args.objects)
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    print('{0:<22} {1:>10} {2:>10} {3:>16}'.format('method', 'objects', 'seconds', 'peak RSS MiB'))
+    for mode in ('list', 'iter'):
+        subprocess.run([sys.executable, __file__, '--client', mode, '--url', url], check=True)
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
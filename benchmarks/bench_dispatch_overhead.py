@@ -0,0 +1,207 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-call SDK overhead of WatsonxDataV2 operations, excluding the network.
+
+`send()` is replaced by a stub returning a canned DetailedResponse, so the
+measured time is argument validation, header/URL/body construction and
+`prepare_request()`. The "before" column runs the per-method request
+building that the generated code used prior to the operation table (kept
+below in GeneratedWatsonxDataV2); the "after" column runs the current
+table-driven dispatcher.
+
+    python benchmarks/bench_dispatch_overhead.py --calls 200000
+"""
+
+import argparse
+import json
+import timeit
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from ibm_cloud_sdk_core.utils import convert_model
+
+from ibm_watsonxdata import WatsonxDataV2
+from ibm_watsonxdata.common import get_sdk_headers
+
+CANNED_RESPONSE = DetailedResponse(response={}, headers={}, status_code=200)
+
+
+class GeneratedWatsonxDataV2(WatsonxDataV2):
+    """The request building of the generated per-method implementation."""
+
+    def list_catalogs(self, *, auth_instance_id=None, **kwargs):
+        headers = {
+            'AuthInstanceId': auth_instance_id,
+        }
+        sdk_headers = get_sdk_headers(
+            service_name=self.DEFAULT_SERVICE_NAME,
+            service_version='V2',
+            operation_id='list_catalogs',
+        )
+        headers.update(sdk_headers)
+
+        if 'headers' in kwargs:
+            headers.update(kwargs.get('headers'))
+            del kwargs['headers']
+        headers['Accept'] = 'application/json'
+
+        url = '/catalogs'
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+        )
+
+        response = self.send(request, **kwargs)
+        return response
+
+    def get_table(self, catalog_id, schema_id, table_id, engine_id, *, auth_instance_id=None, **kwargs):
+        if not catalog_id:
+            raise ValueError('catalog_id must be provided')
+        if not schema_id:
+            raise ValueError('schema_id must be provided')
+        if not table_id:
+            raise ValueError('table_id must be provided')
+        if not engine_id:
+            raise ValueError('engine_id must be provided')
+        headers = {
+            'AuthInstanceId': auth_instance_id,
+        }
+        sdk_headers = get_sdk_headers(
+            service_name=self.DEFAULT_SERVICE_NAME,
+            service_version='V2',
+            operation_id='get_table',
+        )
+        headers.update(sdk_headers)
+
+        params = {
+            'engine_id': engine_id,
+        }
+
+        if 'headers' in kwargs:
+            headers.update(kwargs.get('headers'))
+            del kwargs['headers']
+        headers['Accept'] = 'application/json'
+
+        path_param_keys = ['catalog_id', 'schema_id', 'table_id']
+        path_param_values = self.encode_path_vars(catalog_id, schema_id, table_id)
+        path_param_dict = dict(zip(path_param_keys, path_param_values))
+        url = '/catalogs/{catalog_id}/schemas/{schema_id}/tables/{table_id}'.format(**path_param_dict)
+        request = self.prepare_request(
+            method='GET',
+            url=url,
+            headers=headers,
+            params=params,
+        )
+
+        response = self.send(request, **kwargs)
+        return response
+
+    def create_columns(
+        self, engine_id, catalog_id, schema_id, table_id, *, columns=None, auth_instance_id=None, **kwargs
+    ):
+        if not engine_id:
+            raise ValueError('engine_id must be provided')
+        if not catalog_id:
+            raise ValueError('catalog_id must be provided')
+        if not schema_id:
+            raise ValueError('schema_id must be provided')
+        if not table_id:
+            raise ValueError('table_id must be provided')
+        if columns is not None:
+            columns = [convert_model(x) for x in columns]
+        headers = {
+            'AuthInstanceId': auth_instance_id,
+        }
+        sdk_headers = get_sdk_headers(
+            service_name=self.DEFAULT_SERVICE_NAME,
+            service_version='V2',
+            operation_id='create_columns',
+        )
+        headers.update(sdk_headers)
+
+        params = {
+            'engine_id': engine_id,
+        }
+
+        data = {
+            'columns': columns,
+        }
+        data = {k: v for (k, v) in data.items() if v is not None}
+        data = json.dumps(data)
+        headers['content-type'] = 'application/json'
+
+        if 'headers' in kwargs:
+            headers.update(kwargs.get('headers'))
+            del kwargs['headers']
+        headers['Accept'] = 'application/json'
+
+        path_param_keys = ['catalog_id', 'schema_id', 'table_id']
+        path_param_values = self.encode_path_vars(catalog_id, schema_id, table_id)
+        path_param_dict = dict(zip(path_param_keys, path_param_values))
+        url = '/catalogs/{catalog_id}/schemas/{schema_id}/tables/{table_id}/columns'.format(**path_param_dict)
+        request = self.prepare_request(
+            method='POST',
+            url=url,
+            headers=headers,
+            params=params,
+            data=data,
+        )
+
+        response = self.send(request, **kwargs)
+        return response
+
+
+def new_service(cls):
+    service = cls(authenticator=NoAuthAuthenticator())
+    service.send = lambda request, **kwargs: CANNED_RESPONSE
+    return service
+
+
+SCENARIOS = {
+    'list_catalogs': lambda service: service.list_catalogs(auth_instance_id='crn:v1'),
+    'get_table': lambda service: service.get_table('iceberg_data', 'sales', 'orders', 'presto01'),
+    'create_columns': lambda service: service.create_columns(
+        'presto01',
+        'iceberg_data',
+        'sales',
+        'orders',
+        columns=[{'column_name': 'c{0}'.format(i), 'type': 'varchar'} for i in range(5)],
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=100000, help='calls per scenario')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repetitions; the best is reported')
+    args = parser.parse_args()
+
+    before = new_service(GeneratedWatsonxDataV2)
+    after = new_service(WatsonxDataV2)
+    print('{0:<16} {1:>12} {2:>12} {3:>8}'.format('operation', 'before us', 'after us', 'speedup'))
+    for name, scenario in SCENARIOS.items():
+        results = []
+        for service in (before, after):
+            best = min(timeit.repeat(lambda: scenario(service), number=args.calls, repeat=args.repeat))
+            results.append(best / args.calls * 1e6)
+        print('{0:<16} {1:>12.2f} {2:>12.2f} {3:>7.2f}x'.format(name, results[0], results[1], results[0] / results[1]))
+
+
+if __name__ == '__main__':
+    main()
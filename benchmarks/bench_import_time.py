@@ -0,0 +1,87 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Import time of ibm_watsonxdata, measured with `python -X importtime`.
+
+Each run imports the package in a fresh interpreter and reads the cumulative
+import time of every `ibm_watsonxdata` module from the importtime report.
+The median over all runs is printed; the script exits with status 1 when the
+package's own import time (excluding third-party dependencies such as
+ibm_cloud_sdk_core) exceeds `--max-ms`, or when a model module was imported
+eagerly.
+
+    python benchmarks/bench_import_time.py --runs 20 --max-ms 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+PACKAGE = 'ibm_watsonxdata'
+
+
+def import_times(statement: str) -> dict:
+    """Return {module: (self_us, cumulative_us)} for one fresh-interpreter import."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stderr=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:') :].split('|')
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=15, help='number of fresh interpreters to sample')
+    parser.add_argument('--max-ms', type=float, default=5.0, help='regression threshold for the package itself')
+    parser.add_argument('--statement', default='import ' + PACKAGE, help='import statement to measure')
+    args = parser.parse_args()
+
+    totals, own, models = [], [], set()
+    for _ in range(args.runs):
+        times = import_times(args.statement)
+        totals.append(times[PACKAGE][1] / 1000.0)
+        own.append(sum(t[0] for name, t in times.items() if name.split('.')[0] == PACKAGE) / 1000.0)
+        models.update(name for name in times if name.startswith(PACKAGE + '.models.'))
+
+    own_ms = statistics.median(own)
+    print(
+        '{0}: {1:.1f} ms cumulative, {2:.1f} ms in {3} modules (median of {4} runs)'.format(
+            args.statement, statistics.median(totals), own_ms, PACKAGE, args.runs
+        )
+    )
+    failed = False
+    if own_ms > args.max_ms:
+        print('REGRESSION: {0:.1f} ms exceeds the {1:.1f} ms threshold'.format(own_ms, args.max_ms))
+        failed = True
+    if models and args.statement == 'import ' + PACKAGE:
+        print('REGRESSION: model modules imported eagerly: ' + ', '.join(sorted(models)))
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON encoding and decoding cost of WatsonxDataV2 per codec.
+
+* create_columns: a request with `--columns` Column models; `send()` is
+  replaced by a stub, so the time is model conversion, body encoding and
+  `prepare_request()`.
+* list_tables: a `--tables` element response served by a local HTTP server,
+  so the time includes the HTTP exchange and decoding of the body.
+
+Every installed codec (json, orjson, ujson) is measured.
+
+    python benchmarks/bench_json_codec.py --columns 20000 --tables 50000
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import threading
+import timeit
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_watsonxdata import WatsonxDataV2
+from ibm_watsonxdata.json_codec import CODEC_NAMES, get_json_codec
+
+CANNED_RESPONSE = DetailedResponse(response={}, headers={}, status_code=200)
+
+
+def tables_payload(tables: int) -> bytes:
+    return json.dumps(
+        {
+            'tables': [
+                {
+                    'table_name': 'table_{0}'.format(i),
+                    'columns': [
+                        {'column_name': 'id', 'type': 'bigint'},
+                        {'column_name': 'description', 'type': 'varchar', 'length': '255'},
+                    ],
+                }
+                for i in range(tables)
+            ]
+        }
+    ).encode('utf-8')
+
+
+def serve(body: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # pylint: disable=invalid-name
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def installed_codecs() -> list:
+    names = []
+    for name in CODEC_NAMES:
+        try:
+            get_json_codec(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--columns', type=int, default=20000, help='columns in the create_columns request')
+    parser.add_argument('--tables', type=int, default=50000, help='tables in the list_tables response')
+    parser.add_argument('--repeat', type=int, default=5, help='timing repetitions; the best is reported')
+    args = parser.parse_args()
+
+    from ibm_watsonxdata.watsonx_data_v2 import Column
+
+    columns = [
+        Column(column_name='column_{0}'.format(i), comment='generated column', length='30', type='varchar')
+        for i in range(args.columns)
+    ]
+    server = serve(tables_payload(args.tables))
+    url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+
+    print('{0:<8} {1:>20} {2:>20}'.format('codec', 'create_columns ms', 'list_tables ms'))
+    for name in installed_codecs():
+        encoder = WatsonxDataV2(authenticator=NoAuthAuthenticator(), json_codec=name)
+        encoder.send = lambda request, **kwargs: CANNED_RESPONSE
+        encode = min(
+            timeit.repeat(
+                lambda: encoder.create_columns('presto01', 'c', 's', 't', columns=columns), number=1, repeat=args.repeat
+            )
+        )
+
+        decoder = WatsonxDataV2(authenticator=NoAuthAuthenticator(), json_codec=name)
+        decoder.set_service_url(url)
+        assert len(decoder.list_tables('c', 's', 'presto01').get_result()['tables']) == args.tables
+        decode = min(timeit.repeat(lambda: decoder.list_tables('c', 's', 'presto01'), number=1, repeat=args.repeat))
+        print('{0:<8} {1:>20.1f} {2:>20.1f}'.format(name, encode * 1000.0, decode * 1000.0))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
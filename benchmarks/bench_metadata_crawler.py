@@ -0,0 +1,109 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wall-clock time of a full metadata inventory with MetadataCrawler.
+
+A local HTTP server serves `--catalogs` catalogs of `--schemas` schemas of
+`--tables` tables of 20 columns, delaying each response by `--latency-ms` to
+simulate the round trip to the service. The tree is crawled with each
+`--workers` value; one worker is the sequential walk of `list_catalogs`,
+`list_schemas`, `list_tables` and `list_columns`.
+
+    python benchmarks/bench_metadata_crawler.py --catalogs 2 --schemas 10 --tables 50 --latency-ms 30
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+import argparse
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_watsonxdata.crawler import MetadataCrawler
+from ibm_watsonxdata.watsonx_data_v2 import WatsonxDataV2
+
+
+def serve(catalogs: int, schemas: int, tables: int, latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            time.sleep(latency)
+            level = urlparse(self.path).path.rsplit('/', 1)[-1]
+            if level == 'catalogs':
+                result = {
+                    'catalogs': [
+                        {'catalog_name': 'catalog{0}'.format(i), 'associated_engines': ['presto01']}
+                        for i in range(catalogs)
+                    ]
+                }
+            elif level == 'schemas':
+                result = {'schemas': ['schema{0}'.format(i) for i in range(schemas)]}
+            elif level == 'tables':
+                result = {'tables': ['table{0}'.format(i) for i in range(tables)]}
+            else:
+                result = {'columns': [{'column_name': 'column{0}'.format(i), 'type': 'varchar'} for i in range(20)]}
+            body = json.dumps(result).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--catalogs', type=int, default=2, help='number of catalogs')
+    parser.add_argument('--schemas', type=int, default=10, help='schemas per catalog')
+    parser.add_argument('--tables', type=int, default=50, help='tables per schema')
+    parser.add_argument('--latency-ms', type=float, default=30.0, help='simulated round trip time per request')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 8, 32], help='max_workers values to measure')
+    args = parser.parse_args()
+
+    server = serve(args.catalogs, args.schemas, args.tables, args.latency_ms / 1000.0)
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+
+    print('{0:>12} {1:>10} {2:>10} {3:>10}'.format('max_workers', 'tables', 'seconds', 'speedup'))
+    baseline = None
+    for workers in args.workers:
+        limits = {'schemas': workers, 'tables': workers, 'columns': workers}
+        snapshot = MetadataCrawler(service, max_workers=workers, level_limits=limits).snapshot()
+        assert snapshot.complete
+        assert len(snapshot.table_details) == args.catalogs * args.schemas * args.tables
+        elapsed = snapshot.stats.elapsed
+        baseline = baseline or elapsed
+        print(
+            '{0:>12} {1:>10} {2:>10.2f} {3:>9.1f}x'.format(
+                workers, len(snapshot.table_details), elapsed, baseline / elapsed
+            )
+        )
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory used by deserialized response models.
+
+Builds a ColumnCollection and a SparkEngineApplicationStatusCollection JSON
+payload with `--items` elements each, then deserializes it with from_dict().
+Every collection is measured in a fresh interpreter and reports:
+
+* the tracemalloc peak while running from_dict(), and the memory still held
+  by the resulting model tree afterwards;
+* the growth of the process resident set size (RSS) caused by from_dict().
+
+    python benchmarks/bench_model_memory.py --items 100000
+"""
+
+import argparse
+import gc
+import subprocess
+import sys
+import tracemalloc
+
+
+def column_collection(items: int) -> dict:
+    return {
+        'columns': [
+            {
+                'column_name': 'column_{0}'.format(i),
+                'comment': 'generated column',
+                'extra': 'none',
+                'length': '30',
+                'scale': '2',
+                'type': 'varchar',
+            }
+            for i in range(items)
+        ]
+    }
+
+
+def spark_application_collection(items: int) -> dict:
+    return {
+        'applications': [
+            {
+                'application_details': {
+                    'application': '/opt/jobs/etl.py',
+                    'arguments': ['--day', '2024-06-01'],
+                    'conf': {'spark_app_name': 'etl'},
+                    'env': {'sample_env_key': 'value'},
+                    'name': 'etl-{0}'.format(i),
+                },
+                'application_id': 'app-{0}'.format(i),
+                'creation_time': 'Saturday 28 October 2023 07:17:06.856+0000',
+                'id': 'app-{0}'.format(i),
+                'runtime': {'spark_version': '3.3'},
+                'service_instance_id': 'instance',
+                'spark_application_id': 'spark-{0}'.format(i),
+                'start_time': 'Saturday 28 October 2023 07:17:08.000+0000',
+                'state': 'finished',
+                'state_details': [{'code': 'ok', 'message': 'done', 'type': 'info'}],
+                'submission_time': '2023-11-01T11:18:49.758Z',
+                'type': 'iae',
+                'volumes': [{'mount_path': '/mnt', 'name': 'data', 'read_only': True}],
+            }
+            for i in range(items)
+        ]
+    }
+
+
+CASES = {
+    'ColumnCollection': column_collection,
+    'SparkEngineApplicationStatusCollection': spark_application_collection,
+}
+
+
+def rss_kib() -> int:
+    """Current resident set size of this process, in KiB (Linux)."""
+    with open('/proc/self/statm') as statm:
+        pages = int(statm.read().split()[1])
+    return pages * 4
+
+
+def measure(case: str, items: int) -> None:
+    from ibm_watsonxdata import watsonx_data_v2
+
+    model_class = getattr(watsonx_data_v2, case)
+    payload = CASES[case](items)
+    gc.collect()
+
+    rss_before = rss_kib()
+    tracemalloc.start()
+    model = model_class.from_dict(payload)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    rss_after = rss_kib()
+    print(
+        '{0:<40} {1:>12.1f} {2:>14.1f} {3:>12.1f}'.format(
+            case, peak / 2**20, retained / 2**20, (rss_after - rss_before) / 1024.0
+        )
+    )
+    del model
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100000, help='elements per collection')
+    parser.add_argument('--case', choices=sorted(CASES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        measure(args.case, args.items)
+        return
+
+    print('{0:<40} {1:>12} {2:>14} {3:>12}'.format('collection', 'peak MiB', 'retained MiB', 'RSS MiB'))
+    for case in CASES:
+        subprocess.run([sys.executable, __file__, '--items', str(args.items), '--case', case], check=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wall-clock time of a full ingestion job inventory, serial versus parallel.
+
+A local HTTP server serves `--pages` pages of `--jobs-per-page` ingestion jobs
+through `list_ingestion_jobs`, delaying each response by `--latency-ms` to
+simulate the round trip to the service. `IngestionJobsPager.get_all()` walks
+the pages through their next links, and `get_all(max_workers=N)` fetches the
+numbered pages N at a time.
+
+    python benchmarks/bench_parallel_pages.py --pages 200 --latency-ms 50
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import argparse
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_watsonxdata.watsonx_data_v2 import IngestionJobsPager, WatsonxDataV2
+
+
+def serve(pages: int, jobs_per_page: int, latency: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            time.sleep(latency)
+            page = int(parse_qs(urlparse(self.path).query).get('start', ['1'])[0])
+            result = {
+                'ingestion_jobs': [
+                    {'job_id': 'ingestion-{0}-{1}'.format(page, i), 'status': 'completed'}
+                    for i in range(jobs_per_page if page <= pages else 0)
+                ]
+            }
+            if page < pages:
+                result['next'] = {'href': 'https://localhost/ingestion_jobs?start={0}'.format(page + 1)}
+            body = json.dumps(result).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', type=int, default=200, help='pages of ingestion jobs')
+    parser.add_argument('--jobs-per-page', type=int, default=100, help='ingestion jobs per page')
+    parser.add_argument('--latency-ms', type=float, default=50.0, help='simulated round trip time per request')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4, 8, 16], help='max_workers values to measure')
+    args = parser.parse_args()
+
+    server = serve(args.pages, args.jobs_per_page, args.latency_ms / 1000.0)
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+
+    print('{0:>12} {1:>10} {2:>10} {3:>10}'.format('max_workers', 'jobs', 'seconds', 'speedup'))
+    baseline = None
+    for workers in args.workers:
+        pager = IngestionJobsPager(client=service, auth_instance_id='crn:v1', jobs_per_page=args.jobs_per_page)
+        start = time.perf_counter()
+        jobs = pager.get_all(max_workers=workers)
+        elapsed = time.perf_counter() - start
+        assert len(jobs) == args.pages * args.jobs_per_page
+        baseline = baseline or elapsed
+        print('{0:>12} {1:>10} {2:>10.2f} {3:>9.1f}x'.format(workers, len(jobs), elapsed, baseline / elapsed))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
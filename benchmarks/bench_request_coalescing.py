@@ -0,0 +1,103 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Thundering herd of identical GETs, with and without request coalescing.
+
+`--threads` threads call `get_presto_engine()` for one of `--engines` engines,
+`--rounds` times each, against a local HTTP server that delays every response
+by `--latency-ms`. The number of requests that reached the server and the
+wall-clock time are reported for `coalesce_requests=False` and `True`.
+
+    python benchmarks/bench_request_coalescing.py --threads 200 --engines 4
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import itertools
+import json
+import threading
+import time
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+
+from ibm_watsonxdata import WatsonxDataV2
+
+
+def serve(latency: float, counter: itertools.count) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            next(counter)
+            time.sleep(latency)
+            body = json.dumps({'engine_id': self.path.rsplit('/', 1)[-1], 'status': 'running'}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=200, help='concurrent caller threads')
+    parser.add_argument('--engines', type=int, default=4, help='distinct engine ids the callers ask for')
+    parser.add_argument('--rounds', type=int, default=5, help='calls per thread')
+    parser.add_argument('--latency-ms', type=float, default=100.0, help='simulated server response time')
+    args = parser.parse_args()
+
+    print(
+        '{0:<20} {1:>10} {2:>16} {3:>12} {4:>10}'.format(
+            'coalesce_requests', 'calls', 'server requests', 'coalesced', 'seconds'
+        )
+    )
+    for coalesce in (False, True):
+        counter = itertools.count()
+        server = serve(args.latency_ms / 1000.0, counter)
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), coalesce_requests=coalesce)
+        service.set_service_url('http://127.0.0.1:{0}'.format(server.server_address[1]))
+        barrier = threading.Barrier(args.threads)
+
+        def caller(index):
+            for _ in range(args.rounds):
+                barrier.wait()
+                service.get_presto_engine('presto{0}'.format(index % args.engines))
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            list(executor.map(caller, range(args.threads)))
+        elapsed = time.perf_counter() - start
+        server.shutdown()
+        coalesced = service.request_coalescer.coalesced if coalesce else 0
+        print(
+            '{0:<20} {1:>10} {2:>16} {3:>12} {4:>10.2f}'.format(
+                str(coalesce), args.threads * args.rounds, next(counter), coalesced, elapsed
+            )
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,341 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+asyncio-native client for the IBM watsonx.data V2 API.
+
+`AsyncWatsonxDataV2` exposes every operation of `WatsonxDataV2` with the same
+signature. Instead of blocking on the request, each operation returns an
+awaitable that resolves to the same `DetailedResponse` the synchronous client
+produces, so hundreds of calls can be in flight on one event loop while
+sharing a single pooled HTTP session per event loop.
+
+    async with AsyncWatsonxDataV2(authenticator=authenticator) as service:
+        responses = await asyncio.gather(
+            *(service.get_presto_engine(engine_id) for engine_id in engine_ids)
+        )
+
+This module requires the optional `aiohttp` package
+(`pip install ibm-watsonxdata[async]`).
+"""
+
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Optional, Union
+import asyncio
+import weakref
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.utils import is_json_mimetype
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import MaxRetryError
+from urllib3.util.retry import Retry
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+from .json_codec import JsonCodec
+from .json_stream import JsonArrayParser
+from .watsonx_data_v2 import WatsonxDataV2
+
+#: The authentication types whose authenticators never send requests.
+_LOCAL_AUTHENTICATION_TYPES = frozenset(
+    [Authenticator.AUTHTYPE_NOAUTH, Authenticator.AUTHTYPE_BASIC, Authenticator.AUTHTYPE_BEARERTOKEN]
+)
+
+##############################################################################
+# Service
+##############################################################################
+
+
+class AsyncWatsonxDataV2(WatsonxDataV2):
+    """
+    The watsonx.data V2 service, with asyncio-native operations.
+
+    All operations share the signatures of `WatsonxDataV2`. Argument validation
+    happens when the operation is called, and the returned awaitable performs
+    the HTTP exchange. Requests are sent through one `aiohttp.ClientSession`
+    per client and event loop, created on first use in that loop and released
+    by `close()`, awaited in that loop.
+
+    The configuration of `BaseService` applies as with the synchronous client:
+    `enable_retries()` retries the connection errors, timeouts and the status
+    codes of its retry policy, waiting as the policy says or as the
+    `Retry-After` header asks, and `set_enable_gzip_compression(True)`
+    compresses the request bodies.
+    """
+
+    def __init__(
+        self,
+        authenticator: Authenticator = None,
+        *,
+        connection_limit: int = 100,
+        connection_limit_per_host: int = 0,
+        typed_results: bool = False,
+        json_codec: Union[str, JsonCodec, None] = None,
+    ) -> None:
+        """
+        Construct a new asyncio client for the watsonx.data service.
+
+        :param Authenticator authenticator: The authenticator specifies the authentication mechanism.
+               Get up to date information from https://github.com/IBM/python-sdk-core/blob/main/README.md
+               about initializing the authenticator of your choice.
+        :param int connection_limit: (optional) Maximum number of simultaneously
+               open connections in the shared pool; 0 means unlimited.
+        :param int connection_limit_per_host: (optional) Maximum number of
+               simultaneously open connections to one endpoint; 0 means unlimited.
+        :param bool typed_results: (optional) Resolve results to lazily
+               deserialized models, as with `WatsonxDataV2`.
+        :param str json_codec: (optional) The JSON codec used for request bodies
+               and responses, as with `WatsonxDataV2`.
+        """
+        if aiohttp is None:
+            raise ImportError('AsyncWatsonxDataV2 requires the aiohttp package: pip install ibm-watsonxdata[async]')
+        WatsonxDataV2.__init__(self, authenticator=authenticator, typed_results=typed_results, json_codec=json_codec)
+        self.connection_limit = connection_limit
+        self.connection_limit_per_host = connection_limit_per_host
+        self._sessions = weakref.WeakKeyDictionary()
+
+    async def __aenter__(self) -> 'AsyncWatsonxDataV2':
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session of the running event loop and release its
+        pooled connections.
+        """
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Return the session of the running event loop, created if needed."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                limit_per_host=self.connection_limit_per_host,
+                ssl=False if self.disable_ssl_verification else None,
+            )
+            session = self._sessions[loop] = aiohttp.ClientSession(connector=connector)
+        return session
+
+    def iter_bucket_objects(
+        self,
+        bucket_id: str,
+        *,
+        auth_instance_id: Optional[str] = None,
+        chunk_size: int = 65536,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        Iterate over bucket objects.
+
+        The asynchronous counterpart of `WatsonxDataV2.iter_bucket_objects()`:
+
+            async for key in service.iter_bucket_objects(bucket_id):
+                ...
+
+        :param str bucket_id: bucket id.
+        :param str auth_instance_id: (optional) CRN.
+        :param int chunk_size: (optional) Number of bytes read from the
+               response at a time.
+        :param dict headers: A `dict` containing the request headers
+        :return: An asynchronous iterator over the bucket objects.
+        :rtype: AsyncIterator[str]
+        """
+        response = self.list_bucket_objects(bucket_id, auth_instance_id=auth_instance_id, stream=True, **kwargs)
+        return _aiter_array_items(response, 'objects', chunk_size)
+
+    def prepare_request(self, method: str, url: str, **kwargs) -> Callable[[], dict]:
+        """
+        Return a function building a request, which `send()` calls.
+
+        Building a request authenticates it, and token-based authenticators
+        such as IAM fetch their tokens with blocking requests: `send()` builds
+        it in the default executor of the event loop instead.
+
+        :param str method: The HTTP method of the request.
+        :param str url: The path of the request, relative to the service URL.
+        :param kwargs: The other arguments of `BaseService.prepare_request()`.
+        :return: A function returning the request dict.
+        """
+        return partial(WatsonxDataV2.prepare_request, self, method, url, **kwargs)
+
+    def send(self, request: Union[dict, Callable[[], dict]], **kwargs) -> Awaitable[DetailedResponse]:
+        """
+        Send a prepared request on the shared session.
+
+        :param request: The request built by `prepare_request()`, or the
+               function returned by it.
+        :return: An awaitable resolving to a `DetailedResponse`; it raises
+                 `ApiException` for error status codes, exactly like
+                 `BaseService.send`.
+        """
+        return self._send(request, **kwargs)
+
+    def _process_response(self, operation, response: Awaitable[DetailedResponse]) -> Awaitable[DetailedResponse]:
+        return self._process_awaited_response(operation, response)
+
+    async def _process_awaited_response(self, operation, response: Awaitable[DetailedResponse]) -> DetailedResponse:
+        return WatsonxDataV2._process_response(self, operation, await response)
+
+    async def _send(self, request: Union[dict, Callable[[], dict]], **kwargs) -> DetailedResponse:
+        if callable(request):
+            if self.authenticator.authentication_type() in _LOCAL_AUTHENTICATION_TYPES:
+                request = request()
+            else:
+                request = await asyncio.get_running_loop().run_in_executor(None, request)
+        kwargs = dict({'timeout': 60}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+        kwargs.pop('headers', None)
+        stream_response = kwargs.get('stream') or False
+
+        method = request['method']
+        params = request.get('params')
+        if params:
+            params = {k: str(v) for (k, v) in params.items()}
+        request_options = {
+            'headers': dict(request['headers']),
+            'params': params,
+            'data': request.get('data'),
+            'timeout': _client_timeout(kwargs.get('timeout')),
+        }
+        if kwargs.get('verify') is False:
+            request_options['ssl'] = False
+        if kwargs.get('proxies'):
+            request_options['proxy'] = kwargs['proxies'].get('https') or kwargs['proxies'].get('http')
+
+        response = await self._request(method, request['url'], request_options)
+        if stream_response and 200 <= response.status <= 299:
+            # The caller owns the response and must release it once the body is consumed.
+            return DetailedResponse(
+                response=response, headers=CaseInsensitiveDict(response.headers), status_code=response.status
+            )
+        try:
+            body = await response.read()
+        finally:
+            response.release()
+        headers = CaseInsensitiveDict(response.headers)
+        status_code = response.status
+
+        if 200 <= status_code <= 299:
+            if status_code == 204 or method == 'HEAD' or not body:
+                result = None
+            elif is_json_mimetype(headers.get('Content-Type')):
+                try:
+                    result = self.json_codec.loads(body)
+                except ValueError as err:
+                    raise ApiException(
+                        code=status_code,
+                        http_response=_as_requests_response(response, headers, body),
+                        message='Error processing the HTTP response',
+                    ) from err
+            else:
+                result = _as_requests_response(response, headers, body)
+            return DetailedResponse(response=result, headers=headers, status_code=status_code)
+
+        raise ApiException(status_code, http_response=_as_requests_response(response, headers, body))
+
+    async def _request(self, method: str, url: str, request_options: dict) -> 'aiohttp.ClientResponse':
+        """Send a request, retrying as `enable_retries()` configured; return the last response."""
+        retry = self.retry_config
+        while True:
+            try:
+                response = await self._get_session().request(method, url, **request_options)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                # Like urllib3, retry the requests that never connected, and the others if their method allows it.
+                if retry is None or not (_never_connected(error) or _method_retryable(retry, method)):
+                    raise
+                retry = _increment(retry, method, url)
+                if retry is None:
+                    raise
+                delay = retry.get_backoff_time()
+            else:
+                retry_after = response.headers.get('Retry-After')
+                if retry is None or not retry.is_retry(method, response.status, retry_after is not None):
+                    return response
+                retry = _increment(retry, method, url)
+                if retry is None:
+                    return response
+                response.release()
+                if retry_after is not None and retry.respect_retry_after_header:
+                    delay = retry.parse_retry_after(retry_after)
+                else:
+                    delay = retry.get_backoff_time()
+            await asyncio.sleep(delay)
+
+
+async def _aiter_array_items(response: Awaitable[DetailedResponse], key: str, chunk_size: int) -> AsyncIterator:
+    """Yield the items of the `key` array of a streamed JSON response, then release it."""
+    http_response = (await response).get_result()
+    parser = JsonArrayParser(key)
+    try:
+        async for chunk in http_response.content.iter_chunked(chunk_size):
+            for item in parser.feed(chunk):
+                yield item
+        for item in parser.close():
+            yield item
+    finally:
+        http_response.release()
+
+
+def _never_connected(error: Exception) -> bool:
+    """Return whether a request failed before its connection was made."""
+    return isinstance(error, aiohttp.ClientConnectorError)
+
+
+def _method_retryable(retry: Retry, method: str) -> bool:
+    """Return whether the retry policy retries the requests of a method after they were sent."""
+    return retry.allowed_methods is None or method.upper() in retry.allowed_methods
+
+
+def _increment(retry: Retry, method: str, url: str) -> Optional[Retry]:
+    """Return the retry policy for the next attempt, or None when the retries are exhausted."""
+    try:
+        return retry.increment(method, url)
+    except MaxRetryError:
+        return None
+
+
+def _client_timeout(timeout: Optional[object]) -> 'aiohttp.ClientTimeout':
+    """Translate a `requests` style timeout into an `aiohttp.ClientTimeout`."""
+    if isinstance(timeout, (tuple, list)):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    return aiohttp.ClientTimeout(total=timeout)
+
+
+def _as_requests_response(response: 'aiohttp.ClientResponse', headers: CaseInsensitiveDict, body: bytes):
+    """
+    Wrap a completed aiohttp response in a `requests.Response`, so `ApiException`
+    and non-JSON results look the same as they do for the synchronous client.
+    """
+    http_response = requests.Response()
+    http_response.status_code = response.status
+    http_response.headers = headers
+    http_response.url = str(response.url)
+    http_response.reason = response.reason
+    http_response.encoding = response.charset
+    http_response._content = body  # pylint: disable=protected-access
+    return http_response
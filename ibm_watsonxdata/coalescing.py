@@ -0,0 +1,111 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Single-flight coalescing of identical concurrent requests.
+
+With `WatsonxDataV2(coalesce_requests=True)`, a GET that is identical to one
+already in flight on another thread (same operation, path parameters, query
+parameters and AuthInstanceId) does not reach the service: the caller waits
+for the request in flight and receives its response, or its exception.
+"""
+
+from typing import Callable, Dict, Hashable
+import threading
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+
+class _Flight:
+    """A request in flight and the outcome its waiters share."""
+
+    __slots__ = ('done', 'response', 'error')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class RequestCoalescer:
+    """
+    Shares the outcome of a request between the threads that make it
+    concurrently.
+
+    Responses are shared between callers and must not be modified.
+
+    :attr int requests: Number of requests sent on behalf of callers.
+    :attr int coalesced: Number of calls answered by a request that was
+          already in flight.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize a RequestCoalescer object.
+        """
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the coalescer.
+
+        :return: The requests and coalesced counters and the number of requests
+                 currently in flight.
+        :rtype: dict
+        """
+        with self._lock:
+            return {'requests': self.requests, 'coalesced': self.coalesced, 'in_flight': len(self._flights)}
+
+    def call(self, key: Hashable, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Return the response of send(), or of the call with the same key that is
+        already in flight.
+
+        :param key: The identity of the request.
+        :param send: Function sending the request to the service.
+        :return: The response.
+        :rtype: DetailedResponse
+        :raises Exception: The exception raised by send().
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.requests += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            flight.response = send()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.response
@@ -0,0 +1,378 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parallel crawler of the lakehouse metadata tree.
+
+`MetadataCrawler` walks catalogs, schemas, tables and columns (and optionally
+table snapshots) with a bounded pool of worker threads:
+
+    crawler = MetadataCrawler(service, engine_id='presto01', max_workers=32)
+    for event in crawler.crawl():
+        ...  # a CrawlEvent, as soon as its request completes
+    snapshot = crawler.snapshot()  # or crawl everything into a LakehouseSnapshot
+
+Every level of the tree has its own concurrency limit, so a catalog with many
+schemas cannot starve the column requests of the tables already found, and
+the deepest pending requests are sent first to keep the queues short.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import time
+
+from .models.catalogs import Catalog, Column, Table, TableSnapshot
+from .watsonx_data_v2 import WatsonxDataV2, result_field
+
+#: The levels of the metadata tree, from the root down.
+LEVELS = ('catalogs', 'schemas', 'tables', 'columns', 'snapshots')
+
+#: The default maximum number of concurrent requests of each level.
+DEFAULT_LEVEL_LIMITS = {'catalogs': 1, 'schemas': 4, 'tables': 8, 'columns': 16, 'snapshots': 8}
+
+# The kind of the events produced by the requests of each level.
+_EVENT_KINDS = {
+    'catalogs': 'catalog',
+    'schemas': 'schemas',
+    'tables': 'tables',
+    'columns': 'table',
+    'snapshots': 'snapshots',
+}
+
+
+class CrawlEvent:
+    """
+    One result of a crawl.
+
+    :attr str kind: 'catalog' (value is a `Catalog`), 'schemas' (the schema
+          names of a catalog), 'tables' (the table names of a schema), 'table'
+          (a `Table` with its columns) or 'snapshots' (the `TableSnapshot`s of
+          a table).
+    :attr tuple path: The names leading to the value: (catalog,) for 'catalog'
+          and 'schemas', (catalog, schema) for 'tables', and (catalog, schema,
+          table) for 'table' and 'snapshots'. Failed 'catalog' events have the
+          empty path.
+    :attr value: The value, or None if the request failed.
+    :attr Exception error: The exception of the failed request, or None.
+    """
+
+    __slots__ = ('kind', 'path', 'value', 'error')
+
+    def __init__(self, kind: str, path: Tuple[str, ...], value: object = None, error: Exception = None) -> None:
+        self.kind = kind
+        self.path = path
+        self.value = value
+        self.error = error
+
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return 'CrawlEvent({0!r}, {1!r}, error={2!r})'.format(self.kind, self.path, self.error)
+        return 'CrawlEvent({0!r}, {1!r})'.format(self.kind, self.path)
+
+
+class CrawlStats:
+    """
+    Progress and timing of a crawl.
+
+    :attr dict requests: Completed requests, per level.
+    :attr dict errors: Failed requests, per level.
+    :attr dict request_seconds: Total duration of the requests, per level.
+    :attr dict max_request_seconds: Duration of the slowest request, per level.
+    :attr int queued: Requests waiting for a worker.
+    :attr int in_flight: Requests being sent.
+    """
+
+    def __init__(self) -> None:
+        self.requests = dict.fromkeys(LEVELS, 0)
+        self.errors = dict.fromkeys(LEVELS, 0)
+        self.request_seconds = dict.fromkeys(LEVELS, 0.0)
+        self.max_request_seconds = dict.fromkeys(LEVELS, 0.0)
+        self.queued = 0
+        self.in_flight = 0
+        self._started = time.perf_counter()
+        self._finished = None
+
+    @property
+    def elapsed(self) -> float:
+        """Wall-clock seconds since the crawl started, until it finished."""
+        return (self._finished or time.perf_counter()) - self._started
+
+    def to_dict(self) -> Dict:
+        """Return the statistics as a dict."""
+        return {
+            'requests': dict(self.requests),
+            'errors': dict(self.errors),
+            'request_seconds': dict(self.request_seconds),
+            'max_request_seconds': dict(self.max_request_seconds),
+            'queued': self.queued,
+            'in_flight': self.in_flight,
+            'elapsed': self.elapsed,
+        }
+
+
+class LakehouseSnapshot:
+    """
+    The metadata tree collected by a crawl.
+
+    :attr dict catalogs: `Catalog` models, by catalog name.
+    :attr dict schemas: Schema names, by catalog name.
+    :attr dict tables: Table names, by (catalog, schema).
+    :attr dict table_details: `Table` models with their columns, by (catalog,
+          schema, table).
+    :attr dict snapshots: `TableSnapshot` lists, by (catalog, schema, table).
+    :attr list errors: The failed `CrawlEvent`s; the subtrees below them are
+          missing from the snapshot.
+    :attr CrawlStats stats: The statistics of the crawl.
+    """
+
+    def __init__(self) -> None:
+        self.catalogs = {}
+        self.schemas = {}
+        self.tables = {}
+        self.table_details = {}
+        self.snapshots = {}
+        self.errors = []
+        self.stats = None
+
+    @property
+    def complete(self) -> bool:
+        """True if no request of the crawl failed."""
+        return not self.errors
+
+    def add(self, event: CrawlEvent) -> None:
+        """
+        Record a crawl event.
+
+        :param CrawlEvent event: The event.
+        """
+        if event.error is not None:
+            self.errors.append(event)
+        elif event.kind == 'catalog':
+            self.catalogs[event.path[0]] = event.value
+        elif event.kind == 'schemas':
+            self.schemas[event.path[0]] = event.value
+        elif event.kind == 'tables':
+            self.tables[event.path] = event.value
+        elif event.kind == 'table':
+            self.table_details[event.path] = event.value
+        elif event.kind == 'snapshots':
+            self.snapshots[event.path] = event.value
+
+
+class MetadataCrawler:
+    """
+    Walks catalogs → schemas → tables → columns (and snapshots) concurrently.
+
+    Schemas, tables and columns are listed through an engine: `engine_id`
+    when given, otherwise the first associated engine of each catalog.
+    Failed requests are reported as events with an `error` and do not stop
+    the crawl.
+
+    :attr CrawlStats stats: The statistics of the current or last crawl.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        *,
+        engine_id: Optional[str] = None,
+        auth_instance_id: Optional[str] = None,
+        catalog_names: Optional[Iterable[str]] = None,
+        include_snapshots: bool = False,
+        max_workers: int = 16,
+        level_limits: Optional[Dict[str, int]] = None,
+        progress: Optional[Callable[[CrawlStats], None]] = None,
+        descend: Optional[Callable[[CrawlEvent], bool]] = None,
+    ) -> None:
+        """
+        Initialize a MetadataCrawler object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str engine_id: (optional) The engine used to list schemas,
+               tables and columns.
+        :param str auth_instance_id: (optional) CRN.
+        :param catalog_names: (optional) Only crawl these catalogs.
+        :param bool include_snapshots: (optional) Also list the snapshots of
+               every table.
+        :param int max_workers: (optional) Maximum number of concurrent requests.
+        :param dict level_limits: (optional) Maximum number of concurrent
+               requests per level, overriding `DEFAULT_LEVEL_LIMITS`.
+        :param progress: (optional) Function called with the `CrawlStats`
+               after every completed request.
+        :param descend: (optional) Function called with each 'catalog',
+               'schemas' and 'tables' event before the requests of its
+               children are queued; returning False skips its subtree.
+        """
+        level_limits = dict(DEFAULT_LEVEL_LIMITS, **(level_limits or {}))
+        if set(level_limits) != set(LEVELS):
+            raise ValueError('level_limits keys must be in ' + ', '.join(LEVELS))
+        if max_workers < 1 or min(level_limits.values()) < 1:
+            raise ValueError('max_workers and level_limits must be at least 1')
+        self.client = client
+        self.engine_id = engine_id
+        self.auth_instance_id = auth_instance_id
+        self.catalog_names = None if catalog_names is None else frozenset(catalog_names)
+        self.include_snapshots = include_snapshots
+        self.max_workers = max_workers
+        self.level_limits = level_limits
+        self.progress = progress
+        self.descend = descend
+        self.stats = CrawlStats()
+
+    def snapshot(self) -> LakehouseSnapshot:
+        """
+        Crawl the whole tree.
+
+        :return: The collected metadata.
+        :rtype: LakehouseSnapshot
+        """
+        snapshot = LakehouseSnapshot()
+        for event in self.crawl():
+            snapshot.add(event)
+        snapshot.stats = self.stats
+        return snapshot
+
+    def crawl(self) -> Iterator[CrawlEvent]:
+        """
+        Crawl the tree, yielding each result as soon as its request completes.
+
+        Closing the generator cancels the requests that have not started.
+
+        :return: A generator of `CrawlEvent`s.
+        :rtype: Iterator[CrawlEvent]
+        """
+        stats = self.stats = CrawlStats()
+        queues = {level: deque() for level in LEVELS}
+        running = dict.fromkeys(LEVELS, 0)
+        in_flight = {}
+        queues['catalogs'].append(((), None))
+        stats.queued = 1
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='watsonxdata-crawler')
+        try:
+            while True:
+                # Deepest levels first, so that finished subtrees are reported early.
+                for level in reversed(LEVELS):
+                    queue = queues[level]
+                    while queue and running[level] < self.level_limits[level] and len(in_flight) < self.max_workers:
+                        path, engine_id = queue.popleft()
+                        future = executor.submit(self._request, level, path, engine_id)
+                        in_flight[future] = (level, path, engine_id)
+                        running[level] += 1
+                stats.queued = sum(len(queue) for queue in queues.values())
+                stats.in_flight = len(in_flight)
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    level, path, engine_id = in_flight.pop(future)
+                    running[level] -= 1
+                    result, seconds, error = future.result()
+                    stats.requests[level] += 1
+                    stats.request_seconds[level] += seconds
+                    stats.max_request_seconds[level] = max(stats.max_request_seconds[level], seconds)
+                    stats.in_flight = len(in_flight)
+                    if error is not None:
+                        stats.errors[level] += 1
+                        events = [CrawlEvent(_EVENT_KINDS[level], path, error=error)]
+                    else:
+                        events = self._expand(level, path, engine_id, result, queues)
+                    if self.progress is not None:
+                        self.progress(stats)
+                    yield from events
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+            stats._finished = time.perf_counter()  # pylint: disable=protected-access
+
+    def _request(self, level: str, path: Tuple[str, ...], engine_id: Optional[str]) -> Tuple:
+        """Send the request of one tree node; runs in a worker thread and never raises."""
+        client = self.client
+        auth_instance_id = self.auth_instance_id
+        started = time.perf_counter()
+        try:
+            if level == 'catalogs':
+                response = client.list_catalogs(auth_instance_id=auth_instance_id)
+            elif level == 'schemas':
+                response = client.list_schemas(engine_id, path[0], auth_instance_id=auth_instance_id)
+            elif level == 'tables':
+                response = client.list_tables(path[0], path[1], engine_id, auth_instance_id=auth_instance_id)
+            elif level == 'columns':
+                response = client.list_columns(engine_id, *path, auth_instance_id=auth_instance_id)
+            else:
+                response = client.list_table_snapshots(engine_id, *path, auth_instance_id=auth_instance_id)
+        except Exception as error:  # pylint: disable=broad-except
+            return None, time.perf_counter() - started, error
+        return response.get_result(), time.perf_counter() - started, None
+
+    def _expand(
+        self,
+        level: str,
+        path: Tuple[str, ...],
+        engine_id: Optional[str],
+        result: object,
+        queues: Dict[str, deque],
+    ) -> List[CrawlEvent]:
+        """Turn the result of a request into events, and queue the requests of its children."""
+        events = []
+        if level == 'catalogs':
+            for item in result_field(result, 'catalogs') or []:
+                catalog = _model(Catalog, item)
+                name = catalog.catalog_name
+                if self.catalog_names is not None and name not in self.catalog_names:
+                    continue
+                event = CrawlEvent('catalog', (name,), catalog)
+                events.append(event)
+                if not self._descends(event):
+                    continue
+                catalog_engine_id = self.engine_id or next(iter(catalog.associated_engines or ()), None)
+                if catalog_engine_id is None:
+                    events.append(CrawlEvent('schemas', (name,), error=ValueError('no engine to list ' + name)))
+                else:
+                    queues['schemas'].append(((name,), catalog_engine_id))
+        elif level == 'schemas':
+            schemas = list(result_field(result, 'schemas') or [])
+            event = CrawlEvent('schemas', path, schemas)
+            events.append(event)
+            if self._descends(event):
+                queues['tables'].extend(((path[0], schema), engine_id) for schema in schemas)
+        elif level == 'tables':
+            tables = list(result_field(result, 'tables') or [])
+            event = CrawlEvent('tables', path, tables)
+            events.append(event)
+            for table in tables if self._descends(event) else ():
+                queues['columns'].append((path + (table,), engine_id))
+                if self.include_snapshots:
+                    queues['snapshots'].append((path + (table,), engine_id))
+        elif level == 'columns':
+            columns = [_model(Column, column) for column in result_field(result, 'columns') or []]
+            events.append(CrawlEvent('table', path, Table(table_name=path[2], columns=columns)))
+        else:
+            snapshots = [_model(TableSnapshot, snapshot) for snapshot in result_field(result, 'snapshots') or []]
+            events.append(CrawlEvent('snapshots', path, snapshots))
+        return events
+
+    def _descends(self, event: CrawlEvent) -> bool:
+        return self.descend is None or self.descend(event)
+
+
+def _model(model_class: type, value: object) -> object:
+    """Return value as an instance of model_class."""
+    if isinstance(value, model_class):
+        return value
+    return model_class.from_dict(value)
@@ -0,0 +1,154 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Waiting for engines to reach a state.
+
+After `pause_presto_engine`, `resume_prestissimo_engine`,
+`create_spark_engine_resume`, `scale_presto_engine` and the like, the engine
+changes state asynchronously. `EngineWaiter` waits for any number of engines,
+of any types, from a single scheduler thread that sends one `list_*_engines`
+request per engine type and poll, instead of one `get_*_engine` request per
+engine:
+
+    futures = wait_for_engines(service, [('presto', 'presto01', 'running'), ('spark', 'spark02', 'paused')], 900)
+    for future in futures.values():
+        engine = future.result()
+
+The polls of each engine type back off while none of its engines changes
+status, see `StatusPoller`.
+"""
+
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from .polling import StatusPoller, _Target
+from .watsonx_data_v2 import WatsonxDataV2, result_field
+
+#: The list operation, the field of its result listing the engines and the id
+#: field of each engine, by engine type.
+ENGINE_TYPES = {
+    'db2': ('list_db2_engines', 'db2_engines', 'engine_id'),
+    'milvus': ('list_milvus_services', 'milvus_services', 'service_id'),
+    'netezza': ('list_netezza_engines', 'netezza_engines', 'engine_id'),
+    'other': ('list_other_engines', 'other_engines', 'engine_id'),
+    'prestissimo': ('list_prestissimo_engines', 'prestissimo_engines', 'engine_id'),
+    'presto': ('list_presto_engines', 'presto_engines', 'engine_id'),
+    'spark': ('list_spark_engines', 'spark_engines', 'engine_id'),
+}
+
+#: The default statuses that end a wait with an error.
+DEFAULT_FAILURE_STATES = frozenset(['failed'])
+
+
+class EngineWaiter(StatusPoller):
+    """
+    Waits for engines to reach a status, polling each engine type with one
+    list request.
+
+    The futures returned by `wait()` are resolved with the engine, as found in
+    the engine list (a `dict`, or a model with typed results). A future fails
+    with `TimeoutError` when its timeout elapses, and with `RuntimeError` when
+    the engine reaches one of the failure states. Errors of the list requests
+    are retried at the next poll.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        *,
+        auth_instance_id: Optional[str] = None,
+        failure_states: Iterable[str] = DEFAULT_FAILURE_STATES,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize an EngineWaiter object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str auth_instance_id: (optional) CRN.
+        :param failure_states: (optional) The statuses that end a wait with an
+               error.
+        :param kwargs: (optional) The polling intervals, see `StatusPoller`.
+        """
+        StatusPoller.__init__(self, failure_states=failure_states, **kwargs)
+        self.client = client
+        self.auth_instance_id = auth_instance_id
+
+    def wait(
+        self,
+        engine_type: str,
+        engine_id: str,
+        states: Union[str, Iterable[str]],
+        *,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[Future], None]] = None,
+    ) -> Future:
+        """
+        Start waiting for an engine to reach one of the given statuses.
+
+        :param str engine_type: The type of the engine, a key of `ENGINE_TYPES`
+               such as 'presto' or 'spark'.
+        :param str engine_id: The engine id (the service id for 'milvus').
+        :param states: The status, or statuses, to wait for, such as 'running'.
+        :param float timeout: (optional) Seconds after which the wait fails.
+        :param callback: (optional) Function called with the future once done.
+        :return: A future resolved with the engine.
+        :rtype: Future
+        """
+        if engine_type not in ENGINE_TYPES:
+            raise ValueError('engine_type must be one of ' + ', '.join(sorted(ENGINE_TYPES)))
+        return self._watch(engine_type, engine_id, [states] if isinstance(states, str) else states, timeout, callback)
+
+    def _fetch(self, group: Hashable) -> Dict[str, object]:
+        operation_id, items_field, id_field = ENGINE_TYPES[group]
+        response = getattr(self.client, operation_id)(auth_instance_id=self.auth_instance_id, fresh=True)
+        return {
+            result_field(engine, id_field): engine for engine in result_field(response.get_result(), items_field) or []
+        }
+
+    def _describe(self, target: _Target) -> str:
+        return '{0} engine {1}'.format(target.group, target.resource_id)
+
+
+def wait_for_engines(
+    client: WatsonxDataV2,
+    targets: Iterable[Tuple[str, str, Union[str, Iterable[str]]]],
+    timeout: float,
+    **kwargs,
+) -> Dict[Tuple[str, str], Future]:
+    """
+    Wait for several engines to reach a status.
+
+    The waiter is not returned, so its scheduler thread only stops once every
+    wait is done: the timeout is required. Use an `EngineWaiter` and its
+    `close()` to wait without a timeout.
+
+    :param WatsonxDataV2 client: The client used for the requests.
+    :param targets: The (engine type, engine id, status or statuses) to wait
+           for, see `EngineWaiter.wait`.
+    :param float timeout: Seconds after which the waits fail.
+    :param kwargs: (optional) Further arguments of `EngineWaiter`.
+    :return: The futures of the waits, by (engine type, engine id).
+    :rtype: dict
+    :raises ValueError: If the timeout is None.
+    """
+    if timeout is None:
+        raise ValueError('timeout must be provided')
+    waiter = EngineWaiter(client, **kwargs)
+    return {
+        (engine_type, engine_id): waiter.wait(engine_type, engine_id, states, timeout=timeout)
+        for engine_type, engine_id, states in targets
+    }
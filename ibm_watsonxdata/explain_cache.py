@@ -0,0 +1,369 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cache of explain plans.
+
+    cache = ExplainCache(ttl=3600, max_entries=10000, path='~/.cache/watsonxdata/plans.sqlite')
+    service = WatsonxDataV2(authenticator=authenticator, explain_cache=cache)
+
+Responses of `run_explain_statement` and `run_prestissimo_explain_statement`
+are keyed by engine, format, type and normalized statement: comments are
+dropped, whitespace is collapsed and unquoted words are lowercased, so that
+statements differing only in layout or keyword case share a plan. With
+`parameterize_literals`, string and numeric literals are replaced by `?`
+as well; the cached plan then shows the literals of the first statement.
+
+Entries are kept for `ttl` seconds in a size-bounded LRU and, with `path`,
+in a SQLite database that outlives the process. Updating, restarting or
+deleting a Presto or Prestissimo engine, or adding or removing its catalogs,
+through a client that uses the cache invalidates the plans of that engine.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+_TOKENS = re.compile(
+    r"""
+      (?P<space>\s+|--[^\n]*|/\*.*?\*/)
+    | (?P<string>[xX]?'(?:[^']|'')*')
+    | (?P<quoted>"(?:[^"]|"")*"|`[^`]*`)
+    | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+    | (?P<word>[^\W\d]\w*)
+    | (?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# The words that end an ORDER BY or GROUP BY list, whose numbers are column positions, not literals.
+_BY_LIST_ENDS = frozenset(['having', 'limit', 'offset', 'fetch', 'union', 'intersect', 'except', 'window', 'from'])
+
+
+def normalize_statement(statement: str, parameterize_literals: bool = False) -> str:
+    """
+    Return the normalized form of an SQL statement: comments removed, runs of
+    whitespace replaced by one space, unquoted words lowercased and the
+    trailing semicolon removed. Quoted identifiers and literals are kept as
+    is.
+
+    :param str statement: The statement.
+    :param bool parameterize_literals: (optional) When true, string and
+           numeric literals are replaced by `?`, except the column positions
+           of ORDER BY and GROUP BY.
+    :return: The normalized statement.
+    :rtype: str
+    """
+    parts = []
+    space = False
+    depth = 0
+    by_depth = None
+    previous = None
+    for match in _TOKENS.finditer(statement):
+        kind = match.lastgroup
+        if kind == 'space':
+            space = True
+            continue
+        token = match.group()
+        if kind == 'word':
+            token = token.lower()
+            if token == 'by':
+                by_depth = depth
+            elif token in _BY_LIST_ENDS and by_depth == depth:
+                by_depth = None
+        elif kind == 'other':
+            if token == '(':
+                depth += 1
+            elif token == ')':
+                depth -= 1
+                if by_depth is not None and depth < by_depth:
+                    by_depth = None
+        elif parameterize_literals and kind == 'string':
+            token = '?'
+        elif parameterize_literals and kind == 'number':
+            if not (by_depth == depth and previous in ('by', ',')):
+                token = '?'
+        if space and parts:
+            parts.append(' ')
+        space = False
+        parts.append(token)
+        previous = token
+    while parts and parts[-1] in (';', ' '):
+        parts.pop()
+    return ''.join(parts)
+
+
+class ExplainCache:
+    """
+    TTL and size-bounded LRU cache of explain plans, with an optional disk tier.
+
+    Cached responses are shared between callers and must not be modified.
+    The cache is thread-safe and may be shared by several clients of the same
+    service URL.
+
+    :attr int hits: Number of explains answered from memory.
+    :attr int disk_hits: Number of explains answered from the disk tier.
+    :attr int misses: Number of explains sent to the service.
+    :attr int evictions: Number of entries evicted from memory to respect
+          `max_entries`.
+    :attr int expirations: Number of entries dropped because their TTL elapsed.
+    :attr int invalidations: Number of entries dropped by engine changes.
+    """
+
+    #: The operations whose responses are cached.
+    CACHED_OPERATIONS = frozenset(['run_explain_statement', 'run_prestissimo_explain_statement'])
+
+    #: The operations that invalidate the plans of their engine.
+    INVALIDATING_OPERATIONS = frozenset(
+        [
+            'update_presto_engine',
+            'add_presto_engine_catalogs',
+            'delete_presto_engine_catalogs',
+            'restart_presto_engine',
+            'delete_engine',
+            'update_prestissimo_engine',
+            'add_prestissimo_engine_catalogs',
+            'delete_prestissimo_engine_catalogs',
+            'restart_prestissimo_engine',
+            'delete_prestissimo_engine',
+        ]
+    )
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 3600.0,
+        max_entries: int = 1024,
+        path: Optional[str] = None,
+        parameterize_literals: bool = False,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize an ExplainCache object.
+
+        :param float ttl: (optional) Seconds a plan stays valid.
+        :param int max_entries: (optional) Maximum number of plans kept in
+               memory.
+        :param str path: (optional) The SQLite database file of the disk tier,
+               created if needed.
+        :param bool parameterize_literals: (optional) When true, statements
+               that only differ by their literals share a plan.
+        :param clock: (optional) Function returning the current UNIX time.
+        """
+        if ttl <= 0:
+            raise ValueError('ttl must be positive')
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.parameterize_literals = parameterize_literals
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._db = None
+        if path is not None:
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS plans ('
+                'key TEXT PRIMARY KEY, engine_id TEXT, status_code INTEGER, result TEXT, stored_at REAL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS plans_engine_id ON plans (engine_id)')
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the cache.
+
+        :return: The hits, disk_hits, misses, evictions, expirations and
+                 invalidations counters, the number of entries in memory and,
+                 with a disk tier, on disk.
+        :rtype: dict
+        """
+        with self._lock:
+            stats = {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+            }
+            if self._db is not None:
+                stats['disk_entries'] = self._db.execute('SELECT COUNT(*) FROM plans').fetchone()[0]
+        return stats
+
+    def key(
+        self,
+        operation_id: str,
+        auth_instance_id: Optional[str],
+        engine_id: str,
+        statement: str,
+        format: Optional[str],  # pylint: disable=redefined-builtin
+        type: Optional[str],  # pylint: disable=redefined-builtin
+        *extra: object,
+    ) -> Tuple:
+        """
+        Return the cache key of an explain.
+
+        :param str operation_id: The operation.
+        :param str auth_instance_id: The AuthInstanceId of the request.
+        :param str engine_id: The engine the statement is explained on.
+        :param str statement: The statement, normalized by the key.
+        :param str format: The requested plan format.
+        :param str type: The requested plan type.
+        :param extra: Further values the in-memory response depends on.
+        :return: The key.
+        :rtype: tuple
+        """
+        normalized = normalize_statement(statement, self.parameterize_literals)
+        return (operation_id, auth_instance_id, engine_id, normalized, format, type) + extra
+
+    def call(self, key: Tuple, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Return the cached response for key, or the response of send(), which is
+        then cached.
+
+        A response is not cached if an invalidation happened while it was
+        being fetched, since it may predate the engine change.
+
+        :param tuple key: The cache key of the explain.
+        :param send: Function sending the explain to the service.
+        :return: The response.
+        :rtype: DetailedResponse
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+            if self._db is not None:
+                # The stored json does not depend on the extra part of the key.
+                row = self._db.execute(
+                    'SELECT status_code, result, stored_at FROM plans WHERE key = ?', (_db_key(key),)
+                ).fetchone()
+                if row is not None and row[2] + self.ttl > now:
+                    self.disk_hits += 1
+                    response = DetailedResponse(response=json.loads(row[1]), status_code=row[0])
+                    self._remember(key, row[2] + self.ttl, response)
+                    return response
+            self.misses += 1
+            generation = self._generation
+
+        response = send()
+
+        with self._lock:
+            if generation == self._generation:
+                now = self._clock()
+                self._remember(key, now + self.ttl, response)
+                if self._db is not None:
+                    result = response.get_result()
+                    if hasattr(result, 'to_dict'):
+                        result = result.to_dict()
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO plans VALUES (?, ?, ?, ?, ?)',
+                        (_db_key(key), key[2], response.get_status_code(), json.dumps(result), now),
+                    )
+        return response
+
+    def invalidate(self, engine_id: Optional[str] = None) -> None:
+        """
+        Drop the plans of an engine, in memory and on disk. Without argument,
+        every plan is dropped.
+
+        :param str engine_id: (optional) The engine id.
+        """
+        with self._lock:
+            self._generation += 1
+            stale = [key for key in self._entries if engine_id is None or key[2] == engine_id]
+            for key in stale:
+                del self._entries[key]
+            dropped = len(stale)
+            if self._db is not None:
+                if engine_id is None:
+                    cursor = self._db.execute('DELETE FROM plans')
+                else:
+                    cursor = self._db.execute('DELETE FROM plans WHERE engine_id = ?', (engine_id,))
+                # The plans in memory are usually on disk too.
+                dropped = max(dropped, cursor.rowcount)
+            self.invalidations += dropped
+
+    def clear(self) -> None:
+        """
+        Drop every plan; the counters are kept.
+        """
+        self.invalidate()
+
+    def prune(self) -> int:
+        """
+        Drop the plans whose TTL elapsed from the disk tier.
+
+        :return: The number of dropped plans.
+        :rtype: int
+        """
+        if self._db is None:
+            return 0
+        with self._lock:
+            cursor = self._db.execute('DELETE FROM plans WHERE stored_at <= ?', (self._clock() - self.ttl,))
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """
+        Close the database of the disk tier.
+        """
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: Tuple, expires: float, response: DetailedResponse) -> None:
+        """Add an entry to memory, evicting the least recently used ones; called with the lock held."""
+        self._entries[key] = (expires, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+def _db_key(key: Tuple) -> str:
+    return json.dumps(key[:6])
@@ -0,0 +1,441 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Parser of explain and explain analyze plans.
+
+`parse_plan` turns the result of `run_explain_statement`,
+`run_explain_analyze_statement`, `run_prestissimo_explain_statement` or
+`run_prestissimo_explain_analyze_statement`, in the text or graphviz format,
+into a `Plan` tree of `PlanNode`s:
+
+    plan = parse_plan(service.run_explain_analyze_statement('presto01', statement).get_result())
+    for node in plan.hotspots(3):
+        print(node.operator, node.cpu_ms, node.output_rows)
+    expensive = plan.flag(rows=10**8)
+
+The distributed text format is one tree per fragment; the fragments are
+joined into one tree under the `RemoteSource` nodes that read them. Every
+traversal and query visits each node once.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+import heapq
+import re
+
+#: The kinds of operators, see `PlanNode.kind`.
+SCAN = 'scan'
+JOIN = 'join'
+AGGREGATE = 'aggregate'
+EXCHANGE = 'exchange'
+SORT = 'sort'
+OTHER = 'other'
+
+_FRAGMENT = re.compile(r'^Fragment (\d+)')
+_NODE = re.compile(r'^(\s*)- (.*)$')
+_OPERATOR = re.compile(r'([A-Za-z]\w*)(?:\(([^)]*)\))?')
+_PLAN_NODE_ID = re.compile(r'\[PlanNodeId ([\w,]+)\]')
+_FRAGMENT_IDS = re.compile(r'\[(\d+(?:,\s*\d+)*)\]')
+_ESTIMATE = re.compile(r'\b(rows|cpu|memory|network):\s*([-+\d.,eE]+|\?)')
+_DURATION = r'([\d.]+)\s*(ns|us|ms|s|m|h|d)\b'
+_CPU = re.compile(r'CPU: *' + _DURATION)
+_WALL = re.compile(r'(?:Wall|Scheduled): *' + _DURATION)
+_OUTPUT_ROWS = re.compile(r'Output: *([\d.,]+)([kKMBT]?) +rows?\b')
+
+_GRAPHVIZ_CLUSTER = re.compile(r'subgraph\s+cluster_(\w+)')
+_GRAPHVIZ_NODE = re.compile(r'(\w+)\s*\[\s*label\s*=\s*"((?:[^"\\]|\\.)*)"')
+_GRAPHVIZ_EDGE = re.compile(r'(\w+)\s*->\s*(\w+)')
+
+_MILLISECONDS = {'ns': 1e-6, 'us': 1e-3, 'ms': 1.0, 's': 1e3, 'm': 6e4, 'h': 3.6e6, 'd': 8.64e7}
+_MULTIPLIERS = {'': 1, 'k': 1e3, 'K': 1e3, 'M': 1e6, 'B': 1e9, 'T': 1e12}
+
+
+class PlanNode:
+    """
+    An operator of a plan.
+
+    The estimates are those of the operator's output; they are None when the
+    plan has none, or when the engine could not estimate them. The actual
+    metrics are only set by explain analyze plans.
+
+    :attr str id: The plan node id, or a sequence number when the plan has
+          none.
+    :attr str operator: The operator, such as 'InnerJoin' or 'TableScan'.
+    :attr str qualifier: The qualifier of the operator, such as 'FINAL' for
+          'Aggregate(FINAL)', or None.
+    :attr str label: The full description of the operator in the plan.
+    :attr str fragment: The id of the fragment or cluster of the operator, or
+          None.
+    :attr float estimated_rows: Estimated number of output rows.
+    :attr float estimated_cpu: Estimated CPU cost.
+    :attr float estimated_memory: Estimated memory cost.
+    :attr float estimated_network: Estimated network cost.
+    :attr float cpu_ms: Actual CPU time, in milliseconds.
+    :attr float wall_ms: Actual wall time, in milliseconds.
+    :attr int output_rows: Actual number of output rows.
+    :attr PlanNode parent: The operator consuming the output of this one, or
+          None.
+    :attr List[PlanNode] children: The operators this one reads from.
+    """
+
+    __slots__ = (
+        'id',
+        'operator',
+        'qualifier',
+        'label',
+        'fragment',
+        'estimated_rows',
+        'estimated_cpu',
+        'estimated_memory',
+        'estimated_network',
+        'cpu_ms',
+        'wall_ms',
+        'output_rows',
+        'parent',
+        'children',
+    )
+
+    def __init__(self, id: str, label: str, fragment: Optional[str] = None) -> None:
+        """
+        Initialize a PlanNode object.
+
+        :param str id: The plan node id.
+        :param str label: The description of the operator, starting with its
+               name.
+        :param str fragment: (optional) The id of the fragment of the operator.
+        """
+        match = _OPERATOR.match(label)
+        self.id = id
+        self.operator = match.group(1) if match else label
+        self.qualifier = match.group(2) if match else None
+        self.label = label
+        self.fragment = fragment
+        self.estimated_rows = None
+        self.estimated_cpu = None
+        self.estimated_memory = None
+        self.estimated_network = None
+        self.cpu_ms = None
+        self.wall_ms = None
+        self.output_rows = None
+        self.parent = None
+        self.children = []
+
+    def __repr__(self) -> str:
+        return 'PlanNode({0!r}, {1!r})'.format(self.id, self.operator)
+
+    @property
+    def kind(self) -> str:
+        """
+        The kind of the operator: `SCAN`, `JOIN`, `AGGREGATE`, `EXCHANGE`,
+        `SORT` or `OTHER`.
+        """
+        return _kind(self.operator)
+
+    def walk(self) -> Iterator['PlanNode']:
+        """
+        Return the nodes of the subtree of this node, in depth-first order.
+
+        :return: An iterator of `PlanNode`s, starting with this one.
+        :rtype: Iterator[PlanNode]
+        """
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def to_dict(self) -> Dict:
+        """Return the operator, without its children, as a dict."""
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in ('parent', 'children') and getattr(self, name) is not None
+        }
+
+
+class Plan:
+    """
+    A parsed plan.
+
+    :attr List[PlanNode] roots: The nodes without parent; usually the single
+          output operator.
+    :attr List[PlanNode] nodes: Every node, in the order of the plan.
+    :attr bool analyzed: True if the plan has actual metrics.
+    """
+
+    def __init__(self, roots: List[PlanNode], nodes: List[PlanNode]) -> None:
+        self.roots = roots
+        self.nodes = nodes
+        self.analyzed = any(node.cpu_ms is not None or node.output_rows is not None for node in nodes)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __iter__(self) -> Iterator[PlanNode]:
+        return iter(self.nodes)
+
+    @property
+    def root(self) -> PlanNode:
+        """The first root of the plan."""
+        return self.roots[0]
+
+    def walk(self) -> Iterator[PlanNode]:
+        """
+        Return the nodes of the plan in depth-first order, from the roots.
+
+        :return: An iterator of `PlanNode`s.
+        :rtype: Iterator[PlanNode]
+        """
+        for root in self.roots:
+            yield from root.walk()
+
+    def find(self, *, kind: Optional[str] = None, operator: Optional[str] = None) -> List[PlanNode]:
+        """
+        Return the nodes of a kind, or of an operator.
+
+        :param str kind: (optional) `SCAN`, `JOIN`, `AGGREGATE`, `EXCHANGE`,
+               `SORT` or `OTHER`.
+        :param str operator: (optional) The operator name, such as 'InnerJoin'.
+        :return: The matching nodes, in the order of the plan.
+        :rtype: List[PlanNode]
+        """
+        return [
+            node
+            for node in self.nodes
+            if (kind is None or node.kind == kind) and (operator is None or node.operator == operator)
+        ]
+
+    def hotspots(self, n: int = 5, metric: str = 'cpu_ms', kinds: Optional[Iterable[str]] = None) -> List[PlanNode]:
+        """
+        Return the n nodes with the highest value of a metric.
+
+        :param int n: (optional) Number of nodes.
+        :param str metric: (optional) The `PlanNode` attribute compared, such
+               as 'cpu_ms', 'wall_ms', 'output_rows', 'estimated_rows' or
+               'estimated_cpu'.
+        :param kinds: (optional) Only consider the nodes of these kinds.
+        :return: The nodes, highest first; nodes without the metric are
+                 skipped.
+        :rtype: List[PlanNode]
+        """
+        kinds = None if kinds is None else frozenset(kinds)
+        candidates = [
+            node for node in self.nodes if getattr(node, metric) is not None and (kinds is None or node.kind in kinds)
+        ]
+        return heapq.nlargest(n, candidates, key=lambda node: getattr(node, metric))
+
+    def flag(
+        self,
+        *,
+        kinds: Iterable[str] = (SCAN, JOIN),
+        rows: Optional[float] = None,
+        cpu: Optional[float] = None,
+        cpu_ms: Optional[float] = None,
+    ) -> List[PlanNode]:
+        """
+        Return the nodes of the given kinds over any of the given thresholds.
+
+        The row threshold applies to the actual output rows of analyzed
+        plans, and to the estimated rows otherwise.
+
+        :param kinds: (optional) The kinds of the nodes checked; scans and
+               joins by default.
+        :param float rows: (optional) Maximum number of output rows.
+        :param float cpu: (optional) Maximum estimated CPU cost.
+        :param float cpu_ms: (optional) Maximum actual CPU time, in
+               milliseconds.
+        :return: The flagged nodes, in the order of the plan.
+        :rtype: List[PlanNode]
+        """
+        kinds = frozenset(kinds)
+        flagged = []
+        for node in self.nodes:
+            if node.kind not in kinds:
+                continue
+            node_rows = node.output_rows if node.output_rows is not None else node.estimated_rows
+            if _over(node_rows, rows) or _over(node.estimated_cpu, cpu) or _over(node.cpu_ms, cpu_ms):
+                flagged.append(node)
+        return flagged
+
+    @property
+    def total_cpu_ms(self) -> Optional[float]:
+        """The sum of the actual CPU time of the nodes, or None if the plan is not analyzed."""
+        if not self.analyzed:
+            return None
+        return sum(node.cpu_ms for node in self.nodes if node.cpu_ms is not None)
+
+    def total(self, metric: str) -> Optional[float]:
+        """
+        Return the sum of a metric over the nodes.
+
+        :param str metric: The `PlanNode` attribute summed, such as 'wall_ms'
+               or 'estimated_cpu'.
+        :return: The sum, or None if no node has the metric.
+        :rtype: float
+        """
+        values = [getattr(node, metric) for node in self.nodes if getattr(node, metric) is not None]
+        return sum(values) if values else None
+
+
+def parse_plan(plan: Union[str, Dict, object], format: Optional[str] = None) -> Plan:
+    """
+    Parse an explain or explain analyze plan.
+
+    :param plan: The plan: its text, or the result of an explain operation,
+           as a `dict` or a model with a `result` attribute.
+    :param str format: (optional) 'text' or 'graphviz'; detected by default.
+    :return: The plan tree.
+    :rtype: Plan
+    :raises ValueError: if the plan has no operator.
+    """
+    if isinstance(plan, dict):
+        plan = plan.get('result')
+    elif not isinstance(plan, str):
+        plan = getattr(plan, 'result', None)
+    if not isinstance(plan, str):
+        raise ValueError('plan must be a string or an explain result')
+    if format is None:
+        format = 'graphviz' if plan.lstrip().startswith('digraph') else 'text'
+    if format.lower() == 'graphviz':
+        parsed = _parse_graphviz(plan)
+    elif format.lower() == 'text':
+        parsed = _parse_text(plan)
+    else:
+        raise ValueError('format must be text or graphviz')
+    if not parsed.nodes:
+        raise ValueError('no plan operator found')
+    return parsed
+
+
+def _parse_text(text: str) -> Plan:
+    nodes = []
+    top_level = []
+    fragment_roots = {}
+    remote_sources = []
+    fragment = None
+    stack = []  # (indent, node) of the ancestors of the next node
+    node = None
+    for line in text.splitlines():
+        match = _FRAGMENT.match(line)
+        if match:
+            fragment = match.group(1)
+            stack = []
+            node = None
+            continue
+        match = _NODE.match(line)
+        if match:
+            indent = len(match.group(1))
+            label = match.group(2)
+            plan_node_id = _PLAN_NODE_ID.search(label)
+            node = PlanNode(plan_node_id.group(1) if plan_node_id else str(len(nodes)), label, fragment)
+            nodes.append(node)
+            while stack and stack[-1][0] >= indent:
+                stack.pop()
+            if stack:
+                node.parent = stack[-1][1]
+                node.parent.children.append(node)
+            else:
+                top_level.append(node)
+                fragment_roots.setdefault(fragment, node)
+            stack.append((indent, node))
+            if node.operator in ('RemoteSource', 'RemoteMerge'):
+                remote_sources.append(node)
+        elif node is not None:
+            _parse_metrics(node, line)
+
+    # Graft the fragments under the remote sources that read them.
+    for node in remote_sources:
+        match = _FRAGMENT_IDS.search(_PLAN_NODE_ID.sub('', node.label))
+        for fragment_id in match.group(1).split(',') if match else ():
+            child = fragment_roots.get(fragment_id.strip())
+            if child is not None and child.parent is None and child is not node:
+                child.parent = node
+                node.children.append(child)
+    return Plan([node for node in top_level if node.parent is None], nodes)
+
+
+def _parse_metrics(node: PlanNode, line: str) -> None:
+    """Set the estimates or actual metrics a line of the plan gives for node."""
+    if ': ' not in line:
+        return
+    if 'Estimates:' in line:
+        # Fused operators list the estimates of each step; the last one is the output.
+        estimates = line[line.rfind('{') :]
+        for name, value in _ESTIMATE.findall(estimates):
+            setattr(node, 'estimated_' + name, None if value == '?' else _number(value))
+        return
+    match = _CPU.search(line)
+    if match:
+        node.cpu_ms = float(match.group(1)) * _MILLISECONDS[match.group(2)]
+    match = _WALL.search(line)
+    if match:
+        node.wall_ms = float(match.group(1)) * _MILLISECONDS[match.group(2)]
+    match = _OUTPUT_ROWS.search(line)
+    if match:
+        node.output_rows = int(_number(match.group(1)) * _MULTIPLIERS[match.group(2)])
+
+
+def _parse_graphviz(text: str) -> Plan:
+    nodes = {}
+    order = []
+    cluster = None
+    for line in text.splitlines():
+        match = _GRAPHVIZ_CLUSTER.search(line)
+        if match:
+            cluster = match.group(1)
+            continue
+        match = _GRAPHVIZ_NODE.search(line)
+        if match:
+            label = match.group(2).replace('\\"', '"').strip('{}')
+            node = nodes[match.group(1)] = PlanNode(match.group(1), _unescape(label), cluster)
+            order.append(node)
+            continue
+        match = _GRAPHVIZ_EDGE.search(line)
+        if match and match.group(1) in nodes and match.group(2) in nodes:
+            parent = nodes[match.group(1)]
+            child = nodes[match.group(2)]
+            if child.parent is None:
+                child.parent = parent
+                parent.children.append(child)
+    return Plan([node for node in order if node.parent is None], order)
+
+
+def _unescape(label: str) -> str:
+    """Return a graphviz record label as plain text, with its fields separated by ' | '."""
+    label = re.sub(r'\\([{}|<>])', r'\1', label)
+    return ' | '.join(field.strip() for field in label.split('|'))
+
+
+def _kind(operator: str) -> str:
+    if operator.startswith('Scan') or operator in ('TableScan', 'IndexSource'):
+        return SCAN
+    if 'Join' in operator:
+        return JOIN
+    if operator.startswith(('Aggregate', 'Aggregation', 'StreamingAggregate')) or operator == 'MarkDistinct':
+        return AGGREGATE
+    if 'Exchange' in operator or operator in ('RemoteSource', 'RemoteMerge'):
+        return EXCHANGE
+    if operator in ('Sort', 'TopN', 'PartialSort', 'TopNRowNumber'):
+        return SORT
+    return OTHER
+
+
+def _number(value: str) -> float:
+    return float(value.replace(',', ''))
+
+
+def _over(value: Optional[float], threshold: Optional[float]) -> bool:
+    return threshold is not None and value is not None and value > threshold
@@ -0,0 +1,147 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JSON codecs used by the service clients to encode request bodies and decode
+responses.
+
+The standard library codec is always available. `orjson` and `ujson` are used
+when they are installed (`pip install ibm-watsonxdata[fast-json]`). All codecs
+accept model instances anywhere in the encoded value and serialize them through
+their `to_dict()` method.
+"""
+
+from typing import Union
+import json
+
+CODEC_NAMES = ('json', 'orjson', 'ujson')
+
+
+def _model_to_dict(value: object) -> dict:
+    if hasattr(value, 'to_dict'):
+        return value.to_dict()
+    raise TypeError('Object of type {0} is not JSON serializable'.format(type(value).__name__))
+
+
+class JsonCodec:
+    """
+    JSON codec backed by the standard library `json` module.
+
+    :attr str name: The name of the codec.
+    """
+
+    name = 'json'
+
+    def dumps(self, value: object) -> Union[str, bytes]:
+        """
+        Encode a value as JSON.
+
+        :param value: The value to encode; models are encoded through `to_dict()`.
+        :return: The JSON document, as `str` or UTF-8 encoded `bytes`.
+        """
+        return json.dumps(value, default=_model_to_dict)
+
+    def loads(self, document: Union[str, bytes]) -> object:
+        """
+        Decode a JSON document.
+
+        :param document: The JSON document, as `str` or UTF-8 encoded `bytes`.
+        :return: The decoded value.
+        :raises ValueError: The document is not valid JSON.
+        """
+        return json.loads(document, strict=False)
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    JSON codec backed by `orjson`.
+
+    Documents that orjson rejects but the standard library accepts in
+    non-strict mode (for example raw control characters inside strings) are
+    decoded with the standard library.
+    """
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        self._orjson = orjson
+
+    def dumps(self, value: object) -> bytes:
+        return self._orjson.dumps(value, default=_model_to_dict)
+
+    def loads(self, document: Union[str, bytes]) -> object:
+        try:
+            return self._orjson.loads(document)
+        except self._orjson.JSONDecodeError:
+            return json.loads(document, strict=False)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    JSON codec backed by `ujson`.
+    """
+
+    name = 'ujson'
+
+    def __init__(self) -> None:
+        import ujson  # pylint: disable=import-outside-toplevel
+
+        self._ujson = ujson
+
+    def dumps(self, value: object) -> str:
+        return self._ujson.dumps(value, default=_model_to_dict, ensure_ascii=False, escape_forward_slashes=False)
+
+    def loads(self, document: Union[str, bytes]) -> object:
+        try:
+            return self._ujson.loads(document)
+        except self._ujson.JSONDecodeError:
+            return json.loads(document, strict=False)
+
+
+_CODEC_CLASSES = {
+    'json': JsonCodec,
+    'orjson': OrjsonCodec,
+    'ujson': UjsonCodec,
+}
+
+
+def get_json_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """
+    Return a JSON codec.
+
+    :param codec: (optional) A `JsonCodec` instance, or the name of a codec:
+           'json' (the default), 'orjson', 'ujson', or 'auto' for the fastest
+           installed codec.
+    :return: The codec.
+    :raises ValueError: The codec name is unknown.
+    :raises ImportError: The named codec is not installed.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        codec = 'json'
+    if codec == 'auto':
+        for name in ('orjson', 'ujson'):
+            try:
+                return _CODEC_CLASSES[name]()
+            except ImportError:
+                continue
+        return JsonCodec()
+    if codec not in _CODEC_CLASSES:
+        raise ValueError('json_codec must be one of {0}, or auto'.format(', '.join(CODEC_NAMES)))
+    return _CODEC_CLASSES[codec]()
@@ -0,0 +1,205 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental parsing of large JSON responses.
+
+`JsonArrayParser` is fed the raw bytes of a JSON object as they arrive and
+returns the items of one of its array members as soon as each is complete,
+so a collection response can be consumed item by item without holding the
+whole document or its decoded form in memory:
+
+    parser = JsonArrayParser('objects')
+    for chunk in http_response.iter_content(65536):
+        for key in parser.feed(chunk):
+            ...
+    parser.close()
+"""
+
+from typing import List
+import codecs
+import json
+import re
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DELIMITERS = frozenset(' \t\n\r,]}')
+_BLANKS = frozenset(' \t\n\r')
+_ITEM_SEPARATOR = re.compile(r'[ \t\n\r]*,[ \t\n\r]*')
+
+# Parser states
+_OBJECT_START = 0
+_FIRST_KEY = 1
+_KEY = 2
+_COLON = 3
+_VALUE = 4
+_AFTER_VALUE = 5
+_FIRST_ITEM = 6
+_ITEM = 7
+_AFTER_ITEM = 8
+_DONE = 9
+
+_INCOMPLETE = object()
+
+
+class JsonArrayParser:
+    """
+    Incremental parser for the items of an array member of a JSON object.
+
+    Only the item being parsed is buffered. Other members of the object are
+    decoded and discarded, so they should be small compared to the array.
+
+    :attr str key: The name of the array member whose items are returned.
+    """
+
+    def __init__(self, key: str) -> None:
+        """
+        Initialize a JsonArrayParser.
+
+        :param str key: The name of the array member whose items are returned.
+        """
+        self.key = key
+        self._decoder = json.JSONDecoder(strict=False)
+        self._text = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = ''
+        self._state = _OBJECT_START
+        self._member = None
+
+    def feed(self, data: bytes) -> List:
+        """
+        Parse the next chunk of the document.
+
+        :param bytes data: The next chunk of the UTF-8 encoded document.
+        :return: The array items completed by this chunk, in document order.
+        :rtype: list
+        :raises ValueError: The document is not a valid JSON object.
+        """
+        self._buffer += self._text.decode(data)
+        return self._parse(final=False)
+
+    def close(self) -> List:
+        """
+        Signal the end of the document.
+
+        An empty document is accepted and contains no items.
+
+        :return: The array items completed by the end of the document.
+        :rtype: list
+        :raises ValueError: The document is truncated or not a valid JSON object.
+        """
+        self._buffer += self._text.decode(b'', final=True)
+        items = self._parse(final=True)
+        if self._state not in (_OBJECT_START, _DONE):
+            raise ValueError('Truncated JSON document')
+        return items
+
+    def _parse(self, final: bool) -> List:
+        items = []
+        buffer = self._buffer
+        pos = 0
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            state = self._state
+            char = buffer[pos]
+            if state in (_ITEM, _FIRST_ITEM) and not (state == _FIRST_ITEM and char == ']'):
+                pos = self._scan_items(buffer, pos, final, items)
+                if self._state != _AFTER_ITEM:
+                    break
+            elif state == _AFTER_ITEM and char == ',':
+                pos += 1
+                self._state = _ITEM
+            elif state in (_AFTER_ITEM, _FIRST_ITEM) and char == ']':
+                pos += 1
+                self._state = _AFTER_VALUE
+            elif state == _OBJECT_START and char == '{':
+                pos += 1
+                self._state = _FIRST_KEY
+            elif state in (_KEY, _FIRST_KEY) and char == '"':
+                member = self._decode(buffer, pos, final)
+                if member is _INCOMPLETE:
+                    break
+                self._member, pos = member
+                self._state = _COLON
+            elif state == _COLON and char == ':':
+                pos += 1
+                self._state = _VALUE
+            elif state == _VALUE and self._member == self.key and char == '[':
+                pos += 1
+                self._state = _FIRST_ITEM
+            elif state == _VALUE:
+                value = self._decode(buffer, pos, final)
+                if value is _INCOMPLETE:
+                    break
+                pos = value[1]
+                self._state = _AFTER_VALUE
+            elif state == _AFTER_VALUE and char == ',':
+                pos += 1
+                self._state = _KEY
+            elif state in (_AFTER_VALUE, _FIRST_KEY) and char == '}':
+                pos += 1
+                self._state = _DONE
+            else:
+                raise ValueError('Unexpected {0!r} at offset {1} of the buffered JSON document'.format(char, pos))
+        self._buffer = buffer[pos:]
+        return items
+
+    def _scan_items(self, buffer: str, pos: int, final: bool, items: List) -> int:
+        """
+        Append the consecutive array items starting at pos to items.
+
+        :return: The position after the last complete item; the state is
+                 _AFTER_ITEM unless not even one item was complete.
+        """
+        scan_once = self._decoder.scan_once
+        match_separator = _ITEM_SEPARATOR.match
+        end = len(buffer)
+        append = items.append
+        while True:
+            try:
+                value, next_pos = scan_once(buffer, pos)
+            except (StopIteration, json.JSONDecodeError):
+                if final:
+                    self._decoder.raw_decode(buffer, pos)
+                return pos
+            if next_pos == end or buffer[next_pos] not in _DELIMITERS and type(value) in (int, float):
+                if not final:
+                    return pos
+            append(value)
+            self._state = _AFTER_ITEM
+            if next_pos < end and buffer[next_pos] == ',' and buffer[next_pos + 1 : next_pos + 2] not in _BLANKS:
+                # Compact documents: the next item follows the comma directly.
+                pos = next_pos + 1
+            else:
+                separator = match_separator(buffer, next_pos)
+                if separator is None:
+                    return next_pos
+                pos = separator.end()
+            self._state = _ITEM
+
+    def _decode(self, buffer: str, pos: int, final: bool) -> object:
+        """Decode the value at pos, or return _INCOMPLETE if it may continue in the next chunk."""
+        try:
+            value, end = self._decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _INCOMPLETE
+        # A number that is not followed by a delimiter, such as the 1 of "1." or
+        # one at the end of the buffer, may continue in the next chunk.
+        if not final and (end == len(buffer) or type(value) in (int, float) and buffer[end] not in _DELIMITERS):
+            return _INCOMPLETE
+        return value, end
@@ -0,0 +1,225 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process cache of catalog metadata responses.
+
+    cache = MetadataCache(ttl=300, max_entries=10000)
+    service = WatsonxDataV2(authenticator=authenticator, metadata_cache=cache)
+
+Responses of `list_catalogs`, `list_schemas`, `list_tables`, `get_table` and
+`list_columns` are kept for `ttl` seconds, and the least recently used entry
+is evicted when the cache is full. Schema and table mutations made through a
+client that uses the cache invalidate the entries they may have changed, for
+every engine. Changes made by other clients are only seen once the entries
+expire.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+import threading
+import time
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+
+class MetadataCache:
+    """
+    TTL and size-bounded LRU cache of catalog metadata responses.
+
+    Entries are keyed by operation, AuthInstanceId and the
+    (engine_id, catalog_id, schema_id, table_id) the operation applies to.
+    Cached responses are shared between callers and must not be modified.
+    The cache is thread-safe and may be shared by several clients.
+
+    :attr int hits: Number of operations answered from the cache.
+    :attr int misses: Number of operations sent to the service.
+    :attr int evictions: Number of entries evicted to respect `max_entries`.
+    :attr int expirations: Number of entries dropped because their TTL elapsed.
+    :attr int invalidations: Number of entries dropped by mutations.
+    """
+
+    #: The operations whose responses are cached.
+    CACHED_OPERATIONS = frozenset(['list_catalogs', 'list_schemas', 'list_tables', 'get_table', 'list_columns'])
+
+    #: The operations that invalidate cached responses.
+    INVALIDATING_OPERATIONS = frozenset(
+        [
+            'create_schema',
+            'delete_schema',
+            'delete_table',
+            'rename_table',
+            'rollback_table',
+            'create_columns',
+            'update_column',
+            'delete_column',
+        ]
+    )
+
+    #: The engine list invalidated by each engine mutation; engine lists are
+    #: not cached, see `MetadataStore`.
+    ENGINE_MUTATIONS = {}
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a MetadataCache object.
+
+        :param float ttl: (optional) Seconds a response stays valid.
+        :param int max_entries: (optional) Maximum number of cached responses.
+        :param clock: (optional) Function returning the current time in seconds.
+        """
+        if ttl <= 0:
+            raise ValueError('ttl must be positive')
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the cache.
+
+        :return: The hits, misses, evictions, expirations and invalidations
+                 counters and the current number of entries.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'entries': len(self._entries),
+            }
+
+    @staticmethod
+    def key(
+        operation_id: str,
+        auth_instance_id: Optional[str],
+        engine_id: Optional[str],
+        path_values: Dict[str, str],
+        *extra: object,
+    ) -> Tuple:
+        """
+        Return the cache key of a metadata operation.
+
+        :param str operation_id: The operation.
+        :param str auth_instance_id: The AuthInstanceId of the request.
+        :param str engine_id: The engine_id of the request.
+        :param dict path_values: The path parameters of the request, by name.
+        :param extra: Further values the response depends on.
+        :return: The key.
+        :rtype: tuple
+        """
+        path = tuple(
+            path_values[name] for name in ('catalog_id', 'schema_id', 'table_id') if path_values.get(name) is not None
+        )
+        return (operation_id, auth_instance_id, engine_id, path) + extra
+
+    def call(self, key: Tuple, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Return the cached response for key, or the response of send(), which is
+        then cached.
+
+        A response is not cached if an invalidation happened while it was
+        being fetched, since it may predate the mutation.
+
+        :param tuple key: The cache key of the operation.
+        :param send: Function sending the operation to the service.
+        :return: The response.
+        :rtype: DetailedResponse
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            generation = self._generation
+
+        response = send()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (self._clock() + self.ttl, response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return response
+
+    def invalidate(
+        self,
+        catalog_id: Optional[str] = None,
+        schema_id: Optional[str] = None,
+        table_id: Optional[str] = None,
+    ) -> None:
+        """
+        Drop the entries a mutation of a catalog, schema or table may have
+        changed, for every engine: the entries of the object and of everything
+        it contains, and the listing of its parent (such as `list_tables` of
+        the schema when a table changes). Without arguments, every entry is
+        dropped.
+
+        :param str catalog_id: (optional) catalog id.
+        :param str schema_id: (optional) schema id, within catalog_id.
+        :param str table_id: (optional) table id, within schema_id.
+        """
+        scope = tuple(value for value in (catalog_id, schema_id, table_id) if value is not None)
+        parent = scope[:-1]
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key in self._entries
+                if not scope or _key_path(key)[: len(scope)] == scope or _key_path(key) == parent
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """
+        Drop every entry; the counters are kept.
+        """
+        self.invalidate()
+
+
+def _key_path(key: Tuple) -> Tuple[str, ...]:
+    return key[3]
@@ -0,0 +1,327 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent store of catalog metadata and engine list responses.
+
+    store = MetadataStore('~/.cache/watsonxdata/metadata.sqlite')
+    service = WatsonxDataV2(authenticator=authenticator, metadata_cache=store)
+
+`MetadataStore` is used like `MetadataCache`, but keeps the responses in a
+SQLite database that outlives the process, so that a new process answers
+metadata lookups from disk. Every entry is stamped with the time it was
+stored:
+
+* entries younger than `refresh_after` seconds are returned as is;
+* entries younger than `max_age` seconds are returned, and refreshed from
+  the service in the background;
+* older entries are fetched from the service.
+
+Responses served from the store have the `X-Stored-At` header, the UNIX time
+the entry was stored at. Schema, table and column mutations made through a
+client that uses the store invalidate the affected entries, and engine
+mutations the list of the engines of their type. Use one database per service
+URL.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from ibm_cloud_sdk_core import DetailedResponse
+
+from .metadata_cache import MetadataCache
+
+
+class MetadataStore:
+    """
+    SQLite store of metadata responses, with freshness stamps and background
+    refresh.
+
+    The store is thread-safe, and several processes may share the database.
+
+    :attr int hits: Number of operations answered from the store.
+    :attr int misses: Number of operations sent to the service.
+    :attr int refreshes: Number of background refreshes started.
+    :attr int refresh_errors: Number of background refreshes that failed; the
+          stored entry is kept.
+    :attr int invalidations: Number of entries dropped by mutations.
+    """
+
+    #: The operations whose responses are stored.
+    CACHED_OPERATIONS = MetadataCache.CACHED_OPERATIONS | frozenset(
+        [
+            'list_db2_engines',
+            'list_netezza_engines',
+            'list_other_engines',
+            'list_prestissimo_engines',
+            'list_presto_engines',
+            'list_spark_engines',
+            'list_milvus_services',
+        ]
+    )
+
+    #: The operations that invalidate stored responses.
+    INVALIDATING_OPERATIONS = MetadataCache.INVALIDATING_OPERATIONS
+
+    #: The engine list invalidated by each engine mutation.
+    ENGINE_MUTATIONS = {
+        operation_id: list_operation_id
+        for list_operation_id, operation_ids in {
+            'list_db2_engines': ['create_db2_engine', 'delete_db2_engine', 'update_db2_engine'],
+            'list_netezza_engines': ['create_netezza_engine', 'delete_netezza_engine', 'update_netezza_engine'],
+            'list_other_engines': ['create_other_engine', 'delete_other_engine'],
+            'list_prestissimo_engines': [
+                'create_prestissimo_engine',
+                'delete_prestissimo_engine',
+                'update_prestissimo_engine',
+                'add_prestissimo_engine_catalogs',
+                'delete_prestissimo_engine_catalogs',
+                'pause_prestissimo_engine',
+                'restart_prestissimo_engine',
+                'resume_prestissimo_engine',
+                'scale_prestissimo_engine',
+            ],
+            'list_presto_engines': [
+                'create_presto_engine',
+                'delete_engine',
+                'update_presto_engine',
+                'add_presto_engine_catalogs',
+                'delete_presto_engine_catalogs',
+                'pause_presto_engine',
+                'restart_presto_engine',
+                'resume_presto_engine',
+                'scale_presto_engine',
+            ],
+            'list_spark_engines': [
+                'create_spark_engine',
+                'delete_spark_engine',
+                'update_spark_engine',
+                'add_spark_engine_catalogs',
+                'delete_spark_engine_catalogs',
+                'create_spark_engine_pause',
+                'create_spark_engine_resume',
+                'create_spark_engine_scale',
+            ],
+            'list_milvus_services': ['create_milvus_service', 'delete_milvus_service', 'update_milvus_service'],
+        }.items()
+        for operation_id in operation_ids
+    }
+
+    key = staticmethod(MetadataCache.key)
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        refresh_after: float = 60.0,
+        max_age: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize a MetadataStore object.
+
+        :param str path: The SQLite database file, created if needed, or
+               ':memory:'.
+        :param float refresh_after: (optional) Age in seconds after which an
+               entry is refreshed in the background.
+        :param float max_age: (optional) Age in seconds after which an entry
+               is no longer returned.
+        :param clock: (optional) Function returning the current UNIX time.
+        """
+        if refresh_after < 0 or max_age < refresh_after:
+            raise ValueError('refresh_after must be between 0 and max_age')
+        self.refresh_after = refresh_after
+        self.max_age = max_age
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._refreshing = set()
+        self._executor = None
+        if path != ':memory:':
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, catalog_id TEXT, schema_id TEXT, table_id TEXT, '
+            'status_code INTEGER, result TEXT, stored_at REAL)'
+        )
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the store.
+
+        :return: The hits, misses, refreshes, refresh_errors and invalidations
+                 counters and the current number of entries.
+        :rtype: dict
+        """
+        entries = len(self)
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'refreshes': self.refreshes,
+            'refresh_errors': self.refresh_errors,
+            'invalidations': self.invalidations,
+            'entries': entries,
+        }
+
+    def call(self, key: Tuple, send: Callable[[], DetailedResponse]) -> DetailedResponse:
+        """
+        Return the stored response for key, or the response of send(), which is
+        then stored.
+
+        :param tuple key: The key of the operation, see `MetadataCache.key`.
+        :param send: Function sending the operation to the service.
+        :return: The response.
+        :rtype: DetailedResponse
+        """
+        # The stored json does not depend on typed_results, the extra part of the key.
+        db_key = json.dumps(key[:4])
+        with self._lock:
+            row = self._db.execute(
+                'SELECT status_code, result, stored_at FROM responses WHERE key = ?', (db_key,)
+            ).fetchone()
+            age = None if row is None else self._clock() - row[2]
+            if age is not None and age < self.max_age:
+                self.hits += 1
+                refresh = age >= self.refresh_after and db_key not in self._refreshing
+                if refresh:
+                    self._refreshing.add(db_key)
+                    self.refreshes += 1
+            else:
+                self.misses += 1
+                refresh = False
+            generation = self._generation
+
+        if age is None or age >= self.max_age:
+            response = send()
+            self._put(db_key, key, response, generation)
+            return response
+
+        if refresh:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+
+                self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='watsonxdata-metadata-store')
+            self._executor.submit(self._refresh, db_key, key, send, generation)
+        return DetailedResponse(response=json.loads(row[1]), headers={'X-Stored-At': repr(row[2])}, status_code=row[0])
+
+    def invalidate(
+        self,
+        catalog_id: Optional[str] = None,
+        schema_id: Optional[str] = None,
+        table_id: Optional[str] = None,
+    ) -> None:
+        """
+        Drop the entries a mutation of a catalog, schema or table may have
+        changed, like `MetadataCache.invalidate`. Without arguments, every
+        entry is dropped.
+
+        :param str catalog_id: (optional) catalog id.
+        :param str schema_id: (optional) schema id, within catalog_id.
+        :param str table_id: (optional) table id, within schema_id.
+        """
+        scope = [value for value in (catalog_id, schema_id, table_id) if value is not None]
+        columns = ('catalog_id', 'schema_id', 'table_id')
+        parent = (scope[:-1] + [None, None, None])[:3]
+        where = ' AND '.join('{0} = ?'.format(column) for column in columns[: len(scope)]) or '1'
+        where += ' OR ' + ' AND '.join('{0} IS ?'.format(column) for column in columns)
+        with self._lock:
+            self._generation += 1
+            cursor = self._db.execute('DELETE FROM responses WHERE ' + where, scope + parent)
+            self.invalidations += cursor.rowcount
+
+    def invalidate_operation(self, operation_id: str) -> None:
+        """
+        Drop the entries of an operation, such as the engine list an engine
+        mutation changed.
+
+        :param str operation_id: The operation.
+        """
+        # The key of an entry is the json list of the operation id, AuthInstanceId, engine_id and path values.
+        prefix = json.dumps([operation_id])[:-1] + ','
+        with self._lock:
+            self._generation += 1
+            cursor = self._db.execute('DELETE FROM responses WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+            self.invalidations += cursor.rowcount
+
+    def clear(self) -> None:
+        """
+        Drop every entry; the counters are kept.
+        """
+        self.invalidate()
+
+    def prune(self) -> int:
+        """
+        Drop the entries older than `max_age`.
+
+        :return: The number of dropped entries.
+        :rtype: int
+        """
+        with self._lock:
+            cursor = self._db.execute('DELETE FROM responses WHERE stored_at <= ?', (self._clock() - self.max_age,))
+            return cursor.rowcount
+
+    def close(self) -> None:
+        """
+        Wait for the background refreshes and close the database.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        with self._lock:
+            self._db.close()
+
+    def _refresh(self, db_key: str, key: Tuple, send: Callable[[], DetailedResponse], generation: int) -> None:
+        try:
+            self._put(db_key, key, send(), generation)
+        except Exception:  # pylint: disable=broad-except
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(db_key)
+
+    def _put(self, db_key: str, key: Tuple, response: DetailedResponse, generation: int) -> None:
+        """Store a response, unless an invalidation happened while it was being fetched."""
+        result = response.get_result()
+        if hasattr(result, 'to_dict'):
+            result = result.to_dict()
+        path = (list(key[3]) + [None, None, None])[:3]
+        data = json.dumps(result)
+        with self._lock:
+            if generation == self._generation:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [db_key] + path + [response.get_status_code(), data, self._clock()],
+                )
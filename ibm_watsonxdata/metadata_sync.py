@@ -0,0 +1,263 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental synchronization of the lakehouse metadata tree.
+
+`MetadataSync` keeps a `SyncState` of hashes: per schema, the hash of its
+table list, and per table, the hash of its column list and of each column.
+Every `sync()` lists the catalogs, schemas and tables with a
+`MetadataCrawler`, but only lists the columns of the schemas whose table list
+changed since the previous sync, and returns a `ChangeSet` of the added,
+removed and altered tables and columns:
+
+    sync = MetadataSync(service, engine_id='presto01', state=SyncState.from_dict(saved))
+    changes = sync.sync()
+    saved = sync.state.to_dict()
+
+Column changes of a table are only noticed when the table list of its schema
+changed as well, or on a `deep` sync, which lists the columns of every table.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+import hashlib
+import json
+
+from .crawler import CrawlEvent, MetadataCrawler
+from .models.catalogs import Table
+from .watsonx_data_v2 import WatsonxDataV2
+
+
+class SyncState:
+    """
+    The hashed snapshot of a lakehouse kept between syncs.
+
+    :attr dict table_lists: (hash of the table list, table names), by
+          (catalog, schema). The hash is None when some of the columns of
+          the schema could not be listed, so that it is listed again.
+    :attr dict column_lists: (hash of the column list, {column name: hash of
+          the column}), by (catalog, schema, table).
+    """
+
+    def __init__(self) -> None:
+        self.table_lists = {}
+        self.column_lists = {}
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SyncState':
+        """Initialize a SyncState object from a json dictionary."""
+        state = cls()
+        for schema in _dict.get('schemas', []):
+            state.table_lists[(schema['catalog'], schema['schema'])] = (schema['hash'], list(schema['tables']))
+        for table in _dict.get('tables', []):
+            state.column_lists[(table['catalog'], table['schema'], table['table'])] = (
+                table['hash'],
+                dict(table['columns']),
+            )
+        return state
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this state."""
+        return {
+            'schemas': [
+                {'catalog': catalog, 'schema': schema, 'hash': digest, 'tables': list(tables)}
+                for (catalog, schema), (digest, tables) in self.table_lists.items()
+            ],
+            'tables': [
+                {'catalog': catalog, 'schema': schema, 'table': table, 'hash': digest, 'columns': dict(columns)}
+                for (catalog, schema, table), (digest, columns) in self.column_lists.items()
+            ],
+        }
+
+    def remove_schema(self, catalog: str, schema: str) -> List[Tuple[str, str, str]]:
+        """Forget a schema and its tables; return the paths of the tables."""
+        _, tables = self.table_lists.pop((catalog, schema))
+        paths = [(catalog, schema, table) for table in tables]
+        for path in paths:
+            self.column_lists.pop(path, None)
+        return paths
+
+
+class ChangeSet:
+    """
+    The changes found by a sync.
+
+    :attr dict added_tables: `Table` models with their columns, by (catalog,
+          schema, table).
+    :attr list removed_tables: The (catalog, schema, table) of removed tables.
+    :attr dict altered_tables: `Table` models of tables whose columns changed,
+          by (catalog, schema, table).
+    :attr dict added_columns: Names of the columns added to altered tables.
+    :attr dict removed_columns: Names of the columns removed from altered
+          tables.
+    :attr dict altered_columns: Names of the columns of altered tables whose
+          definition changed.
+    :attr list errors: The failed `CrawlEvent`s; the state of their subtrees
+          is kept and checked again by the next sync.
+    :attr CrawlStats stats: The statistics of the crawl.
+    """
+
+    def __init__(self) -> None:
+        self.added_tables = {}
+        self.removed_tables = []
+        self.altered_tables = {}
+        self.added_columns = {}
+        self.removed_columns = {}
+        self.altered_columns = {}
+        self.errors = []
+        self.stats = None
+
+    def __bool__(self) -> bool:
+        return bool(self.added_tables or self.removed_tables or self.altered_tables)
+
+
+class MetadataSync:
+    """
+    Finds the metadata changes of a lakehouse since the previous sync.
+
+    :attr SyncState state: The state of the last sync, updated by `sync()`.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        *,
+        state: Optional[SyncState] = None,
+        engine_id: Optional[str] = None,
+        auth_instance_id: Optional[str] = None,
+        catalog_names: Optional[Iterable[str]] = None,
+        max_workers: int = 16,
+        level_limits: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """
+        Initialize a MetadataSync object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param SyncState state: (optional) The state of a previous sync; by
+               default every table is reported as added by the first sync.
+        :param str engine_id: (optional) The engine used to list schemas,
+               tables and columns.
+        :param str auth_instance_id: (optional) CRN.
+        :param catalog_names: (optional) Only sync these catalogs.
+        :param int max_workers: (optional) Maximum number of concurrent requests.
+        :param dict level_limits: (optional) Maximum number of concurrent
+               requests per level, see `MetadataCrawler`.
+        """
+        self.state = state if state is not None else SyncState()
+        self._crawler_args = {
+            'engine_id': engine_id,
+            'auth_instance_id': auth_instance_id,
+            'catalog_names': catalog_names,
+            'max_workers': max_workers,
+            'level_limits': level_limits,
+        }
+        self.client = client
+
+    def sync(self, *, deep: bool = False) -> ChangeSet:
+        """
+        Compare the lakehouse with the state, and update the state.
+
+        :param bool deep: (optional) List the columns of every table, to
+               notice column changes in schemas whose table list is unchanged.
+        :return: The changes.
+        :rtype: ChangeSet
+        """
+        state = self.state
+        changes = ChangeSet()
+        descended = {}
+
+        def descend(event: CrawlEvent) -> bool:
+            if event.kind != 'tables':
+                return True
+            digest = _digest(sorted(event.value))
+            previous = state.table_lists.get(event.path)
+            if deep or previous is None or previous[0] != digest:
+                descended[event.path] = digest
+                return True
+            return False
+
+        crawler = MetadataCrawler(self.client, descend=descend, **self._crawler_args)
+        schemas = {}
+        table_lists = {}
+        tables = {}
+        failed = set()
+        for event in crawler.crawl():
+            if event.error is not None:
+                changes.errors.append(event)
+                failed.add(event.path)
+            elif event.kind == 'schemas':
+                schemas[event.path[0]] = set(event.value)
+            elif event.kind == 'tables':
+                table_lists[event.path] = event.value
+            elif event.kind == 'table':
+                tables[event.path] = event.value
+        changes.stats = crawler.stats
+        if () in failed:
+            return changes
+
+        for catalog, schema in list(state.table_lists):
+            if crawler.catalog_names is not None and catalog not in crawler.catalog_names:
+                continue
+            if (catalog,) not in failed and schema not in schemas.get(catalog, ()):
+                changes.removed_tables.extend(state.remove_schema(catalog, schema))
+        for path, digest in descended.items():
+            self._update_schema(changes, path, table_lists[path], digest, tables)
+        return changes
+
+    def _update_schema(
+        self,
+        changes: ChangeSet,
+        path: Tuple[str, str],
+        names: List[str],
+        digest: str,
+        tables: Dict[Tuple[str, str, str], Table],
+    ) -> None:
+        """Record the changes of a schema whose columns were listed, and update its state."""
+        state = self.state
+        _, previous_names = state.table_lists.get(path, (None, []))
+        for table in previous_names:
+            if table not in names:
+                changes.removed_tables.append(path + (table,))
+                state.column_lists.pop(path + (table,), None)
+
+        complete = True
+        for table in names:
+            table_path = path + (table,)
+            details = tables.get(table_path)
+            if details is None:
+                complete = False
+                continue
+            column_hashes = {column.column_name: _digest(column.to_dict()) for column in details.columns}
+            column_list_digest = _digest(list(column_hashes.items()))
+            previous = state.column_lists.get(table_path)
+            state.column_lists[table_path] = (column_list_digest, column_hashes)
+            if previous is None:
+                changes.added_tables[table_path] = details
+            elif previous[0] != column_list_digest:
+                previous_hashes = previous[1]
+                changes.altered_tables[table_path] = details
+                changes.added_columns[table_path] = [name for name in column_hashes if name not in previous_hashes]
+                changes.removed_columns[table_path] = [name for name in previous_hashes if name not in column_hashes]
+                changes.altered_columns[table_path] = [
+                    name for name, value in column_hashes.items() if previous_hashes.get(name, value) != value
+                ]
+        state.table_lists[path] = (digest if complete else None, list(names))
+
+
+def _digest(value: object) -> str:
+    """Return a short stable hash of a json value."""
+    data = json.dumps(value, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -0,0 +1,721 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: buckets.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from .shared import SuccessResponse
+
+
+class BucketCatalog:
+    """
+    bucket catalog.
+
+    :param str catalog_name: (optional) catalog name.
+    :param List[str] catalog_tags: (optional) catalog tags.
+    :param str catalog_type: (optional) catalog type.
+    """
+
+    __slots__ = ('catalog_name', 'catalog_tags', 'catalog_type')
+
+    def __init__(
+        self,
+        *,
+        catalog_name: Optional[str] = None,
+        catalog_tags: Optional[List[str]] = None,
+        catalog_type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a BucketCatalog object.
+
+        :param str catalog_name: (optional) catalog name.
+        :param List[str] catalog_tags: (optional) catalog tags.
+        :param str catalog_type: (optional) catalog type.
+        """
+        self.catalog_name = catalog_name
+        self.catalog_tags = catalog_tags
+        self.catalog_type = catalog_type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BucketCatalog':
+        """Initialize a BucketCatalog object from a json dictionary."""
+        args = {}
+        if (catalog_name := _dict.get('catalog_name')) is not None:
+            args['catalog_name'] = catalog_name
+        if (catalog_tags := _dict.get('catalog_tags')) is not None:
+            args['catalog_tags'] = catalog_tags
+        if (catalog_type := _dict.get('catalog_type')) is not None:
+            args['catalog_type'] = catalog_type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BucketCatalog object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalog_name') and self.catalog_name is not None:
+            _dict['catalog_name'] = self.catalog_name
+        if hasattr(self, 'catalog_tags') and self.catalog_tags is not None:
+            _dict['catalog_tags'] = self.catalog_tags
+        if hasattr(self, 'catalog_type') and self.catalog_type is not None:
+            _dict['catalog_type'] = self.catalog_type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this BucketCatalog object as a `dict`."""
+        return {name: getattr(self, name) for name in BucketCatalog.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BucketCatalog object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BucketCatalog') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BucketCatalog') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class BucketDetails:
+    """
+    bucket details.
+
+    :param str access_key: (optional) Access key ID, encrypted during bucket
+          registration.
+    :param str bucket_name: actual bucket name.
+    :param str endpoint: (optional) Cos endpoint.
+    :param str secret_key: (optional) Secret access key, encrypted during bucket
+          registration.
+    """
+
+    __slots__ = ('access_key', 'bucket_name', 'endpoint', 'secret_key')
+
+    def __init__(
+        self,
+        bucket_name: str,
+        *,
+        access_key: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        secret_key: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a BucketDetails object.
+
+        :param str bucket_name: actual bucket name.
+        :param str access_key: (optional) Access key ID, encrypted during bucket
+               registration.
+        :param str endpoint: (optional) Cos endpoint.
+        :param str secret_key: (optional) Secret access key, encrypted during
+               bucket registration.
+        """
+        self.access_key = access_key
+        self.bucket_name = bucket_name
+        self.endpoint = endpoint
+        self.secret_key = secret_key
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BucketDetails':
+        """Initialize a BucketDetails object from a json dictionary."""
+        args = {}
+        if (access_key := _dict.get('access_key')) is not None:
+            args['access_key'] = access_key
+        if (bucket_name := _dict.get('bucket_name')) is not None:
+            args['bucket_name'] = bucket_name
+        else:
+            raise ValueError('Required property \'bucket_name\' not present in BucketDetails JSON')
+        if (endpoint := _dict.get('endpoint')) is not None:
+            args['endpoint'] = endpoint
+        if (secret_key := _dict.get('secret_key')) is not None:
+            args['secret_key'] = secret_key
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BucketDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'access_key') and self.access_key is not None:
+            _dict['access_key'] = self.access_key
+        if hasattr(self, 'bucket_name') and self.bucket_name is not None:
+            _dict['bucket_name'] = self.bucket_name
+        if hasattr(self, 'endpoint') and self.endpoint is not None:
+            _dict['endpoint'] = self.endpoint
+        if hasattr(self, 'secret_key') and self.secret_key is not None:
+            _dict['secret_key'] = self.secret_key
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this BucketDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in BucketDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BucketDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BucketDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BucketDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class BucketRegistration:
+    """
+    Bucket.
+
+    :param List[str] actions: (optional) Actions.
+    :param BucketCatalog associated_catalog: bucket catalog.
+    :param BucketDetails bucket_details: (optional) bucket details.
+    :param str bucket_display_name: (optional) bucket display name.
+    :param str bucket_id: (optional) bucket ID auto generated during bucket
+          registration.
+    :param str bucket_type: bucket type.
+    :param str created_by: Username who created the bucket.
+    :param str created_on: Creation date.
+    :param str description: bucket description.
+    :param str managed_by: managed by.
+    :param str region: (optional) Region where the bucket is located.
+    :param str state: mark bucket active or inactive.
+    :param List[str] tags: (optional) tags.
+    """
+
+    __slots__ = (
+        'actions',
+        'associated_catalog',
+        'bucket_details',
+        'bucket_display_name',
+        'bucket_id',
+        'bucket_type',
+        'created_by',
+        'created_on',
+        'description',
+        'managed_by',
+        'region',
+        'state',
+        'tags',
+    )
+
+    def __init__(
+        self,
+        associated_catalog: 'BucketCatalog',
+        bucket_type: str,
+        created_by: str,
+        created_on: str,
+        description: str,
+        managed_by: str,
+        state: str,
+        *,
+        actions: Optional[List[str]] = None,
+        bucket_details: Optional['BucketDetails'] = None,
+        bucket_display_name: Optional[str] = None,
+        bucket_id: Optional[str] = None,
+        region: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a BucketRegistration object.
+
+        :param BucketCatalog associated_catalog: bucket catalog.
+        :param str bucket_type: bucket type.
+        :param str created_by: Username who created the bucket.
+        :param str created_on: Creation date.
+        :param str description: bucket description.
+        :param str managed_by: managed by.
+        :param str state: mark bucket active or inactive.
+        :param List[str] actions: (optional) Actions.
+        :param BucketDetails bucket_details: (optional) bucket details.
+        :param str bucket_display_name: (optional) bucket display name.
+        :param str bucket_id: (optional) bucket ID auto generated during bucket
+               registration.
+        :param str region: (optional) Region where the bucket is located.
+        :param List[str] tags: (optional) tags.
+        """
+        self.actions = actions
+        self.associated_catalog = associated_catalog
+        self.bucket_details = bucket_details
+        self.bucket_display_name = bucket_display_name
+        self.bucket_id = bucket_id
+        self.bucket_type = bucket_type
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.managed_by = managed_by
+        self.region = region
+        self.state = state
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BucketRegistration':
+        """Initialize a BucketRegistration object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (associated_catalog := _dict.get('associated_catalog')) is not None:
+            args['associated_catalog'] = BucketCatalog.from_dict(associated_catalog)
+        else:
+            raise ValueError('Required property \'associated_catalog\' not present in BucketRegistration JSON')
+        if (bucket_details := _dict.get('bucket_details')) is not None:
+            args['bucket_details'] = BucketDetails.from_dict(bucket_details)
+        if (bucket_display_name := _dict.get('bucket_display_name')) is not None:
+            args['bucket_display_name'] = bucket_display_name
+        if (bucket_id := _dict.get('bucket_id')) is not None:
+            args['bucket_id'] = bucket_id
+        if (bucket_type := _dict.get('bucket_type')) is not None:
+            args['bucket_type'] = bucket_type
+        else:
+            raise ValueError('Required property \'bucket_type\' not present in BucketRegistration JSON')
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        else:
+            raise ValueError('Required property \'created_by\' not present in BucketRegistration JSON')
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        else:
+            raise ValueError('Required property \'created_on\' not present in BucketRegistration JSON')
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        else:
+            raise ValueError('Required property \'description\' not present in BucketRegistration JSON')
+        if (managed_by := _dict.get('managed_by')) is not None:
+            args['managed_by'] = managed_by
+        else:
+            raise ValueError('Required property \'managed_by\' not present in BucketRegistration JSON')
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (state := _dict.get('state')) is not None:
+            args['state'] = state
+        else:
+            raise ValueError('Required property \'state\' not present in BucketRegistration JSON')
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BucketRegistration object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'associated_catalog') and self.associated_catalog is not None:
+            if isinstance(self.associated_catalog, dict):
+                _dict['associated_catalog'] = self.associated_catalog
+            else:
+                _dict['associated_catalog'] = self.associated_catalog.to_dict()
+        if hasattr(self, 'bucket_details') and self.bucket_details is not None:
+            if isinstance(self.bucket_details, dict):
+                _dict['bucket_details'] = self.bucket_details
+            else:
+                _dict['bucket_details'] = self.bucket_details.to_dict()
+        if hasattr(self, 'bucket_display_name') and self.bucket_display_name is not None:
+            _dict['bucket_display_name'] = self.bucket_display_name
+        if hasattr(self, 'bucket_id') and self.bucket_id is not None:
+            _dict['bucket_id'] = self.bucket_id
+        if hasattr(self, 'bucket_type') and self.bucket_type is not None:
+            _dict['bucket_type'] = self.bucket_type
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'managed_by') and self.managed_by is not None:
+            _dict['managed_by'] = self.managed_by
+        if hasattr(self, 'region') and self.region is not None:
+            _dict['region'] = self.region
+        if hasattr(self, 'state') and self.state is not None:
+            _dict['state'] = self.state
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this BucketRegistration object as a `dict`."""
+        return {name: getattr(self, name) for name in BucketRegistration.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BucketRegistration object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BucketRegistration') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BucketRegistration') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class BucketTypeEnum(str, Enum):
+        """
+        bucket type.
+        """
+
+        AMAZON_S3 = 'amazon_s3'
+        AWS_S3 = 'aws_s3'
+        MINIO = 'minio'
+        IBM_COS = 'ibm_cos'
+        IBM_CEPH = 'ibm_ceph'
+
+    class ManagedByEnum(str, Enum):
+        """
+        managed by.
+        """
+
+        IBM = 'ibm'
+        CUSTOMER = 'customer'
+
+    class StateEnum(str, Enum):
+        """
+        mark bucket active or inactive.
+        """
+
+        ACTIVE = 'active'
+        INACTIVE = 'inactive'
+
+
+class BucketRegistrationCollection:
+    """
+    List bucket registrations.
+
+    :param List[BucketRegistration] bucket_registrations: (optional) Buckets.
+    """
+
+    __slots__ = ('bucket_registrations',)
+
+    def __init__(
+        self,
+        *,
+        bucket_registrations: Optional[List['BucketRegistration']] = None,
+    ) -> None:
+        """
+        Initialize a BucketRegistrationCollection object.
+
+        :param List[BucketRegistration] bucket_registrations: (optional) Buckets.
+        """
+        self.bucket_registrations = bucket_registrations
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BucketRegistrationCollection':
+        """Initialize a BucketRegistrationCollection object from a json dictionary."""
+        args = {}
+        if (bucket_registrations := _dict.get('bucket_registrations')) is not None:
+            args['bucket_registrations'] = [BucketRegistration.from_dict(v) for v in bucket_registrations]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BucketRegistrationCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'bucket_registrations') and self.bucket_registrations is not None:
+            bucket_registrations_list = []
+            for v in self.bucket_registrations:
+                if isinstance(v, dict):
+                    bucket_registrations_list.append(v)
+                else:
+                    bucket_registrations_list.append(v.to_dict())
+            _dict['bucket_registrations'] = bucket_registrations_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this BucketRegistrationCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in BucketRegistrationCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BucketRegistrationCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BucketRegistrationCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BucketRegistrationCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class BucketRegistrationObjectCollection:
+    """
+    List bucket objects.
+
+    :param List[str] objects: (optional) bucket object.
+    """
+
+    __slots__ = ('objects',)
+
+    def __init__(
+        self,
+        *,
+        objects: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a BucketRegistrationObjectCollection object.
+
+        :param List[str] objects: (optional) bucket object.
+        """
+        self.objects = objects
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BucketRegistrationObjectCollection':
+        """Initialize a BucketRegistrationObjectCollection object from a json dictionary."""
+        args = {}
+        if (objects := _dict.get('objects')) is not None:
+            args['objects'] = objects
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BucketRegistrationObjectCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'objects') and self.objects is not None:
+            _dict['objects'] = self.objects
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this BucketRegistrationObjectCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in BucketRegistrationObjectCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BucketRegistrationObjectCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BucketRegistrationObjectCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BucketRegistrationObjectCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class BucketRegistrationPatch:
+    """
+    Update bucket parameters.
+
+    :param BucketDetails bucket_details: (optional) bucket details.
+    :param str bucket_display_name: (optional) bucket display name.
+    :param str description: (optional) modified description.
+    :param List[str] tags: (optional) Tags.
+    """
+
+    __slots__ = ('bucket_details', 'bucket_display_name', 'description', 'tags')
+
+    def __init__(
+        self,
+        *,
+        bucket_details: Optional['BucketDetails'] = None,
+        bucket_display_name: Optional[str] = None,
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a BucketRegistrationPatch object.
+
+        :param BucketDetails bucket_details: (optional) bucket details.
+        :param str bucket_display_name: (optional) bucket display name.
+        :param str description: (optional) modified description.
+        :param List[str] tags: (optional) Tags.
+        """
+        self.bucket_details = bucket_details
+        self.bucket_display_name = bucket_display_name
+        self.description = description
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BucketRegistrationPatch':
+        """Initialize a BucketRegistrationPatch object from a json dictionary."""
+        args = {}
+        if (bucket_details := _dict.get('bucket_details')) is not None:
+            args['bucket_details'] = BucketDetails.from_dict(bucket_details)
+        if (bucket_display_name := _dict.get('bucket_display_name')) is not None:
+            args['bucket_display_name'] = bucket_display_name
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a BucketRegistrationPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'bucket_details') and self.bucket_details is not None:
+            if isinstance(self.bucket_details, dict):
+                _dict['bucket_details'] = self.bucket_details
+            else:
+                _dict['bucket_details'] = self.bucket_details.to_dict()
+        if hasattr(self, 'bucket_display_name') and self.bucket_display_name is not None:
+            _dict['bucket_display_name'] = self.bucket_display_name
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this BucketRegistrationPatch object as a `dict`."""
+        return {name: getattr(self, name) for name in BucketRegistrationPatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this BucketRegistrationPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'BucketRegistrationPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'BucketRegistrationPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class CreateActivateBucketCreatedBody:
+    """
+    Activate bucket.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a CreateActivateBucketCreatedBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CreateActivateBucketCreatedBody':
+        """Initialize a CreateActivateBucketCreatedBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CreateActivateBucketCreatedBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this CreateActivateBucketCreatedBody object as a `dict`."""
+        return {name: getattr(self, name) for name in CreateActivateBucketCreatedBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CreateActivateBucketCreatedBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CreateActivateBucketCreatedBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CreateActivateBucketCreatedBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
@@ -0,0 +1,1317 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: catalogs, schemas, tables, columns and snapshots.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from .shared import SuccessResponse
+
+
+class Catalog:
+    """
+    Define the catalog details.
+
+    :param List[str] actions: (optional) list of allowed actions.
+    :param List[str] associated_buckets: (optional) Associated buckets items.
+    :param List[str] associated_databases: (optional) Associated databases items.
+    :param List[str] associated_engines: (optional) Associated engines items.
+    :param str catalog_name: (optional) Name for the catalog.
+    :param str catalog_type: (optional) Table type.
+    :param str created_by: (optional) Created by.
+    :param str created_on: (optional) Created on.
+    :param str description: (optional) Description.
+    :param str hostname: (optional) IBM thrift uri hostname.
+    :param str last_sync_at: (optional) Last sync time.
+    :param str managed_by: (optional) Managed by.
+    :param str metastore: (optional) Catalog name.
+    :param str port: (optional) IBM thrift uri port.
+    :param str status: (optional) Catalog status.
+    :param str sync_description: (optional) Sync description.
+    :param List[str] sync_exception: (optional) Tables not sync because data is
+          corrupted.
+    :param str sync_status: (optional) Sync status.
+    :param List[str] tags: (optional) Tags.
+    :param str thrift_uri: (optional) Customer thrift uri.
+    """
+
+    __slots__ = (
+        'actions',
+        'associated_buckets',
+        'associated_databases',
+        'associated_engines',
+        'catalog_name',
+        'catalog_type',
+        'created_by',
+        'created_on',
+        'description',
+        'hostname',
+        'last_sync_at',
+        'managed_by',
+        'metastore',
+        'port',
+        'status',
+        'sync_description',
+        'sync_exception',
+        'sync_status',
+        'tags',
+        'thrift_uri',
+    )
+
+    def __init__(
+        self,
+        *,
+        actions: Optional[List[str]] = None,
+        associated_buckets: Optional[List[str]] = None,
+        associated_databases: Optional[List[str]] = None,
+        associated_engines: Optional[List[str]] = None,
+        catalog_name: Optional[str] = None,
+        catalog_type: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[str] = None,
+        description: Optional[str] = None,
+        hostname: Optional[str] = None,
+        last_sync_at: Optional[str] = None,
+        managed_by: Optional[str] = None,
+        metastore: Optional[str] = None,
+        port: Optional[str] = None,
+        status: Optional[str] = None,
+        sync_description: Optional[str] = None,
+        sync_exception: Optional[List[str]] = None,
+        sync_status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        thrift_uri: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Catalog object.
+
+        :param List[str] actions: (optional) list of allowed actions.
+        :param List[str] associated_buckets: (optional) Associated buckets items.
+        :param List[str] associated_databases: (optional) Associated databases
+               items.
+        :param List[str] associated_engines: (optional) Associated engines items.
+        :param str catalog_name: (optional) Name for the catalog.
+        :param str catalog_type: (optional) Table type.
+        :param str created_by: (optional) Created by.
+        :param str created_on: (optional) Created on.
+        :param str description: (optional) Description.
+        :param str hostname: (optional) IBM thrift uri hostname.
+        :param str last_sync_at: (optional) Last sync time.
+        :param str managed_by: (optional) Managed by.
+        :param str metastore: (optional) Catalog name.
+        :param str port: (optional) IBM thrift uri port.
+        :param str status: (optional) Catalog status.
+        :param str sync_description: (optional) Sync description.
+        :param List[str] sync_exception: (optional) Tables not sync because data is
+               corrupted.
+        :param str sync_status: (optional) Sync status.
+        :param List[str] tags: (optional) Tags.
+        :param str thrift_uri: (optional) Customer thrift uri.
+        """
+        self.actions = actions
+        self.associated_buckets = associated_buckets
+        self.associated_databases = associated_databases
+        self.associated_engines = associated_engines
+        self.catalog_name = catalog_name
+        self.catalog_type = catalog_type
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.hostname = hostname
+        self.last_sync_at = last_sync_at
+        self.managed_by = managed_by
+        self.metastore = metastore
+        self.port = port
+        self.status = status
+        self.sync_description = sync_description
+        self.sync_exception = sync_exception
+        self.sync_status = sync_status
+        self.tags = tags
+        self.thrift_uri = thrift_uri
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Catalog':
+        """Initialize a Catalog object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (associated_buckets := _dict.get('associated_buckets')) is not None:
+            args['associated_buckets'] = associated_buckets
+        if (associated_databases := _dict.get('associated_databases')) is not None:
+            args['associated_databases'] = associated_databases
+        if (associated_engines := _dict.get('associated_engines')) is not None:
+            args['associated_engines'] = associated_engines
+        if (catalog_name := _dict.get('catalog_name')) is not None:
+            args['catalog_name'] = catalog_name
+        if (catalog_type := _dict.get('catalog_type')) is not None:
+            args['catalog_type'] = catalog_type
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (hostname := _dict.get('hostname')) is not None:
+            args['hostname'] = hostname
+        if (last_sync_at := _dict.get('last_sync_at')) is not None:
+            args['last_sync_at'] = last_sync_at
+        if (managed_by := _dict.get('managed_by')) is not None:
+            args['managed_by'] = managed_by
+        if (metastore := _dict.get('metastore')) is not None:
+            args['metastore'] = metastore
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (sync_description := _dict.get('sync_description')) is not None:
+            args['sync_description'] = sync_description
+        if (sync_exception := _dict.get('sync_exception')) is not None:
+            args['sync_exception'] = sync_exception
+        if (sync_status := _dict.get('sync_status')) is not None:
+            args['sync_status'] = sync_status
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (thrift_uri := _dict.get('thrift_uri')) is not None:
+            args['thrift_uri'] = thrift_uri
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Catalog object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'associated_buckets') and self.associated_buckets is not None:
+            _dict['associated_buckets'] = self.associated_buckets
+        if hasattr(self, 'associated_databases') and self.associated_databases is not None:
+            _dict['associated_databases'] = self.associated_databases
+        if hasattr(self, 'associated_engines') and self.associated_engines is not None:
+            _dict['associated_engines'] = self.associated_engines
+        if hasattr(self, 'catalog_name') and self.catalog_name is not None:
+            _dict['catalog_name'] = self.catalog_name
+        if hasattr(self, 'catalog_type') and self.catalog_type is not None:
+            _dict['catalog_type'] = self.catalog_type
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'hostname') and self.hostname is not None:
+            _dict['hostname'] = self.hostname
+        if hasattr(self, 'last_sync_at') and self.last_sync_at is not None:
+            _dict['last_sync_at'] = self.last_sync_at
+        if hasattr(self, 'managed_by') and self.managed_by is not None:
+            _dict['managed_by'] = self.managed_by
+        if hasattr(self, 'metastore') and self.metastore is not None:
+            _dict['metastore'] = self.metastore
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'sync_description') and self.sync_description is not None:
+            _dict['sync_description'] = self.sync_description
+        if hasattr(self, 'sync_exception') and self.sync_exception is not None:
+            _dict['sync_exception'] = self.sync_exception
+        if hasattr(self, 'sync_status') and self.sync_status is not None:
+            _dict['sync_status'] = self.sync_status
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'thrift_uri') and self.thrift_uri is not None:
+            _dict['thrift_uri'] = self.thrift_uri
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Catalog object as a `dict`."""
+        return {name: getattr(self, name) for name in Catalog.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Catalog object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Catalog') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Catalog') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class ManagedByEnum(str, Enum):
+        """
+        Managed by.
+        """
+
+        IBM = 'ibm'
+        CUSTOMER = 'customer'
+
+
+class CatalogCollection:
+    """
+    GetCatalogs OK.
+
+    :param List[Catalog] catalogs: (optional) Catalogs.
+    """
+
+    __slots__ = ('catalogs',)
+
+    def __init__(
+        self,
+        *,
+        catalogs: Optional[List['Catalog']] = None,
+    ) -> None:
+        """
+        Initialize a CatalogCollection object.
+
+        :param List[Catalog] catalogs: (optional) Catalogs.
+        """
+        self.catalogs = catalogs
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CatalogCollection':
+        """Initialize a CatalogCollection object from a json dictionary."""
+        args = {}
+        if (catalogs := _dict.get('catalogs')) is not None:
+            args['catalogs'] = [Catalog.from_dict(v) for v in catalogs]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CatalogCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalogs') and self.catalogs is not None:
+            catalogs_list = []
+            for v in self.catalogs:
+                if isinstance(v, dict):
+                    catalogs_list.append(v)
+                else:
+                    catalogs_list.append(v.to_dict())
+            _dict['catalogs'] = catalogs_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this CatalogCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in CatalogCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CatalogCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CatalogCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CatalogCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Column:
+    """
+    Column.
+
+    :param str column_name: (optional) Column name.
+    :param str comment: (optional) Comment.
+    :param str extra: (optional) Extra.
+    :param str length: (optional) length.
+    :param str scale: (optional) scale.
+    :param str type: (optional) Data type.
+    """
+
+    __slots__ = ('column_name', 'comment', 'extra', 'length', 'scale', 'type')
+
+    def __init__(
+        self,
+        *,
+        column_name: Optional[str] = None,
+        comment: Optional[str] = None,
+        extra: Optional[str] = None,
+        length: Optional[str] = None,
+        scale: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Column object.
+
+        :param str column_name: (optional) Column name.
+        :param str comment: (optional) Comment.
+        :param str extra: (optional) Extra.
+        :param str length: (optional) length.
+        :param str scale: (optional) scale.
+        :param str type: (optional) Data type.
+        """
+        self.column_name = column_name
+        self.comment = comment
+        self.extra = extra
+        self.length = length
+        self.scale = scale
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Column':
+        """Initialize a Column object from a json dictionary."""
+        args = {}
+        if (column_name := _dict.get('column_name')) is not None:
+            args['column_name'] = column_name
+        if (comment := _dict.get('comment')) is not None:
+            args['comment'] = comment
+        if (extra := _dict.get('extra')) is not None:
+            args['extra'] = extra
+        if (length := _dict.get('length')) is not None:
+            args['length'] = length
+        if (scale := _dict.get('scale')) is not None:
+            args['scale'] = scale
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Column object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'column_name') and self.column_name is not None:
+            _dict['column_name'] = self.column_name
+        if hasattr(self, 'comment') and self.comment is not None:
+            _dict['comment'] = self.comment
+        if hasattr(self, 'extra') and self.extra is not None:
+            _dict['extra'] = self.extra
+        if hasattr(self, 'length') and self.length is not None:
+            _dict['length'] = self.length
+        if hasattr(self, 'scale') and self.scale is not None:
+            _dict['scale'] = self.scale
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Column object as a `dict`."""
+        return {name: getattr(self, name) for name in Column.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Column object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Column') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Column') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ColumnCollection:
+    """
+    list of columns in a table.
+
+    :param List[Column] columns: (optional) List of the columns present in the
+          table.
+    """
+
+    __slots__ = ('columns',)
+
+    def __init__(
+        self,
+        *,
+        columns: Optional[List['Column']] = None,
+    ) -> None:
+        """
+        Initialize a ColumnCollection object.
+
+        :param List[Column] columns: (optional) List of the columns present in the
+               table.
+        """
+        self.columns = columns
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ColumnCollection':
+        """Initialize a ColumnCollection object from a json dictionary."""
+        args = {}
+        if (columns := _dict.get('columns')) is not None:
+            args['columns'] = [Column.from_dict(v) for v in columns]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ColumnCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'columns') and self.columns is not None:
+            columns_list = []
+            for v in self.columns:
+                if isinstance(v, dict):
+                    columns_list.append(v)
+                else:
+                    columns_list.append(v.to_dict())
+            _dict['columns'] = columns_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this ColumnCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in ColumnCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ColumnCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ColumnCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ColumnCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ColumnPatch:
+    """
+    list of columns to be added to a table.
+
+    :param str column_name: (optional) Column name.
+    """
+
+    __slots__ = ('column_name',)
+
+    def __init__(
+        self,
+        *,
+        column_name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ColumnPatch object.
+
+        :param str column_name: (optional) Column name.
+        """
+        self.column_name = column_name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ColumnPatch':
+        """Initialize a ColumnPatch object from a json dictionary."""
+        args = {}
+        if (column_name := _dict.get('column_name')) is not None:
+            args['column_name'] = column_name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ColumnPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'column_name') and self.column_name is not None:
+            _dict['column_name'] = self.column_name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this ColumnPatch object as a `dict`."""
+        return {name: getattr(self, name) for name in ColumnPatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ColumnPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ColumnPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ColumnPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class CreateSchemaCreatedBody:
+    """
+    success response.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a CreateSchemaCreatedBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CreateSchemaCreatedBody':
+        """Initialize a CreateSchemaCreatedBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CreateSchemaCreatedBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this CreateSchemaCreatedBody object as a `dict`."""
+        return {name: getattr(self, name) for name in CreateSchemaCreatedBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CreateSchemaCreatedBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CreateSchemaCreatedBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CreateSchemaCreatedBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ListSchemasOKBody:
+    """
+    GetSchemas OK.
+
+    :param SuccessResponse response: Response of success.
+    :param List[str] schemas: Schemas.
+    """
+
+    __slots__ = ('response', 'schemas')
+
+    def __init__(
+        self,
+        response: 'SuccessResponse',
+        schemas: List[str],
+    ) -> None:
+        """
+        Initialize a ListSchemasOKBody object.
+
+        :param SuccessResponse response: Response of success.
+        :param List[str] schemas: Schemas.
+        """
+        self.response = response
+        self.schemas = schemas
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ListSchemasOKBody':
+        """Initialize a ListSchemasOKBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        else:
+            raise ValueError('Required property \'response\' not present in ListSchemasOKBody JSON')
+        if (schemas := _dict.get('schemas')) is not None:
+            args['schemas'] = schemas
+        else:
+            raise ValueError('Required property \'schemas\' not present in ListSchemasOKBody JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ListSchemasOKBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        if hasattr(self, 'schemas') and self.schemas is not None:
+            _dict['schemas'] = self.schemas
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this ListSchemasOKBody object as a `dict`."""
+        return {name: getattr(self, name) for name in ListSchemasOKBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ListSchemasOKBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ListSchemasOKBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ListSchemasOKBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ReplaceSnapshotCreatedBody:
+    """
+    success response.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a ReplaceSnapshotCreatedBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ReplaceSnapshotCreatedBody':
+        """Initialize a ReplaceSnapshotCreatedBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ReplaceSnapshotCreatedBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this ReplaceSnapshotCreatedBody object as a `dict`."""
+        return {name: getattr(self, name) for name in ReplaceSnapshotCreatedBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ReplaceSnapshotCreatedBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ReplaceSnapshotCreatedBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ReplaceSnapshotCreatedBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SyncCatalogs:
+    """
+    catalogs definition.
+
+    :param bool auto_add_new_tables: Auto add new table.
+    :param bool sync_iceberg_md: Sync iceberg metadata.
+    """
+
+    __slots__ = ('auto_add_new_tables', 'sync_iceberg_md')
+
+    def __init__(
+        self,
+        auto_add_new_tables: bool,
+        sync_iceberg_md: bool,
+    ) -> None:
+        """
+        Initialize a SyncCatalogs object.
+
+        :param bool auto_add_new_tables: Auto add new table.
+        :param bool sync_iceberg_md: Sync iceberg metadata.
+        """
+        self.auto_add_new_tables = auto_add_new_tables
+        self.sync_iceberg_md = sync_iceberg_md
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SyncCatalogs':
+        """Initialize a SyncCatalogs object from a json dictionary."""
+        args = {}
+        if (auto_add_new_tables := _dict.get('auto_add_new_tables')) is not None:
+            args['auto_add_new_tables'] = auto_add_new_tables
+        else:
+            raise ValueError('Required property \'auto_add_new_tables\' not present in SyncCatalogs JSON')
+        if (sync_iceberg_md := _dict.get('sync_iceberg_md')) is not None:
+            args['sync_iceberg_md'] = sync_iceberg_md
+        else:
+            raise ValueError('Required property \'sync_iceberg_md\' not present in SyncCatalogs JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SyncCatalogs object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'auto_add_new_tables') and self.auto_add_new_tables is not None:
+            _dict['auto_add_new_tables'] = self.auto_add_new_tables
+        if hasattr(self, 'sync_iceberg_md') and self.sync_iceberg_md is not None:
+            _dict['sync_iceberg_md'] = self.sync_iceberg_md
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SyncCatalogs object as a `dict`."""
+        return {name: getattr(self, name) for name in SyncCatalogs.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SyncCatalogs object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SyncCatalogs') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SyncCatalogs') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Table:
+    """
+    GetColumns OK.
+
+    :param List[Column] columns: (optional) Columns.
+    :param str table_name: (optional) Table name.
+    """
+
+    __slots__ = ('columns', 'table_name')
+
+    def __init__(
+        self,
+        *,
+        columns: Optional[List['Column']] = None,
+        table_name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Table object.
+
+        :param List[Column] columns: (optional) Columns.
+        :param str table_name: (optional) Table name.
+        """
+        self.columns = columns
+        self.table_name = table_name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Table':
+        """Initialize a Table object from a json dictionary."""
+        args = {}
+        if (columns := _dict.get('columns')) is not None:
+            args['columns'] = [Column.from_dict(v) for v in columns]
+        if (table_name := _dict.get('table_name')) is not None:
+            args['table_name'] = table_name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Table object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'columns') and self.columns is not None:
+            columns_list = []
+            for v in self.columns:
+                if isinstance(v, dict):
+                    columns_list.append(v)
+                else:
+                    columns_list.append(v.to_dict())
+            _dict['columns'] = columns_list
+        if hasattr(self, 'table_name') and self.table_name is not None:
+            _dict['table_name'] = self.table_name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Table object as a `dict`."""
+        return {name: getattr(self, name) for name in Table.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Table object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Table') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Table') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class TableCollection:
+    """
+    tables list.
+
+    :param List[str] tables: (optional) List of the tables present in the schema.
+    """
+
+    __slots__ = ('tables',)
+
+    def __init__(
+        self,
+        *,
+        tables: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a TableCollection object.
+
+        :param List[str] tables: (optional) List of the tables present in the
+               schema.
+        """
+        self.tables = tables
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'TableCollection':
+        """Initialize a TableCollection object from a json dictionary."""
+        args = {}
+        if (tables := _dict.get('tables')) is not None:
+            args['tables'] = tables
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a TableCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'tables') and self.tables is not None:
+            _dict['tables'] = self.tables
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this TableCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in TableCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this TableCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'TableCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'TableCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class TablePatch:
+    """
+    UpdateTable body.
+
+    :param str table_name: (optional) New table name.
+    """
+
+    __slots__ = ('table_name',)
+
+    def __init__(
+        self,
+        *,
+        table_name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a TablePatch object.
+
+        :param str table_name: (optional) New table name.
+        """
+        self.table_name = table_name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'TablePatch':
+        """Initialize a TablePatch object from a json dictionary."""
+        args = {}
+        if (table_name := _dict.get('table_name')) is not None:
+            args['table_name'] = table_name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a TablePatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'table_name') and self.table_name is not None:
+            _dict['table_name'] = self.table_name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this TablePatch object as a `dict`."""
+        return {name: getattr(self, name) for name in TablePatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this TablePatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'TablePatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'TablePatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class TableSnapshot:
+    """
+    TableSnapshot.
+
+    :param str committed_at: (optional) Committed at.
+    :param str operation: (optional) Operation.
+    :param str snapshot_id: (optional) Snapshot id.
+    :param str summary: (optional) Summary.
+    """
+
+    __slots__ = ('committed_at', 'operation', 'snapshot_id', 'summary')
+
+    def __init__(
+        self,
+        *,
+        committed_at: Optional[str] = None,
+        operation: Optional[str] = None,
+        snapshot_id: Optional[str] = None,
+        summary: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a TableSnapshot object.
+
+        :param str committed_at: (optional) Committed at.
+        :param str operation: (optional) Operation.
+        :param str snapshot_id: (optional) Snapshot id.
+        :param str summary: (optional) Summary.
+        """
+        self.committed_at = committed_at
+        self.operation = operation
+        self.snapshot_id = snapshot_id
+        self.summary = summary
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'TableSnapshot':
+        """Initialize a TableSnapshot object from a json dictionary."""
+        args = {}
+        if (committed_at := _dict.get('committed_at')) is not None:
+            args['committed_at'] = committed_at
+        if (operation := _dict.get('operation')) is not None:
+            args['operation'] = operation
+        if (snapshot_id := _dict.get('snapshot_id')) is not None:
+            args['snapshot_id'] = snapshot_id
+        if (summary := _dict.get('summary')) is not None:
+            args['summary'] = summary
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a TableSnapshot object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'committed_at') and self.committed_at is not None:
+            _dict['committed_at'] = self.committed_at
+        if hasattr(self, 'operation') and self.operation is not None:
+            _dict['operation'] = self.operation
+        if hasattr(self, 'snapshot_id') and self.snapshot_id is not None:
+            _dict['snapshot_id'] = self.snapshot_id
+        if hasattr(self, 'summary') and self.summary is not None:
+            _dict['summary'] = self.summary
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this TableSnapshot object as a `dict`."""
+        return {name: getattr(self, name) for name in TableSnapshot.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this TableSnapshot object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'TableSnapshot') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'TableSnapshot') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class TableSnapshotCollection:
+    """
+    TableSnapshot OK.
+
+    :param List[TableSnapshot] snapshots: (optional) Snapshots.
+    """
+
+    __slots__ = ('snapshots',)
+
+    def __init__(
+        self,
+        *,
+        snapshots: Optional[List['TableSnapshot']] = None,
+    ) -> None:
+        """
+        Initialize a TableSnapshotCollection object.
+
+        :param List[TableSnapshot] snapshots: (optional) Snapshots.
+        """
+        self.snapshots = snapshots
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'TableSnapshotCollection':
+        """Initialize a TableSnapshotCollection object from a json dictionary."""
+        args = {}
+        if (snapshots := _dict.get('snapshots')) is not None:
+            args['snapshots'] = [TableSnapshot.from_dict(v) for v in snapshots]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a TableSnapshotCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'snapshots') and self.snapshots is not None:
+            snapshots_list = []
+            for v in self.snapshots:
+                if isinstance(v, dict):
+                    snapshots_list.append(v)
+                else:
+                    snapshots_list.append(v.to_dict())
+            _dict['snapshots'] = snapshots_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this TableSnapshotCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in TableSnapshotCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this TableSnapshotCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'TableSnapshotCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'TableSnapshotCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class UpdateSyncCatalogOKBody:
+    """
+    success response.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a UpdateSyncCatalogOKBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'UpdateSyncCatalogOKBody':
+        """Initialize a UpdateSyncCatalogOKBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a UpdateSyncCatalogOKBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this UpdateSyncCatalogOKBody object as a `dict`."""
+        return {name: getattr(self, name) for name in UpdateSyncCatalogOKBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this UpdateSyncCatalogOKBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'UpdateSyncCatalogOKBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'UpdateSyncCatalogOKBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
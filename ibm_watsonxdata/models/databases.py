@@ -0,0 +1,896 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: databases.
+"""
+
+from typing import Dict, List, Optional
+import json
+
+
+class DatabaseCatalog:
+    """
+    database catalog.
+
+    :param str catalog_name: (optional) catalog name.
+    :param List[str] catalog_tags: (optional) catalog tags.
+    :param str catalog_type: (optional) catalog type.
+    """
+
+    __slots__ = ('catalog_name', 'catalog_tags', 'catalog_type')
+
+    def __init__(
+        self,
+        *,
+        catalog_name: Optional[str] = None,
+        catalog_tags: Optional[List[str]] = None,
+        catalog_type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a DatabaseCatalog object.
+
+        :param str catalog_name: (optional) catalog name.
+        :param List[str] catalog_tags: (optional) catalog tags.
+        :param str catalog_type: (optional) catalog type.
+        """
+        self.catalog_name = catalog_name
+        self.catalog_tags = catalog_tags
+        self.catalog_type = catalog_type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseCatalog':
+        """Initialize a DatabaseCatalog object from a json dictionary."""
+        args = {}
+        if (catalog_name := _dict.get('catalog_name')) is not None:
+            args['catalog_name'] = catalog_name
+        if (catalog_tags := _dict.get('catalog_tags')) is not None:
+            args['catalog_tags'] = catalog_tags
+        if (catalog_type := _dict.get('catalog_type')) is not None:
+            args['catalog_type'] = catalog_type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseCatalog object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalog_name') and self.catalog_name is not None:
+            _dict['catalog_name'] = self.catalog_name
+        if hasattr(self, 'catalog_tags') and self.catalog_tags is not None:
+            _dict['catalog_tags'] = self.catalog_tags
+        if hasattr(self, 'catalog_type') and self.catalog_type is not None:
+            _dict['catalog_type'] = self.catalog_type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseCatalog object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseCatalog.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseCatalog object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseCatalog') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseCatalog') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DatabaseDetails:
+    """
+    database details.
+
+    :param str certificate: (optional) contents of a pem/crt file.
+    :param str certificate_extension: (optional) extension of the certificate file.
+    :param str database_name: (optional) Database name.
+    :param str hostname: Host name.
+    :param str hostname_in_certificate: (optional) Hostname in certificate.
+    :param str hosts: (optional) String of hostname:port.
+    :param str password: (optional) Psssword.
+    :param int port: Port.
+    :param bool sasl: (optional) SASL Mode.
+    :param bool ssl: (optional) SSL Mode.
+    :param str tables: (optional) Only for Kafka - Add kafka tables.
+    :param str username: (optional) Username.
+    :param bool validate_server_certificate: (optional) Verify certificate.
+    """
+
+    __slots__ = (
+        'certificate',
+        'certificate_extension',
+        'database_name',
+        'hostname',
+        'hostname_in_certificate',
+        'hosts',
+        'password',
+        'port',
+        'sasl',
+        'ssl',
+        'tables',
+        'username',
+        'validate_server_certificate',
+    )
+
+    def __init__(
+        self,
+        hostname: str,
+        port: int,
+        *,
+        certificate: Optional[str] = None,
+        certificate_extension: Optional[str] = None,
+        database_name: Optional[str] = None,
+        hostname_in_certificate: Optional[str] = None,
+        hosts: Optional[str] = None,
+        password: Optional[str] = None,
+        sasl: Optional[bool] = None,
+        ssl: Optional[bool] = None,
+        tables: Optional[str] = None,
+        username: Optional[str] = None,
+        validate_server_certificate: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize a DatabaseDetails object.
+
+        :param str hostname: Host name.
+        :param int port: Port.
+        :param str certificate: (optional) contents of a pem/crt file.
+        :param str certificate_extension: (optional) extension of the certificate
+               file.
+        :param str database_name: (optional) Database name.
+        :param str hostname_in_certificate: (optional) Hostname in certificate.
+        :param str hosts: (optional) String of hostname:port.
+        :param str password: (optional) Psssword.
+        :param bool sasl: (optional) SASL Mode.
+        :param bool ssl: (optional) SSL Mode.
+        :param str tables: (optional) Only for Kafka - Add kafka tables.
+        :param str username: (optional) Username.
+        :param bool validate_server_certificate: (optional) Verify certificate.
+        """
+        self.certificate = certificate
+        self.certificate_extension = certificate_extension
+        self.database_name = database_name
+        self.hostname = hostname
+        self.hostname_in_certificate = hostname_in_certificate
+        self.hosts = hosts
+        self.password = password
+        self.port = port
+        self.sasl = sasl
+        self.ssl = ssl
+        self.tables = tables
+        self.username = username
+        self.validate_server_certificate = validate_server_certificate
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseDetails':
+        """Initialize a DatabaseDetails object from a json dictionary."""
+        args = {}
+        if (certificate := _dict.get('certificate')) is not None:
+            args['certificate'] = certificate
+        if (certificate_extension := _dict.get('certificate_extension')) is not None:
+            args['certificate_extension'] = certificate_extension
+        if (database_name := _dict.get('database_name')) is not None:
+            args['database_name'] = database_name
+        if (hostname := _dict.get('hostname')) is not None:
+            args['hostname'] = hostname
+        else:
+            raise ValueError('Required property \'hostname\' not present in DatabaseDetails JSON')
+        if (hostname_in_certificate := _dict.get('hostname_in_certificate')) is not None:
+            args['hostname_in_certificate'] = hostname_in_certificate
+        if (hosts := _dict.get('hosts')) is not None:
+            args['hosts'] = hosts
+        if (password := _dict.get('password')) is not None:
+            args['password'] = password
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        else:
+            raise ValueError('Required property \'port\' not present in DatabaseDetails JSON')
+        if (sasl := _dict.get('sasl')) is not None:
+            args['sasl'] = sasl
+        if (ssl := _dict.get('ssl')) is not None:
+            args['ssl'] = ssl
+        if (tables := _dict.get('tables')) is not None:
+            args['tables'] = tables
+        if (username := _dict.get('username')) is not None:
+            args['username'] = username
+        if (validate_server_certificate := _dict.get('validate_server_certificate')) is not None:
+            args['validate_server_certificate'] = validate_server_certificate
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'certificate') and self.certificate is not None:
+            _dict['certificate'] = self.certificate
+        if hasattr(self, 'certificate_extension') and self.certificate_extension is not None:
+            _dict['certificate_extension'] = self.certificate_extension
+        if hasattr(self, 'database_name') and self.database_name is not None:
+            _dict['database_name'] = self.database_name
+        if hasattr(self, 'hostname') and self.hostname is not None:
+            _dict['hostname'] = self.hostname
+        if hasattr(self, 'hostname_in_certificate') and self.hostname_in_certificate is not None:
+            _dict['hostname_in_certificate'] = self.hostname_in_certificate
+        if hasattr(self, 'hosts') and self.hosts is not None:
+            _dict['hosts'] = self.hosts
+        if hasattr(self, 'password') and self.password is not None:
+            _dict['password'] = self.password
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'sasl') and self.sasl is not None:
+            _dict['sasl'] = self.sasl
+        if hasattr(self, 'ssl') and self.ssl is not None:
+            _dict['ssl'] = self.ssl
+        if hasattr(self, 'tables') and self.tables is not None:
+            _dict['tables'] = self.tables
+        if hasattr(self, 'username') and self.username is not None:
+            _dict['username'] = self.username
+        if hasattr(self, 'validate_server_certificate') and self.validate_server_certificate is not None:
+            _dict['validate_server_certificate'] = self.validate_server_certificate
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DatabaseRegistration:
+    """
+    database registration object.
+
+    :param List[str] actions: (optional) actions.
+    :param DatabaseCatalog associated_catalog: (optional) database catalog.
+    :param str catalog_name: (optional) Catalog name.
+    :param str created_by: (optional) Created by.
+    :param str created_on: (optional) Created on.
+    :param DatabaseDetails database_details: database details.
+    :param str database_display_name: Database display name.
+    :param str database_id: (optional) Database ID.
+    :param List[DatabaseRegistrationDatabasePropertiesItems] database_properties:
+          (optional) This will hold all the properties for a custom database.
+    :param str database_type: Connector type.
+    :param str description: (optional) Database description.
+    :param List[str] tags: (optional) tags.
+    """
+
+    __slots__ = (
+        'actions',
+        'associated_catalog',
+        'catalog_name',
+        'created_by',
+        'created_on',
+        'database_details',
+        'database_display_name',
+        'database_id',
+        'database_properties',
+        'database_type',
+        'description',
+        'tags',
+    )
+
+    def __init__(
+        self,
+        database_details: 'DatabaseDetails',
+        database_display_name: str,
+        database_type: str,
+        *,
+        actions: Optional[List[str]] = None,
+        associated_catalog: Optional['DatabaseCatalog'] = None,
+        catalog_name: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[str] = None,
+        database_id: Optional[str] = None,
+        database_properties: Optional[List['DatabaseRegistrationDatabasePropertiesItems']] = None,
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a DatabaseRegistration object.
+
+        :param DatabaseDetails database_details: database details.
+        :param str database_display_name: Database display name.
+        :param str database_type: Connector type.
+        :param List[str] actions: (optional) actions.
+        :param DatabaseCatalog associated_catalog: (optional) database catalog.
+        :param str catalog_name: (optional) Catalog name.
+        :param str created_by: (optional) Created by.
+        :param str created_on: (optional) Created on.
+        :param str database_id: (optional) Database ID.
+        :param List[DatabaseRegistrationDatabasePropertiesItems]
+               database_properties: (optional) This will hold all the properties for a
+               custom database.
+        :param str description: (optional) Database description.
+        :param List[str] tags: (optional) tags.
+        """
+        self.actions = actions
+        self.associated_catalog = associated_catalog
+        self.catalog_name = catalog_name
+        self.created_by = created_by
+        self.created_on = created_on
+        self.database_details = database_details
+        self.database_display_name = database_display_name
+        self.database_id = database_id
+        self.database_properties = database_properties
+        self.database_type = database_type
+        self.description = description
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseRegistration':
+        """Initialize a DatabaseRegistration object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (associated_catalog := _dict.get('associated_catalog')) is not None:
+            args['associated_catalog'] = DatabaseCatalog.from_dict(associated_catalog)
+        if (catalog_name := _dict.get('catalog_name')) is not None:
+            args['catalog_name'] = catalog_name
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (database_details := _dict.get('database_details')) is not None:
+            args['database_details'] = DatabaseDetails.from_dict(database_details)
+        else:
+            raise ValueError('Required property \'database_details\' not present in DatabaseRegistration JSON')
+        if (database_display_name := _dict.get('database_display_name')) is not None:
+            args['database_display_name'] = database_display_name
+        else:
+            raise ValueError('Required property \'database_display_name\' not present in DatabaseRegistration JSON')
+        if (database_id := _dict.get('database_id')) is not None:
+            args['database_id'] = database_id
+        if (database_properties := _dict.get('database_properties')) is not None:
+            args['database_properties'] = [
+                DatabaseRegistrationDatabasePropertiesItems.from_dict(v) for v in database_properties
+            ]
+        if (database_type := _dict.get('database_type')) is not None:
+            args['database_type'] = database_type
+        else:
+            raise ValueError('Required property \'database_type\' not present in DatabaseRegistration JSON')
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseRegistration object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'associated_catalog') and self.associated_catalog is not None:
+            if isinstance(self.associated_catalog, dict):
+                _dict['associated_catalog'] = self.associated_catalog
+            else:
+                _dict['associated_catalog'] = self.associated_catalog.to_dict()
+        if hasattr(self, 'catalog_name') and self.catalog_name is not None:
+            _dict['catalog_name'] = self.catalog_name
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'database_details') and self.database_details is not None:
+            if isinstance(self.database_details, dict):
+                _dict['database_details'] = self.database_details
+            else:
+                _dict['database_details'] = self.database_details.to_dict()
+        if hasattr(self, 'database_display_name') and self.database_display_name is not None:
+            _dict['database_display_name'] = self.database_display_name
+        if hasattr(self, 'database_id') and self.database_id is not None:
+            _dict['database_id'] = self.database_id
+        if hasattr(self, 'database_properties') and self.database_properties is not None:
+            database_properties_list = []
+            for v in self.database_properties:
+                if isinstance(v, dict):
+                    database_properties_list.append(v)
+                else:
+                    database_properties_list.append(v.to_dict())
+            _dict['database_properties'] = database_properties_list
+        if hasattr(self, 'database_type') and self.database_type is not None:
+            _dict['database_type'] = self.database_type
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseRegistration object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseRegistration.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseRegistration object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseRegistration') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseRegistration') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DatabaseRegistrationCollection:
+    """
+    list database registrations.
+
+    :param List[DatabaseRegistration] database_registrations: (optional) Database
+          body.
+    """
+
+    __slots__ = ('database_registrations',)
+
+    def __init__(
+        self,
+        *,
+        database_registrations: Optional[List['DatabaseRegistration']] = None,
+    ) -> None:
+        """
+        Initialize a DatabaseRegistrationCollection object.
+
+        :param List[DatabaseRegistration] database_registrations: (optional)
+               Database body.
+        """
+        self.database_registrations = database_registrations
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseRegistrationCollection':
+        """Initialize a DatabaseRegistrationCollection object from a json dictionary."""
+        args = {}
+        if (database_registrations := _dict.get('database_registrations')) is not None:
+            args['database_registrations'] = [DatabaseRegistration.from_dict(v) for v in database_registrations]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseRegistrationCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'database_registrations') and self.database_registrations is not None:
+            database_registrations_list = []
+            for v in self.database_registrations:
+                if isinstance(v, dict):
+                    database_registrations_list.append(v)
+                else:
+                    database_registrations_list.append(v.to_dict())
+            _dict['database_registrations'] = database_registrations_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseRegistrationCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseRegistrationCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseRegistrationCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseRegistrationCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseRegistrationCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DatabaseRegistrationDatabasePropertiesItems:
+    """
+    Key value object.
+
+    :param bool encrypt: Wether the value is to be encrypted before storing.
+    :param str key: Key of the database property.
+    :param str value: Value of the database property.
+    """
+
+    __slots__ = ('encrypt', 'key', 'value')
+
+    def __init__(
+        self,
+        encrypt: bool,
+        key: str,
+        value: str,
+    ) -> None:
+        """
+        Initialize a DatabaseRegistrationDatabasePropertiesItems object.
+
+        :param bool encrypt: Wether the value is to be encrypted before storing.
+        :param str key: Key of the database property.
+        :param str value: Value of the database property.
+        """
+        self.encrypt = encrypt
+        self.key = key
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseRegistrationDatabasePropertiesItems':
+        """Initialize a DatabaseRegistrationDatabasePropertiesItems object from a json dictionary."""
+        args = {}
+        if (encrypt := _dict.get('encrypt')) is not None:
+            args['encrypt'] = encrypt
+        else:
+            raise ValueError(
+                'Required property \'encrypt\' not present in DatabaseRegistrationDatabasePropertiesItems JSON'
+            )
+        if (key := _dict.get('key')) is not None:
+            args['key'] = key
+        else:
+            raise ValueError(
+                'Required property \'key\' not present in DatabaseRegistrationDatabasePropertiesItems JSON'
+            )
+        if (value := _dict.get('value')) is not None:
+            args['value'] = value
+        else:
+            raise ValueError(
+                'Required property \'value\' not present in DatabaseRegistrationDatabasePropertiesItems JSON'
+            )
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseRegistrationDatabasePropertiesItems object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'encrypt') and self.encrypt is not None:
+            _dict['encrypt'] = self.encrypt
+        if hasattr(self, 'key') and self.key is not None:
+            _dict['key'] = self.key
+        if hasattr(self, 'value') and self.value is not None:
+            _dict['value'] = self.value
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseRegistrationDatabasePropertiesItems object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseRegistrationDatabasePropertiesItems.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseRegistrationDatabasePropertiesItems object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseRegistrationDatabasePropertiesItems') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseRegistrationDatabasePropertiesItems') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DatabaseRegistrationPatch:
+    """
+    update db body.
+
+    :param DatabaseRegistrationPatchDatabaseDetails database_details: (optional) New
+          database details.
+    :param str database_display_name: (optional) New database display name.
+    :param str description: (optional) New database description.
+    :param List[str] tags: (optional) New tags.
+    """
+
+    __slots__ = ('database_details', 'database_display_name', 'description', 'tags')
+
+    def __init__(
+        self,
+        *,
+        database_details: Optional['DatabaseRegistrationPatchDatabaseDetails'] = None,
+        database_display_name: Optional[str] = None,
+        description: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a DatabaseRegistrationPatch object.
+
+        :param DatabaseRegistrationPatchDatabaseDetails database_details:
+               (optional) New database details.
+        :param str database_display_name: (optional) New database display name.
+        :param str description: (optional) New database description.
+        :param List[str] tags: (optional) New tags.
+        """
+        self.database_details = database_details
+        self.database_display_name = database_display_name
+        self.description = description
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseRegistrationPatch':
+        """Initialize a DatabaseRegistrationPatch object from a json dictionary."""
+        args = {}
+        if (database_details := _dict.get('database_details')) is not None:
+            args['database_details'] = DatabaseRegistrationPatchDatabaseDetails.from_dict(database_details)
+        if (database_display_name := _dict.get('database_display_name')) is not None:
+            args['database_display_name'] = database_display_name
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseRegistrationPatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'database_details') and self.database_details is not None:
+            if isinstance(self.database_details, dict):
+                _dict['database_details'] = self.database_details
+            else:
+                _dict['database_details'] = self.database_details.to_dict()
+        if hasattr(self, 'database_display_name') and self.database_display_name is not None:
+            _dict['database_display_name'] = self.database_display_name
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseRegistrationPatch object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseRegistrationPatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseRegistrationPatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseRegistrationPatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseRegistrationPatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DatabaseRegistrationPatchDatabaseDetails:
+    """
+    New database details.
+
+    :param str password: (optional) New password.
+    :param str username: (optional) New username.
+    """
+
+    __slots__ = ('password', 'username')
+
+    def __init__(
+        self,
+        *,
+        password: Optional[str] = None,
+        username: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a DatabaseRegistrationPatchDatabaseDetails object.
+
+        :param str password: (optional) New password.
+        :param str username: (optional) New username.
+        """
+        self.password = password
+        self.username = username
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseRegistrationPatchDatabaseDetails':
+        """Initialize a DatabaseRegistrationPatchDatabaseDetails object from a json dictionary."""
+        args = {}
+        if (password := _dict.get('password')) is not None:
+            args['password'] = password
+        if (username := _dict.get('username')) is not None:
+            args['username'] = username
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseRegistrationPatchDatabaseDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'password') and self.password is not None:
+            _dict['password'] = self.password
+        if hasattr(self, 'username') and self.username is not None:
+            _dict['username'] = self.username
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseRegistrationPatchDatabaseDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseRegistrationPatchDatabaseDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseRegistrationPatchDatabaseDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseRegistrationPatchDatabaseDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseRegistrationPatchDatabaseDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class DatabaseRegistrationPrototypeDatabasePropertiesItems:
+    """
+    Key value object.
+
+    :param bool encrypt: Wether the value is to be encrypted before storing.
+    :param str key: Key of the database property.
+    :param str value: Value of the database property.
+    """
+
+    __slots__ = ('encrypt', 'key', 'value')
+
+    def __init__(
+        self,
+        encrypt: bool,
+        key: str,
+        value: str,
+    ) -> None:
+        """
+        Initialize a DatabaseRegistrationPrototypeDatabasePropertiesItems object.
+
+        :param bool encrypt: Wether the value is to be encrypted before storing.
+        :param str key: Key of the database property.
+        :param str value: Value of the database property.
+        """
+        self.encrypt = encrypt
+        self.key = key
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DatabaseRegistrationPrototypeDatabasePropertiesItems':
+        """Initialize a DatabaseRegistrationPrototypeDatabasePropertiesItems object from a json dictionary."""
+        args = {}
+        if (encrypt := _dict.get('encrypt')) is not None:
+            args['encrypt'] = encrypt
+        else:
+            raise ValueError(
+                'Required property \'encrypt\' not present in DatabaseRegistrationPrototypeDatabasePropertiesItems JSON'
+            )
+        if (key := _dict.get('key')) is not None:
+            args['key'] = key
+        else:
+            raise ValueError(
+                'Required property \'key\' not present in DatabaseRegistrationPrototypeDatabasePropertiesItems JSON'
+            )
+        if (value := _dict.get('value')) is not None:
+            args['value'] = value
+        else:
+            raise ValueError(
+                'Required property \'value\' not present in DatabaseRegistrationPrototypeDatabasePropertiesItems JSON'
+            )
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DatabaseRegistrationPrototypeDatabasePropertiesItems object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'encrypt') and self.encrypt is not None:
+            _dict['encrypt'] = self.encrypt
+        if hasattr(self, 'key') and self.key is not None:
+            _dict['key'] = self.key
+        if hasattr(self, 'value') and self.value is not None:
+            _dict['value'] = self.value
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DatabaseRegistrationPrototypeDatabasePropertiesItems object as a `dict`."""
+        return {name: getattr(self, name) for name in DatabaseRegistrationPrototypeDatabasePropertiesItems.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DatabaseRegistrationPrototypeDatabasePropertiesItems object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DatabaseRegistrationPrototypeDatabasePropertiesItems') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DatabaseRegistrationPrototypeDatabasePropertiesItems') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
@@ -0,0 +1,5013 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: engines (Db2, Netezza, other, Presto and Prestissimo).
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from .shared import SuccessResponse
+
+
+class CreateEnginePauseCreatedBody:
+    """
+    Pause.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a CreateEnginePauseCreatedBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CreateEnginePauseCreatedBody':
+        """Initialize a CreateEnginePauseCreatedBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CreateEnginePauseCreatedBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this CreateEnginePauseCreatedBody object as a `dict`."""
+        return {name: getattr(self, name) for name in CreateEnginePauseCreatedBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CreateEnginePauseCreatedBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CreateEnginePauseCreatedBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CreateEnginePauseCreatedBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class CreateEngineRestartCreatedBody:
+    """
+    restart engine.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a CreateEngineRestartCreatedBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CreateEngineRestartCreatedBody':
+        """Initialize a CreateEngineRestartCreatedBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CreateEngineRestartCreatedBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this CreateEngineRestartCreatedBody object as a `dict`."""
+        return {name: getattr(self, name) for name in CreateEngineRestartCreatedBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CreateEngineRestartCreatedBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CreateEngineRestartCreatedBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CreateEngineRestartCreatedBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class CreateEngineResumeCreatedBody:
+    """
+    resume.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a CreateEngineResumeCreatedBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CreateEngineResumeCreatedBody':
+        """Initialize a CreateEngineResumeCreatedBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CreateEngineResumeCreatedBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this CreateEngineResumeCreatedBody object as a `dict`."""
+        return {name: getattr(self, name) for name in CreateEngineResumeCreatedBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CreateEngineResumeCreatedBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CreateEngineResumeCreatedBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CreateEngineResumeCreatedBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class CreateEngineScaleCreatedBody:
+    """
+    scale engine.
+
+    :param SuccessResponse response: (optional) Response of success.
+    """
+
+    __slots__ = ('response',)
+
+    def __init__(
+        self,
+        *,
+        response: Optional['SuccessResponse'] = None,
+    ) -> None:
+        """
+        Initialize a CreateEngineScaleCreatedBody object.
+
+        :param SuccessResponse response: (optional) Response of success.
+        """
+        self.response = response
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'CreateEngineScaleCreatedBody':
+        """Initialize a CreateEngineScaleCreatedBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a CreateEngineScaleCreatedBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this CreateEngineScaleCreatedBody object as a `dict`."""
+        return {name: getattr(self, name) for name in CreateEngineScaleCreatedBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this CreateEngineScaleCreatedBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'CreateEngineScaleCreatedBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'CreateEngineScaleCreatedBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Db2Engine:
+    """
+    Db2 engine details.
+
+    :param List[str] actions: (optional) Actions.
+    :param str build_version: (optional) watsonx.data build version.
+    :param str created_by: (optional) Created user name.
+    :param int created_on: (optional) Created time in epoch format.
+    :param str description: (optional) Engine description.
+    :param Db2EngineDetails engine_details: (optional) External engine details.
+    :param str engine_display_name: (optional) Engine display name.
+    :param str engine_id: (optional) Engine programmatic name.
+    :param str host_name: (optional) Engine host name. In case of OCP based
+          clusters, this is internal hostname.
+    :param str origin: (optional) Origin - place holder.
+    :param int port: (optional) Engine port.
+    :param str status: (optional) Engine status.
+    :param List[str] tags: (optional) Tags.
+    :param str type: (optional) Engine type.
+    """
+
+    __slots__ = (
+        'actions',
+        'build_version',
+        'created_by',
+        'created_on',
+        'description',
+        'engine_details',
+        'engine_display_name',
+        'engine_id',
+        'host_name',
+        'origin',
+        'port',
+        'status',
+        'tags',
+        'type',
+    )
+
+    def __init__(
+        self,
+        *,
+        actions: Optional[List[str]] = None,
+        build_version: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[int] = None,
+        description: Optional[str] = None,
+        engine_details: Optional['Db2EngineDetails'] = None,
+        engine_display_name: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        host_name: Optional[str] = None,
+        origin: Optional[str] = None,
+        port: Optional[int] = None,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Db2Engine object.
+
+        :param List[str] actions: (optional) Actions.
+        :param str build_version: (optional) watsonx.data build version.
+        :param str created_by: (optional) Created user name.
+        :param int created_on: (optional) Created time in epoch format.
+        :param str description: (optional) Engine description.
+        :param Db2EngineDetails engine_details: (optional) External engine details.
+        :param str engine_display_name: (optional) Engine display name.
+        :param str engine_id: (optional) Engine programmatic name.
+        :param str host_name: (optional) Engine host name. In case of OCP based
+               clusters, this is internal hostname.
+        :param str origin: (optional) Origin - place holder.
+        :param int port: (optional) Engine port.
+        :param str status: (optional) Engine status.
+        :param List[str] tags: (optional) Tags.
+        :param str type: (optional) Engine type.
+        """
+        self.actions = actions
+        self.build_version = build_version
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.engine_details = engine_details
+        self.engine_display_name = engine_display_name
+        self.engine_id = engine_id
+        self.host_name = host_name
+        self.origin = origin
+        self.port = port
+        self.status = status
+        self.tags = tags
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Db2Engine':
+        """Initialize a Db2Engine object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (build_version := _dict.get('build_version')) is not None:
+            args['build_version'] = build_version
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_details := _dict.get('engine_details')) is not None:
+            args['engine_details'] = Db2EngineDetails.from_dict(engine_details)
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_id := _dict.get('engine_id')) is not None:
+            args['engine_id'] = engine_id
+        if (host_name := _dict.get('host_name')) is not None:
+            args['host_name'] = host_name
+        if (origin := _dict.get('origin')) is not None:
+            args['origin'] = origin
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Db2Engine object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'build_version') and self.build_version is not None:
+            _dict['build_version'] = self.build_version
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_details') and self.engine_details is not None:
+            if isinstance(self.engine_details, dict):
+                _dict['engine_details'] = self.engine_details
+            else:
+                _dict['engine_details'] = self.engine_details.to_dict()
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_id') and self.engine_id is not None:
+            _dict['engine_id'] = self.engine_id
+        if hasattr(self, 'host_name') and self.host_name is not None:
+            _dict['host_name'] = self.host_name
+        if hasattr(self, 'origin') and self.origin is not None:
+            _dict['origin'] = self.origin
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Db2Engine object as a `dict`."""
+        return {name: getattr(self, name) for name in Db2Engine.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Db2Engine object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Db2Engine') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Db2Engine') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Db2EngineCollection:
+    """
+    list db2 engines.
+
+    :param List[Db2Engine] db2_engines: (optional) list db2 engines.
+    """
+
+    __slots__ = ('db2_engines',)
+
+    def __init__(
+        self,
+        *,
+        db2_engines: Optional[List['Db2Engine']] = None,
+    ) -> None:
+        """
+        Initialize a Db2EngineCollection object.
+
+        :param List[Db2Engine] db2_engines: (optional) list db2 engines.
+        """
+        self.db2_engines = db2_engines
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Db2EngineCollection':
+        """Initialize a Db2EngineCollection object from a json dictionary."""
+        args = {}
+        if (db2_engines := _dict.get('db2_engines')) is not None:
+            args['db2_engines'] = [Db2Engine.from_dict(v) for v in db2_engines]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Db2EngineCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'db2_engines') and self.db2_engines is not None:
+            db2_engines_list = []
+            for v in self.db2_engines:
+                if isinstance(v, dict):
+                    db2_engines_list.append(v)
+                else:
+                    db2_engines_list.append(v.to_dict())
+            _dict['db2_engines'] = db2_engines_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Db2EngineCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in Db2EngineCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Db2EngineCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Db2EngineCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Db2EngineCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Db2EngineDetails:
+    """
+    External engine details.
+
+    :param str connection_string: (optional) External engine connection string.
+    :param str metastore_host: (optional) Metastore host.
+    """
+
+    __slots__ = ('connection_string', 'metastore_host')
+
+    def __init__(
+        self,
+        *,
+        connection_string: Optional[str] = None,
+        metastore_host: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Db2EngineDetails object.
+
+        :param str connection_string: (optional) External engine connection string.
+        :param str metastore_host: (optional) Metastore host.
+        """
+        self.connection_string = connection_string
+        self.metastore_host = metastore_host
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Db2EngineDetails':
+        """Initialize a Db2EngineDetails object from a json dictionary."""
+        args = {}
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        if (metastore_host := _dict.get('metastore_host')) is not None:
+            args['metastore_host'] = metastore_host
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Db2EngineDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'metastore_host') and self.metastore_host is not None:
+            _dict['metastore_host'] = self.metastore_host
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Db2EngineDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in Db2EngineDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Db2EngineDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Db2EngineDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Db2EngineDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Db2EngineDetailsBody:
+    """
+    External engine details.
+
+    :param str connection_string: (optional) External engine connection string.
+    """
+
+    __slots__ = ('connection_string',)
+
+    def __init__(
+        self,
+        *,
+        connection_string: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Db2EngineDetailsBody object.
+
+        :param str connection_string: (optional) External engine connection string.
+        """
+        self.connection_string = connection_string
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Db2EngineDetailsBody':
+        """Initialize a Db2EngineDetailsBody object from a json dictionary."""
+        args = {}
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Db2EngineDetailsBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Db2EngineDetailsBody object as a `dict`."""
+        return {name: getattr(self, name) for name in Db2EngineDetailsBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Db2EngineDetailsBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Db2EngineDetailsBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Db2EngineDetailsBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Db2EnginePatch:
+    """
+    UpdateEngine body.
+
+    :param str description: (optional) Modified description.
+    :param str engine_display_name: (optional) Engine display name.
+    :param List[str] tags: (optional) Tags.
+    """
+
+    __slots__ = ('description', 'engine_display_name', 'tags')
+
+    def __init__(
+        self,
+        *,
+        description: Optional[str] = None,
+        engine_display_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a Db2EnginePatch object.
+
+        :param str description: (optional) Modified description.
+        :param str engine_display_name: (optional) Engine display name.
+        :param List[str] tags: (optional) Tags.
+        """
+        self.description = description
+        self.engine_display_name = engine_display_name
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Db2EnginePatch':
+        """Initialize a Db2EnginePatch object from a json dictionary."""
+        args = {}
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Db2EnginePatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Db2EnginePatch object as a `dict`."""
+        return {name: getattr(self, name) for name in Db2EnginePatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Db2EnginePatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Db2EnginePatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Db2EnginePatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class Driver:
+    """
+    Driver.
+
+    :param str connection_type: (optional) Connection type.
+    :param str driver_id: (optional) Driver name.
+    :param str driver_name: (optional) Driver name.
+    :param str driver_version: (optional) Driver version.
+    """
+
+    __slots__ = ('connection_type', 'driver_id', 'driver_name', 'driver_version')
+
+    def __init__(
+        self,
+        *,
+        connection_type: Optional[str] = None,
+        driver_id: Optional[str] = None,
+        driver_name: Optional[str] = None,
+        driver_version: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a Driver object.
+
+        :param str connection_type: (optional) Connection type.
+        :param str driver_id: (optional) Driver name.
+        :param str driver_name: (optional) Driver name.
+        :param str driver_version: (optional) Driver version.
+        """
+        self.connection_type = connection_type
+        self.driver_id = driver_id
+        self.driver_name = driver_name
+        self.driver_version = driver_version
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'Driver':
+        """Initialize a Driver object from a json dictionary."""
+        args = {}
+        if (connection_type := _dict.get('connection_type')) is not None:
+            args['connection_type'] = connection_type
+        if (driver_id := _dict.get('driver_id')) is not None:
+            args['driver_id'] = driver_id
+        if (driver_name := _dict.get('driver_name')) is not None:
+            args['driver_name'] = driver_name
+        if (driver_version := _dict.get('driver_version')) is not None:
+            args['driver_version'] = driver_version
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a Driver object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'connection_type') and self.connection_type is not None:
+            _dict['connection_type'] = self.connection_type
+        if hasattr(self, 'driver_id') and self.driver_id is not None:
+            _dict['driver_id'] = self.driver_id
+        if hasattr(self, 'driver_name') and self.driver_name is not None:
+            _dict['driver_name'] = self.driver_name
+        if hasattr(self, 'driver_version') and self.driver_version is not None:
+            _dict['driver_version'] = self.driver_version
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this Driver object as a `dict`."""
+        return {name: getattr(self, name) for name in Driver.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this Driver object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'Driver') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'Driver') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class EngineDetailsBody:
+    """
+    Node details.
+
+    :param str api_key: (optional) api key to work with the saas IAE instance.
+    :param str connection_string: (optional) External engine connection string.
+    :param NodeDescriptionBody coordinator: (optional) coordinator/worker property
+          settings.
+    :param str instance_id: (optional) Instance to access the instance.
+    :param str managed_by: (optional) How is the spark instance managed.
+    :param str size_config: (optional) Size config.
+    :param NodeDescriptionBody worker: (optional) coordinator/worker property
+          settings.
+    """
+
+    __slots__ = ('api_key', 'connection_string', 'coordinator', 'instance_id', 'managed_by', 'size_config', 'worker')
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        connection_string: Optional[str] = None,
+        coordinator: Optional['NodeDescriptionBody'] = None,
+        instance_id: Optional[str] = None,
+        managed_by: Optional[str] = None,
+        size_config: Optional[str] = None,
+        worker: Optional['NodeDescriptionBody'] = None,
+    ) -> None:
+        """
+        Initialize a EngineDetailsBody object.
+
+        :param str api_key: (optional) api key to work with the saas IAE instance.
+        :param str connection_string: (optional) External engine connection string.
+        :param NodeDescriptionBody coordinator: (optional) coordinator/worker
+               property settings.
+        :param str instance_id: (optional) Instance to access the instance.
+        :param str managed_by: (optional) How is the spark instance managed.
+        :param str size_config: (optional) Size config.
+        :param NodeDescriptionBody worker: (optional) coordinator/worker property
+               settings.
+        """
+        self.api_key = api_key
+        self.connection_string = connection_string
+        self.coordinator = coordinator
+        self.instance_id = instance_id
+        self.managed_by = managed_by
+        self.size_config = size_config
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EngineDetailsBody':
+        """Initialize a EngineDetailsBody object from a json dictionary."""
+        args = {}
+        if (api_key := _dict.get('api_key')) is not None:
+            args['api_key'] = api_key
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = NodeDescriptionBody.from_dict(coordinator)
+        if (instance_id := _dict.get('instance_id')) is not None:
+            args['instance_id'] = instance_id
+        if (managed_by := _dict.get('managed_by')) is not None:
+            args['managed_by'] = managed_by
+        if (size_config := _dict.get('size_config')) is not None:
+            args['size_config'] = size_config
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = NodeDescriptionBody.from_dict(worker)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EngineDetailsBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'api_key') and self.api_key is not None:
+            _dict['api_key'] = self.api_key
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        if hasattr(self, 'instance_id') and self.instance_id is not None:
+            _dict['instance_id'] = self.instance_id
+        if hasattr(self, 'managed_by') and self.managed_by is not None:
+            _dict['managed_by'] = self.managed_by
+        if hasattr(self, 'size_config') and self.size_config is not None:
+            _dict['size_config'] = self.size_config
+        if hasattr(self, 'worker') and self.worker is not None:
+            if isinstance(self.worker, dict):
+                _dict['worker'] = self.worker
+            else:
+                _dict['worker'] = self.worker.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this EngineDetailsBody object as a `dict`."""
+        return {name: getattr(self, name) for name in EngineDetailsBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EngineDetailsBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EngineDetailsBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EngineDetailsBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class SizeConfigEnum(str, Enum):
+        """
+        Size config.
+        """
+
+        STARTER = 'starter'
+        CACHE_OPTIMIZED = 'cache_optimized'
+        COMPUTE_OPTIMIZED = 'compute_optimized'
+        SMALL = 'small'
+        MEDIUM = 'medium'
+        LARGE = 'large'
+        CUSTOM = 'custom'
+
+
+class EnginePropertiesOaiGen1Configuration:
+    """
+    Configuration settings.
+
+    :param NodeDescriptionBody coordinator: (optional) coordinator/worker property
+          settings.
+    :param NodeDescriptionBody worker: (optional) coordinator/worker property
+          settings.
+    """
+
+    __slots__ = ('coordinator', 'worker')
+
+    def __init__(
+        self,
+        *,
+        coordinator: Optional['NodeDescriptionBody'] = None,
+        worker: Optional['NodeDescriptionBody'] = None,
+    ) -> None:
+        """
+        Initialize a EnginePropertiesOaiGen1Configuration object.
+
+        :param NodeDescriptionBody coordinator: (optional) coordinator/worker
+               property settings.
+        :param NodeDescriptionBody worker: (optional) coordinator/worker property
+               settings.
+        """
+        self.coordinator = coordinator
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EnginePropertiesOaiGen1Configuration':
+        """Initialize a EnginePropertiesOaiGen1Configuration object from a json dictionary."""
+        args = {}
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = NodeDescriptionBody.from_dict(coordinator)
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = NodeDescriptionBody.from_dict(worker)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EnginePropertiesOaiGen1Configuration object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        if hasattr(self, 'worker') and self.worker is not None:
+            if isinstance(self.worker, dict):
+                _dict['worker'] = self.worker
+            else:
+                _dict['worker'] = self.worker.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this EnginePropertiesOaiGen1Configuration object as a `dict`."""
+        return {name: getattr(self, name) for name in EnginePropertiesOaiGen1Configuration.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EnginePropertiesOaiGen1Configuration object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EnginePropertiesOaiGen1Configuration') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EnginePropertiesOaiGen1Configuration') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class EnginePropertiesOaiGen1Jvm:
+    """
+    JVM settings.
+
+    :param NodeDescriptionBody coordinator: (optional) coordinator/worker property
+          settings.
+    :param NodeDescriptionBody worker: (optional) coordinator/worker property
+          settings.
+    """
+
+    __slots__ = ('coordinator', 'worker')
+
+    def __init__(
+        self,
+        *,
+        coordinator: Optional['NodeDescriptionBody'] = None,
+        worker: Optional['NodeDescriptionBody'] = None,
+    ) -> None:
+        """
+        Initialize a EnginePropertiesOaiGen1Jvm object.
+
+        :param NodeDescriptionBody coordinator: (optional) coordinator/worker
+               property settings.
+        :param NodeDescriptionBody worker: (optional) coordinator/worker property
+               settings.
+        """
+        self.coordinator = coordinator
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EnginePropertiesOaiGen1Jvm':
+        """Initialize a EnginePropertiesOaiGen1Jvm object from a json dictionary."""
+        args = {}
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = NodeDescriptionBody.from_dict(coordinator)
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = NodeDescriptionBody.from_dict(worker)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EnginePropertiesOaiGen1Jvm object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        if hasattr(self, 'worker') and self.worker is not None:
+            if isinstance(self.worker, dict):
+                _dict['worker'] = self.worker
+            else:
+                _dict['worker'] = self.worker.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this EnginePropertiesOaiGen1Jvm object as a `dict`."""
+        return {name: getattr(self, name) for name in EnginePropertiesOaiGen1Jvm.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EnginePropertiesOaiGen1Jvm object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EnginePropertiesOaiGen1Jvm') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EnginePropertiesOaiGen1Jvm') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class EnginePropertiesOaiGenConfiguration:
+    """
+    Configuration settings for the engine properties.
+
+    :param PrestissimoNodeDescriptionBody coordinator: (optional) Node details.
+    :param PrestissimoNodeDescriptionBody worker: (optional) Node details.
+    """
+
+    __slots__ = ('coordinator', 'worker')
+
+    def __init__(
+        self,
+        *,
+        coordinator: Optional['PrestissimoNodeDescriptionBody'] = None,
+        worker: Optional['PrestissimoNodeDescriptionBody'] = None,
+    ) -> None:
+        """
+        Initialize a EnginePropertiesOaiGenConfiguration object.
+
+        :param PrestissimoNodeDescriptionBody coordinator: (optional) Node details.
+        :param PrestissimoNodeDescriptionBody worker: (optional) Node details.
+        """
+        self.coordinator = coordinator
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'EnginePropertiesOaiGenConfiguration':
+        """Initialize a EnginePropertiesOaiGenConfiguration object from a json dictionary."""
+        args = {}
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = PrestissimoNodeDescriptionBody.from_dict(coordinator)
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = PrestissimoNodeDescriptionBody.from_dict(worker)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a EnginePropertiesOaiGenConfiguration object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        if hasattr(self, 'worker') and self.worker is not None:
+            if isinstance(self.worker, dict):
+                _dict['worker'] = self.worker
+            else:
+                _dict['worker'] = self.worker.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this EnginePropertiesOaiGenConfiguration object as a `dict`."""
+        return {name: getattr(self, name) for name in EnginePropertiesOaiGenConfiguration.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this EnginePropertiesOaiGenConfiguration object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'EnginePropertiesOaiGenConfiguration') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'EnginePropertiesOaiGenConfiguration') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class NetezzaEngine:
+    """
+    Netezza engine details.
+
+    :param List[str] actions: (optional) Actions.
+    :param str build_version: (optional) watsonx.data build version.
+    :param str created_by: (optional) Created user name.
+    :param int created_on: (optional) Created time in epoch format.
+    :param str description: (optional) Engine description.
+    :param NetezzaEngineDetails engine_details: (optional) External engine details.
+    :param str engine_display_name: (optional) Engine display name.
+    :param str engine_id: (optional) Engine programmatic name.
+    :param str host_name: (optional) Engine host name. In case of OCP based
+          clusters, this is internal hostname.
+    :param str origin: (optional) Origin - place holder.
+    :param int port: (optional) Engine port.
+    :param str status: (optional) Engine status.
+    :param List[str] tags: (optional) Tags.
+    :param str type: (optional) Engine type.
+    """
+
+    __slots__ = (
+        'actions',
+        'build_version',
+        'created_by',
+        'created_on',
+        'description',
+        'engine_details',
+        'engine_display_name',
+        'engine_id',
+        'host_name',
+        'origin',
+        'port',
+        'status',
+        'tags',
+        'type',
+    )
+
+    def __init__(
+        self,
+        *,
+        actions: Optional[List[str]] = None,
+        build_version: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[int] = None,
+        description: Optional[str] = None,
+        engine_details: Optional['NetezzaEngineDetails'] = None,
+        engine_display_name: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        host_name: Optional[str] = None,
+        origin: Optional[str] = None,
+        port: Optional[int] = None,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a NetezzaEngine object.
+
+        :param List[str] actions: (optional) Actions.
+        :param str build_version: (optional) watsonx.data build version.
+        :param str created_by: (optional) Created user name.
+        :param int created_on: (optional) Created time in epoch format.
+        :param str description: (optional) Engine description.
+        :param NetezzaEngineDetails engine_details: (optional) External engine
+               details.
+        :param str engine_display_name: (optional) Engine display name.
+        :param str engine_id: (optional) Engine programmatic name.
+        :param str host_name: (optional) Engine host name. In case of OCP based
+               clusters, this is internal hostname.
+        :param str origin: (optional) Origin - place holder.
+        :param int port: (optional) Engine port.
+        :param str status: (optional) Engine status.
+        :param List[str] tags: (optional) Tags.
+        :param str type: (optional) Engine type.
+        """
+        self.actions = actions
+        self.build_version = build_version
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.engine_details = engine_details
+        self.engine_display_name = engine_display_name
+        self.engine_id = engine_id
+        self.host_name = host_name
+        self.origin = origin
+        self.port = port
+        self.status = status
+        self.tags = tags
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'NetezzaEngine':
+        """Initialize a NetezzaEngine object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (build_version := _dict.get('build_version')) is not None:
+            args['build_version'] = build_version
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_details := _dict.get('engine_details')) is not None:
+            args['engine_details'] = NetezzaEngineDetails.from_dict(engine_details)
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_id := _dict.get('engine_id')) is not None:
+            args['engine_id'] = engine_id
+        if (host_name := _dict.get('host_name')) is not None:
+            args['host_name'] = host_name
+        if (origin := _dict.get('origin')) is not None:
+            args['origin'] = origin
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a NetezzaEngine object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'build_version') and self.build_version is not None:
+            _dict['build_version'] = self.build_version
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_details') and self.engine_details is not None:
+            if isinstance(self.engine_details, dict):
+                _dict['engine_details'] = self.engine_details
+            else:
+                _dict['engine_details'] = self.engine_details.to_dict()
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_id') and self.engine_id is not None:
+            _dict['engine_id'] = self.engine_id
+        if hasattr(self, 'host_name') and self.host_name is not None:
+            _dict['host_name'] = self.host_name
+        if hasattr(self, 'origin') and self.origin is not None:
+            _dict['origin'] = self.origin
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this NetezzaEngine object as a `dict`."""
+        return {name: getattr(self, name) for name in NetezzaEngine.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this NetezzaEngine object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'NetezzaEngine') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'NetezzaEngine') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class NetezzaEngineCollection:
+    """
+    list Netezza engines.
+
+    :param List[NetezzaEngine] netezza_engines: (optional) list Netezza engines.
+    """
+
+    __slots__ = ('netezza_engines',)
+
+    def __init__(
+        self,
+        *,
+        netezza_engines: Optional[List['NetezzaEngine']] = None,
+    ) -> None:
+        """
+        Initialize a NetezzaEngineCollection object.
+
+        :param List[NetezzaEngine] netezza_engines: (optional) list Netezza
+               engines.
+        """
+        self.netezza_engines = netezza_engines
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'NetezzaEngineCollection':
+        """Initialize a NetezzaEngineCollection object from a json dictionary."""
+        args = {}
+        if (netezza_engines := _dict.get('netezza_engines')) is not None:
+            args['netezza_engines'] = [NetezzaEngine.from_dict(v) for v in netezza_engines]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a NetezzaEngineCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'netezza_engines') and self.netezza_engines is not None:
+            netezza_engines_list = []
+            for v in self.netezza_engines:
+                if isinstance(v, dict):
+                    netezza_engines_list.append(v)
+                else:
+                    netezza_engines_list.append(v.to_dict())
+            _dict['netezza_engines'] = netezza_engines_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this NetezzaEngineCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in NetezzaEngineCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this NetezzaEngineCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'NetezzaEngineCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'NetezzaEngineCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class NetezzaEngineDetails:
+    """
+    External engine details.
+
+    :param str connection_string: (optional) External engine connection string.
+    :param str metastore_host: (optional) Metastore host.
+    """
+
+    __slots__ = ('connection_string', 'metastore_host')
+
+    def __init__(
+        self,
+        *,
+        connection_string: Optional[str] = None,
+        metastore_host: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a NetezzaEngineDetails object.
+
+        :param str connection_string: (optional) External engine connection string.
+        :param str metastore_host: (optional) Metastore host.
+        """
+        self.connection_string = connection_string
+        self.metastore_host = metastore_host
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'NetezzaEngineDetails':
+        """Initialize a NetezzaEngineDetails object from a json dictionary."""
+        args = {}
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        if (metastore_host := _dict.get('metastore_host')) is not None:
+            args['metastore_host'] = metastore_host
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a NetezzaEngineDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'metastore_host') and self.metastore_host is not None:
+            _dict['metastore_host'] = self.metastore_host
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this NetezzaEngineDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in NetezzaEngineDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this NetezzaEngineDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'NetezzaEngineDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'NetezzaEngineDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class NetezzaEngineDetailsBody:
+    """
+    External engine details.
+
+    :param str connection_string: (optional) External engine connection string.
+    """
+
+    __slots__ = ('connection_string',)
+
+    def __init__(
+        self,
+        *,
+        connection_string: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a NetezzaEngineDetailsBody object.
+
+        :param str connection_string: (optional) External engine connection string.
+        """
+        self.connection_string = connection_string
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'NetezzaEngineDetailsBody':
+        """Initialize a NetezzaEngineDetailsBody object from a json dictionary."""
+        args = {}
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a NetezzaEngineDetailsBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this NetezzaEngineDetailsBody object as a `dict`."""
+        return {name: getattr(self, name) for name in NetezzaEngineDetailsBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this NetezzaEngineDetailsBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'NetezzaEngineDetailsBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'NetezzaEngineDetailsBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class NetezzaEnginePatch:
+    """
+    UpdateEngine body.
+
+    :param str description: (optional) Modified description.
+    :param str engine_display_name: (optional) Engine display name.
+    :param List[str] tags: (optional) Tags.
+    """
+
+    __slots__ = ('description', 'engine_display_name', 'tags')
+
+    def __init__(
+        self,
+        *,
+        description: Optional[str] = None,
+        engine_display_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a NetezzaEnginePatch object.
+
+        :param str description: (optional) Modified description.
+        :param str engine_display_name: (optional) Engine display name.
+        :param List[str] tags: (optional) Tags.
+        """
+        self.description = description
+        self.engine_display_name = engine_display_name
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'NetezzaEnginePatch':
+        """Initialize a NetezzaEnginePatch object from a json dictionary."""
+        args = {}
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a NetezzaEnginePatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this NetezzaEnginePatch object as a `dict`."""
+        return {name: getattr(self, name) for name in NetezzaEnginePatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this NetezzaEnginePatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'NetezzaEnginePatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'NetezzaEnginePatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class NodeDescription:
+    """
+    NodeDescription.
+
+    :param str node_type: (optional) Node type.
+    :param int quantity: (optional) Quantity.
+    """
+
+    __slots__ = ('node_type', 'quantity')
+
+    def __init__(
+        self,
+        *,
+        node_type: Optional[str] = None,
+        quantity: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a NodeDescription object.
+
+        :param str node_type: (optional) Node type.
+        :param int quantity: (optional) Quantity.
+        """
+        self.node_type = node_type
+        self.quantity = quantity
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'NodeDescription':
+        """Initialize a NodeDescription object from a json dictionary."""
+        args = {}
+        if (node_type := _dict.get('node_type')) is not None:
+            args['node_type'] = node_type
+        if (quantity := _dict.get('quantity')) is not None:
+            args['quantity'] = quantity
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a NodeDescription object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'node_type') and self.node_type is not None:
+            _dict['node_type'] = self.node_type
+        if hasattr(self, 'quantity') and self.quantity is not None:
+            _dict['quantity'] = self.quantity
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this NodeDescription object as a `dict`."""
+        return {name: getattr(self, name) for name in NodeDescription.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this NodeDescription object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'NodeDescription') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'NodeDescription') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class NodeDescriptionBody:
+    """
+    coordinator/worker property settings.
+
+    :param str node_type: (optional) Node Type, r5, m, i..
+    :param int quantity: (optional) Number of nodes.
+    """
+
+    __slots__ = ('node_type', 'quantity')
+
+    def __init__(
+        self,
+        *,
+        node_type: Optional[str] = None,
+        quantity: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a NodeDescriptionBody object.
+
+        :param str node_type: (optional) Node Type, r5, m, i..
+        :param int quantity: (optional) Number of nodes.
+        """
+        self.node_type = node_type
+        self.quantity = quantity
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'NodeDescriptionBody':
+        """Initialize a NodeDescriptionBody object from a json dictionary."""
+        args = {}
+        if (node_type := _dict.get('node_type')) is not None:
+            args['node_type'] = node_type
+        if (quantity := _dict.get('quantity')) is not None:
+            args['quantity'] = quantity
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a NodeDescriptionBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'node_type') and self.node_type is not None:
+            _dict['node_type'] = self.node_type
+        if hasattr(self, 'quantity') and self.quantity is not None:
+            _dict['quantity'] = self.quantity
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this NodeDescriptionBody object as a `dict`."""
+        return {name: getattr(self, name) for name in NodeDescriptionBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this NodeDescriptionBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'NodeDescriptionBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'NodeDescriptionBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class OtherEngine:
+    """
+    external engine details.
+
+    :param List[str] actions: (optional) Actions.
+    :param str created_by: (optional) created user name.
+    :param int created_on: (optional) created time in epoch format.
+    :param str description: (optional) engine description.
+    :param OtherEngineDetails engine_details: (optional) External engine details.
+    :param str engine_display_name: (optional) Engine display name.
+    :param str engine_id: (optional) engine programmatic name.
+    :param str host_name: (optional) Engine host name. In case of OCP based
+          clusters, this is internal hostname.
+    :param str origin: (optional) origin.
+    :param int port: (optional) Engine port.
+    :param str status: (optional) engine status.
+    :param List[str] tags: (optional) Tags.
+    :param str type: (optional) Type like presto, netezza, external,..
+    """
+
+    __slots__ = (
+        'actions',
+        'created_by',
+        'created_on',
+        'description',
+        'engine_details',
+        'engine_display_name',
+        'engine_id',
+        'host_name',
+        'origin',
+        'port',
+        'status',
+        'tags',
+        'type',
+    )
+
+    def __init__(
+        self,
+        *,
+        actions: Optional[List[str]] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[int] = None,
+        description: Optional[str] = None,
+        engine_details: Optional['OtherEngineDetails'] = None,
+        engine_display_name: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        host_name: Optional[str] = None,
+        origin: Optional[str] = None,
+        port: Optional[int] = None,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a OtherEngine object.
+
+        :param List[str] actions: (optional) Actions.
+        :param str created_by: (optional) created user name.
+        :param int created_on: (optional) created time in epoch format.
+        :param str description: (optional) engine description.
+        :param OtherEngineDetails engine_details: (optional) External engine
+               details.
+        :param str engine_display_name: (optional) Engine display name.
+        :param str engine_id: (optional) engine programmatic name.
+        :param str host_name: (optional) Engine host name. In case of OCP based
+               clusters, this is internal hostname.
+        :param str origin: (optional) origin.
+        :param int port: (optional) Engine port.
+        :param str status: (optional) engine status.
+        :param List[str] tags: (optional) Tags.
+        :param str type: (optional) Type like presto, netezza, external,..
+        """
+        self.actions = actions
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.engine_details = engine_details
+        self.engine_display_name = engine_display_name
+        self.engine_id = engine_id
+        self.host_name = host_name
+        self.origin = origin
+        self.port = port
+        self.status = status
+        self.tags = tags
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'OtherEngine':
+        """Initialize a OtherEngine object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_details := _dict.get('engine_details')) is not None:
+            args['engine_details'] = OtherEngineDetails.from_dict(engine_details)
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_id := _dict.get('engine_id')) is not None:
+            args['engine_id'] = engine_id
+        if (host_name := _dict.get('host_name')) is not None:
+            args['host_name'] = host_name
+        if (origin := _dict.get('origin')) is not None:
+            args['origin'] = origin
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a OtherEngine object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_details') and self.engine_details is not None:
+            if isinstance(self.engine_details, dict):
+                _dict['engine_details'] = self.engine_details
+            else:
+                _dict['engine_details'] = self.engine_details.to_dict()
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_id') and self.engine_id is not None:
+            _dict['engine_id'] = self.engine_id
+        if hasattr(self, 'host_name') and self.host_name is not None:
+            _dict['host_name'] = self.host_name
+        if hasattr(self, 'origin') and self.origin is not None:
+            _dict['origin'] = self.origin
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this OtherEngine object as a `dict`."""
+        return {name: getattr(self, name) for name in OtherEngine.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this OtherEngine object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'OtherEngine') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'OtherEngine') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class OtherEngineCollection:
+    """
+    list other engines.
+
+    :param List[OtherEngine] other_engines: (optional) list other engines.
+    """
+
+    __slots__ = ('other_engines',)
+
+    def __init__(
+        self,
+        *,
+        other_engines: Optional[List['OtherEngine']] = None,
+    ) -> None:
+        """
+        Initialize a OtherEngineCollection object.
+
+        :param List[OtherEngine] other_engines: (optional) list other engines.
+        """
+        self.other_engines = other_engines
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'OtherEngineCollection':
+        """Initialize a OtherEngineCollection object from a json dictionary."""
+        args = {}
+        if (other_engines := _dict.get('other_engines')) is not None:
+            args['other_engines'] = [OtherEngine.from_dict(v) for v in other_engines]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a OtherEngineCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'other_engines') and self.other_engines is not None:
+            other_engines_list = []
+            for v in self.other_engines:
+                if isinstance(v, dict):
+                    other_engines_list.append(v)
+                else:
+                    other_engines_list.append(v.to_dict())
+            _dict['other_engines'] = other_engines_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this OtherEngineCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in OtherEngineCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this OtherEngineCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'OtherEngineCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'OtherEngineCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class OtherEngineDetails:
+    """
+    External engine details.
+
+    :param str connection_string: external engine connection string.
+    :param str engine_type: Actual engine type.
+    :param str metastore_host: (optional) metastore host - not required while
+          registering an engine.
+    """
+
+    __slots__ = ('connection_string', 'engine_type', 'metastore_host')
+
+    def __init__(
+        self,
+        connection_string: str,
+        engine_type: str,
+        *,
+        metastore_host: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a OtherEngineDetails object.
+
+        :param str connection_string: external engine connection string.
+        :param str engine_type: Actual engine type.
+        :param str metastore_host: (optional) metastore host - not required while
+               registering an engine.
+        """
+        self.connection_string = connection_string
+        self.engine_type = engine_type
+        self.metastore_host = metastore_host
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'OtherEngineDetails':
+        """Initialize a OtherEngineDetails object from a json dictionary."""
+        args = {}
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        else:
+            raise ValueError('Required property \'connection_string\' not present in OtherEngineDetails JSON')
+        if (engine_type := _dict.get('engine_type')) is not None:
+            args['engine_type'] = engine_type
+        else:
+            raise ValueError('Required property \'engine_type\' not present in OtherEngineDetails JSON')
+        if (metastore_host := _dict.get('metastore_host')) is not None:
+            args['metastore_host'] = metastore_host
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a OtherEngineDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'engine_type') and self.engine_type is not None:
+            _dict['engine_type'] = self.engine_type
+        if hasattr(self, 'metastore_host') and self.metastore_host is not None:
+            _dict['metastore_host'] = self.metastore_host
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this OtherEngineDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in OtherEngineDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this OtherEngineDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'OtherEngineDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'OtherEngineDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class OtherEngineDetailsBody:
+    """
+    External engine details.
+
+    :param str connection_string: External engine connection string.
+    :param str engine_type: Actual engine type.
+    """
+
+    __slots__ = ('connection_string', 'engine_type')
+
+    def __init__(
+        self,
+        connection_string: str,
+        engine_type: str,
+    ) -> None:
+        """
+        Initialize a OtherEngineDetailsBody object.
+
+        :param str connection_string: External engine connection string.
+        :param str engine_type: Actual engine type.
+        """
+        self.connection_string = connection_string
+        self.engine_type = engine_type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'OtherEngineDetailsBody':
+        """Initialize a OtherEngineDetailsBody object from a json dictionary."""
+        args = {}
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        else:
+            raise ValueError('Required property \'connection_string\' not present in OtherEngineDetailsBody JSON')
+        if (engine_type := _dict.get('engine_type')) is not None:
+            args['engine_type'] = engine_type
+        else:
+            raise ValueError('Required property \'engine_type\' not present in OtherEngineDetailsBody JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a OtherEngineDetailsBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'engine_type') and self.engine_type is not None:
+            _dict['engine_type'] = self.engine_type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this OtherEngineDetailsBody object as a `dict`."""
+        return {name: getattr(self, name) for name in OtherEngineDetailsBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this OtherEngineDetailsBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'OtherEngineDetailsBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'OtherEngineDetailsBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestissimoEndpoints:
+    """
+    Endpoints.
+
+    :param str applications_api: (optional) Application API.
+    :param str history_server_endpoint: (optional) History server endpoint.
+    :param str spark_access_endpoint: (optional) Spark kernel endpoint.
+    :param str spark_jobs_v4_endpoint: (optional) Spark jobs V4 endpoint.
+    :param str spark_kernel_endpoint: (optional) Spark kernel endpoint.
+    :param str view_history_server: (optional) View history server.
+    :param str wxd_application_endpoint: (optional) Wxd application endpoint.
+    """
+
+    __slots__ = (
+        'applications_api',
+        'history_server_endpoint',
+        'spark_access_endpoint',
+        'spark_jobs_v4_endpoint',
+        'spark_kernel_endpoint',
+        'view_history_server',
+        'wxd_application_endpoint',
+    )
+
+    def __init__(
+        self,
+        *,
+        applications_api: Optional[str] = None,
+        history_server_endpoint: Optional[str] = None,
+        spark_access_endpoint: Optional[str] = None,
+        spark_jobs_v4_endpoint: Optional[str] = None,
+        spark_kernel_endpoint: Optional[str] = None,
+        view_history_server: Optional[str] = None,
+        wxd_application_endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEndpoints object.
+
+        :param str applications_api: (optional) Application API.
+        :param str history_server_endpoint: (optional) History server endpoint.
+        :param str spark_access_endpoint: (optional) Spark kernel endpoint.
+        :param str spark_jobs_v4_endpoint: (optional) Spark jobs V4 endpoint.
+        :param str spark_kernel_endpoint: (optional) Spark kernel endpoint.
+        :param str view_history_server: (optional) View history server.
+        :param str wxd_application_endpoint: (optional) Wxd application endpoint.
+        """
+        self.applications_api = applications_api
+        self.history_server_endpoint = history_server_endpoint
+        self.spark_access_endpoint = spark_access_endpoint
+        self.spark_jobs_v4_endpoint = spark_jobs_v4_endpoint
+        self.spark_kernel_endpoint = spark_kernel_endpoint
+        self.view_history_server = view_history_server
+        self.wxd_application_endpoint = wxd_application_endpoint
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEndpoints':
+        """Initialize a PrestissimoEndpoints object from a json dictionary."""
+        args = {}
+        if (applications_api := _dict.get('applications_api')) is not None:
+            args['applications_api'] = applications_api
+        if (history_server_endpoint := _dict.get('history_server_endpoint')) is not None:
+            args['history_server_endpoint'] = history_server_endpoint
+        if (spark_access_endpoint := _dict.get('spark_access_endpoint')) is not None:
+            args['spark_access_endpoint'] = spark_access_endpoint
+        if (spark_jobs_v4_endpoint := _dict.get('spark_jobs_v4_endpoint')) is not None:
+            args['spark_jobs_v4_endpoint'] = spark_jobs_v4_endpoint
+        if (spark_kernel_endpoint := _dict.get('spark_kernel_endpoint')) is not None:
+            args['spark_kernel_endpoint'] = spark_kernel_endpoint
+        if (view_history_server := _dict.get('view_history_server')) is not None:
+            args['view_history_server'] = view_history_server
+        if (wxd_application_endpoint := _dict.get('wxd_application_endpoint')) is not None:
+            args['wxd_application_endpoint'] = wxd_application_endpoint
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEndpoints object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'applications_api') and self.applications_api is not None:
+            _dict['applications_api'] = self.applications_api
+        if hasattr(self, 'history_server_endpoint') and self.history_server_endpoint is not None:
+            _dict['history_server_endpoint'] = self.history_server_endpoint
+        if hasattr(self, 'spark_access_endpoint') and self.spark_access_endpoint is not None:
+            _dict['spark_access_endpoint'] = self.spark_access_endpoint
+        if hasattr(self, 'spark_jobs_v4_endpoint') and self.spark_jobs_v4_endpoint is not None:
+            _dict['spark_jobs_v4_endpoint'] = self.spark_jobs_v4_endpoint
+        if hasattr(self, 'spark_kernel_endpoint') and self.spark_kernel_endpoint is not None:
+            _dict['spark_kernel_endpoint'] = self.spark_kernel_endpoint
+        if hasattr(self, 'view_history_server') and self.view_history_server is not None:
+            _dict['view_history_server'] = self.view_history_server
+        if hasattr(self, 'wxd_application_endpoint') and self.wxd_application_endpoint is not None:
+            _dict['wxd_application_endpoint'] = self.wxd_application_endpoint
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEndpoints object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEndpoints.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEndpoints object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEndpoints') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEndpoints') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestissimoEngine:
+    """
+    EngineDetail.
+
+    :param List[str] actions: (optional) Actions.
+    :param List[str] associated_catalogs: (optional) Associated catalog.
+    :param str build_version: (optional) watsonx.data build version.
+    :param PrestissimoNodeDescriptionBody coordinator: (optional) Node details.
+    :param str created_by: (optional) Created user name.
+    :param int created_on: (optional) Created time in epoch format.
+    :param str description: (optional) Engine description.
+    :param PrestissimoEngineDetails engine_details: (optional) External engine
+          details.
+    :param str engine_display_name: (optional) Engine display name.
+    :param str engine_id: (optional) Engine programmatic name.
+    :param PrestissimoEngineEngineProperties engine_properties: (optional) Engine
+          properties.
+    :param str engine_restart: (optional) Triggers engine restart if value is force.
+    :param str external_host_name: Applicable only for OCP based clusters.  This is
+          typically  servicename+route.
+    :param str group_id: (optional) Group ID.
+    :param str host_name: (optional) Engine host name. In case of OCP based
+          clusters, this is internal hostname.
+    :param str origin: (optional) Origin - place holder.
+    :param int port: (optional) Engine port.
+    :param str region: (optional) Region - place holder.
+    :param RemoveEngineProperties remove_engine_properties: (optional) RemoveEngine
+          properties.
+    :param str size_config: (optional) Size config.
+    :param str status: (optional) Engine status.
+    :param int status_code: Engine status code.
+    :param List[str] tags: (optional) Tags.
+    :param str type: (optional) Engine type.
+    :param str version: (optional) Version of the engine.
+    :param PrestissimoNodeDescriptionBody worker: (optional) Node details.
+    """
+
+    __slots__ = (
+        'actions',
+        'associated_catalogs',
+        'build_version',
+        'coordinator',
+        'created_by',
+        'created_on',
+        'description',
+        'engine_details',
+        'engine_display_name',
+        'engine_id',
+        'engine_properties',
+        'engine_restart',
+        'external_host_name',
+        'group_id',
+        'host_name',
+        'origin',
+        'port',
+        'region',
+        'remove_engine_properties',
+        'size_config',
+        'status',
+        'status_code',
+        'tags',
+        'type',
+        'version',
+        'worker',
+    )
+
+    def __init__(
+        self,
+        external_host_name: str,
+        status_code: int,
+        *,
+        actions: Optional[List[str]] = None,
+        associated_catalogs: Optional[List[str]] = None,
+        build_version: Optional[str] = None,
+        coordinator: Optional['PrestissimoNodeDescriptionBody'] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[int] = None,
+        description: Optional[str] = None,
+        engine_details: Optional['PrestissimoEngineDetails'] = None,
+        engine_display_name: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        engine_properties: Optional['PrestissimoEngineEngineProperties'] = None,
+        engine_restart: Optional[str] = None,
+        group_id: Optional[str] = None,
+        host_name: Optional[str] = None,
+        origin: Optional[str] = None,
+        port: Optional[int] = None,
+        region: Optional[str] = None,
+        remove_engine_properties: Optional['RemoveEngineProperties'] = None,
+        size_config: Optional[str] = None,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        version: Optional[str] = None,
+        worker: Optional['PrestissimoNodeDescriptionBody'] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEngine object.
+
+        :param str external_host_name: Applicable only for OCP based clusters.
+               This is typically  servicename+route.
+        :param int status_code: Engine status code.
+        :param List[str] actions: (optional) Actions.
+        :param List[str] associated_catalogs: (optional) Associated catalog.
+        :param str build_version: (optional) watsonx.data build version.
+        :param PrestissimoNodeDescriptionBody coordinator: (optional) Node details.
+        :param str created_by: (optional) Created user name.
+        :param int created_on: (optional) Created time in epoch format.
+        :param str description: (optional) Engine description.
+        :param PrestissimoEngineDetails engine_details: (optional) External engine
+               details.
+        :param str engine_display_name: (optional) Engine display name.
+        :param str engine_id: (optional) Engine programmatic name.
+        :param PrestissimoEngineEngineProperties engine_properties: (optional)
+               Engine properties.
+        :param str engine_restart: (optional) Triggers engine restart if value is
+               force.
+        :param str group_id: (optional) Group ID.
+        :param str host_name: (optional) Engine host name. In case of OCP based
+               clusters, this is internal hostname.
+        :param str origin: (optional) Origin - place holder.
+        :param int port: (optional) Engine port.
+        :param str region: (optional) Region - place holder.
+        :param RemoveEngineProperties remove_engine_properties: (optional)
+               RemoveEngine properties.
+        :param str size_config: (optional) Size config.
+        :param str status: (optional) Engine status.
+        :param List[str] tags: (optional) Tags.
+        :param str type: (optional) Engine type.
+        :param str version: (optional) Version of the engine.
+        :param PrestissimoNodeDescriptionBody worker: (optional) Node details.
+        """
+        self.actions = actions
+        self.associated_catalogs = associated_catalogs
+        self.build_version = build_version
+        self.coordinator = coordinator
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.engine_details = engine_details
+        self.engine_display_name = engine_display_name
+        self.engine_id = engine_id
+        self.engine_properties = engine_properties
+        self.engine_restart = engine_restart
+        self.external_host_name = external_host_name
+        self.group_id = group_id
+        self.host_name = host_name
+        self.origin = origin
+        self.port = port
+        self.region = region
+        self.remove_engine_properties = remove_engine_properties
+        self.size_config = size_config
+        self.status = status
+        self.status_code = status_code
+        self.tags = tags
+        self.type = type
+        self.version = version
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEngine':
+        """Initialize a PrestissimoEngine object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (associated_catalogs := _dict.get('associated_catalogs')) is not None:
+            args['associated_catalogs'] = associated_catalogs
+        if (build_version := _dict.get('build_version')) is not None:
+            args['build_version'] = build_version
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = PrestissimoNodeDescriptionBody.from_dict(coordinator)
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_details := _dict.get('engine_details')) is not None:
+            args['engine_details'] = PrestissimoEngineDetails.from_dict(engine_details)
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_id := _dict.get('engine_id')) is not None:
+            args['engine_id'] = engine_id
+        if (engine_properties := _dict.get('engine_properties')) is not None:
+            args['engine_properties'] = PrestissimoEngineEngineProperties.from_dict(engine_properties)
+        if (engine_restart := _dict.get('engine_restart')) is not None:
+            args['engine_restart'] = engine_restart
+        if (external_host_name := _dict.get('external_host_name')) is not None:
+            args['external_host_name'] = external_host_name
+        else:
+            raise ValueError('Required property \'external_host_name\' not present in PrestissimoEngine JSON')
+        if (group_id := _dict.get('group_id')) is not None:
+            args['group_id'] = group_id
+        if (host_name := _dict.get('host_name')) is not None:
+            args['host_name'] = host_name
+        if (origin := _dict.get('origin')) is not None:
+            args['origin'] = origin
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (remove_engine_properties := _dict.get('remove_engine_properties')) is not None:
+            args['remove_engine_properties'] = RemoveEngineProperties.from_dict(remove_engine_properties)
+        if (size_config := _dict.get('size_config')) is not None:
+            args['size_config'] = size_config
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_code := _dict.get('status_code')) is not None:
+            args['status_code'] = status_code
+        else:
+            raise ValueError('Required property \'status_code\' not present in PrestissimoEngine JSON')
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        if (version := _dict.get('version')) is not None:
+            args['version'] = version
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = PrestissimoNodeDescriptionBody.from_dict(worker)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEngine object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'associated_catalogs') and self.associated_catalogs is not None:
+            _dict['associated_catalogs'] = self.associated_catalogs
+        if hasattr(self, 'build_version') and self.build_version is not None:
+            _dict['build_version'] = self.build_version
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_details') and self.engine_details is not None:
+            if isinstance(self.engine_details, dict):
+                _dict['engine_details'] = self.engine_details
+            else:
+                _dict['engine_details'] = self.engine_details.to_dict()
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_id') and self.engine_id is not None:
+            _dict['engine_id'] = self.engine_id
+        if hasattr(self, 'engine_properties') and self.engine_properties is not None:
+            if isinstance(self.engine_properties, dict):
+                _dict['engine_properties'] = self.engine_properties
+            else:
+                _dict['engine_properties'] = self.engine_properties.to_dict()
+        if hasattr(self, 'engine_restart') and self.engine_restart is not None:
+            _dict['engine_restart'] = self.engine_restart
+        if hasattr(self, 'external_host_name') and self.external_host_name is not None:
+            _dict['external_host_name'] = self.external_host_name
+        if hasattr(self, 'group_id') and self.group_id is not None:
+            _dict['group_id'] = self.group_id
+        if hasattr(self, 'host_name') and self.host_name is not None:
+            _dict['host_name'] = self.host_name
+        if hasattr(self, 'origin') and self.origin is not None:
+            _dict['origin'] = self.origin
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'region') and self.region is not None:
+            _dict['region'] = self.region
+        if hasattr(self, 'remove_engine_properties') and self.remove_engine_properties is not None:
+            if isinstance(self.remove_engine_properties, dict):
+                _dict['remove_engine_properties'] = self.remove_engine_properties
+            else:
+                _dict['remove_engine_properties'] = self.remove_engine_properties.to_dict()
+        if hasattr(self, 'size_config') and self.size_config is not None:
+            _dict['size_config'] = self.size_config
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'status_code') and self.status_code is not None:
+            _dict['status_code'] = self.status_code
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'version') and self.version is not None:
+            _dict['version'] = self.version
+        if hasattr(self, 'worker') and self.worker is not None:
+            if isinstance(self.worker, dict):
+                _dict['worker'] = self.worker
+            else:
+                _dict['worker'] = self.worker.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEngine object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEngine.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEngine object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEngine') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEngine') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class EngineRestartEnum(str, Enum):
+        """
+        Triggers engine restart if value is force.
+        """
+
+        FORCE = 'force'
+        FALSE = 'false'
+
+    class OriginEnum(str, Enum):
+        """
+        Origin - place holder.
+        """
+
+        NATIVE = 'native'
+        EXTERNAL = 'external'
+        DISCOVER = 'discover'
+
+    class StatusEnum(str, Enum):
+        """
+        Engine status.
+        """
+
+        RUNNING = 'running'
+        PENDING = 'pending'
+        STOPPED = 'stopped'
+
+
+class PrestissimoEngineCollection:
+    """
+    list Prestissimo Engines.
+
+    :param List[PrestissimoEngine] prestissimo_engines: (optional) list prestissimo
+          engines.
+    """
+
+    __slots__ = ('prestissimo_engines',)
+
+    def __init__(
+        self,
+        *,
+        prestissimo_engines: Optional[List['PrestissimoEngine']] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEngineCollection object.
+
+        :param List[PrestissimoEngine] prestissimo_engines: (optional) list
+               prestissimo engines.
+        """
+        self.prestissimo_engines = prestissimo_engines
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEngineCollection':
+        """Initialize a PrestissimoEngineCollection object from a json dictionary."""
+        args = {}
+        if (prestissimo_engines := _dict.get('prestissimo_engines')) is not None:
+            args['prestissimo_engines'] = [PrestissimoEngine.from_dict(v) for v in prestissimo_engines]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEngineCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'prestissimo_engines') and self.prestissimo_engines is not None:
+            prestissimo_engines_list = []
+            for v in self.prestissimo_engines:
+                if isinstance(v, dict):
+                    prestissimo_engines_list.append(v)
+                else:
+                    prestissimo_engines_list.append(v.to_dict())
+            _dict['prestissimo_engines'] = prestissimo_engines_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEngineCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEngineCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEngineCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEngineCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEngineCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestissimoEngineDetails:
+    """
+    External engine details.
+
+    :param str api_key: (optional) api key to work with the saas IAE instance.
+    :param str connection_string: (optional) External engine connection string.
+    :param PrestissimoNodeDescriptionBody coordinator: (optional) Node details.
+    :param PrestissimoEndpoints endpoints: (optional) Endpoints.
+    :param str instance_id: (optional) Instance to access the instance.
+    :param str managed_by: (optional) How is the spark instance managed.
+    :param str metastore_host: (optional) Metastore host.
+    :param str size_config: (optional) Size config.
+    :param PrestissimoNodeDescriptionBody worker: (optional) Node details.
+    """
+
+    __slots__ = (
+        'api_key',
+        'connection_string',
+        'coordinator',
+        'endpoints',
+        'instance_id',
+        'managed_by',
+        'metastore_host',
+        'size_config',
+        'worker',
+    )
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        connection_string: Optional[str] = None,
+        coordinator: Optional['PrestissimoNodeDescriptionBody'] = None,
+        endpoints: Optional['PrestissimoEndpoints'] = None,
+        instance_id: Optional[str] = None,
+        managed_by: Optional[str] = None,
+        metastore_host: Optional[str] = None,
+        size_config: Optional[str] = None,
+        worker: Optional['PrestissimoNodeDescriptionBody'] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEngineDetails object.
+
+        :param str api_key: (optional) api key to work with the saas IAE instance.
+        :param str connection_string: (optional) External engine connection string.
+        :param PrestissimoNodeDescriptionBody coordinator: (optional) Node details.
+        :param PrestissimoEndpoints endpoints: (optional) Endpoints.
+        :param str instance_id: (optional) Instance to access the instance.
+        :param str managed_by: (optional) How is the spark instance managed.
+        :param str metastore_host: (optional) Metastore host.
+        :param str size_config: (optional) Size config.
+        :param PrestissimoNodeDescriptionBody worker: (optional) Node details.
+        """
+        self.api_key = api_key
+        self.connection_string = connection_string
+        self.coordinator = coordinator
+        self.endpoints = endpoints
+        self.instance_id = instance_id
+        self.managed_by = managed_by
+        self.metastore_host = metastore_host
+        self.size_config = size_config
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEngineDetails':
+        """Initialize a PrestissimoEngineDetails object from a json dictionary."""
+        args = {}
+        if (api_key := _dict.get('api_key')) is not None:
+            args['api_key'] = api_key
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = PrestissimoNodeDescriptionBody.from_dict(coordinator)
+        if (endpoints := _dict.get('endpoints')) is not None:
+            args['endpoints'] = PrestissimoEndpoints.from_dict(endpoints)
+        if (instance_id := _dict.get('instance_id')) is not None:
+            args['instance_id'] = instance_id
+        if (managed_by := _dict.get('managed_by')) is not None:
+            args['managed_by'] = managed_by
+        if (metastore_host := _dict.get('metastore_host')) is not None:
+            args['metastore_host'] = metastore_host
+        if (size_config := _dict.get('size_config')) is not None:
+            args['size_config'] = size_config
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = PrestissimoNodeDescriptionBody.from_dict(worker)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEngineDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'api_key') and self.api_key is not None:
+            _dict['api_key'] = self.api_key
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        if hasattr(self, 'endpoints') and self.endpoints is not None:
+            if isinstance(self.endpoints, dict):
+                _dict['endpoints'] = self.endpoints
+            else:
+                _dict['endpoints'] = self.endpoints.to_dict()
+        if hasattr(self, 'instance_id') and self.instance_id is not None:
+            _dict['instance_id'] = self.instance_id
+        if hasattr(self, 'managed_by') and self.managed_by is not None:
+            _dict['managed_by'] = self.managed_by
+        if hasattr(self, 'metastore_host') and self.metastore_host is not None:
+            _dict['metastore_host'] = self.metastore_host
+        if hasattr(self, 'size_config') and self.size_config is not None:
+            _dict['size_config'] = self.size_config
+        if hasattr(self, 'worker') and self.worker is not None:
+            if isinstance(self.worker, dict):
+                _dict['worker'] = self.worker
+            else:
+                _dict['worker'] = self.worker.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEngineDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEngineDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEngineDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEngineDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEngineDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class SizeConfigEnum(str, Enum):
+        """
+        Size config.
+        """
+
+        STARTER = 'starter'
+        CACHE_OPTIMIZED = 'cache_optimized'
+        COMPUTE_OPTIMIZED = 'compute_optimized'
+        SMALL = 'small'
+        MEDIUM = 'medium'
+        LARGE = 'large'
+        CUSTOM = 'custom'
+
+
+class PrestissimoEngineEngineProperties:
+    """
+    Engine properties.
+
+    :param PrestissimoEnginePropertiesCatalog catalog: (optional) catalog
+          properties.
+    :param EnginePropertiesOaiGenConfiguration configuration: (optional)
+          Configuration settings for the engine properties.
+    :param PrestissimoEnginePropertiesVelox velox: (optional) velox properties.
+    :param PrestissimoEnginePropertiesOaiGen1Jvm jvm: (optional) JVM settings.
+    """
+
+    __slots__ = ('catalog', 'configuration', 'velox', 'jvm')
+
+    def __init__(
+        self,
+        *,
+        catalog: Optional['PrestissimoEnginePropertiesCatalog'] = None,
+        configuration: Optional['EnginePropertiesOaiGenConfiguration'] = None,
+        velox: Optional['PrestissimoEnginePropertiesVelox'] = None,
+        jvm: Optional['PrestissimoEnginePropertiesOaiGen1Jvm'] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEngineEngineProperties object.
+
+        :param PrestissimoEnginePropertiesCatalog catalog: (optional) catalog
+               properties.
+        :param EnginePropertiesOaiGenConfiguration configuration: (optional)
+               Configuration settings for the engine properties.
+        :param PrestissimoEnginePropertiesVelox velox: (optional) velox properties.
+        :param PrestissimoEnginePropertiesOaiGen1Jvm jvm: (optional) JVM settings.
+        """
+        self.catalog = catalog
+        self.configuration = configuration
+        self.velox = velox
+        self.jvm = jvm
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEngineEngineProperties':
+        """Initialize a PrestissimoEngineEngineProperties object from a json dictionary."""
+        args = {}
+        if (catalog := _dict.get('catalog')) is not None:
+            args['catalog'] = PrestissimoEnginePropertiesCatalog.from_dict(catalog)
+        if (configuration := _dict.get('configuration')) is not None:
+            args['configuration'] = EnginePropertiesOaiGenConfiguration.from_dict(configuration)
+        if (velox := _dict.get('velox')) is not None:
+            args['velox'] = PrestissimoEnginePropertiesVelox.from_dict(velox)
+        if (jvm := _dict.get('jvm')) is not None:
+            args['jvm'] = PrestissimoEnginePropertiesOaiGen1Jvm.from_dict(jvm)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEngineEngineProperties object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalog') and self.catalog is not None:
+            if isinstance(self.catalog, dict):
+                _dict['catalog'] = self.catalog
+            else:
+                _dict['catalog'] = self.catalog.to_dict()
+        if hasattr(self, 'configuration') and self.configuration is not None:
+            if isinstance(self.configuration, dict):
+                _dict['configuration'] = self.configuration
+            else:
+                _dict['configuration'] = self.configuration.to_dict()
+        if hasattr(self, 'velox') and self.velox is not None:
+            if isinstance(self.velox, dict):
+                _dict['velox'] = self.velox
+            else:
+                _dict['velox'] = self.velox.to_dict()
+        if hasattr(self, 'jvm') and self.jvm is not None:
+            if isinstance(self.jvm, dict):
+                _dict['jvm'] = self.jvm
+            else:
+                _dict['jvm'] = self.jvm.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEngineEngineProperties object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEngineEngineProperties.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEngineEngineProperties object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEngineEngineProperties') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEngineEngineProperties') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestissimoEnginePatch:
+    """
+    Update prestissimo engine body.
+
+    :param str description: (optional) Modified description.
+    :param str engine_display_name: (optional) Engine display name.
+    :param PrestissimoEngineEngineProperties engine_properties: (optional) Engine
+          properties.
+    :param str engine_restart: (optional) Triggers engine restart if value is force.
+    :param RemoveEngineProperties remove_engine_properties: (optional) RemoveEngine
+          properties.
+    :param List[str] tags: (optional) Tags.
+    """
+
+    __slots__ = (
+        'description',
+        'engine_display_name',
+        'engine_properties',
+        'engine_restart',
+        'remove_engine_properties',
+        'tags',
+    )
+
+    def __init__(
+        self,
+        *,
+        description: Optional[str] = None,
+        engine_display_name: Optional[str] = None,
+        engine_properties: Optional['PrestissimoEngineEngineProperties'] = None,
+        engine_restart: Optional[str] = None,
+        remove_engine_properties: Optional['RemoveEngineProperties'] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEnginePatch object.
+
+        :param str description: (optional) Modified description.
+        :param str engine_display_name: (optional) Engine display name.
+        :param PrestissimoEngineEngineProperties engine_properties: (optional)
+               Engine properties.
+        :param str engine_restart: (optional) Triggers engine restart if value is
+               force.
+        :param RemoveEngineProperties remove_engine_properties: (optional)
+               RemoveEngine properties.
+        :param List[str] tags: (optional) Tags.
+        """
+        self.description = description
+        self.engine_display_name = engine_display_name
+        self.engine_properties = engine_properties
+        self.engine_restart = engine_restart
+        self.remove_engine_properties = remove_engine_properties
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEnginePatch':
+        """Initialize a PrestissimoEnginePatch object from a json dictionary."""
+        args = {}
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_properties := _dict.get('engine_properties')) is not None:
+            args['engine_properties'] = PrestissimoEngineEngineProperties.from_dict(engine_properties)
+        if (engine_restart := _dict.get('engine_restart')) is not None:
+            args['engine_restart'] = engine_restart
+        if (remove_engine_properties := _dict.get('remove_engine_properties')) is not None:
+            args['remove_engine_properties'] = RemoveEngineProperties.from_dict(remove_engine_properties)
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEnginePatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_properties') and self.engine_properties is not None:
+            if isinstance(self.engine_properties, dict):
+                _dict['engine_properties'] = self.engine_properties
+            else:
+                _dict['engine_properties'] = self.engine_properties.to_dict()
+        if hasattr(self, 'engine_restart') and self.engine_restart is not None:
+            _dict['engine_restart'] = self.engine_restart
+        if hasattr(self, 'remove_engine_properties') and self.remove_engine_properties is not None:
+            if isinstance(self.remove_engine_properties, dict):
+                _dict['remove_engine_properties'] = self.remove_engine_properties
+            else:
+                _dict['remove_engine_properties'] = self.remove_engine_properties.to_dict()
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEnginePatch object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEnginePatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEnginePatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEnginePatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEnginePatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class EngineRestartEnum(str, Enum):
+        """
+        Triggers engine restart if value is force.
+        """
+
+        FORCE = 'force'
+        FALSE = 'false'
+
+
+class PrestissimoEnginePropertiesCatalog:
+    """
+    catalog properties.
+
+    :param List[str] catalog_name: (optional) catalog name.
+    """
+
+    __slots__ = ('catalog_name',)
+
+    def __init__(
+        self,
+        *,
+        catalog_name: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEnginePropertiesCatalog object.
+
+        :param List[str] catalog_name: (optional) catalog name.
+        """
+        self.catalog_name = catalog_name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEnginePropertiesCatalog':
+        """Initialize a PrestissimoEnginePropertiesCatalog object from a json dictionary."""
+        args = {}
+        if (catalog_name := _dict.get('catalog_name')) is not None:
+            args['catalog_name'] = catalog_name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEnginePropertiesCatalog object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalog_name') and self.catalog_name is not None:
+            _dict['catalog_name'] = self.catalog_name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEnginePropertiesCatalog object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEnginePropertiesCatalog.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEnginePropertiesCatalog object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEnginePropertiesCatalog') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEnginePropertiesCatalog') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestissimoEnginePropertiesOaiGen1Jvm:
+    """
+    JVM settings.
+
+    :param NodeDescriptionBody coordinator: (optional) coordinator/worker property
+          settings.
+    """
+
+    __slots__ = ('coordinator',)
+
+    def __init__(
+        self,
+        *,
+        coordinator: Optional['NodeDescriptionBody'] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEnginePropertiesOaiGen1Jvm object.
+
+        :param NodeDescriptionBody coordinator: (optional) coordinator/worker
+               property settings.
+        """
+        self.coordinator = coordinator
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEnginePropertiesOaiGen1Jvm':
+        """Initialize a PrestissimoEnginePropertiesOaiGen1Jvm object from a json dictionary."""
+        args = {}
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = NodeDescriptionBody.from_dict(coordinator)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEnginePropertiesOaiGen1Jvm object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEnginePropertiesOaiGen1Jvm object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEnginePropertiesOaiGen1Jvm.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEnginePropertiesOaiGen1Jvm object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEnginePropertiesOaiGen1Jvm') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEnginePropertiesOaiGen1Jvm') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestissimoEnginePropertiesVelox:
+    """
+    velox properties.
+
+    :param List[str] velox_property: (optional) velox property.
+    """
+
+    __slots__ = ('velox_property',)
+
+    def __init__(
+        self,
+        *,
+        velox_property: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoEnginePropertiesVelox object.
+
+        :param List[str] velox_property: (optional) velox property.
+        """
+        self.velox_property = velox_property
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoEnginePropertiesVelox':
+        """Initialize a PrestissimoEnginePropertiesVelox object from a json dictionary."""
+        args = {}
+        if (velox_property := _dict.get('velox_property')) is not None:
+            args['velox_property'] = velox_property
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoEnginePropertiesVelox object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'velox_property') and self.velox_property is not None:
+            _dict['velox_property'] = self.velox_property
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoEnginePropertiesVelox object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoEnginePropertiesVelox.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoEnginePropertiesVelox object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoEnginePropertiesVelox') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoEnginePropertiesVelox') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestissimoNodeDescriptionBody:
+    """
+    Node details.
+
+    :param str node_type: (optional) Node Type, r5, m, i..
+    :param int quantity: (optional) Number of nodes.
+    """
+
+    __slots__ = ('node_type', 'quantity')
+
+    def __init__(
+        self,
+        *,
+        node_type: Optional[str] = None,
+        quantity: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a PrestissimoNodeDescriptionBody object.
+
+        :param str node_type: (optional) Node Type, r5, m, i..
+        :param int quantity: (optional) Number of nodes.
+        """
+        self.node_type = node_type
+        self.quantity = quantity
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestissimoNodeDescriptionBody':
+        """Initialize a PrestissimoNodeDescriptionBody object from a json dictionary."""
+        args = {}
+        if (node_type := _dict.get('node_type')) is not None:
+            args['node_type'] = node_type
+        if (quantity := _dict.get('quantity')) is not None:
+            args['quantity'] = quantity
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestissimoNodeDescriptionBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'node_type') and self.node_type is not None:
+            _dict['node_type'] = self.node_type
+        if hasattr(self, 'quantity') and self.quantity is not None:
+            _dict['quantity'] = self.quantity
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestissimoNodeDescriptionBody object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestissimoNodeDescriptionBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestissimoNodeDescriptionBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestissimoNodeDescriptionBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestissimoNodeDescriptionBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestoEngine:
+    """
+    EngineDetail.
+
+    :param List[str] actions: (optional) Actions.
+    :param List[str] associated_catalogs: (optional) Associated catalogs.
+    :param str build_version: (optional) watsonx.data build version.
+    :param NodeDescription coordinator: (optional) NodeDescription.
+    :param str created_by: (optional) Created user name.
+    :param int created_on: (optional) Created time in epoch format.
+    :param str description: (optional) Engine description.
+    :param List[Driver] drivers: (optional) Driver details.
+    :param EngineDetailsBody engine_details: (optional) Node details.
+    :param str engine_display_name: (optional) Engine display name.
+    :param str engine_id: (optional) Engine programmatic name.
+    :param PrestoEngineEngineProperties engine_properties: (optional) Engine
+          properties.
+    :param str engine_restart: (optional) Triggers engine restart if value is force.
+    :param str external_host_name: Applicable only for OCP based clusters.  This is
+          typically  servicename+route.
+    :param str group_id: (optional) Group ID.
+    :param str host_name: (optional) Engine host name. In case of OCP based
+          clusters, this is internal hostname.
+    :param str origin: (optional) Origin - created or registered.
+    :param int port: (optional) Engine port.
+    :param str region: (optional) Region (cloud).
+    :param PrestoEnginePatchRemoveEngineProperties remove_engine_properties:
+          (optional) RemoveEngine properties.
+    :param str size_config: (optional) Size config.
+    :param str status: (optional) Engine status.
+    :param int status_code: Engine status code.
+    :param List[str] tags: (optional) Tags.
+    :param str type: (optional) Engine type presto.
+    :param str version: (optional) Version of the engine.
+    :param NodeDescription worker: (optional) NodeDescription.
+    """
+
+    __slots__ = (
+        'actions',
+        'associated_catalogs',
+        'build_version',
+        'coordinator',
+        'created_by',
+        'created_on',
+        'description',
+        'drivers',
+        'engine_details',
+        'engine_display_name',
+        'engine_id',
+        'engine_properties',
+        'engine_restart',
+        'external_host_name',
+        'group_id',
+        'host_name',
+        'origin',
+        'port',
+        'region',
+        'remove_engine_properties',
+        'size_config',
+        'status',
+        'status_code',
+        'tags',
+        'type',
+        'version',
+        'worker',
+    )
+
+    def __init__(
+        self,
+        external_host_name: str,
+        status_code: int,
+        *,
+        actions: Optional[List[str]] = None,
+        associated_catalogs: Optional[List[str]] = None,
+        build_version: Optional[str] = None,
+        coordinator: Optional['NodeDescription'] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[int] = None,
+        description: Optional[str] = None,
+        drivers: Optional[List['Driver']] = None,
+        engine_details: Optional['EngineDetailsBody'] = None,
+        engine_display_name: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        engine_properties: Optional['PrestoEngineEngineProperties'] = None,
+        engine_restart: Optional[str] = None,
+        group_id: Optional[str] = None,
+        host_name: Optional[str] = None,
+        origin: Optional[str] = None,
+        port: Optional[int] = None,
+        region: Optional[str] = None,
+        remove_engine_properties: Optional['PrestoEnginePatchRemoveEngineProperties'] = None,
+        size_config: Optional[str] = None,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        type: Optional[str] = None,
+        version: Optional[str] = None,
+        worker: Optional['NodeDescription'] = None,
+    ) -> None:
+        """
+        Initialize a PrestoEngine object.
+
+        :param str external_host_name: Applicable only for OCP based clusters.
+               This is typically  servicename+route.
+        :param int status_code: Engine status code.
+        :param List[str] actions: (optional) Actions.
+        :param List[str] associated_catalogs: (optional) Associated catalogs.
+        :param str build_version: (optional) watsonx.data build version.
+        :param NodeDescription coordinator: (optional) NodeDescription.
+        :param str created_by: (optional) Created user name.
+        :param int created_on: (optional) Created time in epoch format.
+        :param str description: (optional) Engine description.
+        :param List[Driver] drivers: (optional) Driver details.
+        :param EngineDetailsBody engine_details: (optional) Node details.
+        :param str engine_display_name: (optional) Engine display name.
+        :param str engine_id: (optional) Engine programmatic name.
+        :param PrestoEngineEngineProperties engine_properties: (optional) Engine
+               properties.
+        :param str engine_restart: (optional) Triggers engine restart if value is
+               force.
+        :param str group_id: (optional) Group ID.
+        :param str host_name: (optional) Engine host name. In case of OCP based
+               clusters, this is internal hostname.
+        :param str origin: (optional) Origin - created or registered.
+        :param int port: (optional) Engine port.
+        :param str region: (optional) Region (cloud).
+        :param PrestoEnginePatchRemoveEngineProperties remove_engine_properties:
+               (optional) RemoveEngine properties.
+        :param str size_config: (optional) Size config.
+        :param str status: (optional) Engine status.
+        :param List[str] tags: (optional) Tags.
+        :param str type: (optional) Engine type presto.
+        :param str version: (optional) Version of the engine.
+        :param NodeDescription worker: (optional) NodeDescription.
+        """
+        self.actions = actions
+        self.associated_catalogs = associated_catalogs
+        self.build_version = build_version
+        self.coordinator = coordinator
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.drivers = drivers
+        self.engine_details = engine_details
+        self.engine_display_name = engine_display_name
+        self.engine_id = engine_id
+        self.engine_properties = engine_properties
+        self.engine_restart = engine_restart
+        self.external_host_name = external_host_name
+        self.group_id = group_id
+        self.host_name = host_name
+        self.origin = origin
+        self.port = port
+        self.region = region
+        self.remove_engine_properties = remove_engine_properties
+        self.size_config = size_config
+        self.status = status
+        self.status_code = status_code
+        self.tags = tags
+        self.type = type
+        self.version = version
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestoEngine':
+        """Initialize a PrestoEngine object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (associated_catalogs := _dict.get('associated_catalogs')) is not None:
+            args['associated_catalogs'] = associated_catalogs
+        if (build_version := _dict.get('build_version')) is not None:
+            args['build_version'] = build_version
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = NodeDescription.from_dict(coordinator)
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (drivers := _dict.get('drivers')) is not None:
+            args['drivers'] = [Driver.from_dict(v) for v in drivers]
+        if (engine_details := _dict.get('engine_details')) is not None:
+            args['engine_details'] = EngineDetailsBody.from_dict(engine_details)
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_id := _dict.get('engine_id')) is not None:
+            args['engine_id'] = engine_id
+        if (engine_properties := _dict.get('engine_properties')) is not None:
+            args['engine_properties'] = PrestoEngineEngineProperties.from_dict(engine_properties)
+        if (engine_restart := _dict.get('engine_restart')) is not None:
+            args['engine_restart'] = engine_restart
+        if (external_host_name := _dict.get('external_host_name')) is not None:
+            args['external_host_name'] = external_host_name
+        else:
+            raise ValueError('Required property \'external_host_name\' not present in PrestoEngine JSON')
+        if (group_id := _dict.get('group_id')) is not None:
+            args['group_id'] = group_id
+        if (host_name := _dict.get('host_name')) is not None:
+            args['host_name'] = host_name
+        if (origin := _dict.get('origin')) is not None:
+            args['origin'] = origin
+        if (port := _dict.get('port')) is not None:
+            args['port'] = port
+        if (region := _dict.get('region')) is not None:
+            args['region'] = region
+        if (remove_engine_properties := _dict.get('remove_engine_properties')) is not None:
+            args['remove_engine_properties'] = PrestoEnginePatchRemoveEngineProperties.from_dict(
+                remove_engine_properties
+            )
+        if (size_config := _dict.get('size_config')) is not None:
+            args['size_config'] = size_config
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_code := _dict.get('status_code')) is not None:
+            args['status_code'] = status_code
+        else:
+            raise ValueError('Required property \'status_code\' not present in PrestoEngine JSON')
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        if (version := _dict.get('version')) is not None:
+            args['version'] = version
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = NodeDescription.from_dict(worker)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestoEngine object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'associated_catalogs') and self.associated_catalogs is not None:
+            _dict['associated_catalogs'] = self.associated_catalogs
+        if hasattr(self, 'build_version') and self.build_version is not None:
+            _dict['build_version'] = self.build_version
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            if isinstance(self.coordinator, dict):
+                _dict['coordinator'] = self.coordinator
+            else:
+                _dict['coordinator'] = self.coordinator.to_dict()
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'drivers') and self.drivers is not None:
+            drivers_list = []
+            for v in self.drivers:
+                if isinstance(v, dict):
+                    drivers_list.append(v)
+                else:
+                    drivers_list.append(v.to_dict())
+            _dict['drivers'] = drivers_list
+        if hasattr(self, 'engine_details') and self.engine_details is not None:
+            if isinstance(self.engine_details, dict):
+                _dict['engine_details'] = self.engine_details
+            else:
+                _dict['engine_details'] = self.engine_details.to_dict()
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_id') and self.engine_id is not None:
+            _dict['engine_id'] = self.engine_id
+        if hasattr(self, 'engine_properties') and self.engine_properties is not None:
+            if isinstance(self.engine_properties, dict):
+                _dict['engine_properties'] = self.engine_properties
+            else:
+                _dict['engine_properties'] = self.engine_properties.to_dict()
+        if hasattr(self, 'engine_restart') and self.engine_restart is not None:
+            _dict['engine_restart'] = self.engine_restart
+        if hasattr(self, 'external_host_name') and self.external_host_name is not None:
+            _dict['external_host_name'] = self.external_host_name
+        if hasattr(self, 'group_id') and self.group_id is not None:
+            _dict['group_id'] = self.group_id
+        if hasattr(self, 'host_name') and self.host_name is not None:
+            _dict['host_name'] = self.host_name
+        if hasattr(self, 'origin') and self.origin is not None:
+            _dict['origin'] = self.origin
+        if hasattr(self, 'port') and self.port is not None:
+            _dict['port'] = self.port
+        if hasattr(self, 'region') and self.region is not None:
+            _dict['region'] = self.region
+        if hasattr(self, 'remove_engine_properties') and self.remove_engine_properties is not None:
+            if isinstance(self.remove_engine_properties, dict):
+                _dict['remove_engine_properties'] = self.remove_engine_properties
+            else:
+                _dict['remove_engine_properties'] = self.remove_engine_properties.to_dict()
+        if hasattr(self, 'size_config') and self.size_config is not None:
+            _dict['size_config'] = self.size_config
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'status_code') and self.status_code is not None:
+            _dict['status_code'] = self.status_code
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'version') and self.version is not None:
+            _dict['version'] = self.version
+        if hasattr(self, 'worker') and self.worker is not None:
+            if isinstance(self.worker, dict):
+                _dict['worker'] = self.worker
+            else:
+                _dict['worker'] = self.worker.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestoEngine object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestoEngine.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestoEngine object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestoEngine') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestoEngine') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class EngineRestartEnum(str, Enum):
+        """
+        Triggers engine restart if value is force.
+        """
+
+        FORCE = 'force'
+        FALSE = 'false'
+
+    class OriginEnum(str, Enum):
+        """
+        Origin - created or registered.
+        """
+
+        NATIVE = 'native'
+        EXTERNAL = 'external'
+        DISCOVER = 'discover'
+
+    class StatusEnum(str, Enum):
+        """
+        Engine status.
+        """
+
+        RUNNING = 'running'
+        PENDING = 'pending'
+        STOPPED = 'stopped'
+
+
+class PrestoEngineCollection:
+    """
+    List Presto engines.
+
+    :param List[PrestoEngine] presto_engines: (optional) Presto engine.
+    """
+
+    __slots__ = ('presto_engines',)
+
+    def __init__(
+        self,
+        *,
+        presto_engines: Optional[List['PrestoEngine']] = None,
+    ) -> None:
+        """
+        Initialize a PrestoEngineCollection object.
+
+        :param List[PrestoEngine] presto_engines: (optional) Presto engine.
+        """
+        self.presto_engines = presto_engines
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestoEngineCollection':
+        """Initialize a PrestoEngineCollection object from a json dictionary."""
+        args = {}
+        if (presto_engines := _dict.get('presto_engines')) is not None:
+            args['presto_engines'] = [PrestoEngine.from_dict(v) for v in presto_engines]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestoEngineCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'presto_engines') and self.presto_engines is not None:
+            presto_engines_list = []
+            for v in self.presto_engines:
+                if isinstance(v, dict):
+                    presto_engines_list.append(v)
+                else:
+                    presto_engines_list.append(v.to_dict())
+            _dict['presto_engines'] = presto_engines_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestoEngineCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestoEngineCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestoEngineCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestoEngineCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestoEngineCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestoEngineEngineProperties:
+    """
+    Engine properties.
+
+    :param PrestoEnginePropertiesCatalog catalog: (optional) Catalog configuration
+          settings.
+    :param EnginePropertiesOaiGen1Configuration configuration: (optional)
+          Configuration settings.
+    :param PrestoEnginePropertiesGlobal global_: (optional) Global session is to
+          accomodate all the custom properties that can be applicable for both coordinator
+          and worker.
+    :param EnginePropertiesOaiGen1Jvm jvm: (optional) JVM settings.
+    """
+
+    __slots__ = ('catalog', 'configuration', 'global_', 'jvm')
+
+    def __init__(
+        self,
+        *,
+        catalog: Optional['PrestoEnginePropertiesCatalog'] = None,
+        configuration: Optional['EnginePropertiesOaiGen1Configuration'] = None,
+        global_: Optional['PrestoEnginePropertiesGlobal'] = None,
+        jvm: Optional['EnginePropertiesOaiGen1Jvm'] = None,
+    ) -> None:
+        """
+        Initialize a PrestoEngineEngineProperties object.
+
+        :param PrestoEnginePropertiesCatalog catalog: (optional) Catalog
+               configuration settings.
+        :param EnginePropertiesOaiGen1Configuration configuration: (optional)
+               Configuration settings.
+        :param PrestoEnginePropertiesGlobal global_: (optional) Global session is
+               to accomodate all the custom properties that can be applicable for both
+               coordinator and worker.
+        :param EnginePropertiesOaiGen1Jvm jvm: (optional) JVM settings.
+        """
+        self.catalog = catalog
+        self.configuration = configuration
+        self.global_ = global_
+        self.jvm = jvm
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestoEngineEngineProperties':
+        """Initialize a PrestoEngineEngineProperties object from a json dictionary."""
+        args = {}
+        if (catalog := _dict.get('catalog')) is not None:
+            args['catalog'] = PrestoEnginePropertiesCatalog.from_dict(catalog)
+        if (configuration := _dict.get('configuration')) is not None:
+            args['configuration'] = EnginePropertiesOaiGen1Configuration.from_dict(configuration)
+        if (global_ := _dict.get('global')) is not None:
+            args['global_'] = PrestoEnginePropertiesGlobal.from_dict(global_)
+        if (jvm := _dict.get('jvm')) is not None:
+            args['jvm'] = EnginePropertiesOaiGen1Jvm.from_dict(jvm)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestoEngineEngineProperties object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalog') and self.catalog is not None:
+            if isinstance(self.catalog, dict):
+                _dict['catalog'] = self.catalog
+            else:
+                _dict['catalog'] = self.catalog.to_dict()
+        if hasattr(self, 'configuration') and self.configuration is not None:
+            if isinstance(self.configuration, dict):
+                _dict['configuration'] = self.configuration
+            else:
+                _dict['configuration'] = self.configuration.to_dict()
+        if hasattr(self, 'global_') and self.global_ is not None:
+            if isinstance(self.global_, dict):
+                _dict['global'] = self.global_
+            else:
+                _dict['global'] = self.global_.to_dict()
+        if hasattr(self, 'jvm') and self.jvm is not None:
+            if isinstance(self.jvm, dict):
+                _dict['jvm'] = self.jvm
+            else:
+                _dict['jvm'] = self.jvm.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestoEngineEngineProperties object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestoEngineEngineProperties.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestoEngineEngineProperties object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestoEngineEngineProperties') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestoEngineEngineProperties') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestoEnginePatch:
+    """
+    UpdateEngine body.
+
+    :param str description: (optional) Modified description.
+    :param str engine_display_name: (optional) Engine display name.
+    :param PrestoEngineEngineProperties engine_properties: (optional) Engine
+          properties.
+    :param str engine_restart: (optional) Triggers engine restart if value is force.
+    :param PrestoEnginePatchRemoveEngineProperties remove_engine_properties:
+          (optional) RemoveEngine properties.
+    :param List[str] tags: (optional) Tags.
+    """
+
+    __slots__ = (
+        'description',
+        'engine_display_name',
+        'engine_properties',
+        'engine_restart',
+        'remove_engine_properties',
+        'tags',
+    )
+
+    def __init__(
+        self,
+        *,
+        description: Optional[str] = None,
+        engine_display_name: Optional[str] = None,
+        engine_properties: Optional['PrestoEngineEngineProperties'] = None,
+        engine_restart: Optional[str] = None,
+        remove_engine_properties: Optional['PrestoEnginePatchRemoveEngineProperties'] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a PrestoEnginePatch object.
+
+        :param str description: (optional) Modified description.
+        :param str engine_display_name: (optional) Engine display name.
+        :param PrestoEngineEngineProperties engine_properties: (optional) Engine
+               properties.
+        :param str engine_restart: (optional) Triggers engine restart if value is
+               force.
+        :param PrestoEnginePatchRemoveEngineProperties remove_engine_properties:
+               (optional) RemoveEngine properties.
+        :param List[str] tags: (optional) Tags.
+        """
+        self.description = description
+        self.engine_display_name = engine_display_name
+        self.engine_properties = engine_properties
+        self.engine_restart = engine_restart
+        self.remove_engine_properties = remove_engine_properties
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestoEnginePatch':
+        """Initialize a PrestoEnginePatch object from a json dictionary."""
+        args = {}
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_properties := _dict.get('engine_properties')) is not None:
+            args['engine_properties'] = PrestoEngineEngineProperties.from_dict(engine_properties)
+        if (engine_restart := _dict.get('engine_restart')) is not None:
+            args['engine_restart'] = engine_restart
+        if (remove_engine_properties := _dict.get('remove_engine_properties')) is not None:
+            args['remove_engine_properties'] = PrestoEnginePatchRemoveEngineProperties.from_dict(
+                remove_engine_properties
+            )
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestoEnginePatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_properties') and self.engine_properties is not None:
+            if isinstance(self.engine_properties, dict):
+                _dict['engine_properties'] = self.engine_properties
+            else:
+                _dict['engine_properties'] = self.engine_properties.to_dict()
+        if hasattr(self, 'engine_restart') and self.engine_restart is not None:
+            _dict['engine_restart'] = self.engine_restart
+        if hasattr(self, 'remove_engine_properties') and self.remove_engine_properties is not None:
+            if isinstance(self.remove_engine_properties, dict):
+                _dict['remove_engine_properties'] = self.remove_engine_properties
+            else:
+                _dict['remove_engine_properties'] = self.remove_engine_properties.to_dict()
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestoEnginePatch object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestoEnginePatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestoEnginePatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestoEnginePatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestoEnginePatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class EngineRestartEnum(str, Enum):
+        """
+        Triggers engine restart if value is force.
+        """
+
+        FORCE = 'force'
+        FALSE = 'false'
+
+
+class PrestoEnginePatchRemoveEngineProperties:
+    """
+    RemoveEngine properties.
+
+    :param RemoveEnginePropertiesOaiGenConfiguration configuration: (optional)
+          Configuration settings for removing engine properties.
+    :param RemoveEnginePropertiesOaiGenJvm jvm: (optional) JVM properties.
+    :param PrestoEnginePropertiesCatalog catalog: (optional) Catalog configuration
+          settings.
+    """
+
+    __slots__ = ('configuration', 'jvm', 'catalog')
+
+    def __init__(
+        self,
+        *,
+        configuration: Optional['RemoveEnginePropertiesOaiGenConfiguration'] = None,
+        jvm: Optional['RemoveEnginePropertiesOaiGenJvm'] = None,
+        catalog: Optional['PrestoEnginePropertiesCatalog'] = None,
+    ) -> None:
+        """
+        Initialize a PrestoEnginePatchRemoveEngineProperties object.
+
+        :param RemoveEnginePropertiesOaiGenConfiguration configuration: (optional)
+               Configuration settings for removing engine properties.
+        :param RemoveEnginePropertiesOaiGenJvm jvm: (optional) JVM properties.
+        :param PrestoEnginePropertiesCatalog catalog: (optional) Catalog
+               configuration settings.
+        """
+        self.configuration = configuration
+        self.jvm = jvm
+        self.catalog = catalog
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestoEnginePatchRemoveEngineProperties':
+        """Initialize a PrestoEnginePatchRemoveEngineProperties object from a json dictionary."""
+        args = {}
+        if (configuration := _dict.get('configuration')) is not None:
+            args['configuration'] = RemoveEnginePropertiesOaiGenConfiguration.from_dict(configuration)
+        if (jvm := _dict.get('jvm')) is not None:
+            args['jvm'] = RemoveEnginePropertiesOaiGenJvm.from_dict(jvm)
+        if (catalog := _dict.get('catalog')) is not None:
+            args['catalog'] = PrestoEnginePropertiesCatalog.from_dict(catalog)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestoEnginePatchRemoveEngineProperties object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'configuration') and self.configuration is not None:
+            if isinstance(self.configuration, dict):
+                _dict['configuration'] = self.configuration
+            else:
+                _dict['configuration'] = self.configuration.to_dict()
+        if hasattr(self, 'jvm') and self.jvm is not None:
+            if isinstance(self.jvm, dict):
+                _dict['jvm'] = self.jvm
+            else:
+                _dict['jvm'] = self.jvm.to_dict()
+        if hasattr(self, 'catalog') and self.catalog is not None:
+            if isinstance(self.catalog, dict):
+                _dict['catalog'] = self.catalog
+            else:
+                _dict['catalog'] = self.catalog.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestoEnginePatchRemoveEngineProperties object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestoEnginePatchRemoveEngineProperties.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestoEnginePatchRemoveEngineProperties object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestoEnginePatchRemoveEngineProperties') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestoEnginePatchRemoveEngineProperties') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestoEnginePropertiesCatalog:
+    """
+    Catalog configuration settings.
+
+    :param str catalog_name: (optional) Name of the catalog.
+    """
+
+    __slots__ = ('catalog_name',)
+
+    def __init__(
+        self,
+        *,
+        catalog_name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a PrestoEnginePropertiesCatalog object.
+
+        :param str catalog_name: (optional) Name of the catalog.
+        """
+        self.catalog_name = catalog_name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestoEnginePropertiesCatalog':
+        """Initialize a PrestoEnginePropertiesCatalog object from a json dictionary."""
+        args = {}
+        if (catalog_name := _dict.get('catalog_name')) is not None:
+            args['catalog_name'] = catalog_name
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestoEnginePropertiesCatalog object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalog_name') and self.catalog_name is not None:
+            _dict['catalog_name'] = self.catalog_name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestoEnginePropertiesCatalog object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestoEnginePropertiesCatalog.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestoEnginePropertiesCatalog object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestoEnginePropertiesCatalog') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestoEnginePropertiesCatalog') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class PrestoEnginePropertiesGlobal:
+    """
+    Global session is to accomodate all the custom properties that can be applicable for
+    both coordinator and worker.
+
+    :param str global_property: (optional) Global property settings.
+    """
+
+    __slots__ = ('global_property',)
+
+    def __init__(
+        self,
+        *,
+        global_property: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a PrestoEnginePropertiesGlobal object.
+
+        :param str global_property: (optional) Global property settings.
+        """
+        self.global_property = global_property
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PrestoEnginePropertiesGlobal':
+        """Initialize a PrestoEnginePropertiesGlobal object from a json dictionary."""
+        args = {}
+        if (global_property := _dict.get('global_property')) is not None:
+            args['global_property'] = global_property
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a PrestoEnginePropertiesGlobal object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'global_property') and self.global_property is not None:
+            _dict['global_property'] = self.global_property
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this PrestoEnginePropertiesGlobal object as a `dict`."""
+        return {name: getattr(self, name) for name in PrestoEnginePropertiesGlobal.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this PrestoEnginePropertiesGlobal object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'PrestoEnginePropertiesGlobal') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'PrestoEnginePropertiesGlobal') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RemoveEngineProperties:
+    """
+    RemoveEngine properties.
+
+    :param PrestissimoEnginePropertiesCatalog catalog: (optional) catalog
+          properties.
+    :param RemoveEnginePropertiesConfiguration configuration: (optional) remove
+          engine properties configuration.
+    :param RemoveEnginePropertiesConfiguration jvm: (optional) remove engine
+          properties configuration.
+    :param List[str] velox: (optional) velox description.
+    """
+
+    __slots__ = ('catalog', 'configuration', 'jvm', 'velox')
+
+    def __init__(
+        self,
+        *,
+        catalog: Optional['PrestissimoEnginePropertiesCatalog'] = None,
+        configuration: Optional['RemoveEnginePropertiesConfiguration'] = None,
+        jvm: Optional['RemoveEnginePropertiesConfiguration'] = None,
+        velox: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a RemoveEngineProperties object.
+
+        :param PrestissimoEnginePropertiesCatalog catalog: (optional) catalog
+               properties.
+        :param RemoveEnginePropertiesConfiguration configuration: (optional) remove
+               engine properties configuration.
+        :param RemoveEnginePropertiesConfiguration jvm: (optional) remove engine
+               properties configuration.
+        :param List[str] velox: (optional) velox description.
+        """
+        self.catalog = catalog
+        self.configuration = configuration
+        self.jvm = jvm
+        self.velox = velox
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RemoveEngineProperties':
+        """Initialize a RemoveEngineProperties object from a json dictionary."""
+        args = {}
+        if (catalog := _dict.get('catalog')) is not None:
+            args['catalog'] = PrestissimoEnginePropertiesCatalog.from_dict(catalog)
+        if (configuration := _dict.get('configuration')) is not None:
+            args['configuration'] = RemoveEnginePropertiesConfiguration.from_dict(configuration)
+        if (jvm := _dict.get('jvm')) is not None:
+            args['jvm'] = RemoveEnginePropertiesConfiguration.from_dict(jvm)
+        if (velox := _dict.get('velox')) is not None:
+            args['velox'] = velox
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RemoveEngineProperties object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'catalog') and self.catalog is not None:
+            if isinstance(self.catalog, dict):
+                _dict['catalog'] = self.catalog
+            else:
+                _dict['catalog'] = self.catalog.to_dict()
+        if hasattr(self, 'configuration') and self.configuration is not None:
+            if isinstance(self.configuration, dict):
+                _dict['configuration'] = self.configuration
+            else:
+                _dict['configuration'] = self.configuration.to_dict()
+        if hasattr(self, 'jvm') and self.jvm is not None:
+            if isinstance(self.jvm, dict):
+                _dict['jvm'] = self.jvm
+            else:
+                _dict['jvm'] = self.jvm.to_dict()
+        if hasattr(self, 'velox') and self.velox is not None:
+            _dict['velox'] = self.velox
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this RemoveEngineProperties object as a `dict`."""
+        return {name: getattr(self, name) for name in RemoveEngineProperties.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RemoveEngineProperties object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RemoveEngineProperties') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RemoveEngineProperties') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RemoveEnginePropertiesConfiguration:
+    """
+    remove engine properties configuration.
+
+    :param List[str] coordinator: (optional) description for coordinator property.
+    :param List[str] worker: (optional) description for worker property.
+    """
+
+    __slots__ = ('coordinator', 'worker')
+
+    def __init__(
+        self,
+        *,
+        coordinator: Optional[List[str]] = None,
+        worker: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a RemoveEnginePropertiesConfiguration object.
+
+        :param List[str] coordinator: (optional) description for coordinator
+               property.
+        :param List[str] worker: (optional) description for worker property.
+        """
+        self.coordinator = coordinator
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RemoveEnginePropertiesConfiguration':
+        """Initialize a RemoveEnginePropertiesConfiguration object from a json dictionary."""
+        args = {}
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = coordinator
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = worker
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RemoveEnginePropertiesConfiguration object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            _dict['coordinator'] = self.coordinator
+        if hasattr(self, 'worker') and self.worker is not None:
+            _dict['worker'] = self.worker
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this RemoveEnginePropertiesConfiguration object as a `dict`."""
+        return {name: getattr(self, name) for name in RemoveEnginePropertiesConfiguration.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RemoveEnginePropertiesConfiguration object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RemoveEnginePropertiesConfiguration') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RemoveEnginePropertiesConfiguration') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RemoveEnginePropertiesOaiGenConfiguration:
+    """
+    Configuration settings for removing engine properties.
+
+    :param List[str] coordinator: (optional) List of coordinator properties.
+    :param List[str] worker: (optional) List of worker properties.
+    """
+
+    __slots__ = ('coordinator', 'worker')
+
+    def __init__(
+        self,
+        *,
+        coordinator: Optional[List[str]] = None,
+        worker: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a RemoveEnginePropertiesOaiGenConfiguration object.
+
+        :param List[str] coordinator: (optional) List of coordinator properties.
+        :param List[str] worker: (optional) List of worker properties.
+        """
+        self.coordinator = coordinator
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RemoveEnginePropertiesOaiGenConfiguration':
+        """Initialize a RemoveEnginePropertiesOaiGenConfiguration object from a json dictionary."""
+        args = {}
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = coordinator
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = worker
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RemoveEnginePropertiesOaiGenConfiguration object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            _dict['coordinator'] = self.coordinator
+        if hasattr(self, 'worker') and self.worker is not None:
+            _dict['worker'] = self.worker
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this RemoveEnginePropertiesOaiGenConfiguration object as a `dict`."""
+        return {name: getattr(self, name) for name in RemoveEnginePropertiesOaiGenConfiguration.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RemoveEnginePropertiesOaiGenConfiguration object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RemoveEnginePropertiesOaiGenConfiguration') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RemoveEnginePropertiesOaiGenConfiguration') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RemoveEnginePropertiesOaiGenJvm:
+    """
+    JVM properties.
+
+    :param List[str] coordinator: (optional) List of coordinator properties.
+    :param List[str] worker: (optional) List of worker properties.
+    """
+
+    __slots__ = ('coordinator', 'worker')
+
+    def __init__(
+        self,
+        *,
+        coordinator: Optional[List[str]] = None,
+        worker: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a RemoveEnginePropertiesOaiGenJvm object.
+
+        :param List[str] coordinator: (optional) List of coordinator properties.
+        :param List[str] worker: (optional) List of worker properties.
+        """
+        self.coordinator = coordinator
+        self.worker = worker
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RemoveEnginePropertiesOaiGenJvm':
+        """Initialize a RemoveEnginePropertiesOaiGenJvm object from a json dictionary."""
+        args = {}
+        if (coordinator := _dict.get('coordinator')) is not None:
+            args['coordinator'] = coordinator
+        if (worker := _dict.get('worker')) is not None:
+            args['worker'] = worker
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RemoveEnginePropertiesOaiGenJvm object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'coordinator') and self.coordinator is not None:
+            _dict['coordinator'] = self.coordinator
+        if hasattr(self, 'worker') and self.worker is not None:
+            _dict['worker'] = self.worker
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this RemoveEnginePropertiesOaiGenJvm object as a `dict`."""
+        return {name: getattr(self, name) for name in RemoveEnginePropertiesOaiGenJvm.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RemoveEnginePropertiesOaiGenJvm object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RemoveEnginePropertiesOaiGenJvm') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RemoveEnginePropertiesOaiGenJvm') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ResultPrestissimoExplainStatement:
+    """
+    ExplainStatement OK.
+
+    :param str result: (optional) Result.
+    """
+
+    __slots__ = ('result',)
+
+    def __init__(
+        self,
+        *,
+        result: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ResultPrestissimoExplainStatement object.
+
+        :param str result: (optional) Result.
+        """
+        self.result = result
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ResultPrestissimoExplainStatement':
+        """Initialize a ResultPrestissimoExplainStatement object from a json dictionary."""
+        args = {}
+        if (result := _dict.get('result')) is not None:
+            args['result'] = result
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ResultPrestissimoExplainStatement object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'result') and self.result is not None:
+            _dict['result'] = self.result
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this ResultPrestissimoExplainStatement object as a `dict`."""
+        return {name: getattr(self, name) for name in ResultPrestissimoExplainStatement.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ResultPrestissimoExplainStatement object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ResultPrestissimoExplainStatement') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ResultPrestissimoExplainStatement') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ResultRunPrestissimoExplainAnalyzeStatement:
+    """
+    explainAnalyzeStatement OK.
+
+    :param str result: (optional) explainAnalyzeStatement result.
+    """
+
+    __slots__ = ('result',)
+
+    def __init__(
+        self,
+        *,
+        result: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a ResultRunPrestissimoExplainAnalyzeStatement object.
+
+        :param str result: (optional) explainAnalyzeStatement result.
+        """
+        self.result = result
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ResultRunPrestissimoExplainAnalyzeStatement':
+        """Initialize a ResultRunPrestissimoExplainAnalyzeStatement object from a json dictionary."""
+        args = {}
+        if (result := _dict.get('result')) is not None:
+            args['result'] = result
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ResultRunPrestissimoExplainAnalyzeStatement object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'result') and self.result is not None:
+            _dict['result'] = self.result
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this ResultRunPrestissimoExplainAnalyzeStatement object as a `dict`."""
+        return {name: getattr(self, name) for name in ResultRunPrestissimoExplainAnalyzeStatement.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ResultRunPrestissimoExplainAnalyzeStatement object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ResultRunPrestissimoExplainAnalyzeStatement') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ResultRunPrestissimoExplainAnalyzeStatement') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RunExplainAnalyzeStatementOKBody:
+    """
+    explainAnalyzeStatement OK.
+
+    :param SuccessResponse response: Response of success.
+    :param str result: explainAnalyzeStatement result.
+    """
+
+    __slots__ = ('response', 'result')
+
+    def __init__(
+        self,
+        response: 'SuccessResponse',
+        result: str,
+    ) -> None:
+        """
+        Initialize a RunExplainAnalyzeStatementOKBody object.
+
+        :param SuccessResponse response: Response of success.
+        :param str result: explainAnalyzeStatement result.
+        """
+        self.response = response
+        self.result = result
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RunExplainAnalyzeStatementOKBody':
+        """Initialize a RunExplainAnalyzeStatementOKBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        else:
+            raise ValueError('Required property \'response\' not present in RunExplainAnalyzeStatementOKBody JSON')
+        if (result := _dict.get('result')) is not None:
+            args['result'] = result
+        else:
+            raise ValueError('Required property \'result\' not present in RunExplainAnalyzeStatementOKBody JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RunExplainAnalyzeStatementOKBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        if hasattr(self, 'result') and self.result is not None:
+            _dict['result'] = self.result
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this RunExplainAnalyzeStatementOKBody object as a `dict`."""
+        return {name: getattr(self, name) for name in RunExplainAnalyzeStatementOKBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RunExplainAnalyzeStatementOKBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RunExplainAnalyzeStatementOKBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RunExplainAnalyzeStatementOKBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class RunExplainStatementOKBody:
+    """
+    ExplainStatement OK.
+
+    :param SuccessResponse response: Response of success.
+    :param str result: Result.
+    """
+
+    __slots__ = ('response', 'result')
+
+    def __init__(
+        self,
+        response: 'SuccessResponse',
+        result: str,
+    ) -> None:
+        """
+        Initialize a RunExplainStatementOKBody object.
+
+        :param SuccessResponse response: Response of success.
+        :param str result: Result.
+        """
+        self.response = response
+        self.result = result
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'RunExplainStatementOKBody':
+        """Initialize a RunExplainStatementOKBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        else:
+            raise ValueError('Required property \'response\' not present in RunExplainStatementOKBody JSON')
+        if (result := _dict.get('result')) is not None:
+            args['result'] = result
+        else:
+            raise ValueError('Required property \'result\' not present in RunExplainStatementOKBody JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a RunExplainStatementOKBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        if hasattr(self, 'result') and self.result is not None:
+            _dict['result'] = self.result
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this RunExplainStatementOKBody object as a `dict`."""
+        return {name: getattr(self, name) for name in RunExplainStatementOKBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this RunExplainStatementOKBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'RunExplainStatementOKBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'RunExplainStatementOKBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
@@ -0,0 +1,643 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: ingestion jobs.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+
+class IngestionJob:
+    """
+    Ingestion job.
+
+    :param bool create_if_not_exist: (optional) Create new target table (if True);
+          Insert into pre-existing target table (if False).
+    :param IngestionJobCsvProperty csv_property: (optional) Ingestion CSV
+          properties.
+    :param str details: (optional) Error messages of failed ingestion job.
+    :param str end_timestamp: (optional) Unix timestamp of ingestion job completing.
+    :param str engine_id: (optional) ID of the spark engine to be used for
+          ingestion.
+    :param str engine_name: (optional) Name of the spark engine to be used for
+          ingestion.
+    :param IngestionJobExecuteConfig execute_config: (optional) Ingestion engine
+          configuration.
+    :param str instance_id: (optional) Instance ID of the lakehouse where ingestion
+          job is executed.
+    :param str job_id: (optional) Job ID of the ingestion job.
+    :param str partition_by: (optional) partition by expression of the target table.
+    :param str schema: (optional) Schema definition of the source table.
+    :param str source_data_files: (optional) Source data location of the ingestion
+          job.
+    :param str source_file_type: (optional) Source file types (parquet or csv).
+    :param str start_timestamp: (optional) Unix timestamp of ingestion job starting.
+    :param str status: (optional) Current state of ingestion job.
+    :param str target_table: (optional) Target table name in format
+          catalog.schema.table.
+    :param str username: (optional) Ingestion job user.
+    :param bool validate_csv_header: (optional) Validate CSV header if the target
+          table exist.
+    """
+
+    __slots__ = (
+        'create_if_not_exist',
+        'csv_property',
+        'details',
+        'end_timestamp',
+        'engine_id',
+        'engine_name',
+        'execute_config',
+        'instance_id',
+        'job_id',
+        'partition_by',
+        'schema',
+        'source_data_files',
+        'source_file_type',
+        'start_timestamp',
+        'status',
+        'target_table',
+        'username',
+        'validate_csv_header',
+    )
+
+    def __init__(
+        self,
+        *,
+        create_if_not_exist: Optional[bool] = None,
+        csv_property: Optional['IngestionJobCsvProperty'] = None,
+        details: Optional[str] = None,
+        end_timestamp: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        engine_name: Optional[str] = None,
+        execute_config: Optional['IngestionJobExecuteConfig'] = None,
+        instance_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        partition_by: Optional[str] = None,
+        schema: Optional[str] = None,
+        source_data_files: Optional[str] = None,
+        source_file_type: Optional[str] = None,
+        start_timestamp: Optional[str] = None,
+        status: Optional[str] = None,
+        target_table: Optional[str] = None,
+        username: Optional[str] = None,
+        validate_csv_header: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize a IngestionJob object.
+
+        :param bool create_if_not_exist: (optional) Create new target table (if
+               True); Insert into pre-existing target table (if False).
+        :param IngestionJobCsvProperty csv_property: (optional) Ingestion CSV
+               properties.
+        :param str details: (optional) Error messages of failed ingestion job.
+        :param str end_timestamp: (optional) Unix timestamp of ingestion job
+               completing.
+        :param str engine_id: (optional) ID of the spark engine to be used for
+               ingestion.
+        :param str engine_name: (optional) Name of the spark engine to be used for
+               ingestion.
+        :param IngestionJobExecuteConfig execute_config: (optional) Ingestion
+               engine configuration.
+        :param str instance_id: (optional) Instance ID of the lakehouse where
+               ingestion job is executed.
+        :param str job_id: (optional) Job ID of the ingestion job.
+        :param str partition_by: (optional) partition by expression of the target
+               table.
+        :param str schema: (optional) Schema definition of the source table.
+        :param str source_data_files: (optional) Source data location of the
+               ingestion job.
+        :param str source_file_type: (optional) Source file types (parquet or csv).
+        :param str start_timestamp: (optional) Unix timestamp of ingestion job
+               starting.
+        :param str status: (optional) Current state of ingestion job.
+        :param str target_table: (optional) Target table name in format
+               catalog.schema.table.
+        :param str username: (optional) Ingestion job user.
+        :param bool validate_csv_header: (optional) Validate CSV header if the
+               target table exist.
+        """
+        self.create_if_not_exist = create_if_not_exist
+        self.csv_property = csv_property
+        self.details = details
+        self.end_timestamp = end_timestamp
+        self.engine_id = engine_id
+        self.engine_name = engine_name
+        self.execute_config = execute_config
+        self.instance_id = instance_id
+        self.job_id = job_id
+        self.partition_by = partition_by
+        self.schema = schema
+        self.source_data_files = source_data_files
+        self.source_file_type = source_file_type
+        self.start_timestamp = start_timestamp
+        self.status = status
+        self.target_table = target_table
+        self.username = username
+        self.validate_csv_header = validate_csv_header
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'IngestionJob':
+        """Initialize a IngestionJob object from a json dictionary."""
+        args = {}
+        if (create_if_not_exist := _dict.get('create_if_not_exist')) is not None:
+            args['create_if_not_exist'] = create_if_not_exist
+        if (csv_property := _dict.get('csv_property')) is not None:
+            args['csv_property'] = IngestionJobCsvProperty.from_dict(csv_property)
+        if (details := _dict.get('details')) is not None:
+            args['details'] = details
+        if (end_timestamp := _dict.get('end_timestamp')) is not None:
+            args['end_timestamp'] = end_timestamp
+        if (engine_id := _dict.get('engine_id')) is not None:
+            args['engine_id'] = engine_id
+        if (engine_name := _dict.get('engine_name')) is not None:
+            args['engine_name'] = engine_name
+        if (execute_config := _dict.get('execute_config')) is not None:
+            args['execute_config'] = IngestionJobExecuteConfig.from_dict(execute_config)
+        if (instance_id := _dict.get('instance_id')) is not None:
+            args['instance_id'] = instance_id
+        if (job_id := _dict.get('job_id')) is not None:
+            args['job_id'] = job_id
+        if (partition_by := _dict.get('partition_by')) is not None:
+            args['partition_by'] = partition_by
+        if (schema := _dict.get('schema')) is not None:
+            args['schema'] = schema
+        if (source_data_files := _dict.get('source_data_files')) is not None:
+            args['source_data_files'] = source_data_files
+        if (source_file_type := _dict.get('source_file_type')) is not None:
+            args['source_file_type'] = source_file_type
+        if (start_timestamp := _dict.get('start_timestamp')) is not None:
+            args['start_timestamp'] = start_timestamp
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (target_table := _dict.get('target_table')) is not None:
+            args['target_table'] = target_table
+        if (username := _dict.get('username')) is not None:
+            args['username'] = username
+        if (validate_csv_header := _dict.get('validate_csv_header')) is not None:
+            args['validate_csv_header'] = validate_csv_header
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a IngestionJob object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'create_if_not_exist') and self.create_if_not_exist is not None:
+            _dict['create_if_not_exist'] = self.create_if_not_exist
+        if hasattr(self, 'csv_property') and self.csv_property is not None:
+            if isinstance(self.csv_property, dict):
+                _dict['csv_property'] = self.csv_property
+            else:
+                _dict['csv_property'] = self.csv_property.to_dict()
+        if hasattr(self, 'details') and self.details is not None:
+            _dict['details'] = self.details
+        if hasattr(self, 'end_timestamp') and self.end_timestamp is not None:
+            _dict['end_timestamp'] = self.end_timestamp
+        if hasattr(self, 'engine_id') and self.engine_id is not None:
+            _dict['engine_id'] = self.engine_id
+        if hasattr(self, 'engine_name') and self.engine_name is not None:
+            _dict['engine_name'] = self.engine_name
+        if hasattr(self, 'execute_config') and self.execute_config is not None:
+            if isinstance(self.execute_config, dict):
+                _dict['execute_config'] = self.execute_config
+            else:
+                _dict['execute_config'] = self.execute_config.to_dict()
+        if hasattr(self, 'instance_id') and self.instance_id is not None:
+            _dict['instance_id'] = self.instance_id
+        if hasattr(self, 'job_id') and self.job_id is not None:
+            _dict['job_id'] = self.job_id
+        if hasattr(self, 'partition_by') and self.partition_by is not None:
+            _dict['partition_by'] = self.partition_by
+        if hasattr(self, 'schema') and self.schema is not None:
+            _dict['schema'] = self.schema
+        if hasattr(self, 'source_data_files') and self.source_data_files is not None:
+            _dict['source_data_files'] = self.source_data_files
+        if hasattr(self, 'source_file_type') and self.source_file_type is not None:
+            _dict['source_file_type'] = self.source_file_type
+        if hasattr(self, 'start_timestamp') and self.start_timestamp is not None:
+            _dict['start_timestamp'] = self.start_timestamp
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'target_table') and self.target_table is not None:
+            _dict['target_table'] = self.target_table
+        if hasattr(self, 'username') and self.username is not None:
+            _dict['username'] = self.username
+        if hasattr(self, 'validate_csv_header') and self.validate_csv_header is not None:
+            _dict['validate_csv_header'] = self.validate_csv_header
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this IngestionJob object as a `dict`."""
+        return {name: getattr(self, name) for name in IngestionJob.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this IngestionJob object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'IngestionJob') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'IngestionJob') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class SourceFileTypeEnum(str, Enum):
+        """
+        Source file types (parquet or csv).
+        """
+
+        CSV = 'csv'
+        PARQUET = 'parquet'
+
+
+class IngestionJobCollection:
+    """
+    List ingestion jobs.
+
+    :param List[IngestionJob] ingestion_jobs: (optional) Ingestion jobs.
+    :param IngestionJobCollectionPage first: (optional) A page in a pagination
+          collection.
+    :param IngestionJobCollectionPage next: (optional) A page in a pagination
+          collection.
+    """
+
+    __slots__ = ('ingestion_jobs', 'first', 'next')
+
+    def __init__(
+        self,
+        *,
+        ingestion_jobs: Optional[List['IngestionJob']] = None,
+        first: Optional['IngestionJobCollectionPage'] = None,
+        next: Optional['IngestionJobCollectionPage'] = None,
+    ) -> None:
+        """
+        Initialize a IngestionJobCollection object.
+
+        :param List[IngestionJob] ingestion_jobs: (optional) Ingestion jobs.
+        :param IngestionJobCollectionPage first: (optional) A page in a pagination
+               collection.
+        :param IngestionJobCollectionPage next: (optional) A page in a pagination
+               collection.
+        """
+        self.ingestion_jobs = ingestion_jobs
+        self.first = first
+        self.next = next
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'IngestionJobCollection':
+        """Initialize a IngestionJobCollection object from a json dictionary."""
+        args = {}
+        if (ingestion_jobs := _dict.get('ingestion_jobs')) is not None:
+            args['ingestion_jobs'] = [IngestionJob.from_dict(v) for v in ingestion_jobs]
+        if (first := _dict.get('first')) is not None:
+            args['first'] = IngestionJobCollectionPage.from_dict(first)
+        if (next := _dict.get('next')) is not None:
+            args['next'] = IngestionJobCollectionPage.from_dict(next)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a IngestionJobCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'ingestion_jobs') and self.ingestion_jobs is not None:
+            ingestion_jobs_list = []
+            for v in self.ingestion_jobs:
+                if isinstance(v, dict):
+                    ingestion_jobs_list.append(v)
+                else:
+                    ingestion_jobs_list.append(v.to_dict())
+            _dict['ingestion_jobs'] = ingestion_jobs_list
+        if hasattr(self, 'first') and self.first is not None:
+            if isinstance(self.first, dict):
+                _dict['first'] = self.first
+            else:
+                _dict['first'] = self.first.to_dict()
+        if hasattr(self, 'next') and self.next is not None:
+            if isinstance(self.next, dict):
+                _dict['next'] = self.next
+            else:
+                _dict['next'] = self.next.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this IngestionJobCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in IngestionJobCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this IngestionJobCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'IngestionJobCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'IngestionJobCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class IngestionJobCollectionPage:
+    """
+    A page in a pagination collection.
+
+    :param str href: (optional) Link to the a page in the collection.
+    """
+
+    __slots__ = ('href',)
+
+    def __init__(
+        self,
+        *,
+        href: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a IngestionJobCollectionPage object.
+
+        """
+        self.href = href
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'IngestionJobCollectionPage':
+        """Initialize a IngestionJobCollectionPage object from a json dictionary."""
+        args = {}
+        if (href := _dict.get('href')) is not None:
+            args['href'] = href
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a IngestionJobCollectionPage object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'href') and getattr(self, 'href') is not None:
+            _dict['href'] = getattr(self, 'href')
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this IngestionJobCollectionPage object as a `dict`."""
+        return {name: getattr(self, name) for name in IngestionJobCollectionPage.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this IngestionJobCollectionPage object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'IngestionJobCollectionPage') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'IngestionJobCollectionPage') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class IngestionJobCsvProperty:
+    """
+    Ingestion CSV properties.
+
+    :param str encoding: (optional) Encoding used in CSV file.
+    :param str escape_character: (optional) Escape character of CSV file.
+    :param str field_delimiter: (optional) Field delimiter of CSV file.
+    :param bool header: (optional) Identify if header exists in CSV file.
+    :param str line_delimiter: (optional) Line delimiter of CSV file.
+    """
+
+    __slots__ = ('encoding', 'escape_character', 'field_delimiter', 'header', 'line_delimiter')
+
+    def __init__(
+        self,
+        *,
+        encoding: Optional[str] = None,
+        escape_character: Optional[str] = None,
+        field_delimiter: Optional[str] = None,
+        header: Optional[bool] = None,
+        line_delimiter: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a IngestionJobCsvProperty object.
+
+        :param str encoding: (optional) Encoding used in CSV file.
+        :param str escape_character: (optional) Escape character of CSV file.
+        :param str field_delimiter: (optional) Field delimiter of CSV file.
+        :param bool header: (optional) Identify if header exists in CSV file.
+        :param str line_delimiter: (optional) Line delimiter of CSV file.
+        """
+        self.encoding = encoding
+        self.escape_character = escape_character
+        self.field_delimiter = field_delimiter
+        self.header = header
+        self.line_delimiter = line_delimiter
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'IngestionJobCsvProperty':
+        """Initialize a IngestionJobCsvProperty object from a json dictionary."""
+        args = {}
+        if (encoding := _dict.get('encoding')) is not None:
+            args['encoding'] = encoding
+        if (escape_character := _dict.get('escape_character')) is not None:
+            args['escape_character'] = escape_character
+        if (field_delimiter := _dict.get('field_delimiter')) is not None:
+            args['field_delimiter'] = field_delimiter
+        if (header := _dict.get('header')) is not None:
+            args['header'] = header
+        if (line_delimiter := _dict.get('line_delimiter')) is not None:
+            args['line_delimiter'] = line_delimiter
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a IngestionJobCsvProperty object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'encoding') and self.encoding is not None:
+            _dict['encoding'] = self.encoding
+        if hasattr(self, 'escape_character') and self.escape_character is not None:
+            _dict['escape_character'] = self.escape_character
+        if hasattr(self, 'field_delimiter') and self.field_delimiter is not None:
+            _dict['field_delimiter'] = self.field_delimiter
+        if hasattr(self, 'header') and self.header is not None:
+            _dict['header'] = self.header
+        if hasattr(self, 'line_delimiter') and self.line_delimiter is not None:
+            _dict['line_delimiter'] = self.line_delimiter
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this IngestionJobCsvProperty object as a `dict`."""
+        return {name: getattr(self, name) for name in IngestionJobCsvProperty.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this IngestionJobCsvProperty object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'IngestionJobCsvProperty') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'IngestionJobCsvProperty') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class IngestionJobExecuteConfig:
+    """
+    Ingestion engine configuration.
+
+    :param int driver_cores: (optional) Driver core(s) configuration for Spark
+          engine.
+    :param str driver_memory: (optional) Driver memory configuration (in GB) for
+          Spark engine.
+    :param int executor_cores: (optional) Executor core(s) configuration for Spark
+          engine.
+    :param str executor_memory: (optional) Executor memory configuration (in GB) for
+          Spark engine.
+    :param int num_executors: (optional) Number of executors to assign for Spark
+          engine.
+    """
+
+    __slots__ = ('driver_cores', 'driver_memory', 'executor_cores', 'executor_memory', 'num_executors')
+
+    def __init__(
+        self,
+        *,
+        driver_cores: Optional[int] = None,
+        driver_memory: Optional[str] = None,
+        executor_cores: Optional[int] = None,
+        executor_memory: Optional[str] = None,
+        num_executors: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a IngestionJobExecuteConfig object.
+
+        :param int driver_cores: (optional) Driver core(s) configuration for Spark
+               engine.
+        :param str driver_memory: (optional) Driver memory configuration (in GB)
+               for Spark engine.
+        :param int executor_cores: (optional) Executor core(s) configuration for
+               Spark engine.
+        :param str executor_memory: (optional) Executor memory configuration (in
+               GB) for Spark engine.
+        :param int num_executors: (optional) Number of executors to assign for
+               Spark engine.
+        """
+        self.driver_cores = driver_cores
+        self.driver_memory = driver_memory
+        self.executor_cores = executor_cores
+        self.executor_memory = executor_memory
+        self.num_executors = num_executors
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'IngestionJobExecuteConfig':
+        """Initialize a IngestionJobExecuteConfig object from a json dictionary."""
+        args = {}
+        if (driver_cores := _dict.get('driver_cores')) is not None:
+            args['driver_cores'] = driver_cores
+        if (driver_memory := _dict.get('driver_memory')) is not None:
+            args['driver_memory'] = driver_memory
+        if (executor_cores := _dict.get('executor_cores')) is not None:
+            args['executor_cores'] = executor_cores
+        if (executor_memory := _dict.get('executor_memory')) is not None:
+            args['executor_memory'] = executor_memory
+        if (num_executors := _dict.get('num_executors')) is not None:
+            args['num_executors'] = num_executors
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a IngestionJobExecuteConfig object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'driver_cores') and self.driver_cores is not None:
+            _dict['driver_cores'] = self.driver_cores
+        if hasattr(self, 'driver_memory') and self.driver_memory is not None:
+            _dict['driver_memory'] = self.driver_memory
+        if hasattr(self, 'executor_cores') and self.executor_cores is not None:
+            _dict['executor_cores'] = self.executor_cores
+        if hasattr(self, 'executor_memory') and self.executor_memory is not None:
+            _dict['executor_memory'] = self.executor_memory
+        if hasattr(self, 'num_executors') and self.num_executors is not None:
+            _dict['num_executors'] = self.num_executors
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this IngestionJobExecuteConfig object as a `dict`."""
+        return {name: getattr(self, name) for name in IngestionJobExecuteConfig.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this IngestionJobExecuteConfig object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'IngestionJobExecuteConfig') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'IngestionJobExecuteConfig') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
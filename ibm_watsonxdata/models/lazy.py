@@ -0,0 +1,114 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lazily deserialized models.
+
+`lazy_from_dict(PrestoEngine, _dict)` returns a `PrestoEngine` that keeps the
+json dictionary and deserializes each attribute the first time it is read.
+Nested models are themselves lazy, so reading `engine.status` never touches
+`engine_details`, `coordinator` or `drivers`. Once read, an attribute is
+stored in its slot and behaves exactly like one set by `from_dict()`.
+"""
+
+from keyword import iskeyword
+from typing import Callable, Dict, List, Type, get_type_hints
+import typing
+
+_LAZY_CLASSES = {}
+
+
+def lazy_from_dict(model_class: Type, _dict: Dict) -> object:
+    """
+    Return an instance of `model_class` backed by `_dict`, deserialized on demand.
+
+    Unlike `model_class.from_dict()`, required properties are not validated
+    up front; a missing property reads as None.
+
+    :param type model_class: The model class, such as `PrestoEngine`.
+    :param dict _dict: The json dictionary of the model.
+    :return: An instance of a subclass of `model_class`.
+    """
+    lazy_class = _LAZY_CLASSES.get(model_class)
+    if lazy_class is None:
+        lazy_class = _LAZY_CLASSES[model_class] = _make_lazy_class(model_class)
+    model = lazy_class.__new__(lazy_class)
+    model._raw = _dict
+    return model
+
+
+def _make_lazy_class(model_class: Type) -> Type:
+    decoders = {name: _decoder(hint) for (name, hint) in _attribute_hints(model_class).items()}
+    keys = {name: name[:-1] if name.endswith('_') and iskeyword(name[:-1]) else name for name in decoders}
+
+    def __getattr__(self, name: str):
+        # Only called when the slot has not been filled yet.
+        if name not in decoders:
+            raise AttributeError('{0!r} object has no attribute {1!r}'.format(model_class.__name__, name))
+        value = self._raw.get(keys[name])
+        if value is not None:
+            value = decoders[name](value)
+        setattr(self, name, value)
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, model_class):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __reduce__(self):
+        return (lazy_from_dict, (model_class, self._raw))
+
+    return type(
+        model_class.__name__,
+        (model_class,),
+        {
+            '__slots__': ('_raw',),
+            '__module__': model_class.__module__,
+            '__qualname__': model_class.__qualname__,
+            '__doc__': model_class.__doc__,
+            '__getattr__': __getattr__,
+            '__eq__': __eq__,
+            '__hash__': None,
+            '__reduce__': __reduce__,
+        },
+    )
+
+
+def _attribute_hints(model_class: Type) -> Dict[str, object]:
+    hints = get_type_hints(model_class.__init__)
+    return {name: hints.get(name) for name in model_class.__slots__}
+
+
+def _decoder(hint: object) -> Callable:
+    """Return the function that turns the json value of an attribute into its model value."""
+    if typing.get_origin(hint) is typing.Union:
+        hint = next(arg for arg in typing.get_args(hint) if arg is not type(None))
+    if typing.get_origin(hint) in (list, List):
+        (item_hint,) = typing.get_args(hint)
+        if _is_model(item_hint):
+            return lambda value: [lazy_from_dict(item_hint, item) for item in value]
+    elif _is_model(hint):
+        return lambda value: lazy_from_dict(hint, value)
+    return _identity
+
+
+def _is_model(hint: object) -> bool:
+    return isinstance(hint, type) and hasattr(hint, 'from_dict') and '__slots__' in hint.__dict__
+
+
+def _identity(value: object) -> object:
+    return value
@@ -0,0 +1,388 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: Milvus services.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+
+class MilvusService:
+    """
+    milvus service details.
+
+    :param List[str] actions: (optional) Actions.
+    :param str created_by: (optional) Created user name.
+    :param int created_on: (optional) Created time in epoch format.
+    :param str description: (optional) Service description.
+    :param str grpc_host: (optional) milvus grpc_host.
+    :param int grpc_port: (optional) milvus port.
+    :param str host_name: (optional) milvus display name.
+    :param str https_host: (optional) milvus https_host.
+    :param int https_port: (optional) milvus port.
+    :param str origin: (optional) Origin - place holder.
+    :param str service_display_name: (optional) Service display name.
+    :param str service_id: (optional) Service programmatic name.
+    :param str status: (optional) milvus status.
+    :param int status_code: milvus status code.
+    :param List[str] tags: (optional) Tags.
+    :param str type: (optional) service type.
+    """
+
+    __slots__ = (
+        'actions',
+        'created_by',
+        'created_on',
+        'description',
+        'grpc_host',
+        'grpc_port',
+        'host_name',
+        'https_host',
+        'https_port',
+        'origin',
+        'service_display_name',
+        'service_id',
+        'status',
+        'status_code',
+        'tags',
+        'type',
+    )
+
+    def __init__(
+        self,
+        status_code: int,
+        *,
+        actions: Optional[List[str]] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[int] = None,
+        description: Optional[str] = None,
+        grpc_host: Optional[str] = None,
+        grpc_port: Optional[int] = None,
+        host_name: Optional[str] = None,
+        https_host: Optional[str] = None,
+        https_port: Optional[int] = None,
+        origin: Optional[str] = None,
+        service_display_name: Optional[str] = None,
+        service_id: Optional[str] = None,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a MilvusService object.
+
+        :param int status_code: milvus status code.
+        :param List[str] actions: (optional) Actions.
+        :param str created_by: (optional) Created user name.
+        :param int created_on: (optional) Created time in epoch format.
+        :param str description: (optional) Service description.
+        :param str grpc_host: (optional) milvus grpc_host.
+        :param int grpc_port: (optional) milvus port.
+        :param str host_name: (optional) milvus display name.
+        :param str https_host: (optional) milvus https_host.
+        :param int https_port: (optional) milvus port.
+        :param str origin: (optional) Origin - place holder.
+        :param str service_display_name: (optional) Service display name.
+        :param str service_id: (optional) Service programmatic name.
+        :param str status: (optional) milvus status.
+        :param List[str] tags: (optional) Tags.
+        :param str type: (optional) service type.
+        """
+        self.actions = actions
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.grpc_host = grpc_host
+        self.grpc_port = grpc_port
+        self.host_name = host_name
+        self.https_host = https_host
+        self.https_port = https_port
+        self.origin = origin
+        self.service_display_name = service_display_name
+        self.service_id = service_id
+        self.status = status
+        self.status_code = status_code
+        self.tags = tags
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'MilvusService':
+        """Initialize a MilvusService object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (grpc_host := _dict.get('grpc_host')) is not None:
+            args['grpc_host'] = grpc_host
+        if (grpc_port := _dict.get('grpc_port')) is not None:
+            args['grpc_port'] = grpc_port
+        if (host_name := _dict.get('host_name')) is not None:
+            args['host_name'] = host_name
+        if (https_host := _dict.get('https_host')) is not None:
+            args['https_host'] = https_host
+        if (https_port := _dict.get('https_port')) is not None:
+            args['https_port'] = https_port
+        if (origin := _dict.get('origin')) is not None:
+            args['origin'] = origin
+        if (service_display_name := _dict.get('service_display_name')) is not None:
+            args['service_display_name'] = service_display_name
+        if (service_id := _dict.get('service_id')) is not None:
+            args['service_id'] = service_id
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (status_code := _dict.get('status_code')) is not None:
+            args['status_code'] = status_code
+        else:
+            raise ValueError('Required property \'status_code\' not present in MilvusService JSON')
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a MilvusService object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'grpc_host') and self.grpc_host is not None:
+            _dict['grpc_host'] = self.grpc_host
+        if hasattr(self, 'grpc_port') and self.grpc_port is not None:
+            _dict['grpc_port'] = self.grpc_port
+        if hasattr(self, 'host_name') and self.host_name is not None:
+            _dict['host_name'] = self.host_name
+        if hasattr(self, 'https_host') and self.https_host is not None:
+            _dict['https_host'] = self.https_host
+        if hasattr(self, 'https_port') and self.https_port is not None:
+            _dict['https_port'] = self.https_port
+        if hasattr(self, 'origin') and self.origin is not None:
+            _dict['origin'] = self.origin
+        if hasattr(self, 'service_display_name') and self.service_display_name is not None:
+            _dict['service_display_name'] = self.service_display_name
+        if hasattr(self, 'service_id') and self.service_id is not None:
+            _dict['service_id'] = self.service_id
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'status_code') and self.status_code is not None:
+            _dict['status_code'] = self.status_code
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this MilvusService object as a `dict`."""
+        return {name: getattr(self, name) for name in MilvusService.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this MilvusService object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'MilvusService') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'MilvusService') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class StatusEnum(str, Enum):
+        """
+        milvus status.
+        """
+
+        RUNNING = 'running'
+        PENDING = 'pending'
+        STOPPED = 'stopped'
+
+
+class MilvusServiceCollection:
+    """
+    List milvus services.
+
+    :param List[MilvusService] milvus_services: (optional) milvus service body.
+    """
+
+    __slots__ = ('milvus_services',)
+
+    def __init__(
+        self,
+        *,
+        milvus_services: Optional[List['MilvusService']] = None,
+    ) -> None:
+        """
+        Initialize a MilvusServiceCollection object.
+
+        :param List[MilvusService] milvus_services: (optional) milvus service body.
+        """
+        self.milvus_services = milvus_services
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'MilvusServiceCollection':
+        """Initialize a MilvusServiceCollection object from a json dictionary."""
+        args = {}
+        if (milvus_services := _dict.get('milvus_services')) is not None:
+            args['milvus_services'] = [MilvusService.from_dict(v) for v in milvus_services]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a MilvusServiceCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'milvus_services') and self.milvus_services is not None:
+            milvus_services_list = []
+            for v in self.milvus_services:
+                if isinstance(v, dict):
+                    milvus_services_list.append(v)
+                else:
+                    milvus_services_list.append(v.to_dict())
+            _dict['milvus_services'] = milvus_services_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this MilvusServiceCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in MilvusServiceCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this MilvusServiceCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'MilvusServiceCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'MilvusServiceCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class MilvusServicePatch:
+    """
+    UpdateService body.
+
+    :param str description: (optional) Modified description.
+    :param str service_display_name: (optional) Service display name.
+    :param List[str] tags: (optional) Tags.
+    """
+
+    __slots__ = ('description', 'service_display_name', 'tags')
+
+    def __init__(
+        self,
+        *,
+        description: Optional[str] = None,
+        service_display_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a MilvusServicePatch object.
+
+        :param str description: (optional) Modified description.
+        :param str service_display_name: (optional) Service display name.
+        :param List[str] tags: (optional) Tags.
+        """
+        self.description = description
+        self.service_display_name = service_display_name
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'MilvusServicePatch':
+        """Initialize a MilvusServicePatch object from a json dictionary."""
+        args = {}
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (service_display_name := _dict.get('service_display_name')) is not None:
+            args['service_display_name'] = service_display_name
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a MilvusServicePatch object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'service_display_name') and self.service_display_name is not None:
+            _dict['service_display_name'] = self.service_display_name
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this MilvusServicePatch object as a `dict`."""
+        return {name: getattr(self, name) for name in MilvusServicePatch.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this MilvusServicePatch object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'MilvusServicePatch') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'MilvusServicePatch') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
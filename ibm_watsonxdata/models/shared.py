@@ -0,0 +1,95 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: shared by several API areas.
+"""
+
+from typing import Dict, Optional
+import json
+
+
+class SuccessResponse:
+    """
+    Response of success.
+
+    :param str message: (optional) Message.
+    :param str message_code: (optional) Message code.
+    """
+
+    __slots__ = ('message', 'message_code')
+
+    def __init__(
+        self,
+        *,
+        message: Optional[str] = None,
+        message_code: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SuccessResponse object.
+
+        :param str message: (optional) Message.
+        :param str message_code: (optional) Message code.
+        """
+        self.message = message
+        self.message_code = message_code
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SuccessResponse':
+        """Initialize a SuccessResponse object from a json dictionary."""
+        args = {}
+        if (message := _dict.get('message')) is not None:
+            args['message'] = message
+        if (message_code := _dict.get('message_code')) is not None:
+            args['message_code'] = message_code
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SuccessResponse object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'message') and self.message is not None:
+            _dict['message'] = self.message
+        if hasattr(self, 'message_code') and self.message_code is not None:
+            _dict['message_code'] = self.message_code
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SuccessResponse object as a `dict`."""
+        return {name: getattr(self, name) for name in SuccessResponse.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SuccessResponse object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SuccessResponse') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SuccessResponse') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
@@ -0,0 +1,2386 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Models of the watsonx.data V2 API: Spark engines and applications.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional
+import json
+
+from .shared import SuccessResponse
+
+
+class DisplayNameInfoResponse:
+    """
+    DisplayNameInfoResponse.
+
+    :param str display_name: Display name.
+    """
+
+    __slots__ = ('display_name',)
+
+    def __init__(
+        self,
+        display_name: str,
+    ) -> None:
+        """
+        Initialize a DisplayNameInfoResponse object.
+
+        :param str display_name: Display name.
+        """
+        self.display_name = display_name
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'DisplayNameInfoResponse':
+        """Initialize a DisplayNameInfoResponse object from a json dictionary."""
+        args = {}
+        if (display_name := _dict.get('display_name')) is not None:
+            args['display_name'] = display_name
+        else:
+            raise ValueError('Required property \'display_name\' not present in DisplayNameInfoResponse JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a DisplayNameInfoResponse object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'display_name') and self.display_name is not None:
+            _dict['display_name'] = self.display_name
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this DisplayNameInfoResponse object as a `dict`."""
+        return {name: getattr(self, name) for name in DisplayNameInfoResponse.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this DisplayNameInfoResponse object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'DisplayNameInfoResponse') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'DisplayNameInfoResponse') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class ListSparkVersionsOKBody:
+    """
+    List spark version.
+
+    :param SuccessResponse response: Response of success.
+    :param List[DisplayNameInfoResponse] spark_versions: Spark versions list.
+    """
+
+    __slots__ = ('response', 'spark_versions')
+
+    def __init__(
+        self,
+        response: 'SuccessResponse',
+        spark_versions: List['DisplayNameInfoResponse'],
+    ) -> None:
+        """
+        Initialize a ListSparkVersionsOKBody object.
+
+        :param SuccessResponse response: Response of success.
+        :param List[DisplayNameInfoResponse] spark_versions: Spark versions list.
+        """
+        self.response = response
+        self.spark_versions = spark_versions
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'ListSparkVersionsOKBody':
+        """Initialize a ListSparkVersionsOKBody object from a json dictionary."""
+        args = {}
+        if (response := _dict.get('response')) is not None:
+            args['response'] = SuccessResponse.from_dict(response)
+        else:
+            raise ValueError('Required property \'response\' not present in ListSparkVersionsOKBody JSON')
+        if (spark_versions := _dict.get('spark_versions')) is not None:
+            args['spark_versions'] = [DisplayNameInfoResponse.from_dict(v) for v in spark_versions]
+        else:
+            raise ValueError('Required property \'spark_versions\' not present in ListSparkVersionsOKBody JSON')
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a ListSparkVersionsOKBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'response') and self.response is not None:
+            if isinstance(self.response, dict):
+                _dict['response'] = self.response
+            else:
+                _dict['response'] = self.response.to_dict()
+        if hasattr(self, 'spark_versions') and self.spark_versions is not None:
+            spark_versions_list = []
+            for v in self.spark_versions:
+                if isinstance(v, dict):
+                    spark_versions_list.append(v)
+                else:
+                    spark_versions_list.append(v.to_dict())
+            _dict['spark_versions'] = spark_versions_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this ListSparkVersionsOKBody object as a `dict`."""
+        return {name: getattr(self, name) for name in ListSparkVersionsOKBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this ListSparkVersionsOKBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'ListSparkVersionsOKBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'ListSparkVersionsOKBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkApplicationConfig:
+    """
+    Spark applications details configuration.
+
+    :param str spark_sample_config_properpty: (optional)
+          spark_sample_config_properpty.
+    """
+
+    __slots__ = ('spark_sample_config_properpty',)
+
+    def __init__(
+        self,
+        *,
+        spark_sample_config_properpty: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkApplicationConfig object.
+
+        :param str spark_sample_config_properpty: (optional)
+               spark_sample_config_properpty.
+        """
+        self.spark_sample_config_properpty = spark_sample_config_properpty
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkApplicationConfig':
+        """Initialize a SparkApplicationConfig object from a json dictionary."""
+        args = {}
+        if (spark_sample_config_properpty := _dict.get('spark_sample_config_properpty')) is not None:
+            args['spark_sample_config_properpty'] = spark_sample_config_properpty
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkApplicationConfig object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'spark_sample_config_properpty') and self.spark_sample_config_properpty is not None:
+            _dict['spark_sample_config_properpty'] = self.spark_sample_config_properpty
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkApplicationConfig object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkApplicationConfig.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkApplicationConfig object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkApplicationConfig') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkApplicationConfig') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkApplicationDetails:
+    """
+    Application details.
+
+    :param str application: (optional) Application.
+    :param List[str] arguments: (optional) List of arguments.
+    :param str class_: (optional) Class.
+    :param SparkApplicationConfig conf: (optional) Spark applications details
+          configuration.
+    :param SparkApplicationEnv env: (optional) Spark applications details env
+          samples.
+    :param str files: (optional) Files.
+    :param str jars: (optional) Jars.
+    :param str name: (optional) Display name of the spark application.
+    :param str packages: (optional) Packages.
+    :param str repositories: (optional) Repositories.
+    :param str spark_version: (optional) Spark Version.
+    """
+
+    __slots__ = (
+        'application',
+        'arguments',
+        'class_',
+        'conf',
+        'env',
+        'files',
+        'jars',
+        'name',
+        'packages',
+        'repositories',
+        'spark_version',
+    )
+
+    def __init__(
+        self,
+        *,
+        application: Optional[str] = None,
+        arguments: Optional[List[str]] = None,
+        class_: Optional[str] = None,
+        conf: Optional['SparkApplicationConfig'] = None,
+        env: Optional['SparkApplicationEnv'] = None,
+        files: Optional[str] = None,
+        jars: Optional[str] = None,
+        name: Optional[str] = None,
+        packages: Optional[str] = None,
+        repositories: Optional[str] = None,
+        spark_version: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkApplicationDetails object.
+
+        :param str application: (optional) Application.
+        :param List[str] arguments: (optional) List of arguments.
+        :param str class_: (optional) Class.
+        :param SparkApplicationConfig conf: (optional) Spark applications details
+               configuration.
+        :param SparkApplicationEnv env: (optional) Spark applications details env
+               samples.
+        :param str files: (optional) Files.
+        :param str jars: (optional) Jars.
+        :param str name: (optional) Display name of the spark application.
+        :param str packages: (optional) Packages.
+        :param str repositories: (optional) Repositories.
+        :param str spark_version: (optional) Spark Version.
+        """
+        self.application = application
+        self.arguments = arguments
+        self.class_ = class_
+        self.conf = conf
+        self.env = env
+        self.files = files
+        self.jars = jars
+        self.name = name
+        self.packages = packages
+        self.repositories = repositories
+        self.spark_version = spark_version
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkApplicationDetails':
+        """Initialize a SparkApplicationDetails object from a json dictionary."""
+        args = {}
+        if (application := _dict.get('application')) is not None:
+            args['application'] = application
+        if (arguments := _dict.get('arguments')) is not None:
+            args['arguments'] = arguments
+        if (class_ := _dict.get('class')) is not None:
+            args['class_'] = class_
+        if (conf := _dict.get('conf')) is not None:
+            args['conf'] = SparkApplicationConfig.from_dict(conf)
+        if (env := _dict.get('env')) is not None:
+            args['env'] = SparkApplicationEnv.from_dict(env)
+        if (files := _dict.get('files')) is not None:
+            args['files'] = files
+        if (jars := _dict.get('jars')) is not None:
+            args['jars'] = jars
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (packages := _dict.get('packages')) is not None:
+            args['packages'] = packages
+        if (repositories := _dict.get('repositories')) is not None:
+            args['repositories'] = repositories
+        if (spark_version := _dict.get('spark_version')) is not None:
+            args['spark_version'] = spark_version
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkApplicationDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'application') and self.application is not None:
+            _dict['application'] = self.application
+        if hasattr(self, 'arguments') and self.arguments is not None:
+            _dict['arguments'] = self.arguments
+        if hasattr(self, 'class_') and self.class_ is not None:
+            _dict['class'] = self.class_
+        if hasattr(self, 'conf') and self.conf is not None:
+            if isinstance(self.conf, dict):
+                _dict['conf'] = self.conf
+            else:
+                _dict['conf'] = self.conf.to_dict()
+        if hasattr(self, 'env') and self.env is not None:
+            if isinstance(self.env, dict):
+                _dict['env'] = self.env
+            else:
+                _dict['env'] = self.env.to_dict()
+        if hasattr(self, 'files') and self.files is not None:
+            _dict['files'] = self.files
+        if hasattr(self, 'jars') and self.jars is not None:
+            _dict['jars'] = self.jars
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'packages') and self.packages is not None:
+            _dict['packages'] = self.packages
+        if hasattr(self, 'repositories') and self.repositories is not None:
+            _dict['repositories'] = self.repositories
+        if hasattr(self, 'spark_version') and self.spark_version is not None:
+            _dict['spark_version'] = self.spark_version
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkApplicationDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkApplicationDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkApplicationDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkApplicationDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkApplicationDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkApplicationEnv:
+    """
+    Spark applications details env samples.
+
+    :param str sample_env_key: (optional) sample.
+    """
+
+    __slots__ = ('sample_env_key',)
+
+    def __init__(
+        self,
+        *,
+        sample_env_key: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkApplicationEnv object.
+
+        :param str sample_env_key: (optional) sample.
+        """
+        self.sample_env_key = sample_env_key
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkApplicationEnv':
+        """Initialize a SparkApplicationEnv object from a json dictionary."""
+        args = {}
+        if (sample_env_key := _dict.get('sample_env_key')) is not None:
+            args['sample_env_key'] = sample_env_key
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkApplicationEnv object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'sample_env_key') and self.sample_env_key is not None:
+            _dict['sample_env_key'] = self.sample_env_key
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkApplicationEnv object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkApplicationEnv.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkApplicationEnv object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkApplicationEnv') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkApplicationEnv') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkDefaultConfig:
+    """
+    Spark Default Config details.
+
+    :param str config1: (optional) config1.
+    :param str config2: (optional) config2.
+    """
+
+    __slots__ = ('config1', 'config2')
+
+    def __init__(
+        self,
+        *,
+        config1: Optional[str] = None,
+        config2: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkDefaultConfig object.
+
+        :param str config1: (optional) config1.
+        :param str config2: (optional) config2.
+        """
+        self.config1 = config1
+        self.config2 = config2
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkDefaultConfig':
+        """Initialize a SparkDefaultConfig object from a json dictionary."""
+        args = {}
+        if (config1 := _dict.get('config1')) is not None:
+            args['config1'] = config1
+        if (config2 := _dict.get('config2')) is not None:
+            args['config2'] = config2
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkDefaultConfig object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'config1') and self.config1 is not None:
+            _dict['config1'] = self.config1
+        if hasattr(self, 'config2') and self.config2 is not None:
+            _dict['config2'] = self.config2
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkDefaultConfig object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkDefaultConfig.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkDefaultConfig object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkDefaultConfig') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkDefaultConfig') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkEndpoints:
+    """
+    Application Endpoints.
+
+    :param str applications_api: (optional) Application API.
+    :param str history_server_endpoint: (optional) History server endpoint.
+    :param str spark_access_endpoint: (optional) Spark kernel endpoint.
+    :param str spark_jobs_v4_endpoint: (optional) Spark jobs V4 endpoint.
+    :param str spark_kernel_endpoint: (optional) Spark kernel endpoint.
+    :param str view_history_server: (optional) View history server.
+    :param str wxd_application_endpoint: (optional) Wxd application endpoint.
+    :param str wxd_engine_endpoint: (optional) Wxd engine endpoint.
+    :param str wxd_history_server_endpoint: (optional) Wxd history_server endpoint.
+    :param str wxd_history_server_ui_endpoint: (optional) Wxd history_server
+          endpoint.
+    """
+
+    __slots__ = (
+        'applications_api',
+        'history_server_endpoint',
+        'spark_access_endpoint',
+        'spark_jobs_v4_endpoint',
+        'spark_kernel_endpoint',
+        'view_history_server',
+        'wxd_application_endpoint',
+        'wxd_engine_endpoint',
+        'wxd_history_server_endpoint',
+        'wxd_history_server_ui_endpoint',
+    )
+
+    def __init__(
+        self,
+        *,
+        applications_api: Optional[str] = None,
+        history_server_endpoint: Optional[str] = None,
+        spark_access_endpoint: Optional[str] = None,
+        spark_jobs_v4_endpoint: Optional[str] = None,
+        spark_kernel_endpoint: Optional[str] = None,
+        view_history_server: Optional[str] = None,
+        wxd_application_endpoint: Optional[str] = None,
+        wxd_engine_endpoint: Optional[str] = None,
+        wxd_history_server_endpoint: Optional[str] = None,
+        wxd_history_server_ui_endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkEndpoints object.
+
+        :param str applications_api: (optional) Application API.
+        :param str history_server_endpoint: (optional) History server endpoint.
+        :param str spark_access_endpoint: (optional) Spark kernel endpoint.
+        :param str spark_jobs_v4_endpoint: (optional) Spark jobs V4 endpoint.
+        :param str spark_kernel_endpoint: (optional) Spark kernel endpoint.
+        :param str view_history_server: (optional) View history server.
+        :param str wxd_application_endpoint: (optional) Wxd application endpoint.
+        :param str wxd_engine_endpoint: (optional) Wxd engine endpoint.
+        :param str wxd_history_server_endpoint: (optional) Wxd history_server
+               endpoint.
+        :param str wxd_history_server_ui_endpoint: (optional) Wxd history_server
+               endpoint.
+        """
+        self.applications_api = applications_api
+        self.history_server_endpoint = history_server_endpoint
+        self.spark_access_endpoint = spark_access_endpoint
+        self.spark_jobs_v4_endpoint = spark_jobs_v4_endpoint
+        self.spark_kernel_endpoint = spark_kernel_endpoint
+        self.view_history_server = view_history_server
+        self.wxd_application_endpoint = wxd_application_endpoint
+        self.wxd_engine_endpoint = wxd_engine_endpoint
+        self.wxd_history_server_endpoint = wxd_history_server_endpoint
+        self.wxd_history_server_ui_endpoint = wxd_history_server_ui_endpoint
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEndpoints':
+        """Initialize a SparkEndpoints object from a json dictionary."""
+        args = {}
+        if (applications_api := _dict.get('applications_api')) is not None:
+            args['applications_api'] = applications_api
+        if (history_server_endpoint := _dict.get('history_server_endpoint')) is not None:
+            args['history_server_endpoint'] = history_server_endpoint
+        if (spark_access_endpoint := _dict.get('spark_access_endpoint')) is not None:
+            args['spark_access_endpoint'] = spark_access_endpoint
+        if (spark_jobs_v4_endpoint := _dict.get('spark_jobs_v4_endpoint')) is not None:
+            args['spark_jobs_v4_endpoint'] = spark_jobs_v4_endpoint
+        if (spark_kernel_endpoint := _dict.get('spark_kernel_endpoint')) is not None:
+            args['spark_kernel_endpoint'] = spark_kernel_endpoint
+        if (view_history_server := _dict.get('view_history_server')) is not None:
+            args['view_history_server'] = view_history_server
+        if (wxd_application_endpoint := _dict.get('wxd_application_endpoint')) is not None:
+            args['wxd_application_endpoint'] = wxd_application_endpoint
+        if (wxd_engine_endpoint := _dict.get('wxd_engine_endpoint')) is not None:
+            args['wxd_engine_endpoint'] = wxd_engine_endpoint
+        if (wxd_history_server_endpoint := _dict.get('wxd_history_server_endpoint')) is not None:
+            args['wxd_history_server_endpoint'] = wxd_history_server_endpoint
+        if (wxd_history_server_ui_endpoint := _dict.get('wxd_history_server_ui_endpoint')) is not None:
+            args['wxd_history_server_ui_endpoint'] = wxd_history_server_ui_endpoint
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEndpoints object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'applications_api') and self.applications_api is not None:
+            _dict['applications_api'] = self.applications_api
+        if hasattr(self, 'history_server_endpoint') and self.history_server_endpoint is not None:
+            _dict['history_server_endpoint'] = self.history_server_endpoint
+        if hasattr(self, 'spark_access_endpoint') and self.spark_access_endpoint is not None:
+            _dict['spark_access_endpoint'] = self.spark_access_endpoint
+        if hasattr(self, 'spark_jobs_v4_endpoint') and self.spark_jobs_v4_endpoint is not None:
+            _dict['spark_jobs_v4_endpoint'] = self.spark_jobs_v4_endpoint
+        if hasattr(self, 'spark_kernel_endpoint') and self.spark_kernel_endpoint is not None:
+            _dict['spark_kernel_endpoint'] = self.spark_kernel_endpoint
+        if hasattr(self, 'view_history_server') and self.view_history_server is not None:
+            _dict['view_history_server'] = self.view_history_server
+        if hasattr(self, 'wxd_application_endpoint') and self.wxd_application_endpoint is not None:
+            _dict['wxd_application_endpoint'] = self.wxd_application_endpoint
+        if hasattr(self, 'wxd_engine_endpoint') and self.wxd_engine_endpoint is not None:
+            _dict['wxd_engine_endpoint'] = self.wxd_engine_endpoint
+        if hasattr(self, 'wxd_history_server_endpoint') and self.wxd_history_server_endpoint is not None:
+            _dict['wxd_history_server_endpoint'] = self.wxd_history_server_endpoint
+        if hasattr(self, 'wxd_history_server_ui_endpoint') and self.wxd_history_server_ui_endpoint is not None:
+            _dict['wxd_history_server_ui_endpoint'] = self.wxd_history_server_ui_endpoint
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEndpoints object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEndpoints.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEndpoints object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEndpoints') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEndpoints') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkEngine:
+    """
+    EngineDetail.
+
+    :param List[str] actions: (optional) Actions.
+    :param List[str] associated_catalogs: (optional) Associated catalogs.
+    :param str build_version: (optional) watsonx.data build version.
+    :param str created_by: (optional) Created user name.
+    :param int created_on: (optional) Created time in epoch format.
+    :param str description: (optional) Engine description.
+    :param SparkEngineDetails engine_details: (optional) External engine details.
+    :param str engine_display_name: (optional) Engine display name.
+    :param str engine_id: (optional) Engine programmatic name.
+    :param str origin: (optional) Origin - created or registered.
+    :param str status: (optional) Engine status.
+    :param List[str] tags: (optional) Tags.
+    :param str type: (optional) Type like spark, netezza,..
+    """
+
+    __slots__ = (
+        'actions',
+        'associated_catalogs',
+        'build_version',
+        'created_by',
+        'created_on',
+        'description',
+        'engine_details',
+        'engine_display_name',
+        'engine_id',
+        'origin',
+        'status',
+        'tags',
+        'type',
+    )
+
+    def __init__(
+        self,
+        *,
+        actions: Optional[List[str]] = None,
+        associated_catalogs: Optional[List[str]] = None,
+        build_version: Optional[str] = None,
+        created_by: Optional[str] = None,
+        created_on: Optional[int] = None,
+        description: Optional[str] = None,
+        engine_details: Optional['SparkEngineDetails'] = None,
+        engine_display_name: Optional[str] = None,
+        engine_id: Optional[str] = None,
+        origin: Optional[str] = None,
+        status: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngine object.
+
+        :param List[str] actions: (optional) Actions.
+        :param List[str] associated_catalogs: (optional) Associated catalogs.
+        :param str build_version: (optional) watsonx.data build version.
+        :param str created_by: (optional) Created user name.
+        :param int created_on: (optional) Created time in epoch format.
+        :param str description: (optional) Engine description.
+        :param SparkEngineDetails engine_details: (optional) External engine
+               details.
+        :param str engine_display_name: (optional) Engine display name.
+        :param str engine_id: (optional) Engine programmatic name.
+        :param str origin: (optional) Origin - created or registered.
+        :param str status: (optional) Engine status.
+        :param List[str] tags: (optional) Tags.
+        :param str type: (optional) Type like spark, netezza,..
+        """
+        self.actions = actions
+        self.associated_catalogs = associated_catalogs
+        self.build_version = build_version
+        self.created_by = created_by
+        self.created_on = created_on
+        self.description = description
+        self.engine_details = engine_details
+        self.engine_display_name = engine_display_name
+        self.engine_id = engine_id
+        self.origin = origin
+        self.status = status
+        self.tags = tags
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngine':
+        """Initialize a SparkEngine object from a json dictionary."""
+        args = {}
+        if (actions := _dict.get('actions')) is not None:
+            args['actions'] = actions
+        if (associated_catalogs := _dict.get('associated_catalogs')) is not None:
+            args['associated_catalogs'] = associated_catalogs
+        if (build_version := _dict.get('build_version')) is not None:
+            args['build_version'] = build_version
+        if (created_by := _dict.get('created_by')) is not None:
+            args['created_by'] = created_by
+        if (created_on := _dict.get('created_on')) is not None:
+            args['created_on'] = created_on
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_details := _dict.get('engine_details')) is not None:
+            args['engine_details'] = SparkEngineDetails.from_dict(engine_details)
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (engine_id := _dict.get('engine_id')) is not None:
+            args['engine_id'] = engine_id
+        if (origin := _dict.get('origin')) is not None:
+            args['origin'] = origin
+        if (status := _dict.get('status')) is not None:
+            args['status'] = status
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngine object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'actions') and self.actions is not None:
+            _dict['actions'] = self.actions
+        if hasattr(self, 'associated_catalogs') and self.associated_catalogs is not None:
+            _dict['associated_catalogs'] = self.associated_catalogs
+        if hasattr(self, 'build_version') and self.build_version is not None:
+            _dict['build_version'] = self.build_version
+        if hasattr(self, 'created_by') and self.created_by is not None:
+            _dict['created_by'] = self.created_by
+        if hasattr(self, 'created_on') and self.created_on is not None:
+            _dict['created_on'] = self.created_on
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_details') and self.engine_details is not None:
+            if isinstance(self.engine_details, dict):
+                _dict['engine_details'] = self.engine_details
+            else:
+                _dict['engine_details'] = self.engine_details.to_dict()
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'engine_id') and self.engine_id is not None:
+            _dict['engine_id'] = self.engine_id
+        if hasattr(self, 'origin') and self.origin is not None:
+            _dict['origin'] = self.origin
+        if hasattr(self, 'status') and self.status is not None:
+            _dict['status'] = self.status
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngine object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngine.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngine object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngine') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngine') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class OriginEnum(str, Enum):
+        """
+        Origin - created or registered.
+        """
+
+        EXTERNAL = 'external'
+        DISCOVER = 'discover'
+        NATIVE = 'native'
+
+    class TypeEnum(str, Enum):
+        """
+        Type like spark, netezza,..
+        """
+
+        SPARK = 'spark'
+
+
+class SparkEngineApplicationStatus:
+    """
+    Engine Application Status.
+
+    :param SparkApplicationDetails application_details: (optional) Application
+          details.
+    :param str application_id: (optional) Application ID.
+    :param str auto_termination_time: (optional) Auto Termination Time.
+    :param str creation_time: (optional) Creation time.
+    :param str deploy_mode: (optional) Deployment mode.
+    :param str end_time: (optional) End Time.
+    :param str failed_time: (optional) Failed time.
+    :param str finish_time: (optional) Finish time.
+    :param str id: (optional) Application ID.
+    :param str job_endpoint: (optional) Job endpoint.
+    :param str return_code: (optional) Return code.
+    :param SparkEngineApplicationStatusRuntime runtime: (optional) application run
+          time.
+    :param str service_instance_id: (optional) Service Instance ID for POST.
+    :param str spark_application_id: (optional) Spark application ID.
+    :param str spark_application_name: (optional) Spark application name.
+    :param str spark_version: (optional) Spark Version.
+    :param str start_time: (optional) Start time.
+    :param str state: (optional) Application state.
+    :param List[SparkEngineApplicationStatusStateDetailsItems] state_details:
+          (optional) Application state details.
+    :param str submission_time: (optional) Application submission time.
+    :param str template_id: (optional) Template ID.
+    :param str type: (optional) Engine Type.
+    :param List[SparkVolumeDetails] volumes: (optional) Spark application volumes to
+          mount.
+    :param str wxd_application_ui_endpoint: (optional) Wxd history_server endpoint.
+    """
+
+    __slots__ = (
+        'application_details',
+        'application_id',
+        'auto_termination_time',
+        'creation_time',
+        'deploy_mode',
+        'end_time',
+        'failed_time',
+        'finish_time',
+        'id',
+        'job_endpoint',
+        'return_code',
+        'runtime',
+        'service_instance_id',
+        'spark_application_id',
+        'spark_application_name',
+        'spark_version',
+        'start_time',
+        'state',
+        'state_details',
+        'submission_time',
+        'template_id',
+        'type',
+        'volumes',
+        'wxd_application_ui_endpoint',
+    )
+
+    def __init__(
+        self,
+        *,
+        application_details: Optional['SparkApplicationDetails'] = None,
+        application_id: Optional[str] = None,
+        auto_termination_time: Optional[str] = None,
+        creation_time: Optional[str] = None,
+        deploy_mode: Optional[str] = None,
+        end_time: Optional[str] = None,
+        failed_time: Optional[str] = None,
+        finish_time: Optional[str] = None,
+        id: Optional[str] = None,
+        job_endpoint: Optional[str] = None,
+        return_code: Optional[str] = None,
+        runtime: Optional['SparkEngineApplicationStatusRuntime'] = None,
+        service_instance_id: Optional[str] = None,
+        spark_application_id: Optional[str] = None,
+        spark_application_name: Optional[str] = None,
+        spark_version: Optional[str] = None,
+        start_time: Optional[str] = None,
+        state: Optional[str] = None,
+        state_details: Optional[List['SparkEngineApplicationStatusStateDetailsItems']] = None,
+        submission_time: Optional[str] = None,
+        template_id: Optional[str] = None,
+        type: Optional[str] = None,
+        volumes: Optional[List['SparkVolumeDetails']] = None,
+        wxd_application_ui_endpoint: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngineApplicationStatus object.
+
+        :param SparkApplicationDetails application_details: (optional) Application
+               details.
+        :param str application_id: (optional) Application ID.
+        :param str auto_termination_time: (optional) Auto Termination Time.
+        :param str creation_time: (optional) Creation time.
+        :param str deploy_mode: (optional) Deployment mode.
+        :param str end_time: (optional) End Time.
+        :param str failed_time: (optional) Failed time.
+        :param str finish_time: (optional) Finish time.
+        :param str id: (optional) Application ID.
+        :param str job_endpoint: (optional) Job endpoint.
+        :param str return_code: (optional) Return code.
+        :param SparkEngineApplicationStatusRuntime runtime: (optional) application
+               run time.
+        :param str service_instance_id: (optional) Service Instance ID for POST.
+        :param str spark_application_id: (optional) Spark application ID.
+        :param str spark_application_name: (optional) Spark application name.
+        :param str spark_version: (optional) Spark Version.
+        :param str start_time: (optional) Start time.
+        :param str state: (optional) Application state.
+        :param List[SparkEngineApplicationStatusStateDetailsItems] state_details:
+               (optional) Application state details.
+        :param str submission_time: (optional) Application submission time.
+        :param str template_id: (optional) Template ID.
+        :param str type: (optional) Engine Type.
+        :param List[SparkVolumeDetails] volumes: (optional) Spark application
+               volumes to mount.
+        :param str wxd_application_ui_endpoint: (optional) Wxd history_server
+               endpoint.
+        """
+        self.application_details = application_details
+        self.application_id = application_id
+        self.auto_termination_time = auto_termination_time
+        self.creation_time = creation_time
+        self.deploy_mode = deploy_mode
+        self.end_time = end_time
+        self.failed_time = failed_time
+        self.finish_time = finish_time
+        self.id = id
+        self.job_endpoint = job_endpoint
+        self.return_code = return_code
+        self.runtime = runtime
+        self.service_instance_id = service_instance_id
+        self.spark_application_id = spark_application_id
+        self.spark_application_name = spark_application_name
+        self.spark_version = spark_version
+        self.start_time = start_time
+        self.state = state
+        self.state_details = state_details
+        self.submission_time = submission_time
+        self.template_id = template_id
+        self.type = type
+        self.volumes = volumes
+        self.wxd_application_ui_endpoint = wxd_application_ui_endpoint
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngineApplicationStatus':
+        """Initialize a SparkEngineApplicationStatus object from a json dictionary."""
+        args = {}
+        if (application_details := _dict.get('application_details')) is not None:
+            args['application_details'] = SparkApplicationDetails.from_dict(application_details)
+        if (application_id := _dict.get('application_id')) is not None:
+            args['application_id'] = application_id
+        if (auto_termination_time := _dict.get('auto_termination_time')) is not None:
+            args['auto_termination_time'] = auto_termination_time
+        if (creation_time := _dict.get('creation_time')) is not None:
+            args['creation_time'] = creation_time
+        if (deploy_mode := _dict.get('deploy_mode')) is not None:
+            args['deploy_mode'] = deploy_mode
+        if (end_time := _dict.get('end_time')) is not None:
+            args['end_time'] = end_time
+        if (failed_time := _dict.get('failed_time')) is not None:
+            args['failed_time'] = failed_time
+        if (finish_time := _dict.get('finish_time')) is not None:
+            args['finish_time'] = finish_time
+        if (id := _dict.get('id')) is not None:
+            args['id'] = id
+        if (job_endpoint := _dict.get('job_endpoint')) is not None:
+            args['job_endpoint'] = job_endpoint
+        if (return_code := _dict.get('return_code')) is not None:
+            args['return_code'] = return_code
+        if (runtime := _dict.get('runtime')) is not None:
+            args['runtime'] = SparkEngineApplicationStatusRuntime.from_dict(runtime)
+        if (service_instance_id := _dict.get('service_instance_id')) is not None:
+            args['service_instance_id'] = service_instance_id
+        if (spark_application_id := _dict.get('spark_application_id')) is not None:
+            args['spark_application_id'] = spark_application_id
+        if (spark_application_name := _dict.get('spark_application_name')) is not None:
+            args['spark_application_name'] = spark_application_name
+        if (spark_version := _dict.get('spark_version')) is not None:
+            args['spark_version'] = spark_version
+        if (start_time := _dict.get('start_time')) is not None:
+            args['start_time'] = start_time
+        if (state := _dict.get('state')) is not None:
+            args['state'] = state
+        if (state_details := _dict.get('state_details')) is not None:
+            args['state_details'] = [SparkEngineApplicationStatusStateDetailsItems.from_dict(v) for v in state_details]
+        if (submission_time := _dict.get('submission_time')) is not None:
+            args['submission_time'] = submission_time
+        if (template_id := _dict.get('template_id')) is not None:
+            args['template_id'] = template_id
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        if (volumes := _dict.get('volumes')) is not None:
+            args['volumes'] = [SparkVolumeDetails.from_dict(v) for v in volumes]
+        if (wxd_application_ui_endpoint := _dict.get('wxd_application_ui_endpoint')) is not None:
+            args['wxd_application_ui_endpoint'] = wxd_application_ui_endpoint
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngineApplicationStatus object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'application_details') and self.application_details is not None:
+            if isinstance(self.application_details, dict):
+                _dict['application_details'] = self.application_details
+            else:
+                _dict['application_details'] = self.application_details.to_dict()
+        if hasattr(self, 'application_id') and self.application_id is not None:
+            _dict['application_id'] = self.application_id
+        if hasattr(self, 'auto_termination_time') and self.auto_termination_time is not None:
+            _dict['auto_termination_time'] = self.auto_termination_time
+        if hasattr(self, 'creation_time') and self.creation_time is not None:
+            _dict['creation_time'] = self.creation_time
+        if hasattr(self, 'deploy_mode') and self.deploy_mode is not None:
+            _dict['deploy_mode'] = self.deploy_mode
+        if hasattr(self, 'end_time') and self.end_time is not None:
+            _dict['end_time'] = self.end_time
+        if hasattr(self, 'failed_time') and self.failed_time is not None:
+            _dict['failed_time'] = self.failed_time
+        if hasattr(self, 'finish_time') and self.finish_time is not None:
+            _dict['finish_time'] = self.finish_time
+        if hasattr(self, 'id') and self.id is not None:
+            _dict['id'] = self.id
+        if hasattr(self, 'job_endpoint') and self.job_endpoint is not None:
+            _dict['job_endpoint'] = self.job_endpoint
+        if hasattr(self, 'return_code') and self.return_code is not None:
+            _dict['return_code'] = self.return_code
+        if hasattr(self, 'runtime') and self.runtime is not None:
+            if isinstance(self.runtime, dict):
+                _dict['runtime'] = self.runtime
+            else:
+                _dict['runtime'] = self.runtime.to_dict()
+        if hasattr(self, 'service_instance_id') and self.service_instance_id is not None:
+            _dict['service_instance_id'] = self.service_instance_id
+        if hasattr(self, 'spark_application_id') and self.spark_application_id is not None:
+            _dict['spark_application_id'] = self.spark_application_id
+        if hasattr(self, 'spark_application_name') and self.spark_application_name is not None:
+            _dict['spark_application_name'] = self.spark_application_name
+        if hasattr(self, 'spark_version') and self.spark_version is not None:
+            _dict['spark_version'] = self.spark_version
+        if hasattr(self, 'start_time') and self.start_time is not None:
+            _dict['start_time'] = self.start_time
+        if hasattr(self, 'state') and self.state is not None:
+            _dict['state'] = self.state
+        if hasattr(self, 'state_details') and self.state_details is not None:
+            state_details_list = []
+            for v in self.state_details:
+                if isinstance(v, dict):
+                    state_details_list.append(v)
+                else:
+                    state_details_list.append(v.to_dict())
+            _dict['state_details'] = state_details_list
+        if hasattr(self, 'submission_time') and self.submission_time is not None:
+            _dict['submission_time'] = self.submission_time
+        if hasattr(self, 'template_id') and self.template_id is not None:
+            _dict['template_id'] = self.template_id
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        if hasattr(self, 'volumes') and self.volumes is not None:
+            volumes_list = []
+            for v in self.volumes:
+                if isinstance(v, dict):
+                    volumes_list.append(v)
+                else:
+                    volumes_list.append(v.to_dict())
+            _dict['volumes'] = volumes_list
+        if hasattr(self, 'wxd_application_ui_endpoint') and self.wxd_application_ui_endpoint is not None:
+            _dict['wxd_application_ui_endpoint'] = self.wxd_application_ui_endpoint
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngineApplicationStatus object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngineApplicationStatus.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngineApplicationStatus object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngineApplicationStatus') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngineApplicationStatus') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+    class TypeEnum(str, Enum):
+        """
+        Engine Type.
+        """
+
+        IAE = 'iae'
+        EMR = 'emr'
+
+
+class SparkEngineApplicationStatusCollection:
+    """
+    Engine Application Detail.
+
+    :param List[SparkEngineApplicationStatus] applications: (optional) Application
+          body.
+    """
+
+    __slots__ = ('applications',)
+
+    def __init__(
+        self,
+        *,
+        applications: Optional[List['SparkEngineApplicationStatus']] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngineApplicationStatusCollection object.
+
+        :param List[SparkEngineApplicationStatus] applications: (optional)
+               Application body.
+        """
+        self.applications = applications
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngineApplicationStatusCollection':
+        """Initialize a SparkEngineApplicationStatusCollection object from a json dictionary."""
+        args = {}
+        if (applications := _dict.get('applications')) is not None:
+            args['applications'] = [SparkEngineApplicationStatus.from_dict(v) for v in applications]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngineApplicationStatusCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'applications') and self.applications is not None:
+            applications_list = []
+            for v in self.applications:
+                if isinstance(v, dict):
+                    applications_list.append(v)
+                else:
+                    applications_list.append(v.to_dict())
+            _dict['applications'] = applications_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngineApplicationStatusCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngineApplicationStatusCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngineApplicationStatusCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngineApplicationStatusCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngineApplicationStatusCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkEngineApplicationStatusRuntime:
+    """
+    application run time.
+
+    :param str spark_version: (optional) Spark Version.
+    """
+
+    __slots__ = ('spark_version',)
+
+    def __init__(
+        self,
+        *,
+        spark_version: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngineApplicationStatusRuntime object.
+
+        :param str spark_version: (optional) Spark Version.
+        """
+        self.spark_version = spark_version
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngineApplicationStatusRuntime':
+        """Initialize a SparkEngineApplicationStatusRuntime object from a json dictionary."""
+        args = {}
+        if (spark_version := _dict.get('spark_version')) is not None:
+            args['spark_version'] = spark_version
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngineApplicationStatusRuntime object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'spark_version') and self.spark_version is not None:
+            _dict['spark_version'] = self.spark_version
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngineApplicationStatusRuntime object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngineApplicationStatusRuntime.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngineApplicationStatusRuntime object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngineApplicationStatusRuntime') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngineApplicationStatusRuntime') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkEngineApplicationStatusStateDetailsItems:
+    """
+    State details.
+
+    :param str code: (optional) State details code.
+    :param str message: (optional) State details message.
+    :param str type: (optional) State details type.
+    """
+
+    __slots__ = ('code', 'message', 'type')
+
+    def __init__(
+        self,
+        *,
+        code: Optional[str] = None,
+        message: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngineApplicationStatusStateDetailsItems object.
+
+        :param str code: (optional) State details code.
+        :param str message: (optional) State details message.
+        :param str type: (optional) State details type.
+        """
+        self.code = code
+        self.message = message
+        self.type = type
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngineApplicationStatusStateDetailsItems':
+        """Initialize a SparkEngineApplicationStatusStateDetailsItems object from a json dictionary."""
+        args = {}
+        if (code := _dict.get('code')) is not None:
+            args['code'] = code
+        if (message := _dict.get('message')) is not None:
+            args['message'] = message
+        if (type := _dict.get('type')) is not None:
+            args['type'] = type
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngineApplicationStatusStateDetailsItems object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'code') and self.code is not None:
+            _dict['code'] = self.code
+        if hasattr(self, 'message') and self.message is not None:
+            _dict['message'] = self.message
+        if hasattr(self, 'type') and self.type is not None:
+            _dict['type'] = self.type
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngineApplicationStatusStateDetailsItems object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngineApplicationStatusStateDetailsItems.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngineApplicationStatusStateDetailsItems object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngineApplicationStatusStateDetailsItems') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngineApplicationStatusStateDetailsItems') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkEngineCollection:
+    """
+    List spark engines.
+
+    :param List[SparkEngine] spark_engines: (optional) List spark engines.
+    """
+
+    __slots__ = ('spark_engines',)
+
+    def __init__(
+        self,
+        *,
+        spark_engines: Optional[List['SparkEngine']] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngineCollection object.
+
+        :param List[SparkEngine] spark_engines: (optional) List spark engines.
+        """
+        self.spark_engines = spark_engines
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngineCollection':
+        """Initialize a SparkEngineCollection object from a json dictionary."""
+        args = {}
+        if (spark_engines := _dict.get('spark_engines')) is not None:
+            args['spark_engines'] = [SparkEngine.from_dict(v) for v in spark_engines]
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngineCollection object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'spark_engines') and self.spark_engines is not None:
+            spark_engines_list = []
+            for v in self.spark_engines:
+                if isinstance(v, dict):
+                    spark_engines_list.append(v)
+                else:
+                    spark_engines_list.append(v.to_dict())
+            _dict['spark_engines'] = spark_engines_list
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngineCollection object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngineCollection.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngineCollection object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngineCollection') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngineCollection') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkEngineDetails:
+    """
+    External engine details.
+
+    :param str api_key: (optional) api key to work with the saas IAE instance.
+    :param str connection_string: (optional) External engine connection string.
+    :param SparkDefaultConfig default_config: (optional) Spark Default Config
+          details.
+    :param str default_version: (optional) The default spark version for the native
+          engine.
+    :param SparkEndpoints endpoints: (optional) Application Endpoints.
+    :param str engine_home_bucket_display_name: (optional) Default bucket for spark.
+    :param str engine_home_bucket_name: (optional) Default bucket for spark.
+    :param str engine_home_path: (optional) Path for spark.
+    :param str engine_home_volume: (optional) Default volume for spark.
+    :param str engine_home_volume_id: (optional) Default volume for spark.
+    :param str engine_home_volume_name: (optional) Name of the volume.
+    :param str engine_home_volume_storage_class: (optional) Storage class of the
+          volume.
+    :param str engine_home_volume_storage_size: (optional) Storage size of the
+          volume.
+    :param str instance_id: (optional) Instance to access the instance.
+    :param str managed_by: (optional) How is the spark instance managed.
+    :param SparkScaleConfig scale_config: (optional) Spark instance scale
+          configuration.
+    """
+
+    __slots__ = (
+        'api_key',
+        'connection_string',
+        'default_config',
+        'default_version',
+        'endpoints',
+        'engine_home_bucket_display_name',
+        'engine_home_bucket_name',
+        'engine_home_path',
+        'engine_home_volume',
+        'engine_home_volume_id',
+        'engine_home_volume_name',
+        'engine_home_volume_storage_class',
+        'engine_home_volume_storage_size',
+        'instance_id',
+        'managed_by',
+        'scale_config',
+    )
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        connection_string: Optional[str] = None,
+        default_config: Optional['SparkDefaultConfig'] = None,
+        default_version: Optional[str] = None,
+        endpoints: Optional['SparkEndpoints'] = None,
+        engine_home_bucket_display_name: Optional[str] = None,
+        engine_home_bucket_name: Optional[str] = None,
+        engine_home_path: Optional[str] = None,
+        engine_home_volume: Optional[str] = None,
+        engine_home_volume_id: Optional[str] = None,
+        engine_home_volume_name: Optional[str] = None,
+        engine_home_volume_storage_class: Optional[str] = None,
+        engine_home_volume_storage_size: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        managed_by: Optional[str] = None,
+        scale_config: Optional['SparkScaleConfig'] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngineDetails object.
+
+        :param str api_key: (optional) api key to work with the saas IAE instance.
+        :param str connection_string: (optional) External engine connection string.
+        :param SparkDefaultConfig default_config: (optional) Spark Default Config
+               details.
+        :param str default_version: (optional) The default spark version for the
+               native engine.
+        :param SparkEndpoints endpoints: (optional) Application Endpoints.
+        :param str engine_home_bucket_display_name: (optional) Default bucket for
+               spark.
+        :param str engine_home_bucket_name: (optional) Default bucket for spark.
+        :param str engine_home_path: (optional) Path for spark.
+        :param str engine_home_volume: (optional) Default volume for spark.
+        :param str engine_home_volume_id: (optional) Default volume for spark.
+        :param str engine_home_volume_name: (optional) Name of the volume.
+        :param str engine_home_volume_storage_class: (optional) Storage class of
+               the volume.
+        :param str engine_home_volume_storage_size: (optional) Storage size of the
+               volume.
+        :param str instance_id: (optional) Instance to access the instance.
+        :param str managed_by: (optional) How is the spark instance managed.
+        :param SparkScaleConfig scale_config: (optional) Spark instance scale
+               configuration.
+        """
+        self.api_key = api_key
+        self.connection_string = connection_string
+        self.default_config = default_config
+        self.default_version = default_version
+        self.endpoints = endpoints
+        self.engine_home_bucket_display_name = engine_home_bucket_display_name
+        self.engine_home_bucket_name = engine_home_bucket_name
+        self.engine_home_path = engine_home_path
+        self.engine_home_volume = engine_home_volume
+        self.engine_home_volume_id = engine_home_volume_id
+        self.engine_home_volume_name = engine_home_volume_name
+        self.engine_home_volume_storage_class = engine_home_volume_storage_class
+        self.engine_home_volume_storage_size = engine_home_volume_storage_size
+        self.instance_id = instance_id
+        self.managed_by = managed_by
+        self.scale_config = scale_config
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngineDetails':
+        """Initialize a SparkEngineDetails object from a json dictionary."""
+        args = {}
+        if (api_key := _dict.get('api_key')) is not None:
+            args['api_key'] = api_key
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        if (default_config := _dict.get('default_config')) is not None:
+            args['default_config'] = SparkDefaultConfig.from_dict(default_config)
+        if (default_version := _dict.get('default_version')) is not None:
+            args['default_version'] = default_version
+        if (endpoints := _dict.get('endpoints')) is not None:
+            args['endpoints'] = SparkEndpoints.from_dict(endpoints)
+        if (engine_home_bucket_display_name := _dict.get('engine_home_bucket_display_name')) is not None:
+            args['engine_home_bucket_display_name'] = engine_home_bucket_display_name
+        if (engine_home_bucket_name := _dict.get('engine_home_bucket_name')) is not None:
+            args['engine_home_bucket_name'] = engine_home_bucket_name
+        if (engine_home_path := _dict.get('engine_home_path')) is not None:
+            args['engine_home_path'] = engine_home_path
+        if (engine_home_volume := _dict.get('engine_home_volume')) is not None:
+            args['engine_home_volume'] = engine_home_volume
+        if (engine_home_volume_id := _dict.get('engine_home_volume_id')) is not None:
+            args['engine_home_volume_id'] = engine_home_volume_id
+        if (engine_home_volume_name := _dict.get('engine_home_volume_name')) is not None:
+            args['engine_home_volume_name'] = engine_home_volume_name
+        if (engine_home_volume_storage_class := _dict.get('engine_home_volume_storage_class')) is not None:
+            args['engine_home_volume_storage_class'] = engine_home_volume_storage_class
+        if (engine_home_volume_storage_size := _dict.get('engine_home_volume_storage_size')) is not None:
+            args['engine_home_volume_storage_size'] = engine_home_volume_storage_size
+        if (instance_id := _dict.get('instance_id')) is not None:
+            args['instance_id'] = instance_id
+        if (managed_by := _dict.get('managed_by')) is not None:
+            args['managed_by'] = managed_by
+        if (scale_config := _dict.get('scale_config')) is not None:
+            args['scale_config'] = SparkScaleConfig.from_dict(scale_config)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngineDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'api_key') and self.api_key is not None:
+            _dict['api_key'] = self.api_key
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'default_config') and self.default_config is not None:
+            if isinstance(self.default_config, dict):
+                _dict['default_config'] = self.default_config
+            else:
+                _dict['default_config'] = self.default_config.to_dict()
+        if hasattr(self, 'default_version') and self.default_version is not None:
+            _dict['default_version'] = self.default_version
+        if hasattr(self, 'endpoints') and self.endpoints is not None:
+            if isinstance(self.endpoints, dict):
+                _dict['endpoints'] = self.endpoints
+            else:
+                _dict['endpoints'] = self.endpoints.to_dict()
+        if hasattr(self, 'engine_home_bucket_display_name') and self.engine_home_bucket_display_name is not None:
+            _dict['engine_home_bucket_display_name'] = self.engine_home_bucket_display_name
+        if hasattr(self, 'engine_home_bucket_name') and self.engine_home_bucket_name is not None:
+            _dict['engine_home_bucket_name'] = self.engine_home_bucket_name
+        if hasattr(self, 'engine_home_path') and self.engine_home_path is not None:
+            _dict['engine_home_path'] = self.engine_home_path
+        if hasattr(self, 'engine_home_volume') and self.engine_home_volume is not None:
+            _dict['engine_home_volume'] = self.engine_home_volume
+        if hasattr(self, 'engine_home_volume_id') and self.engine_home_volume_id is not None:
+            _dict['engine_home_volume_id'] = self.engine_home_volume_id
+        if hasattr(self, 'engine_home_volume_name') and self.engine_home_volume_name is not None:
+            _dict['engine_home_volume_name'] = self.engine_home_volume_name
+        if hasattr(self, 'engine_home_volume_storage_class') and self.engine_home_volume_storage_class is not None:
+            _dict['engine_home_volume_storage_class'] = self.engine_home_volume_storage_class
+        if hasattr(self, 'engine_home_volume_storage_size') and self.engine_home_volume_storage_size is not None:
+            _dict['engine_home_volume_storage_size'] = self.engine_home_volume_storage_size
+        if hasattr(self, 'instance_id') and self.instance_id is not None:
+            _dict['instance_id'] = self.instance_id
+        if hasattr(self, 'managed_by') and self.managed_by is not None:
+            _dict['managed_by'] = self.managed_by
+        if hasattr(self, 'scale_config') and self.scale_config is not None:
+            if isinstance(self.scale_config, dict):
+                _dict['scale_config'] = self.scale_config
+            else:
+                _dict['scale_config'] = self.scale_config.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngineDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngineDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngineDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngineDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngineDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkEngineDetailsPrototype:
+    """
+    Node details.
+
+    :param str api_key: (optional) api key to work with the saas IAE instance.
+    :param str connection_string: (optional) External engine connection string.
+    :param SparkDefaultConfig default_config: (optional) Spark Default Config
+          details.
+    :param str default_version: (optional) The default spark version for the native
+          engine.
+    :param str engine_home_bucket_display_name: (optional) Default bucket name for
+          spark.
+    :param str engine_home_bucket_name: (optional) Default bucket for spark.
+    :param str engine_home_path: (optional) Path for spark.
+    :param str engine_home_volume_id: (optional) Default volume for spark.
+    :param str engine_home_volume_name: (optional) Name of the volume.
+    :param str engine_home_volume_storage_class: (optional) Storage class of the
+          volume.
+    :param str engine_home_volume_storage_size: (optional) Storage size of the
+          volume.
+    :param str instance_id: (optional) Instance to access the instance.
+    :param str managed_by: (optional) How is the spark instance managed.
+    :param SparkScaleConfig scale_config: (optional) Spark instance scale
+          configuration.
+    """
+
+    __slots__ = (
+        'api_key',
+        'connection_string',
+        'default_config',
+        'default_version',
+        'engine_home_bucket_display_name',
+        'engine_home_bucket_name',
+        'engine_home_path',
+        'engine_home_volume_id',
+        'engine_home_volume_name',
+        'engine_home_volume_storage_class',
+        'engine_home_volume_storage_size',
+        'instance_id',
+        'managed_by',
+        'scale_config',
+    )
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        connection_string: Optional[str] = None,
+        default_config: Optional['SparkDefaultConfig'] = None,
+        default_version: Optional[str] = None,
+        engine_home_bucket_display_name: Optional[str] = None,
+        engine_home_bucket_name: Optional[str] = None,
+        engine_home_path: Optional[str] = None,
+        engine_home_volume_id: Optional[str] = None,
+        engine_home_volume_name: Optional[str] = None,
+        engine_home_volume_storage_class: Optional[str] = None,
+        engine_home_volume_storage_size: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        managed_by: Optional[str] = None,
+        scale_config: Optional['SparkScaleConfig'] = None,
+    ) -> None:
+        """
+        Initialize a SparkEngineDetailsPrototype object.
+
+        :param str api_key: (optional) api key to work with the saas IAE instance.
+        :param str connection_string: (optional) External engine connection string.
+        :param SparkDefaultConfig default_config: (optional) Spark Default Config
+               details.
+        :param str default_version: (optional) The default spark version for the
+               native engine.
+        :param str engine_home_bucket_display_name: (optional) Default bucket name
+               for spark.
+        :param str engine_home_bucket_name: (optional) Default bucket for spark.
+        :param str engine_home_path: (optional) Path for spark.
+        :param str engine_home_volume_id: (optional) Default volume for spark.
+        :param str engine_home_volume_name: (optional) Name of the volume.
+        :param str engine_home_volume_storage_class: (optional) Storage class of
+               the volume.
+        :param str engine_home_volume_storage_size: (optional) Storage size of the
+               volume.
+        :param str instance_id: (optional) Instance to access the instance.
+        :param str managed_by: (optional) How is the spark instance managed.
+        :param SparkScaleConfig scale_config: (optional) Spark instance scale
+               configuration.
+        """
+        self.api_key = api_key
+        self.connection_string = connection_string
+        self.default_config = default_config
+        self.default_version = default_version
+        self.engine_home_bucket_display_name = engine_home_bucket_display_name
+        self.engine_home_bucket_name = engine_home_bucket_name
+        self.engine_home_path = engine_home_path
+        self.engine_home_volume_id = engine_home_volume_id
+        self.engine_home_volume_name = engine_home_volume_name
+        self.engine_home_volume_storage_class = engine_home_volume_storage_class
+        self.engine_home_volume_storage_size = engine_home_volume_storage_size
+        self.instance_id = instance_id
+        self.managed_by = managed_by
+        self.scale_config = scale_config
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkEngineDetailsPrototype':
+        """Initialize a SparkEngineDetailsPrototype object from a json dictionary."""
+        args = {}
+        if (api_key := _dict.get('api_key')) is not None:
+            args['api_key'] = api_key
+        if (connection_string := _dict.get('connection_string')) is not None:
+            args['connection_string'] = connection_string
+        if (default_config := _dict.get('default_config')) is not None:
+            args['default_config'] = SparkDefaultConfig.from_dict(default_config)
+        if (default_version := _dict.get('default_version')) is not None:
+            args['default_version'] = default_version
+        if (engine_home_bucket_display_name := _dict.get('engine_home_bucket_display_name')) is not None:
+            args['engine_home_bucket_display_name'] = engine_home_bucket_display_name
+        if (engine_home_bucket_name := _dict.get('engine_home_bucket_name')) is not None:
+            args['engine_home_bucket_name'] = engine_home_bucket_name
+        if (engine_home_path := _dict.get('engine_home_path')) is not None:
+            args['engine_home_path'] = engine_home_path
+        if (engine_home_volume_id := _dict.get('engine_home_volume_id')) is not None:
+            args['engine_home_volume_id'] = engine_home_volume_id
+        if (engine_home_volume_name := _dict.get('engine_home_volume_name')) is not None:
+            args['engine_home_volume_name'] = engine_home_volume_name
+        if (engine_home_volume_storage_class := _dict.get('engine_home_volume_storage_class')) is not None:
+            args['engine_home_volume_storage_class'] = engine_home_volume_storage_class
+        if (engine_home_volume_storage_size := _dict.get('engine_home_volume_storage_size')) is not None:
+            args['engine_home_volume_storage_size'] = engine_home_volume_storage_size
+        if (instance_id := _dict.get('instance_id')) is not None:
+            args['instance_id'] = instance_id
+        if (managed_by := _dict.get('managed_by')) is not None:
+            args['managed_by'] = managed_by
+        if (scale_config := _dict.get('scale_config')) is not None:
+            args['scale_config'] = SparkScaleConfig.from_dict(scale_config)
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkEngineDetailsPrototype object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'api_key') and self.api_key is not None:
+            _dict['api_key'] = self.api_key
+        if hasattr(self, 'connection_string') and self.connection_string is not None:
+            _dict['connection_string'] = self.connection_string
+        if hasattr(self, 'default_config') and self.default_config is not None:
+            if isinstance(self.default_config, dict):
+                _dict['default_config'] = self.default_config
+            else:
+                _dict['default_config'] = self.default_config.to_dict()
+        if hasattr(self, 'default_version') and self.default_version is not None:
+            _dict['default_version'] = self.default_version
+        if hasattr(self, 'engine_home_bucket_display_name') and self.engine_home_bucket_display_name is not None:
+            _dict['engine_home_bucket_display_name'] = self.engine_home_bucket_display_name
+        if hasattr(self, 'engine_home_bucket_name') and self.engine_home_bucket_name is not None:
+            _dict['engine_home_bucket_name'] = self.engine_home_bucket_name
+        if hasattr(self, 'engine_home_path') and self.engine_home_path is not None:
+            _dict['engine_home_path'] = self.engine_home_path
+        if hasattr(self, 'engine_home_volume_id') and self.engine_home_volume_id is not None:
+            _dict['engine_home_volume_id'] = self.engine_home_volume_id
+        if hasattr(self, 'engine_home_volume_name') and self.engine_home_volume_name is not None:
+            _dict['engine_home_volume_name'] = self.engine_home_volume_name
+        if hasattr(self, 'engine_home_volume_storage_class') and self.engine_home_volume_storage_class is not None:
+            _dict['engine_home_volume_storage_class'] = self.engine_home_volume_storage_class
+        if hasattr(self, 'engine_home_volume_storage_size') and self.engine_home_volume_storage_size is not None:
+            _dict['engine_home_volume_storage_size'] = self.engine_home_volume_storage_size
+        if hasattr(self, 'instance_id') and self.instance_id is not None:
+            _dict['instance_id'] = self.instance_id
+        if hasattr(self, 'managed_by') and self.managed_by is not None:
+            _dict['managed_by'] = self.managed_by
+        if hasattr(self, 'scale_config') and self.scale_config is not None:
+            if isinstance(self.scale_config, dict):
+                _dict['scale_config'] = self.scale_config
+            else:
+                _dict['scale_config'] = self.scale_config.to_dict()
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkEngineDetailsPrototype object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkEngineDetailsPrototype.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkEngineDetailsPrototype object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkEngineDetailsPrototype') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkEngineDetailsPrototype') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkHistoryServer:
+    """
+    Native spark history server.
+
+    :param str auto_termination_time: (optional) History server start time.
+    :param str cores: (optional) History server cores.
+    :param str memory: (optional) History server memory.
+    :param str start_time: (optional) History server start time.
+    :param str state: (optional) History server state.
+    """
+
+    __slots__ = ('auto_termination_time', 'cores', 'memory', 'start_time', 'state')
+
+    def __init__(
+        self,
+        *,
+        auto_termination_time: Optional[str] = None,
+        cores: Optional[str] = None,
+        memory: Optional[str] = None,
+        start_time: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkHistoryServer object.
+
+        :param str auto_termination_time: (optional) History server start time.
+        :param str cores: (optional) History server cores.
+        :param str memory: (optional) History server memory.
+        :param str start_time: (optional) History server start time.
+        :param str state: (optional) History server state.
+        """
+        self.auto_termination_time = auto_termination_time
+        self.cores = cores
+        self.memory = memory
+        self.start_time = start_time
+        self.state = state
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkHistoryServer':
+        """Initialize a SparkHistoryServer object from a json dictionary."""
+        args = {}
+        if (auto_termination_time := _dict.get('auto_termination_time')) is not None:
+            args['auto_termination_time'] = auto_termination_time
+        if (cores := _dict.get('cores')) is not None:
+            args['cores'] = cores
+        if (memory := _dict.get('memory')) is not None:
+            args['memory'] = memory
+        if (start_time := _dict.get('start_time')) is not None:
+            args['start_time'] = start_time
+        if (state := _dict.get('state')) is not None:
+            args['state'] = state
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkHistoryServer object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'auto_termination_time') and self.auto_termination_time is not None:
+            _dict['auto_termination_time'] = self.auto_termination_time
+        if hasattr(self, 'cores') and self.cores is not None:
+            _dict['cores'] = self.cores
+        if hasattr(self, 'memory') and self.memory is not None:
+            _dict['memory'] = self.memory
+        if hasattr(self, 'start_time') and self.start_time is not None:
+            _dict['start_time'] = self.start_time
+        if hasattr(self, 'state') and self.state is not None:
+            _dict['state'] = self.state
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkHistoryServer object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkHistoryServer.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkHistoryServer object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkHistoryServer') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkHistoryServer') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkScaleConfig:
+    """
+    Spark instance scale configuration.
+
+    :param bool auto_scale_enabled: (optional) Enable/disable autoscaling.
+    :param int current_number_of_nodes: (optional) Current node count.
+    :param int maximum_number_of_nodes: (optional) Maximum node count.
+    :param int minimum_number_of_nodes: (optional) Minimum node count.
+    :param str node_type: (optional) Spark instance node type.
+    :param int number_of_nodes: (optional) Node count.
+    """
+
+    __slots__ = (
+        'auto_scale_enabled',
+        'current_number_of_nodes',
+        'maximum_number_of_nodes',
+        'minimum_number_of_nodes',
+        'node_type',
+        'number_of_nodes',
+    )
+
+    def __init__(
+        self,
+        *,
+        auto_scale_enabled: Optional[bool] = None,
+        current_number_of_nodes: Optional[int] = None,
+        maximum_number_of_nodes: Optional[int] = None,
+        minimum_number_of_nodes: Optional[int] = None,
+        node_type: Optional[str] = None,
+        number_of_nodes: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize a SparkScaleConfig object.
+
+        :param bool auto_scale_enabled: (optional) Enable/disable autoscaling.
+        :param int current_number_of_nodes: (optional) Current node count.
+        :param int maximum_number_of_nodes: (optional) Maximum node count.
+        :param int minimum_number_of_nodes: (optional) Minimum node count.
+        :param str node_type: (optional) Spark instance node type.
+        :param int number_of_nodes: (optional) Node count.
+        """
+        self.auto_scale_enabled = auto_scale_enabled
+        self.current_number_of_nodes = current_number_of_nodes
+        self.maximum_number_of_nodes = maximum_number_of_nodes
+        self.minimum_number_of_nodes = minimum_number_of_nodes
+        self.node_type = node_type
+        self.number_of_nodes = number_of_nodes
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkScaleConfig':
+        """Initialize a SparkScaleConfig object from a json dictionary."""
+        args = {}
+        if (auto_scale_enabled := _dict.get('auto_scale_enabled')) is not None:
+            args['auto_scale_enabled'] = auto_scale_enabled
+        if (current_number_of_nodes := _dict.get('current_number_of_nodes')) is not None:
+            args['current_number_of_nodes'] = current_number_of_nodes
+        if (maximum_number_of_nodes := _dict.get('maximum_number_of_nodes')) is not None:
+            args['maximum_number_of_nodes'] = maximum_number_of_nodes
+        if (minimum_number_of_nodes := _dict.get('minimum_number_of_nodes')) is not None:
+            args['minimum_number_of_nodes'] = minimum_number_of_nodes
+        if (node_type := _dict.get('node_type')) is not None:
+            args['node_type'] = node_type
+        if (number_of_nodes := _dict.get('number_of_nodes')) is not None:
+            args['number_of_nodes'] = number_of_nodes
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkScaleConfig object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'auto_scale_enabled') and self.auto_scale_enabled is not None:
+            _dict['auto_scale_enabled'] = self.auto_scale_enabled
+        if hasattr(self, 'current_number_of_nodes') and self.current_number_of_nodes is not None:
+            _dict['current_number_of_nodes'] = self.current_number_of_nodes
+        if hasattr(self, 'maximum_number_of_nodes') and self.maximum_number_of_nodes is not None:
+            _dict['maximum_number_of_nodes'] = self.maximum_number_of_nodes
+        if hasattr(self, 'minimum_number_of_nodes') and self.minimum_number_of_nodes is not None:
+            _dict['minimum_number_of_nodes'] = self.minimum_number_of_nodes
+        if hasattr(self, 'node_type') and self.node_type is not None:
+            _dict['node_type'] = self.node_type
+        if hasattr(self, 'number_of_nodes') and self.number_of_nodes is not None:
+            _dict['number_of_nodes'] = self.number_of_nodes
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkScaleConfig object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkScaleConfig.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkScaleConfig object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkScaleConfig') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkScaleConfig') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class SparkVolumeDetails:
+    """
+    Spark application volume.
+
+    :param str mount_path: (optional) Path in the spark cluster for the mounted
+          volume.
+    :param str name: (optional) volume name.
+    :param bool read_only: (optional) Read only flag.
+    :param str source_sub_path: (optional) Path in the volume to be mounted.
+    """
+
+    __slots__ = ('mount_path', 'name', 'read_only', 'source_sub_path')
+
+    def __init__(
+        self,
+        *,
+        mount_path: Optional[str] = None,
+        name: Optional[str] = None,
+        read_only: Optional[bool] = None,
+        source_sub_path: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a SparkVolumeDetails object.
+
+        :param str mount_path: (optional) Path in the spark cluster for the mounted
+               volume.
+        :param str name: (optional) volume name.
+        :param bool read_only: (optional) Read only flag.
+        :param str source_sub_path: (optional) Path in the volume to be mounted.
+        """
+        self.mount_path = mount_path
+        self.name = name
+        self.read_only = read_only
+        self.source_sub_path = source_sub_path
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'SparkVolumeDetails':
+        """Initialize a SparkVolumeDetails object from a json dictionary."""
+        args = {}
+        if (mount_path := _dict.get('mount_path')) is not None:
+            args['mount_path'] = mount_path
+        if (name := _dict.get('name')) is not None:
+            args['name'] = name
+        if (read_only := _dict.get('read_only')) is not None:
+            args['read_only'] = read_only
+        if (source_sub_path := _dict.get('source_sub_path')) is not None:
+            args['source_sub_path'] = source_sub_path
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a SparkVolumeDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'mount_path') and self.mount_path is not None:
+            _dict['mount_path'] = self.mount_path
+        if hasattr(self, 'name') and self.name is not None:
+            _dict['name'] = self.name
+        if hasattr(self, 'read_only') and self.read_only is not None:
+            _dict['read_only'] = self.read_only
+        if hasattr(self, 'source_sub_path') and self.source_sub_path is not None:
+            _dict['source_sub_path'] = self.source_sub_path
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this SparkVolumeDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in SparkVolumeDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this SparkVolumeDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'SparkVolumeDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'SparkVolumeDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class UpdateSparkEngineBody:
+    """
+    UpdateEngine body.
+
+    :param str description: (optional) Modified description.
+    :param UpdateSparkEngineBodyEngineDetails engine_details: (optional) Engine
+          details.
+    :param str engine_display_name: (optional) Engine display name.
+    :param List[str] tags: (optional) Tags.
+    """
+
+    __slots__ = ('description', 'engine_details', 'engine_display_name', 'tags')
+
+    def __init__(
+        self,
+        *,
+        description: Optional[str] = None,
+        engine_details: Optional['UpdateSparkEngineBodyEngineDetails'] = None,
+        engine_display_name: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Initialize a UpdateSparkEngineBody object.
+
+        :param str description: (optional) Modified description.
+        :param UpdateSparkEngineBodyEngineDetails engine_details: (optional) Engine
+               details.
+        :param str engine_display_name: (optional) Engine display name.
+        :param List[str] tags: (optional) Tags.
+        """
+        self.description = description
+        self.engine_details = engine_details
+        self.engine_display_name = engine_display_name
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'UpdateSparkEngineBody':
+        """Initialize a UpdateSparkEngineBody object from a json dictionary."""
+        args = {}
+        if (description := _dict.get('description')) is not None:
+            args['description'] = description
+        if (engine_details := _dict.get('engine_details')) is not None:
+            args['engine_details'] = UpdateSparkEngineBodyEngineDetails.from_dict(engine_details)
+        if (engine_display_name := _dict.get('engine_display_name')) is not None:
+            args['engine_display_name'] = engine_display_name
+        if (tags := _dict.get('tags')) is not None:
+            args['tags'] = tags
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a UpdateSparkEngineBody object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'description') and self.description is not None:
+            _dict['description'] = self.description
+        if hasattr(self, 'engine_details') and self.engine_details is not None:
+            if isinstance(self.engine_details, dict):
+                _dict['engine_details'] = self.engine_details
+            else:
+                _dict['engine_details'] = self.engine_details.to_dict()
+        if hasattr(self, 'engine_display_name') and self.engine_display_name is not None:
+            _dict['engine_display_name'] = self.engine_display_name
+        if hasattr(self, 'tags') and self.tags is not None:
+            _dict['tags'] = self.tags
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this UpdateSparkEngineBody object as a `dict`."""
+        return {name: getattr(self, name) for name in UpdateSparkEngineBody.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this UpdateSparkEngineBody object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'UpdateSparkEngineBody') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'UpdateSparkEngineBody') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
+
+
+class UpdateSparkEngineBodyEngineDetails:
+    """
+    Engine details.
+
+    :param dict default_config: (optional) Dynamic dict.
+    :param str default_version: (optional) The default spark version for the native
+          engine.
+    """
+
+    __slots__ = ('default_config', 'default_version')
+
+    def __init__(
+        self,
+        *,
+        default_config: Optional[dict] = None,
+        default_version: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize a UpdateSparkEngineBodyEngineDetails object.
+
+        :param dict default_config: (optional) Dynamic dict.
+        :param str default_version: (optional) The default spark version for the
+               native engine.
+        """
+        self.default_config = default_config
+        self.default_version = default_version
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'UpdateSparkEngineBodyEngineDetails':
+        """Initialize a UpdateSparkEngineBodyEngineDetails object from a json dictionary."""
+        args = {}
+        if (default_config := _dict.get('default_config')) is not None:
+            args['default_config'] = default_config
+        if (default_version := _dict.get('default_version')) is not None:
+            args['default_version'] = default_version
+        return cls(**args)
+
+    @classmethod
+    def _from_dict(cls, _dict):
+        """Initialize a UpdateSparkEngineBodyEngineDetails object from a json dictionary."""
+        return cls.from_dict(_dict)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this model."""
+        _dict = {}
+        if hasattr(self, 'default_config') and self.default_config is not None:
+            _dict['default_config'] = self.default_config
+        if hasattr(self, 'default_version') and self.default_version is not None:
+            _dict['default_version'] = self.default_version
+        return _dict
+
+    def _to_dict(self):
+        """Return a json dictionary representing this model."""
+        return self.to_dict()
+
+    @property
+    def __dict__(self) -> Dict:
+        """Return the attributes of this UpdateSparkEngineBodyEngineDetails object as a `dict`."""
+        return {name: getattr(self, name) for name in UpdateSparkEngineBodyEngineDetails.__slots__}
+
+    def __str__(self) -> str:
+        """Return a `str` version of this UpdateSparkEngineBodyEngineDetails object."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def __eq__(self, other: 'UpdateSparkEngineBodyEngineDetails') -> bool:
+        """Return `true` when self and other are equal, false otherwise."""
+        if not isinstance(other, self.__class__):
+            return False
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other: 'UpdateSparkEngineBodyEngineDetails') -> bool:
+        """Return `true` when self and other are not equal, false otherwise."""
+        return not self == other
@@ -0,0 +1,563 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Query plan regression benchmarks.
+
+`PlanBenchmark` runs each statement of a corpus with explain analyze on
+Presto and Prestissimo engines, and records the timings and estimates of the
+parsed plans in a `BenchmarkRun`, which is saved as JSON or CSV. Comparing
+two runs, such as before and after an engine upgrade, flags the statements
+that got slower:
+
+    benchmark = PlanBenchmark(service, [('presto', 'presto01'), ('prestissimo', 'prestissimo01')], repetitions=3)
+    run = benchmark.run(load_corpus('queries/'), label='after-upgrade')
+    run.save('runs/after-upgrade.json')
+
+    comparison = compare_runs(BenchmarkRun.load('runs/before-upgrade.json'), run)
+    print(comparison.summary_table())
+    for delta in comparison.regressions:
+        print(delta.name, delta.engine_id, delta.change)
+
+Explain analyze executes the statements: the corpus should only read data.
+"""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+import csv
+import json
+import os
+import statistics
+import time
+
+from .explain_plan import parse_plan
+from .watsonx_data_v2 import WatsonxDataV2
+
+#: The explain analyze operation of each engine type.
+ENGINE_TYPES = {
+    'presto': 'run_explain_analyze_statement',
+    'prestissimo': 'run_prestissimo_explain_analyze_statement',
+}
+
+#: The metrics of a `PlanTiming`, compared by `compare_runs`.
+METRICS = ('elapsed_ms', 'cpu_ms', 'scheduled_ms', 'output_rows', 'estimated_rows', 'estimated_cpu')
+
+
+def load_corpus(directory: str) -> Dict[str, str]:
+    """
+    Load the statements of the `.sql` files of a directory.
+
+    :param str directory: The directory.
+    :return: The statements, by file name without extension, in name order.
+    :rtype: dict
+    """
+    corpus = {}
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith('.sql'):
+            with open(os.path.join(directory, file_name), encoding='utf-8') as file:
+                corpus[file_name[: -len('.sql')]] = file.read().strip().rstrip(';')
+    return corpus
+
+
+class PlanTiming:
+    """
+    The measures of one explain analyze of a statement.
+
+    :attr str name: The name of the statement in the corpus.
+    :attr str engine_type: 'presto' or 'prestissimo'.
+    :attr str engine_id: The engine id.
+    :attr int repetition: The repetition, from 0.
+    :attr float elapsed_ms: Duration of the explain analyze request.
+    :attr float cpu_ms: Total CPU time of the operators.
+    :attr float scheduled_ms: Total scheduled (wall) time of the operators.
+    :attr int output_rows: Rows returned by the root operator.
+    :attr float estimated_rows: Estimated rows of the root operator.
+    :attr float estimated_cpu: Total estimated CPU cost of the operators.
+    :attr int operators: Number of operators of the plan.
+    :attr str hotspot: The operator with the most CPU time, as
+          'operator[id]'.
+    :attr str error: The error of the request, or None.
+    """
+
+    __slots__ = (
+        'name',
+        'engine_type',
+        'engine_id',
+        'repetition',
+        'elapsed_ms',
+        'cpu_ms',
+        'scheduled_ms',
+        'output_rows',
+        'estimated_rows',
+        'estimated_cpu',
+        'operators',
+        'hotspot',
+        'error',
+    )
+
+    def __init__(self, name: str, engine_type: str, engine_id: str, repetition: int = 0) -> None:
+        self.name = name
+        self.engine_type = engine_type
+        self.engine_id = engine_id
+        self.repetition = repetition
+        self.elapsed_ms = None
+        self.cpu_ms = None
+        self.scheduled_ms = None
+        self.output_rows = None
+        self.estimated_rows = None
+        self.estimated_cpu = None
+        self.operators = None
+        self.hotspot = None
+        self.error = None
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        """The (name, engine_type, engine_id) the timing measures."""
+        return (self.name, self.engine_type, self.engine_id)
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'PlanTiming':
+        """Initialize a PlanTiming object from a json dictionary."""
+        timing = cls(_dict['name'], _dict['engine_type'], _dict['engine_id'], _dict.get('repetition', 0))
+        for name in cls.__slots__[4:]:
+            setattr(timing, name, _dict.get(name))
+        return timing
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this timing."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class BenchmarkRun:
+    """
+    The timings of a benchmark run.
+
+    :attr str label: The name of the run.
+    :attr float started_at: The UNIX time the run started at.
+    :attr List[PlanTiming] timings: The timings, in completion order.
+    """
+
+    def __init__(self, label: str, started_at: float, timings: Optional[List[PlanTiming]] = None) -> None:
+        self.label = label
+        self.started_at = started_at
+        self.timings = timings if timings is not None else []
+
+    @property
+    def errors(self) -> List[PlanTiming]:
+        """The timings of the requests that failed."""
+        return [timing for timing in self.timings if timing.error is not None]
+
+    def medians(self, metric: str = 'elapsed_ms') -> Dict[Tuple[str, str, str], float]:
+        """
+        Return the median of a metric over the repetitions of each statement
+        and engine; failed repetitions are ignored.
+
+        :param str metric: (optional) One of `METRICS`.
+        :return: The medians, by (name, engine_type, engine_id).
+        :rtype: dict
+        """
+        values = {}
+        for timing in self.timings:
+            value = getattr(timing, metric)
+            if value is not None:
+                values.setdefault(timing.key, []).append(value)
+        return {key: statistics.median(series) for key, series in values.items()}
+
+    @classmethod
+    def from_dict(cls, _dict: Dict) -> 'BenchmarkRun':
+        """Initialize a BenchmarkRun object from a json dictionary."""
+        return cls(_dict['label'], _dict['started_at'], [PlanTiming.from_dict(t) for t in _dict.get('timings', [])])
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this run."""
+        return {
+            'label': self.label,
+            'started_at': self.started_at,
+            'timings': [timing.to_dict() for timing in self.timings],
+        }
+
+    @classmethod
+    def load(cls, path: str) -> 'BenchmarkRun':
+        """
+        Load a run saved with `save()`.
+
+        :param str path: The JSON file.
+        :return: The run.
+        :rtype: BenchmarkRun
+        """
+        with open(path, encoding='utf-8') as file:
+            return cls.from_dict(json.load(file))
+
+    def save(self, path: str) -> None:
+        """
+        Save the run as JSON.
+
+        :param str path: The JSON file, replaced if it exists.
+        """
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.to_dict(), file, indent=1)
+
+    def to_csv(self, path: str) -> None:
+        """
+        Save the timings as CSV, one row per explain analyze.
+
+        :param str path: The CSV file, replaced if it exists.
+        """
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(PlanTiming.__slots__)
+            for timing in self.timings:
+                writer.writerow([getattr(timing, name) for name in PlanTiming.__slots__])
+
+
+class PlanBenchmark:
+    """
+    Runs a corpus of statements with explain analyze on a set of engines.
+
+    At most `max_concurrency` statements run at a time, and at most
+    `max_per_engine` on each engine, so that concurrent statements do not
+    distort each other's timings.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        targets: Iterable[Tuple[str, str]],
+        *,
+        auth_instance_id: Optional[str] = None,
+        repetitions: int = 1,
+        max_concurrency: int = 4,
+        max_per_engine: int = 1,
+        verbose: Optional[bool] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Initialize a PlanBenchmark object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param targets: The (engine_type, engine_id) to run the statements on;
+               the engine types are the keys of `ENGINE_TYPES`.
+        :param str auth_instance_id: (optional) CRN.
+        :param int repetitions: (optional) Number of runs of each statement on
+               each engine.
+        :param int max_concurrency: (optional) Maximum number of statements
+               running at a time.
+        :param int max_per_engine: (optional) Maximum number of statements
+               running at a time on one engine.
+        :param bool verbose: (optional) The verbose option of explain analyze.
+        :param clock: (optional) Function returning the current time in seconds.
+        """
+        self.targets = list(targets)
+        for engine_type, _ in self.targets:
+            if engine_type not in ENGINE_TYPES:
+                raise ValueError('unsupported engine type: {0}'.format(engine_type))
+        if repetitions < 1 or max_concurrency < 1 or max_per_engine < 1:
+            raise ValueError('repetitions, max_concurrency and max_per_engine must be at least 1')
+        self.client = client
+        self.auth_instance_id = auth_instance_id
+        self.repetitions = repetitions
+        self.max_concurrency = max_concurrency
+        self.max_per_engine = max_per_engine
+        self.verbose = verbose
+        self._clock = clock
+
+    def run(
+        self,
+        corpus: Mapping[str, str],
+        *,
+        label: Optional[str] = None,
+        progress: Optional[Callable[[PlanTiming], None]] = None,
+    ) -> BenchmarkRun:
+        """
+        Run every statement of the corpus on every target.
+
+        Failed requests are recorded with their error; they do not stop the
+        run.
+
+        :param corpus: The statements, by name.
+        :param str label: (optional) The name of the run; the start time by
+               default.
+        :param progress: (optional) Function called with each timing as it
+               completes.
+        :return: The run.
+        :rtype: BenchmarkRun
+        """
+        started_at = time.time()
+        run = BenchmarkRun(label or time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(started_at)), started_at)
+        # One queue per engine; the repetitions are interleaved to spread them in time.
+        queues = {target: deque() for target in self.targets}
+        for repetition in range(self.repetitions):
+            for name, statement in corpus.items():
+                for target in self.targets:
+                    queues[target].append((name, statement, repetition))
+        running = {target: 0 for target in self.targets}
+        in_flight = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix='watsonxdata-plan-benchmark'
+        ) as executor:
+            while True:
+                for target, queue in queues.items():
+                    while queue and running[target] < self.max_per_engine and len(in_flight) < self.max_concurrency:
+                        name, statement, repetition = queue.popleft()
+                        future = executor.submit(self._measure, name, statement, target, repetition)
+                        in_flight[future] = target
+                        running[target] += 1
+                if not in_flight:
+                    return run
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running[in_flight.pop(future)] -= 1
+                    timing = future.result()
+                    run.timings.append(timing)
+                    if progress is not None:
+                        progress(timing)
+
+    def _measure(self, name: str, statement: str, target: Tuple[str, str], repetition: int) -> PlanTiming:
+        """Run one explain analyze and parse its plan; runs in a worker thread and never raises."""
+        engine_type, engine_id = target
+        timing = PlanTiming(name, engine_type, engine_id, repetition)
+        operation = getattr(self.client, ENGINE_TYPES[engine_type])
+        started = self._clock()
+        try:
+            response = operation(engine_id, statement, verbose=self.verbose, auth_instance_id=self.auth_instance_id)
+            timing.elapsed_ms = (self._clock() - started) * 1000
+            plan = parse_plan(response.get_result())
+        except Exception as error:  # pylint: disable=broad-except
+            timing.error = str(error) or type(error).__name__
+            return timing
+        timing.operators = len(plan)
+        timing.cpu_ms = plan.total_cpu_ms
+        timing.scheduled_ms = plan.total('wall_ms')
+        timing.estimated_cpu = plan.total('estimated_cpu')
+        timing.output_rows = plan.root.output_rows
+        timing.estimated_rows = plan.root.estimated_rows
+        hotspots = plan.hotspots(1)
+        if hotspots:
+            timing.hotspot = '{0}[{1}]'.format(hotspots[0].operator, hotspots[0].id)
+        return timing
+
+
+class QueryDelta:
+    """
+    The change of a metric of a statement on an engine between two runs.
+
+    :attr str name: The name of the statement.
+    :attr str engine_type: The engine type.
+    :attr str engine_id: The engine id.
+    :attr str metric: The metric.
+    :attr float baseline: The median of the metric in the baseline run.
+    :attr float candidate: The median of the metric in the candidate run, or
+          None if every repetition failed.
+    :attr bool regression: True if the change exceeds the thresholds of the
+          comparison, or if the statement only fails in the candidate run.
+    """
+
+    __slots__ = ('name', 'engine_type', 'engine_id', 'metric', 'baseline', 'candidate', 'regression')
+
+    def __init__(
+        self,
+        key: Tuple[str, str, str],
+        metric: str,
+        baseline: float,
+        candidate: Optional[float],
+        regression: bool,
+    ) -> None:
+        self.name, self.engine_type, self.engine_id = key
+        self.metric = metric
+        self.baseline = baseline
+        self.candidate = candidate
+        self.regression = regression
+
+    @property
+    def change(self) -> Optional[float]:
+        """The relative change, such as 0.25 for 25% more, or None."""
+        if self.candidate is None or not self.baseline:
+            return None
+        return self.candidate / self.baseline - 1
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this delta."""
+        _dict = {name: getattr(self, name) for name in self.__slots__}
+        _dict['change'] = self.change
+        return _dict
+
+
+class RunComparison:
+    """
+    The comparison of a candidate run with a baseline run.
+
+    :attr str baseline_label: The label of the baseline run.
+    :attr str candidate_label: The label of the candidate run.
+    :attr List[QueryDelta] deltas: The deltas of each compared metric, for
+          each statement and engine of the baseline with a value.
+    """
+
+    def __init__(self, baseline_label: str, candidate_label: str, deltas: List[QueryDelta]) -> None:
+        self.baseline_label = baseline_label
+        self.candidate_label = candidate_label
+        self.deltas = deltas
+
+    @property
+    def regressions(self) -> List[QueryDelta]:
+        """The deltas flagged as regressions."""
+        return [delta for delta in self.deltas if delta.regression]
+
+    def summary(self) -> List[Dict]:
+        """
+        Return the p50 and p95 of each metric on each engine, over the
+        statements that succeeded in both runs.
+
+        :return: One dict per engine and metric, with the engine_type,
+                 engine_id, metric, statements, p50 and p95 of each run, their
+                 relative changes p50_change and p95_change, and the number of
+                 regressions.
+        :rtype: List[dict]
+        """
+        groups = {}
+        for delta in self.deltas:
+            groups.setdefault((delta.engine_type, delta.engine_id, delta.metric), []).append(delta)
+        rows = []
+        for (engine_type, engine_id, metric), deltas in groups.items():
+            compared = [delta for delta in deltas if delta.candidate is not None]
+            row = {'engine_type': engine_type, 'engine_id': engine_id, 'metric': metric, 'statements': len(compared)}
+            for percentile in (50, 95):
+                baseline = _percentile([delta.baseline for delta in compared], percentile)
+                candidate = _percentile([delta.candidate for delta in compared], percentile)
+                row['p{0}_baseline'.format(percentile)] = baseline
+                row['p{0}_candidate'.format(percentile)] = candidate
+                row['p{0}_change'.format(percentile)] = candidate / baseline - 1 if baseline else None
+            row['regressions'] = sum(delta.regression for delta in deltas)
+            rows.append(row)
+        return rows
+
+    def summary_table(self) -> str:
+        """
+        Return the summary as a text table.
+
+        :return: The table, one line per engine and metric.
+        :rtype: str
+        """
+        header = ('engine', 'metric', 'n', 'p50 base', 'p50 cand', 'p50 chg', 'p95 base', 'p95 cand', 'p95 chg', 'regr')
+        lines = [header]
+        for row in self.summary():
+            lines.append(
+                (
+                    '{engine_type}:{engine_id}'.format(**row),
+                    row['metric'],
+                    str(row['statements']),
+                    _format(row['p50_baseline']),
+                    _format(row['p50_candidate']),
+                    _format_change(row['p50_change']),
+                    _format(row['p95_baseline']),
+                    _format(row['p95_candidate']),
+                    _format_change(row['p95_change']),
+                    str(row['regressions']),
+                )
+            )
+        widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+        return '\n'.join(
+            '  '.join(
+                cell.ljust(width) if i < 2 else cell.rjust(width) for i, (cell, width) in enumerate(zip(line, widths))
+            )
+            for line in lines
+        )
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this comparison."""
+        return {
+            'baseline': self.baseline_label,
+            'candidate': self.candidate_label,
+            'summary': self.summary(),
+            'deltas': [delta.to_dict() for delta in self.deltas],
+        }
+
+    def to_csv(self, path: str) -> None:
+        """
+        Save the deltas as CSV.
+
+        :param str path: The CSV file, replaced if it exists.
+        """
+        fields = QueryDelta.__slots__ + ('change',)
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fields)
+            writer.writeheader()
+            writer.writerows(delta.to_dict() for delta in self.deltas)
+
+
+def compare_runs(
+    baseline: BenchmarkRun,
+    candidate: BenchmarkRun,
+    *,
+    metrics: Iterable[str] = ('elapsed_ms', 'cpu_ms'),
+    threshold: float = 0.2,
+    min_delta: float = 10.0,
+) -> RunComparison:
+    """
+    Compare the medians of the metrics of each statement and engine of two
+    runs.
+
+    A delta is a regression when the candidate median exceeds the baseline
+    median by more than `threshold` and by more than `min_delta`, which keeps
+    the noise of short statements from being flagged; and when a statement
+    that succeeded in the baseline run only failed in the candidate run.
+
+    :param BenchmarkRun baseline: The reference run.
+    :param BenchmarkRun candidate: The run checked for regressions.
+    :param metrics: (optional) The compared metrics, among `METRICS`.
+    :param float threshold: (optional) Relative increase flagged as a
+           regression.
+    :param float min_delta: (optional) Minimum absolute increase flagged as a
+           regression, in the unit of the metric.
+    :return: The comparison.
+    :rtype: RunComparison
+    """
+    deltas = []
+    failed = {timing.key for timing in candidate.timings} - set(candidate.medians('operators'))
+    for metric in metrics:
+        if metric not in METRICS:
+            raise ValueError('unsupported metric: {0}'.format(metric))
+        candidate_medians = candidate.medians(metric)
+        for key, value in sorted(baseline.medians(metric).items()):
+            if key in candidate_medians:
+                other = candidate_medians[key]
+                regression = other - value > max(threshold * value, min_delta)
+            elif key in failed:
+                other = None
+                regression = True
+            else:
+                continue
+            deltas.append(QueryDelta(key, metric, value, other, regression))
+    return RunComparison(baseline.label, candidate.label, deltas)
+
+
+def _percentile(values: List[float], percentile: float) -> Optional[float]:
+    """Return a percentile of values, interpolated between the closest ranks."""
+    if not values:
+        return None
+    values = sorted(values)
+    rank = (len(values) - 1) * percentile / 100.0
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _format(value: Optional[float]) -> str:
+    return '-' if value is None else '{0:.1f}'.format(value)
+
+
+def _format_change(change: Optional[float]) -> str:
+    return '-' if change is None else '{0:+.1%}'.format(change)
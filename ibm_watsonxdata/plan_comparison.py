@@ -0,0 +1,419 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Side-by-side comparison of Presto and Prestissimo plans.
+
+`EngineComparator` explains, or explains and analyzes, each statement on a
+Presto engine and on a Prestissimo engine at the same time, and diffs the two
+plans operator by operator:
+
+    comparator = EngineComparator(service, 'presto01', 'prestissimo01', analyze=True)
+    for comparison in comparator.compare_all(load_corpus('queries/')):
+        if comparison.cost_change is not None and comparison.cost_change < -0.3:
+            print(comparison.name, 'uses {0:.0%} less CPU on Prestissimo'.format(-comparison.cost_change))
+
+`diff_plans` aligns the operators of two parsed plans in depth-first order;
+the aligned operators carry the deltas of their estimates and actual
+metrics, and the others are reported as only present in one plan.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+import time
+
+from .explain_plan import Plan, PlanNode, parse_plan
+from .watsonx_data_v2 import WatsonxDataV2
+
+#: The metrics of the operators compared by `diff_plans`.
+OPERATOR_METRICS = ('estimated_rows', 'estimated_cpu', 'estimated_memory', 'cpu_ms', 'wall_ms', 'output_rows')
+
+
+class OperatorDelta:
+    """
+    A pair of aligned operators of two plans.
+
+    :attr PlanNode presto: The operator of the Presto plan.
+    :attr PlanNode prestissimo: The operator of the Prestissimo plan.
+    """
+
+    __slots__ = ('presto', 'prestissimo')
+
+    def __init__(self, presto: PlanNode, prestissimo: PlanNode) -> None:
+        self.presto = presto
+        self.prestissimo = prestissimo
+
+    @property
+    def operator(self) -> str:
+        """The operator of the pair."""
+        return self.presto.operator
+
+    def delta(self, metric: str) -> Optional[float]:
+        """
+        Return the difference of a metric, Prestissimo minus Presto.
+
+        :param str metric: One of `OPERATOR_METRICS`.
+        :return: The difference, or None if either operator lacks the metric.
+        :rtype: float
+        """
+        presto = getattr(self.presto, metric)
+        prestissimo = getattr(self.prestissimo, metric)
+        if presto is None or prestissimo is None:
+            return None
+        return prestissimo - presto
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this pair."""
+        _dict = {'operator': self.operator, 'presto_id': self.presto.id, 'prestissimo_id': self.prestissimo.id}
+        for metric in OPERATOR_METRICS:
+            delta = self.delta(metric)
+            if delta is not None:
+                _dict[metric + '_delta'] = delta
+        return _dict
+
+
+class PlanDiff:
+    """
+    The operator-level differences between a Presto and a Prestissimo plan.
+
+    :attr Plan presto: The Presto plan.
+    :attr Plan prestissimo: The Prestissimo plan.
+    :attr List[OperatorDelta] matched: The aligned operators.
+    :attr List[PlanNode] presto_only: The operators only in the Presto plan.
+    :attr List[PlanNode] prestissimo_only: The operators only in the
+          Prestissimo plan.
+    """
+
+    def __init__(
+        self,
+        presto: Plan,
+        prestissimo: Plan,
+        matched: List[OperatorDelta],
+        presto_only: List[PlanNode],
+        prestissimo_only: List[PlanNode],
+    ) -> None:
+        self.presto = presto
+        self.prestissimo = prestissimo
+        self.matched = matched
+        self.presto_only = presto_only
+        self.prestissimo_only = prestissimo_only
+
+    @property
+    def same_shape(self) -> bool:
+        """True if every operator is aligned."""
+        return not self.presto_only and not self.prestissimo_only
+
+    def operator_counts(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Return the operators whose number differs between the plans.
+
+        :return: The (Presto, Prestissimo) counts, by operator.
+        :rtype: dict
+        """
+        counts = {}
+        for node in self.presto_only:
+            counts[node.operator] = counts.get(node.operator, 0) - 1
+        for node in self.prestissimo_only:
+            counts[node.operator] = counts.get(node.operator, 0) + 1
+        result = {}
+        for operator, difference in counts.items():
+            if difference:
+                presto = len(self.presto.find(operator=operator))
+                result[operator] = (presto, presto + difference)
+        return result
+
+    def total_delta(self, metric: str) -> Optional[float]:
+        """
+        Return the difference of the total of a metric over each plan,
+        Prestissimo minus Presto.
+
+        :param str metric: One of `OPERATOR_METRICS`.
+        :return: The difference, or None if either plan lacks the metric.
+        :rtype: float
+        """
+        presto = self.presto.total(metric)
+        prestissimo = self.prestissimo.total(metric)
+        if presto is None or prestissimo is None:
+            return None
+        return prestissimo - presto
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this diff."""
+        return {
+            'same_shape': self.same_shape,
+            'matched': [pair.to_dict() for pair in self.matched],
+            'presto_only': [node.to_dict() for node in self.presto_only],
+            'prestissimo_only': [node.to_dict() for node in self.prestissimo_only],
+            'totals': {
+                metric: {
+                    'presto': self.presto.total(metric),
+                    'prestissimo': self.prestissimo.total(metric),
+                }
+                for metric in OPERATOR_METRICS
+            },
+        }
+
+
+def diff_plans(presto: Plan, prestissimo: Plan) -> PlanDiff:
+    """
+    Align the operators of two plans and return their differences.
+
+    The operators are compared in depth-first order by name, so that a
+    fused or missing operator only shifts the alignment locally.
+
+    :param Plan presto: The Presto plan.
+    :param Plan prestissimo: The Prestissimo plan.
+    :return: The differences.
+    :rtype: PlanDiff
+    """
+    presto_nodes = list(presto.walk())
+    prestissimo_nodes = list(prestissimo.walk())
+    matcher = SequenceMatcher(
+        None, [node.operator for node in presto_nodes], [node.operator for node in prestissimo_nodes], autojunk=False
+    )
+    matched, presto_only, prestissimo_only = [], [], []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            matched += [OperatorDelta(a, b) for a, b in zip(presto_nodes[i1:i2], prestissimo_nodes[j1:j2])]
+        else:
+            presto_only += presto_nodes[i1:i2]
+            prestissimo_only += prestissimo_nodes[j1:j2]
+    return PlanDiff(presto, prestissimo, matched, presto_only, prestissimo_only)
+
+
+class StatementComparison:
+    """
+    The comparison of one statement on both engines.
+
+    The cost of a plan is its total actual CPU time when both plans are
+    analyzed, and its total estimated CPU cost otherwise, so that both costs
+    are in the same unit.
+
+    :attr str name: The name of the statement.
+    :attr str statement: The statement.
+    :attr Plan presto_plan: The Presto plan, or None if the request failed.
+    :attr Plan prestissimo_plan: The Prestissimo plan, or None.
+    :attr float presto_elapsed_ms: Duration of the Presto request.
+    :attr float prestissimo_elapsed_ms: Duration of the Prestissimo request.
+    :attr Exception presto_error: The error of the Presto request, or None.
+    :attr Exception prestissimo_error: The error of the Prestissimo request,
+          or None.
+    """
+
+    __slots__ = (
+        'name',
+        'statement',
+        'presto_plan',
+        'prestissimo_plan',
+        'presto_elapsed_ms',
+        'prestissimo_elapsed_ms',
+        'presto_error',
+        'prestissimo_error',
+        '_diff',
+    )
+
+    def __init__(self, name: str, statement: str) -> None:
+        self.name = name
+        self.statement = statement
+        self.presto_plan = None
+        self.prestissimo_plan = None
+        self.presto_elapsed_ms = None
+        self.prestissimo_elapsed_ms = None
+        self.presto_error = None
+        self.prestissimo_error = None
+        self._diff = None
+
+    @property
+    def diff(self) -> Optional[PlanDiff]:
+        """The differences of the plans, or None if either request failed."""
+        if self._diff is None and self.presto_plan is not None and self.prestissimo_plan is not None:
+            self._diff = diff_plans(self.presto_plan, self.prestissimo_plan)
+        return self._diff
+
+    @property
+    def presto_cost(self) -> Optional[float]:
+        """The cost of the Presto plan."""
+        return _cost(self.presto_plan, self._analyzed)
+
+    @property
+    def prestissimo_cost(self) -> Optional[float]:
+        """The cost of the Prestissimo plan."""
+        return _cost(self.prestissimo_plan, self._analyzed)
+
+    @property
+    def _analyzed(self) -> bool:
+        plans = (self.presto_plan, self.prestissimo_plan)
+        return all(plan is not None and plan.analyzed for plan in plans)
+
+    @property
+    def cost_change(self) -> Optional[float]:
+        """The relative change of the cost on Prestissimo, such as -0.4 for 40% less."""
+        return _change(self.presto_cost, self.prestissimo_cost)
+
+    @property
+    def elapsed_change(self) -> Optional[float]:
+        """The relative change of the request duration on Prestissimo."""
+        if self.presto_error is not None or self.prestissimo_error is not None:
+            return None
+        return _change(self.presto_elapsed_ms, self.prestissimo_elapsed_ms)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this comparison."""
+        _dict = {
+            'name': self.name,
+            'presto_cost': self.presto_cost,
+            'prestissimo_cost': self.prestissimo_cost,
+            'cost_change': self.cost_change,
+            'presto_elapsed_ms': self.presto_elapsed_ms,
+            'prestissimo_elapsed_ms': self.prestissimo_elapsed_ms,
+            'elapsed_change': self.elapsed_change,
+            'presto_error': None if self.presto_error is None else str(self.presto_error),
+            'prestissimo_error': None if self.prestissimo_error is None else str(self.prestissimo_error),
+        }
+        if self.diff is not None:
+            _dict['diff'] = self.diff.to_dict()
+        return _dict
+
+
+class EngineComparator:
+    """
+    Compares the plans of statements on a Presto and a Prestissimo engine.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        presto_engine_id: str,
+        prestissimo_engine_id: str,
+        *,
+        analyze: bool = False,
+        plan_type: Optional[str] = None,
+        auth_instance_id: Optional[str] = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        """
+        Initialize an EngineComparator object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str presto_engine_id: The id of the Presto engine.
+        :param str prestissimo_engine_id: The id of the Prestissimo engine.
+        :param bool analyze: (optional) When true, the statements are run with
+               explain analyze, which executes them; by default they are only
+               explained.
+        :param str plan_type: (optional) The type of the explained plans, such
+               as 'distributed'; ignored with analyze.
+        :param str auth_instance_id: (optional) CRN.
+        :param int max_concurrency: (optional) Maximum number of concurrent
+               requests, two per statement.
+        """
+        if max_concurrency < 2:
+            raise ValueError('max_concurrency must be at least 2')
+        self.client = client
+        self.presto_engine_id = presto_engine_id
+        self.prestissimo_engine_id = prestissimo_engine_id
+        self.analyze = analyze
+        self.plan_type = plan_type
+        self.auth_instance_id = auth_instance_id
+        self.max_concurrency = max_concurrency
+
+    def compare(self, statement: str, name: Optional[str] = None) -> StatementComparison:
+        """
+        Run a statement on both engines at the same time and compare its plans.
+
+        :param str statement: The statement.
+        :param str name: (optional) The name of the statement.
+        :return: The comparison.
+        :rtype: StatementComparison
+        """
+        (comparison,) = self.compare_all({name or statement: statement})
+        return comparison
+
+    def compare_all(self, statements: Union[Mapping[str, str], Iterable[str]]) -> Iterator[StatementComparison]:
+        """
+        Compare many statements, yielding the comparisons as they complete.
+
+        Failed requests are recorded in the comparisons; they do not stop the
+        others.
+
+        :param statements: The statements, by name, or an iterable of
+               statements named after themselves.
+        :return: A generator of `StatementComparison`s.
+        :rtype: Iterator[StatementComparison]
+        """
+        items = iter(statements.items() if isinstance(statements, Mapping) else ((s, s) for s in statements))
+        exhausted = False
+        in_flight = {}
+        pending = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='watsonxdata-compare') as executor:
+            while True:
+                while not exhausted and len(in_flight) + 2 <= self.max_concurrency:
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    comparison = StatementComparison(*item)
+                    pending[id(comparison)] = 2
+                    for presto in (True, False):
+                        in_flight[executor.submit(self._explain, comparison, presto)] = comparison
+                if not in_flight:
+                    return
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    comparison = in_flight.pop(future)
+                    pending[id(comparison)] -= 1
+                    if not pending[id(comparison)]:
+                        del pending[id(comparison)]
+                        yield comparison
+
+    def _explain(self, comparison: StatementComparison, presto: bool) -> None:
+        """Explain the statement of a comparison on one engine; runs in a worker thread and never raises."""
+        if presto:
+            engine_id = self.presto_engine_id
+            operation = self.client.run_explain_analyze_statement if self.analyze else self.client.run_explain_statement
+        else:
+            engine_id = self.prestissimo_engine_id
+            operation = (
+                self.client.run_prestissimo_explain_analyze_statement
+                if self.analyze
+                else self.client.run_prestissimo_explain_statement
+            )
+        kwargs = {} if self.analyze else {'type': self.plan_type}
+        started = time.perf_counter()
+        plan = error = None
+        try:
+            response = operation(engine_id, comparison.statement, auth_instance_id=self.auth_instance_id, **kwargs)
+            plan = parse_plan(response.get_result())
+        except Exception as err:  # pylint: disable=broad-except
+            error = err
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if presto:
+            comparison.presto_plan, comparison.presto_error, comparison.presto_elapsed_ms = plan, error, elapsed_ms
+        else:
+            comparison.prestissimo_plan, comparison.prestissimo_error = plan, error
+            comparison.prestissimo_elapsed_ms = elapsed_ms
+
+
+def _cost(plan: Optional[Plan], analyzed: bool) -> Optional[float]:
+    if plan is None:
+        return None
+    return plan.total_cpu_ms if analyzed else plan.total('estimated_cpu')
+
+
+def _change(before: Optional[float], after: Optional[float]) -> Optional[float]:
+    if before is None or after is None or not before:
+        return None
+    return after / before - 1
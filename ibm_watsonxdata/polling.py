@@ -0,0 +1,241 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batched status polling.
+
+`StatusPoller` is the scheduler shared by `EngineWaiter` and
+`SparkApplicationTracker`: resources are waited for in groups that one list
+request answers (the engines of a type, the applications of a Spark engine),
+and a single thread polls each group in turn, resolving a `Future` per
+resource once its status is reached.
+
+The interval between the polls of a group grows from `initial_interval` to
+`max_interval` while none of its resources changes status, starts over when
+one does, and is randomized by `jitter` so that many pollers do not poll in
+lockstep.
+"""
+
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, Iterable, Optional
+import random
+import threading
+import time
+
+from .watsonx_data_v2 import result_field
+
+
+class _Target:
+    """A resource being waited for."""
+
+    __slots__ = ('group', 'resource_id', 'states', 'deadline', 'future', 'status')
+
+    def __init__(self, group: Hashable, resource_id: str, states: frozenset, deadline: Optional[float]) -> None:
+        self.group = group
+        self.resource_id = resource_id
+        self.states = states
+        self.deadline = deadline
+        self.future = Future()
+        self.status = None
+
+
+class StatusPoller:
+    """
+    Base class of the pollers: subclasses send the list request of a group in
+    `_fetch()` and name their resources in `_describe()`.
+
+    A future is resolved with the resource once its status is one of the
+    awaited ones, and fails with `RuntimeError` when the status is one of the
+    failure states, and with `TimeoutError` when its timeout elapses. Failed
+    list requests are retried at the next poll.
+
+    :attr int polls: Number of list requests sent.
+    :attr int poll_errors: Number of list requests that failed.
+    """
+
+    #: The field of a resource holding its status.
+    status_field = 'status'
+
+    def __init__(
+        self,
+        *,
+        initial_interval: float = 2.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        jitter: float = 0.1,
+        failure_states: Iterable[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a StatusPoller object.
+
+        :param float initial_interval: (optional) Seconds between the first
+               polls of a group, and after a status change.
+        :param float max_interval: (optional) Maximum seconds between polls.
+        :param float backoff: (optional) Factor applied to the interval after
+               each poll without status change.
+        :param float jitter: (optional) Relative random variation of the
+               intervals, between 0 and 1.
+        :param failure_states: (optional) The statuses that end a wait with an
+               error.
+        :param clock: (optional) Function returning the current time in seconds.
+        """
+        if not 0 < initial_interval <= max_interval:
+            raise ValueError('initial_interval must be positive and at most max_interval')
+        if backoff < 1 or not 0 <= jitter < 1:
+            raise ValueError('backoff must be at least 1 and jitter between 0 and 1')
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.jitter = jitter
+        self.failure_states = frozenset(failure_states)
+        self._clock = clock
+        self._condition = threading.Condition()
+        self._targets = {}
+        self._intervals = {}
+        self._next_polls = {}
+        self._thread = None
+        self._closed = False
+        self.polls = 0
+        self.poll_errors = 0
+
+    def close(self) -> None:
+        """
+        Cancel the pending waits and stop the scheduler thread.
+        """
+        with self._condition:
+            self._closed = True
+            pending = [target for targets in self._targets.values() for target in targets]
+            self._targets.clear()
+            self._condition.notify()
+        for target in pending:
+            target.future.cancel()
+
+    def _fetch(self, group: Hashable) -> Dict[str, object]:
+        """Send the list request of a group; return its resources by id."""
+        raise NotImplementedError()
+
+    def _describe(self, target: _Target) -> str:
+        """Return the name of the resource of a wait, for error messages."""
+        raise NotImplementedError()
+
+    def _watch(
+        self,
+        group: Hashable,
+        resource_id: str,
+        states: Iterable[str],
+        timeout: Optional[float],
+        callback: Optional[Callable[[Future], None]],
+    ) -> Future:
+        """Start waiting for a resource of a group to reach one of the states."""
+        deadline = None if timeout is None else self._clock() + timeout
+        target = _Target(group, resource_id, frozenset(states), deadline)
+        if callback is not None:
+            target.future.add_done_callback(callback)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(type(self).__name__ + ' is closed')
+            targets = self._targets.get(group)
+            if not targets:
+                targets = self._targets[group] = []
+                self._intervals[group] = self.initial_interval
+                self._next_polls[group] = self._clock()
+            targets.append(target)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='watsonxdata-status-poller', daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return target.future
+
+    def _run(self) -> None:
+        """The scheduler loop: poll the groups that are due, then sleep until the next one."""
+        while True:
+            with self._condition:
+                while True:
+                    pending = [group for group, targets in self._targets.items() if targets]
+                    if not pending:
+                        self._targets.clear()
+                        self._thread = None
+                        return
+                    now = self._clock()
+                    due = [group for group in pending if self._next_polls[group] <= now]
+                    wake = min(
+                        [self._next_polls[group] for group in pending]
+                        + [t.deadline for g in pending for t in self._targets[g] if t.deadline is not None]
+                    )
+                    if due or wake <= now:
+                        break
+                    self._condition.wait(wake - now)
+            for group in due:
+                self._poll(group)
+            self._expire()
+
+    def _poll(self, group: Hashable) -> None:
+        """Send the list request of a group and resolve the waits it answers."""
+        # Waits registered during the request may be for a status change the response predates.
+        with self._condition:
+            polled = list(self._targets.get(group, ()))
+        try:
+            resources = self._fetch(group)
+            error = False
+        except Exception:  # pylint: disable=broad-except
+            resources = {}
+            error = True
+
+        done = []
+        changed = False
+        with self._condition:
+            self.polls += 1
+            self.poll_errors += error
+            targets = self._targets.get(group, [])
+            waiting = {id(target) for target in targets}
+            for target in polled:
+                resource = resources.get(target.resource_id)
+                if resource is None or id(target) not in waiting:
+                    continue
+                status = result_field(resource, self.status_field)
+                changed = changed or status != target.status
+                target.status = status
+                if status in target.states or status in self.failure_states:
+                    done.append((target, resource))
+            finished = {id(target) for target, _ in done}
+            self._targets[group] = [target for target in targets if id(target) not in finished]
+            interval = self.initial_interval if changed else self._intervals[group] * self.backoff
+            interval = self._intervals[group] = min(interval, self.max_interval)
+            self._next_polls[group] = self._clock() + interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+        for target, resource in done:
+            if target.status in target.states:
+                target.future.set_result(resource)
+            else:
+                target.future.set_exception(RuntimeError('{0} is {1}'.format(self._describe(target), target.status)))
+
+    def _expire(self) -> None:
+        """Fail the waits whose timeout elapsed."""
+        expired = []
+        with self._condition:
+            now = self._clock()
+            for group, targets in self._targets.items():
+                expired += [target for target in targets if target.deadline is not None and target.deadline <= now]
+                self._targets[group] = [t for t in targets if t.deadline is None or t.deadline > now]
+        for target in expired:
+            target.future.set_exception(
+                TimeoutError(
+                    '{0} did not reach {1}; last status: {2}'.format(
+                        self._describe(target), ', '.join(sorted(target.states)), target.status
+                    )
+                )
+            )
@@ -0,0 +1,417 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Point-in-time rollback of many tables.
+
+`PointInTimeRollback` rolls tables back to the last snapshot they had at a
+given time, with `rollback_table`, at most `max_concurrency` tables at a
+time, and records the outcome of every table in a `RollbackJournal`:
+
+    rollback = PointInTimeRollback(service, 'presto01', '2024-06-01T12:00:00Z', journal='rollback-0601.sqlite')
+    for result in rollback.run(rollback.list_tables('iceberg_data', 'sales')):
+        if result.status == FAILED:
+            print(result.table, result.error)
+
+Running again with the same journal file skips the tables already rolled
+back, so that a partially failed rollback is continued where it stopped.
+
+The snapshots of every table are listed before its rollback. Tables without
+snapshot committed after the time are left alone, and tables without
+snapshot committed before it cannot be rolled back. A rollback is verified
+by listing the snapshots again: it succeeded once the target snapshot is the
+current one. Transient failures (HTTP 429 and 5xx, connection errors) are
+retried with exponential backoff.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+import os
+import random
+import sqlite3
+import threading
+import time
+
+from .crawler import MetadataCrawler
+from .snapshot_index import SnapshotIndex, TablePath, parse_committed_at
+from .watsonx_data_v2 import WatsonxDataV2, is_transient_error, result_field
+
+#: The statuses of the tables of a rollback.
+ROLLED_BACK = 'rolled_back'
+CURRENT = 'current'
+NO_SNAPSHOT = 'no_snapshot'
+FAILED = 'failed'
+
+#: The statuses of the tables a resumed rollback skips.
+FINISHED_STATUSES = frozenset([ROLLED_BACK, CURRENT, NO_SNAPSHOT])
+
+
+class RollbackResult:
+    """
+    The outcome of the rollback of one table.
+
+    :attr tuple table: The (catalog, schema, table) path.
+    :attr str status: `ROLLED_BACK`, `CURRENT` when no snapshot was committed
+          after the time, `NO_SNAPSHOT` when none was committed before it,
+          or `FAILED`.
+    :attr str snapshot_id: The snapshot the table was rolled back to, or
+          would have been.
+    :attr float committed_at: The commit time of that snapshot, in seconds
+          since the epoch.
+    :attr Exception error: The error of a failed rollback. Results read from
+          a journal have the message of the error.
+    :attr int attempts: Number of requests sent, retries included.
+    """
+
+    __slots__ = ('table', 'status', 'snapshot_id', 'committed_at', 'error', 'attempts')
+
+    def __init__(
+        self,
+        table: TablePath,
+        status: Optional[str] = None,
+        snapshot_id: Optional[str] = None,
+        committed_at: Optional[float] = None,
+        error: Union[Exception, str, None] = None,
+        attempts: int = 0,
+    ) -> None:
+        self.table = tuple(table)
+        self.status = status
+        self.snapshot_id = snapshot_id
+        self.committed_at = committed_at
+        self.error = error
+        self.attempts = attempts
+
+    def __repr__(self) -> str:
+        return 'RollbackResult({0}, {1}, {2!r})'.format('.'.join(self.table), self.status, self.snapshot_id)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this result."""
+        return {
+            'catalog': self.table[0],
+            'schema': self.table[1],
+            'table': self.table[2],
+            'status': self.status,
+            'snapshot_id': self.snapshot_id,
+            'committed_at': self.committed_at,
+            'error': None if self.error is None else str(self.error),
+            'attempts': self.attempts,
+        }
+
+
+class RollbackJournal:
+    """
+    SQLite record of the outcome of every table of a rollback.
+
+    A journal belongs to one rollback: an engine and a time.
+    """
+
+    def __init__(self, path: str = ':memory:') -> None:
+        """
+        Initialize a RollbackJournal object.
+
+        :param str path: (optional) The SQLite database file, created if
+               needed; by default, the journal only lives in memory.
+        """
+        if path != ':memory:':
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS rollback (engine_id TEXT, as_of REAL)')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS tables ('
+            'catalog TEXT, schema TEXT, tbl TEXT, status TEXT, snapshot_id TEXT, committed_at REAL, '
+            'error TEXT, attempts INTEGER, updated_at REAL, PRIMARY KEY (catalog, schema, tbl))'
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM tables').fetchone()[0]
+
+    def bind(self, engine_id: str, as_of: float) -> None:
+        """
+        Bind the journal to a rollback, on first use.
+
+        :param str engine_id: The engine of the rollback.
+        :param float as_of: The time of the rollback, in seconds since the
+               epoch.
+        :raises ValueError: if the journal records another rollback.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT engine_id, as_of FROM rollback').fetchone()
+            if row is None:
+                self._db.execute('INSERT INTO rollback VALUES (?, ?)', (engine_id, as_of))
+            elif row != (engine_id, as_of):
+                raise ValueError('the journal records the rollback of {0} to {1}'.format(*row))
+
+    def record(self, result: RollbackResult) -> None:
+        """
+        Record the outcome of a table, replacing the previous one.
+
+        :param RollbackResult result: The outcome.
+        """
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO tables VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                result.table
+                + (
+                    result.status,
+                    result.snapshot_id,
+                    result.committed_at,
+                    None if result.error is None else str(result.error),
+                    result.attempts,
+                    time.time(),
+                ),
+            )
+
+    def statuses(self) -> Dict[TablePath, str]:
+        """
+        Return the recorded status of every table.
+
+        :return: The statuses, by (catalog, schema, table).
+        :rtype: dict
+        """
+        with self._lock:
+            rows = self._db.execute('SELECT catalog, schema, tbl, status FROM tables').fetchall()
+        return {tuple(row[:3]): row[3] for row in rows}
+
+    def results(self, status: Optional[str] = None) -> List[RollbackResult]:
+        """
+        Return the recorded outcomes.
+
+        :param str status: (optional) Only return the outcomes with this
+               status.
+        :return: The outcomes, by table.
+        :rtype: List[RollbackResult]
+        """
+        query = 'SELECT catalog, schema, tbl, status, snapshot_id, committed_at, error, attempts FROM tables'
+        with self._lock:
+            if status is None:
+                rows = self._db.execute(query + ' ORDER BY catalog, schema, tbl').fetchall()
+            else:
+                rows = self._db.execute(query + ' WHERE status = ? ORDER BY catalog, schema, tbl', (status,)).fetchall()
+        return [RollbackResult(row[:3], *row[3:]) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Return the number of tables by status.
+
+        :return: The counts.
+        :rtype: dict
+        """
+        with self._lock:
+            return dict(self._db.execute('SELECT status, COUNT(*) FROM tables GROUP BY status').fetchall())
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+
+class PointInTimeRollback:
+    """
+    Rolls tables back to the snapshots they had at a time.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        engine_id: str,
+        as_of: Union[str, int, float, datetime],
+        *,
+        journal: Union[RollbackJournal, str, None] = None,
+        index: Optional[SnapshotIndex] = None,
+        auth_instance_id: Optional[str] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        retry_interval: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize a PointInTimeRollback object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str engine_id: The engine running the rollbacks.
+        :param as_of: The time to roll back to, see `parse_committed_at`.
+        :param journal: (optional) The journal, or the path of its SQLite
+               file; by default, a journal in memory.
+        :param SnapshotIndex index: (optional) The index the listed snapshots
+               are added to.
+        :param str auth_instance_id: (optional) CRN.
+        :param int max_concurrency: (optional) Maximum number of tables rolled
+               back at the same time.
+        :param int max_retries: (optional) Maximum number of retries of a
+               request after transient failures.
+        :param float retry_interval: (optional) Seconds before the first retry;
+               doubled at each retry.
+        :param sleep: (optional) Function sleeping between retries.
+        :raises ValueError: if the journal records another rollback.
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        if max_retries < 0:
+            raise ValueError('max_retries must not be negative')
+        self.client = client
+        self.engine_id = engine_id
+        self.as_of = parse_committed_at(as_of)
+        self.journal = journal if isinstance(journal, RollbackJournal) else RollbackJournal(journal or ':memory:')
+        self.journal.bind(engine_id, self.as_of)
+        self.index = index if index is not None else SnapshotIndex(client, engine_id, auth_instance_id=auth_instance_id)
+        self.auth_instance_id = auth_instance_id
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self._sleep = sleep
+        self.skipped = 0
+
+    def list_tables(self, catalog: str, schema: Optional[str] = None) -> List[TablePath]:
+        """
+        List the tables of a catalog, or of one of its schemas.
+
+        :param str catalog: The catalog.
+        :param str schema: (optional) The schema.
+        :return: The (catalog, schema, table) paths.
+        :rtype: List[tuple]
+        :raises ApiException: if a schema or table list cannot be listed.
+        """
+        if schema is not None:
+            response = self.client.list_tables(catalog, schema, self.engine_id, auth_instance_id=self.auth_instance_id)
+            return [(catalog, schema, table) for table in result_field(response.get_result(), 'tables') or []]
+        crawler = MetadataCrawler(
+            self.client,
+            engine_id=self.engine_id,
+            auth_instance_id=self.auth_instance_id,
+            catalog_names=[catalog],
+            descend=lambda event: event.kind != 'tables',
+        )
+        snapshot = crawler.snapshot()
+        if snapshot.errors:
+            # A partial list would silently leave tables out of the rollback.
+            raise snapshot.errors[0].error
+        return sorted(path + (table,) for path, tables in snapshot.tables.items() for table in tables)
+
+    def run(self, tables: Iterable[TablePath]) -> Iterator[RollbackResult]:
+        """
+        Roll tables back, yielding their results in completion order.
+
+        Tables the journal records as finished are skipped and counted in
+        `skipped`; failed tables are tried again. Every result is journaled
+        before it is yielded. Closing the generator stops starting
+        rollbacks, and waits for the rollbacks already started, which are
+        journaled without being yielded.
+
+        :param tables: The (catalog, schema, table) paths.
+        :return: A generator of `RollbackResult`s.
+        :rtype: Iterator[RollbackResult]
+        """
+        finished = {table for table, status in self.journal.statuses().items() if status in FINISHED_STATUSES}
+        self.skipped = 0
+        pending = iter(tables)
+        exhausted = False
+        in_flight = set()
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='watsonxdata-rollback')
+        try:
+            while True:
+                while not exhausted and len(in_flight) < self.max_concurrency:
+                    table = next(pending, None)
+                    if table is None:
+                        exhausted = True
+                    elif tuple(table) in finished:
+                        self.skipped += 1
+                    else:
+                        in_flight.add(executor.submit(self._rollback, RollbackResult(table)))
+                if not in_flight:
+                    return
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                results = [future.result() for future in done]
+                for result in results:
+                    self.journal.record(result)
+                yield from results
+        finally:
+            # The rollbacks already sent complete on the server: journal them, or a resumed run would redo them.
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=True)
+            for future in in_flight:
+                if not future.cancelled():
+                    self.journal.record(future.result())
+
+    def _rollback(self, result: RollbackResult) -> RollbackResult:
+        """Roll one table back; runs in a worker thread and never raises."""
+        table = result.table
+        try:
+            self._list_snapshots(result)
+            target = self.index.as_of(table, self.as_of)
+            if target is None:
+                result.status = NO_SNAPSHOT
+                return result
+            result.snapshot_id, result.committed_at = target.snapshot_id, target.committed_at
+            if self.index.latest(table).snapshot_id == target.snapshot_id:
+                result.status = CURRENT
+                return result
+            self._send(
+                result,
+                self.client.rollback_table,
+                self.engine_id,
+                *table,
+                snapshot_id=target.snapshot_id,
+                auth_instance_id=self.auth_instance_id,
+            )
+            # The response does not tell which snapshot is current: list the snapshots again.
+            self._list_snapshots(result)
+            current = self.index.latest(table)
+            if current is None or current.snapshot_id != target.snapshot_id:
+                raise RuntimeError(
+                    'the rollback of {0} left snapshot {1} current instead of {2}'.format(
+                        '.'.join(table), current and current.snapshot_id, target.snapshot_id
+                    )
+                )
+            result.status = ROLLED_BACK
+        except Exception as error:  # pylint: disable=broad-except
+            result.status, result.error = FAILED, error
+        return result
+
+    def _list_snapshots(self, result: RollbackResult) -> None:
+        """List the snapshots of a table into the index."""
+        response = self._send(
+            result,
+            self.client.list_table_snapshots,
+            self.engine_id,
+            *result.table,
+            auth_instance_id=self.auth_instance_id,
+            fresh=True,
+        )
+        self.index.update(result.table, result_field(response.get_result(), 'snapshots') or [])
+
+    def _send(self, result: RollbackResult, operation: Callable, *args, **kwargs) -> object:
+        """Send a request, retrying transient failures; counts the attempts in the result."""
+        attempts = 0
+        while True:
+            attempts += 1
+            result.attempts += 1
+            try:
+                return operation(*args, **kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                if attempts > self.max_retries or not is_transient_error(error):
+                    raise
+            delay = self.retry_interval * 2 ** (attempts - 1)
+            self._sleep(delay * random.uniform(0.5, 1.0))
@@ -0,0 +1,357 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Routing of statements to the Presto or Prestissimo engine likely to run them
+fastest.
+
+    advisor = RoutingAdvisor(service, node_weights={'cache_optimized': 2.0})
+    recommendation = advisor.recommend('select count(*) from iceberg_data.sales.orders')
+    if recommendation.engine is not None:
+        print(recommendation.engine.engine_type, recommendation.engine.engine_id)
+
+`RoutingAdvisor` lists the engines, explains the statement on every running
+engine at the same time, and ranks the engines by the estimated CPU cost of
+their plan divided by their capacity, the weighted number of their worker
+nodes. Engines that are not running, or that fail to explain the statement,
+are never recommended.
+
+The estimates are cached by statement fingerprint, the normalized statement
+of `normalize_statement`, and the engine list for `engine_ttl` seconds, so
+that routing a statement again sends no request. Only engines that appeared
+since are explained.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+import threading
+import time
+
+from ibm_cloud_sdk_core import ApiException
+
+from .explain_cache import normalize_statement
+from .explain_plan import parse_plan
+from .watsonx_data_v2 import WatsonxDataV2, result_field
+
+#: The list operation, the field of its result listing the engines and the
+#: explain operation, by engine type.
+ENGINE_TYPES = {
+    'presto': ('list_presto_engines', 'presto_engines', 'run_explain_statement'),
+    'prestissimo': ('list_prestissimo_engines', 'prestissimo_engines', 'run_prestissimo_explain_statement'),
+}
+
+# Failures that explaining the statement again would not fix, cached like estimates.
+_FINAL_STATUS_CODES = frozenset([400, 403, 404, 422])
+
+
+class EngineCandidate:
+    """
+    An engine considered for a statement.
+
+    :attr str engine_type: The engine type, 'presto' or 'prestissimo'.
+    :attr str engine_id: The engine id.
+    :attr str status: The status of the engine, such as 'running'.
+    :attr float capacity: The weighted number of worker nodes of the engine.
+    :attr float cost: The estimated CPU cost of the plan of the statement, or
+          None when the engine was not asked or the plan has no estimates.
+    :attr Exception error: The error of the explain request, if it failed.
+    """
+
+    __slots__ = ('engine_type', 'engine_id', 'status', 'capacity', 'cost', 'error')
+
+    def __init__(self, engine_type: str, engine_id: str, status: Optional[str], capacity: float) -> None:
+        self.engine_type = engine_type
+        self.engine_id = engine_id
+        self.status = status
+        self.capacity = capacity
+        self.cost = None
+        self.error = None
+
+    @property
+    def available(self) -> bool:
+        """Whether the engine is running and explained the statement."""
+        return self.status == 'running' and self.error is None
+
+    @property
+    def score(self) -> Optional[float]:
+        """The estimated cost per unit of capacity, lower is faster; None without estimates."""
+        if self.cost is None:
+            return None
+        return self.cost / self.capacity
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this candidate."""
+        return {
+            'engine_type': self.engine_type,
+            'engine_id': self.engine_id,
+            'status': self.status,
+            'capacity': self.capacity,
+            'cost': self.cost,
+            'score': self.score,
+            'error': None if self.error is None else str(self.error),
+        }
+
+    def _rank(self) -> Tuple:
+        # Available engines first, by score then by capacity; engines without estimates after those with.
+        score = self.score
+        return (not self.available, score is None, score or 0.0, -self.capacity, self.engine_type, self.engine_id)
+
+
+class Recommendation:
+    """
+    The engines considered for a statement, best first.
+
+    :attr str fingerprint: The normalized statement.
+    :attr List[EngineCandidate] candidates: The engines, best first.
+    :attr int explains: The number of explain requests sent for this
+          recommendation; 0 when it only used cached estimates.
+    """
+
+    __slots__ = ('fingerprint', 'candidates', 'explains')
+
+    def __init__(self, fingerprint: str, candidates: List[EngineCandidate], explains: int) -> None:
+        self.fingerprint = fingerprint
+        self.candidates = sorted(candidates, key=EngineCandidate._rank)
+        self.explains = explains
+
+    @property
+    def engine(self) -> Optional[EngineCandidate]:
+        """The recommended engine, or None when no engine is available."""
+        if self.candidates and self.candidates[0].available:
+            return self.candidates[0]
+        return None
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this recommendation."""
+        engine = self.engine
+        return {
+            'fingerprint': self.fingerprint,
+            'engine_type': engine and engine.engine_type,
+            'engine_id': engine and engine.engine_id,
+            'explains': self.explains,
+            'candidates': [candidate.to_dict() for candidate in self.candidates],
+        }
+
+
+class RoutingAdvisor:
+    """
+    Recommends the Presto or Prestissimo engine likely to run a statement
+    fastest, from the estimates of its plans.
+
+    The advisor is thread-safe.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        *,
+        engine_types: Iterable[str] = ('presto', 'prestissimo'),
+        node_weights: Optional[Mapping[str, float]] = None,
+        speedups: Optional[Mapping[str, float]] = None,
+        auth_instance_id: Optional[str] = None,
+        max_concurrency: int = 8,
+        ttl: float = 3600.0,
+        engine_ttl: float = 60.0,
+        max_entries: int = 1024,
+        parameterize_literals: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize a RoutingAdvisor object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param engine_types: (optional) The engine types of the pool, keys of
+               `ENGINE_TYPES`.
+        :param node_weights: (optional) The capacity of a worker node, by node
+               type; 1 for unlisted node types.
+        :param speedups: (optional) A factor applied to the capacity of the
+               engines, by engine type, such as {'prestissimo': 2.0}; 1 for
+               unlisted engine types.
+        :param str auth_instance_id: (optional) CRN.
+        :param int max_concurrency: (optional) Maximum number of concurrent
+               requests.
+        :param float ttl: (optional) Seconds the estimates of a statement stay
+               valid.
+        :param float engine_ttl: (optional) Seconds the engine list stays
+               valid.
+        :param int max_entries: (optional) Maximum number of statements whose
+               estimates are kept.
+        :param bool parameterize_literals: (optional) When true, statements
+               that only differ by their literals share their estimates.
+        :param clock: (optional) Function returning the current time in
+               seconds.
+        """
+        engine_types = tuple(engine_types)
+        for engine_type in engine_types:
+            if engine_type not in ENGINE_TYPES:
+                raise ValueError('unsupported engine type: ' + str(engine_type))
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        if ttl <= 0 or engine_ttl <= 0:
+            raise ValueError('ttl and engine_ttl must be positive')
+        if max_entries < 1:
+            raise ValueError('max_entries must be at least 1')
+        self.client = client
+        self.engine_types = engine_types
+        self.node_weights = dict(node_weights or {})
+        self.speedups = dict(speedups or {})
+        self.auth_instance_id = auth_instance_id
+        self.max_concurrency = max_concurrency
+        self.ttl = ttl
+        self.engine_ttl = engine_ttl
+        self.max_entries = max_entries
+        self.parameterize_literals = parameterize_literals
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._estimates = OrderedDict()
+        self._engines = None
+        self._engines_listed_at = None
+        self.hits = 0
+        self.misses = 0
+        self.explains = 0
+        self.list_requests = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the counters of the advisor.
+
+        :return: The hits (recommendations sending no explain request),
+                 misses, explains and list_requests counters, and the number
+                 of statements whose estimates are cached.
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'explains': self.explains,
+                'list_requests': self.list_requests,
+                'entries': len(self._estimates),
+            }
+
+    def recommend(self, statement: str) -> Recommendation:
+        """
+        Recommend an engine for a statement.
+
+        :param str statement: The statement.
+        :return: The recommendation; its `engine` is None when no engine is
+                 running or can explain the statement.
+        :rtype: Recommendation
+        :raises ApiException: if the engines cannot be listed.
+        """
+        fingerprint = normalize_statement(statement, self.parameterize_literals)
+        candidates = self._candidates()
+        now = self._clock()
+        with self._lock:
+            entry = self._estimates.get(fingerprint)
+            if entry is not None and entry[0] <= now - self.ttl:
+                del self._estimates[fingerprint]
+                entry = None
+            estimates = dict(entry[1]) if entry is not None else {}
+        missing = [
+            candidate
+            for candidate in candidates
+            if candidate.status == 'running' and (candidate.engine_type, candidate.engine_id) not in estimates
+        ]
+        if missing:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(missing)), thread_name_prefix='watsonxdata-route'
+            ) as executor:
+                for candidate, outcome in zip(missing, executor.map(lambda c: self._explain(c, statement), missing)):
+                    estimates[(candidate.engine_type, candidate.engine_id)] = outcome
+        for candidate in candidates:
+            candidate.cost, candidate.error = estimates.get((candidate.engine_type, candidate.engine_id), (None, None))
+        with self._lock:
+            if missing:
+                self.misses += 1
+                self.explains += len(missing)
+            else:
+                self.hits += 1
+            cached = {key: outcome for key, outcome in estimates.items() if _is_final(outcome[1])}
+            self._estimates[fingerprint] = (entry[0] if entry is not None else now, cached)
+            self._estimates.move_to_end(fingerprint)
+            while len(self._estimates) > self.max_entries:
+                self._estimates.popitem(last=False)
+        return Recommendation(fingerprint, candidates, len(missing))
+
+    def refresh_engines(self) -> None:
+        """Forget the engine list, so that the next recommendation lists the engines again."""
+        with self._lock:
+            self._engines_listed_at = None
+
+    def clear(self) -> None:
+        """Forget the engine list and all estimates."""
+        with self._lock:
+            self._estimates.clear()
+            self._engines = self._engines_listed_at = None
+
+    def _candidates(self) -> List[EngineCandidate]:
+        """Return new candidates for the engines of the pool, listing them when the list is stale."""
+        now = self._clock()
+        with self._lock:
+            engines = self._engines
+            if self._engines_listed_at is None or self._engines_listed_at <= now - self.engine_ttl:
+                engines = None
+        if engines is None:
+            with ThreadPoolExecutor(
+                max_workers=len(self.engine_types), thread_name_prefix='watsonxdata-route'
+            ) as executor:
+                engines = [engine for listed in executor.map(self._list, self.engine_types) for engine in listed]
+            with self._lock:
+                self.list_requests += len(self.engine_types)
+                self._engines, self._engines_listed_at = engines, now
+        return [EngineCandidate(*engine) for engine in engines]
+
+    def _list(self, engine_type: str) -> List[Tuple[str, str, Optional[str], float]]:
+        """Return the (engine type, engine id, status, capacity) of the engines of a type."""
+        operation_id, items_field, _ = ENGINE_TYPES[engine_type]
+        response = getattr(self.client, operation_id)(auth_instance_id=self.auth_instance_id, fresh=True)
+        speedup = self.speedups.get(engine_type, 1.0)
+        return [
+            (
+                engine_type,
+                result_field(engine, 'engine_id'),
+                result_field(engine, 'status'),
+                self._capacity(engine) * speedup,
+            )
+            for engine in result_field(response.get_result(), items_field) or []
+        ]
+
+    def _capacity(self, engine: object) -> float:
+        """Return the weighted number of worker nodes of an engine, or of its coordinator without workers."""
+        for role in ('worker', 'coordinator'):
+            nodes = result_field(engine, role)
+            quantity = result_field(nodes, 'quantity') if nodes is not None else None
+            if quantity:
+                return quantity * self.node_weights.get(result_field(nodes, 'node_type'), 1.0)
+        return 1.0
+
+    def _explain(self, candidate: EngineCandidate, statement: str) -> Tuple[Optional[float], Optional[Exception]]:
+        """Return the estimated cost of a statement on an engine; runs in a worker thread and never raises."""
+        operation = getattr(self.client, ENGINE_TYPES[candidate.engine_type][2])
+        try:
+            response = operation(candidate.engine_id, statement, auth_instance_id=self.auth_instance_id)
+            return parse_plan(response.get_result()).total('estimated_cpu'), None
+        except Exception as err:  # pylint: disable=broad-except
+            return None, err
+
+
+def _is_final(error: Optional[Exception]) -> bool:
+    """Return whether an explain outcome can be cached: an estimate, or an error that would happen again."""
+    if error is None or isinstance(error, ValueError):
+        return True
+    return isinstance(error, ApiException) and error.status_code in _FINAL_STATUS_CODES
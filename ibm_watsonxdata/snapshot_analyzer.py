@@ -0,0 +1,447 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Snapshot bloat analysis of Iceberg tables.
+
+`SnapshotAnalyzer` lists the snapshots of many tables concurrently and
+computes, per table, the snapshot count, the commit rate, the operation mix
+and the file statistics of the current snapshot, then ranks the tables that
+need their snapshots expired or their files compacted:
+
+    analyzer = SnapshotAnalyzer(service, 'presto01', max_concurrency=32, retention=5 * 86400)
+    report = analyzer.analyze(crawler.snapshot().table_details)
+    for stats in report.expiry_candidates(20):
+        print('.'.join(stats.table), stats.snapshots, stats.expirable)
+    report.to_csv('snapshot-bloat.csv')
+
+Snapshot lists already fetched, such as the `snapshots` of a
+`LakehouseSnapshot`, are analyzed with `analyze_lists()`.
+
+The commit times of a table are parsed in bulk into a sorted array, and the
+counts of expirable and recent snapshots are found by binary search, so a
+table costs a sort and a few lookups, not a pass per statistic.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+import csv
+import json
+import math
+import time
+
+from .snapshot_index import _MILLISECONDS_THRESHOLD, TablePath, parse_committed_at
+from .watsonx_data_v2 import WatsonxDataV2, result_field
+
+#: The columns of `SnapshotBloatReport.to_csv()`.
+CSV_FIELDS = (
+    'catalog',
+    'schema',
+    'table',
+    'snapshots',
+    'expirable',
+    'commits_per_day',
+    'first_commit',
+    'last_commit',
+    'data_files',
+    'delete_files',
+    'total_size',
+    'records',
+    'compactable_files',
+    'operations',
+    'error',
+)
+
+# The summary fields of the current snapshot read into TableSnapshotStats.
+_SUMMARY_FIELDS = {
+    'data_files': 'total-data-files',
+    'delete_files': 'total-delete-files',
+    'total_size': 'total-files-size',
+    'records': 'total-records',
+}
+
+
+class TableSnapshotStats:
+    """
+    The snapshot statistics of one table.
+
+    :attr tuple table: The (catalog, schema, table) path.
+    :attr int snapshots: The number of snapshots.
+    :attr int expirable: The number of snapshots older than the retention,
+          the newest `min_snapshots_to_keep` excepted.
+    :attr float commits_per_day: The commit rate over the analysis window.
+    :attr float first_commit: The time of the oldest snapshot, in seconds
+          since the epoch.
+    :attr float last_commit: The time of the newest snapshot.
+    :attr Counter operations: The number of snapshots by operation, such as
+          'append' or 'overwrite'.
+    :attr int data_files: The number of data files of the current snapshot,
+          from its summary.
+    :attr int delete_files: The number of delete files of the current
+          snapshot.
+    :attr int total_size: The size of the files of the current snapshot, in
+          bytes.
+    :attr int records: The number of records of the current snapshot.
+    :attr int compactable_files: The number of files a compaction to the
+          target file size would remove: the data files beyond the ones the
+          data needs, and the delete files.
+    :attr Exception error: The error of the snapshot list request.
+    """
+
+    __slots__ = (
+        'table',
+        'snapshots',
+        'expirable',
+        'commits_per_day',
+        'first_commit',
+        'last_commit',
+        'operations',
+        'data_files',
+        'delete_files',
+        'total_size',
+        'records',
+        'compactable_files',
+        'error',
+    )
+
+    def __init__(self, table: TablePath) -> None:
+        self.table = tuple(table)
+        self.snapshots = 0
+        self.expirable = 0
+        self.commits_per_day = 0.0
+        self.first_commit = None
+        self.last_commit = None
+        self.operations = Counter()
+        self.data_files = None
+        self.delete_files = None
+        self.total_size = None
+        self.records = None
+        self.compactable_files = None
+        self.error = None
+
+    def __repr__(self) -> str:
+        return 'TableSnapshotStats({0}, snapshots={1}, expirable={2})'.format(
+            '.'.join(self.table), self.snapshots, self.expirable
+        )
+
+    @property
+    def average_file_size(self) -> Optional[float]:
+        """The average size of the data files of the current snapshot, in bytes."""
+        if not self.data_files or self.total_size is None:
+            return None
+        return self.total_size / self.data_files
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing these statistics."""
+        _dict = {'catalog': self.table[0], 'schema': self.table[1], 'table': self.table[2]}
+        for name in CSV_FIELDS[3:]:
+            _dict[name] = getattr(self, name)
+        _dict['operations'] = dict(self.operations)
+        _dict['error'] = None if self.error is None else str(self.error)
+        return _dict
+
+
+class SnapshotBloatReport:
+    """
+    The snapshot statistics of many tables.
+
+    :attr float analyzed_at: The time the expirable snapshots and commit
+          rates are computed at, in seconds since the epoch.
+    :attr dict tables: The `TableSnapshotStats`, by (catalog, schema, table);
+          tables whose snapshots could not be listed have an error.
+    :attr int min_compaction_files: The `compactable_files` from which a
+          table is a compaction candidate.
+    """
+
+    def __init__(self, analyzed_at: float, min_compaction_files: int) -> None:
+        self.analyzed_at = analyzed_at
+        self.min_compaction_files = min_compaction_files
+        self.tables = {}
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    @property
+    def errors(self) -> List[TableSnapshotStats]:
+        """The tables whose snapshots could not be listed."""
+        return [stats for stats in self.tables.values() if stats.error is not None]
+
+    def expiry_candidates(self, n: Optional[int] = None) -> List[TableSnapshotStats]:
+        """
+        Return the tables with expirable snapshots, most expirable first.
+
+        :param int n: (optional) Only return the first n tables.
+        :return: The statistics of the tables.
+        :rtype: List[TableSnapshotStats]
+        """
+        candidates = [stats for stats in self.tables.values() if stats.expirable]
+        candidates.sort(key=lambda stats: (-stats.expirable, -stats.snapshots, stats.table))
+        return candidates[:n]
+
+    def compaction_candidates(self, n: Optional[int] = None) -> List[TableSnapshotStats]:
+        """
+        Return the tables with at least `min_compaction_files` compactable
+        files, most compactable first.
+
+        :param int n: (optional) Only return the first n tables.
+        :return: The statistics of the tables.
+        :rtype: List[TableSnapshotStats]
+        """
+        candidates = [
+            stats
+            for stats in self.tables.values()
+            if stats.compactable_files is not None and stats.compactable_files >= self.min_compaction_files
+        ]
+        candidates.sort(key=lambda stats: (-stats.compactable_files, -stats.commits_per_day, stats.table))
+        return candidates[:n]
+
+    def totals(self) -> Dict:
+        """
+        Return the statistics of all tables.
+
+        :return: The number of tables, failed tables, snapshots and expirable
+                 snapshots, the number of expiry and compaction candidates,
+                 and the operation mix.
+        :rtype: dict
+        """
+        operations = Counter()
+        for stats in self.tables.values():
+            operations.update(stats.operations)
+        return {
+            'tables': len(self.tables),
+            'errors': len(self.errors),
+            'snapshots': sum(stats.snapshots for stats in self.tables.values()),
+            'expirable': sum(stats.expirable for stats in self.tables.values()),
+            'expiry_candidates': len(self.expiry_candidates()),
+            'compaction_candidates': len(self.compaction_candidates()),
+            'operations': dict(operations),
+        }
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this report."""
+        return {
+            'analyzed_at': self.analyzed_at,
+            'totals': self.totals(),
+            'tables': [stats.to_dict() for stats in self.tables.values()],
+        }
+
+    def to_csv(self, path: str) -> None:
+        """
+        Save the statistics as CSV, one row per table; the operation mix is
+        a JSON object.
+
+        :param str path: The CSV file, replaced if it exists.
+        """
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(CSV_FIELDS)
+            for stats in self.tables.values():
+                row = stats.to_dict()
+                row['operations'] = json.dumps(row['operations'], sort_keys=True)
+                writer.writerow([row[name] for name in CSV_FIELDS])
+
+
+class SnapshotAnalyzer:
+    """
+    Computes the snapshot statistics of tables, and ranks the tables that
+    need maintenance.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        engine_id: str,
+        *,
+        auth_instance_id: Optional[str] = None,
+        max_concurrency: int = 8,
+        retention: float = 5 * 86400.0,
+        min_snapshots_to_keep: int = 1,
+        window: float = 7 * 86400.0,
+        target_file_size: int = 512 * 1024 * 1024,
+        min_compaction_files: int = 100,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Initialize a SnapshotAnalyzer object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str engine_id: The engine listing the snapshots.
+        :param str auth_instance_id: (optional) CRN.
+        :param int max_concurrency: (optional) Maximum number of concurrent
+               requests.
+        :param float retention: (optional) Seconds after which a snapshot is
+               expirable; 5 days by default, like Iceberg.
+        :param int min_snapshots_to_keep: (optional) The number of newest
+               snapshots never counted as expirable.
+        :param float window: (optional) Seconds over which the commit rate is
+               computed.
+        :param int target_file_size: (optional) The size of the files a
+               compaction writes, in bytes; 512 MiB by default, like Iceberg.
+        :param int min_compaction_files: (optional) The compactable files
+               from which a table is a compaction candidate.
+        :param clock: (optional) Function returning the current UNIX time.
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        if retention < 0 or window <= 0 or target_file_size <= 0:
+            raise ValueError('retention must not be negative, window and target_file_size must be positive')
+        self.client = client
+        self.engine_id = engine_id
+        self.auth_instance_id = auth_instance_id
+        self.max_concurrency = max_concurrency
+        self.retention = retention
+        self.min_snapshots_to_keep = min_snapshots_to_keep
+        self.window = window
+        self.target_file_size = target_file_size
+        self.min_compaction_files = min_compaction_files
+        self._clock = clock
+
+    def analyze(self, tables: Iterable[TablePath]) -> SnapshotBloatReport:
+        """
+        List the snapshots of tables concurrently and analyze them.
+
+        :param tables: The (catalog, schema, table) paths.
+        :return: The report; tables whose snapshots could not be listed have
+                 an error.
+        :rtype: SnapshotBloatReport
+        """
+        report = SnapshotBloatReport(self._clock(), self.min_compaction_files)
+        tables = [tuple(table) for table in tables]
+        if not tables:
+            return report
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(tables)), thread_name_prefix='watsonxdata-snapshots'
+        ) as executor:
+            futures = {executor.submit(self._list, table): table for table in tables}
+            for future in as_completed(futures):
+                table = futures.pop(future)
+                try:
+                    report.tables[table] = self.table_stats(table, future.result(), report.analyzed_at)
+                except Exception as error:  # pylint: disable=broad-except
+                    stats = report.tables[table] = TableSnapshotStats(table)
+                    stats.error = error
+        return report
+
+    def analyze_lists(self, snapshot_lists: Mapping[TablePath, Iterable[object]]) -> SnapshotBloatReport:
+        """
+        Analyze snapshot lists already fetched.
+
+        :param snapshot_lists: The snapshots, `dict`s or `TableSnapshot`
+               models, by (catalog, schema, table).
+        :return: The report.
+        :rtype: SnapshotBloatReport
+        :raises ValueError: if a `committed_at` is not a time.
+        """
+        report = SnapshotBloatReport(self._clock(), self.min_compaction_files)
+        for table, snapshots in snapshot_lists.items():
+            report.tables[tuple(table)] = self.table_stats(table, snapshots, report.analyzed_at)
+        return report
+
+    def table_stats(self, table: TablePath, snapshots: Iterable[object], now: float) -> TableSnapshotStats:
+        """
+        Compute the statistics of the snapshots of a table.
+
+        :param tuple table: The (catalog, schema, table) path.
+        :param snapshots: The snapshots, `dict`s or `TableSnapshot` models.
+        :param float now: The current time, in seconds since the epoch.
+        :return: The statistics.
+        :rtype: TableSnapshotStats
+        :raises ValueError: if a `committed_at` is not a time.
+        """
+        stats = TableSnapshotStats(table)
+        snapshots = list(snapshots)
+        if not snapshots:
+            return stats
+        committed = _column(snapshots, 'committed_at')
+        if None in committed:
+            dated = [snapshot for snapshot, value in zip(snapshots, committed) if value is not None]
+            committed = [value for value in committed if value is not None]
+        else:
+            dated = snapshots
+        parsed = _parse_times(committed)
+        times = sorted(parsed)
+        stats.snapshots = len(snapshots)
+        stats.operations = Counter(_column(snapshots, 'operation'))
+        current = snapshots[0]
+        if times:
+            stats.first_commit, stats.last_commit = times[0], times[-1]
+            kept = min(len(times), max(self.min_snapshots_to_keep, 0))
+            stats.expirable = min(bisect_left(times, now - self.retention), len(times) - kept)
+            stats.commits_per_day = (len(times) - bisect_left(times, now - self.window)) * 86400.0 / self.window
+            # The current snapshot is the newest one.
+            current = dated[parsed.index(times[-1])]
+        summary = _parse_summary(result_field(current, 'summary'))
+        for name, key in _SUMMARY_FIELDS.items():
+            value = summary.get(key)
+            if value is not None:
+                try:
+                    setattr(stats, name, int(value))
+                except ValueError:
+                    pass
+        if stats.data_files is not None and stats.total_size is not None:
+            needed = math.ceil(stats.total_size / self.target_file_size)
+            stats.compactable_files = max(stats.data_files - needed, 0) + (stats.delete_files or 0)
+        return stats
+
+    def _list(self, table: TablePath) -> List[object]:
+        """Return the snapshots of a table; runs in a worker thread."""
+        response = self.client.list_table_snapshots(
+            self.engine_id, *table, auth_instance_id=self.auth_instance_id, fresh=True
+        )
+        return result_field(response.get_result(), 'snapshots') or []
+
+
+def _column(snapshots: List[object], name: str) -> List[object]:
+    """Return a field of every snapshot; the snapshots are all `dict`s or all models."""
+    if not isinstance(snapshots[0], dict):
+        return list(map(attrgetter(name), snapshots))
+    try:
+        return list(map(itemgetter(name), snapshots))
+    except KeyError:
+        return [snapshot.get(name) for snapshot in snapshots]
+
+
+def _parse_times(values: List[object]) -> array:
+    """Parse commit times into an array of seconds since the epoch, in bulk when they are all numbers."""
+    try:
+        times = array('d', map(float, values))
+    except (TypeError, ValueError):
+        return array('d', map(parse_committed_at, values))
+    if times and max(times) > _MILLISECONDS_THRESHOLD:
+        times = array('d', (t / 1000 if t > _MILLISECONDS_THRESHOLD else t for t in times))
+    return times
+
+
+def _parse_summary(summary: object) -> Dict[str, str]:
+    """
+    Return a snapshot summary as a `dict`: summaries are objects, JSON
+    strings, or strings like '{added-data-files=1, total-records=10}'.
+    """
+    if isinstance(summary, dict):
+        return summary
+    if not isinstance(summary, str) or not summary.strip():
+        return {}
+    try:
+        parsed = json.loads(summary)
+        return parsed if isinstance(parsed, dict) else {}
+    except ValueError:
+        pass
+    pairs = (item.partition('=') for item in summary.strip().strip('{}').split(','))
+    return {key.strip(): value.strip() for key, sep, value in pairs if sep}
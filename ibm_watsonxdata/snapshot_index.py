@@ -0,0 +1,351 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Point-in-time lookup of the snapshots of many tables.
+
+`SnapshotIndex` lists the snapshots of tables concurrently, parses their
+`committed_at` once into a sorted array per table, and answers "which
+snapshot did each table have at time T" by binary search:
+
+    index = SnapshotIndex(service, 'presto01', max_concurrency=16)
+    index.refresh(crawler.snapshot().table_details)  # or any (catalog, schema, table) paths
+    before_incident = index.as_of_all('2024-06-01T12:00:00Z')
+
+`refresh()` lists the snapshots of every indexed table again. Tables whose
+snapshot list did not change cost no parsing, and tables whose list only
+grew only parse their new snapshots. Snapshot lists already fetched, such as
+the `snapshots` of a `LakehouseSnapshot`, are indexed with `update()`.
+"""
+
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import threading
+
+from .watsonx_data_v2 import WatsonxDataV2, result_field
+
+#: The results of `SnapshotIndex.update()`.
+ADDED = 'added'
+UNCHANGED = 'unchanged'
+GROWN = 'grown'
+REBUILT = 'rebuilt'
+
+# Numeric committed_at values above this are in milliseconds, not seconds (year 5138).
+_MILLISECONDS_THRESHOLD = 1e11
+
+TablePath = Tuple[str, str, str]
+
+
+def parse_committed_at(value: Union[str, int, float, datetime]) -> float:
+    """
+    Return a snapshot time as seconds since the epoch.
+
+    :param value: The time: seconds or milliseconds since the epoch, as a
+           number or a string, an ISO 8601 string, or a `datetime`. Times
+           without a time zone are UTC.
+    :return: The seconds since the epoch.
+    :rtype: float
+    :raises ValueError: if the value is not a time.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        seconds = float(value)
+    elif isinstance(value, str):
+        try:
+            seconds = float(value)
+        except ValueError:
+            return parse_committed_at(datetime.fromisoformat(value.strip().replace('Z', '+00:00')))
+    else:
+        raise ValueError('not a time: {0!r}'.format(value))
+    return seconds / 1000 if abs(seconds) > _MILLISECONDS_THRESHOLD else seconds
+
+
+class SnapshotRef:
+    """
+    The snapshot a table had at some time.
+
+    :attr tuple table: The (catalog, schema, table) path.
+    :attr str snapshot_id: The snapshot id.
+    :attr float committed_at: The commit time, in seconds since the epoch.
+    :attr str operation: The operation of the snapshot, such as 'append'.
+    """
+
+    __slots__ = ('table', 'snapshot_id', 'committed_at', 'operation')
+
+    def __init__(self, table: TablePath, snapshot_id: str, committed_at: float, operation: Optional[str]) -> None:
+        self.table = table
+        self.snapshot_id = snapshot_id
+        self.committed_at = committed_at
+        self.operation = operation
+
+    def __repr__(self) -> str:
+        return 'SnapshotRef({0}, {1!r}, {2})'.format('.'.join(self.table), self.snapshot_id, self.committed_at)
+
+    def to_dict(self) -> Dict:
+        """Return a json dictionary representing this snapshot."""
+        return {
+            'catalog': self.table[0],
+            'schema': self.table[1],
+            'table': self.table[2],
+            'snapshot_id': self.snapshot_id,
+            'committed_at': self.committed_at,
+            'operation': self.operation,
+        }
+
+
+class _Timeline:
+    """The snapshots of a table sorted by commit time; never modified once built, so readers need no lock."""
+
+    __slots__ = ('times', 'snapshot_ids', 'operations', 'signature')
+
+    def __init__(self, times: array, snapshot_ids: List[str], operations: List[Optional[str]], signature: Tuple):
+        self.times = times
+        self.snapshot_ids = snapshot_ids
+        self.operations = operations
+        # The length and the first and last snapshot ids of the list the timeline was built from.
+        self.signature = signature
+
+
+class SnapshotIndex:
+    """
+    Sorted snapshot timelines of tables, for as-of queries.
+
+    Queries may run while the index is refreshed.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        engine_id: str,
+        *,
+        auth_instance_id: Optional[str] = None,
+        max_concurrency: int = 8,
+    ) -> None:
+        """
+        Initialize a SnapshotIndex object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str engine_id: The engine listing the snapshots.
+        :param str auth_instance_id: (optional) CRN.
+        :param int max_concurrency: (optional) Maximum number of concurrent
+               requests.
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+        self.client = client
+        self.engine_id = engine_id
+        self.auth_instance_id = auth_instance_id
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._timelines = {}
+        self.errors = {}
+
+    def __len__(self) -> int:
+        return len(self._timelines)
+
+    def __contains__(self, table: TablePath) -> bool:
+        return tuple(table) in self._timelines
+
+    @property
+    def tables(self) -> List[TablePath]:
+        """The indexed tables."""
+        return list(self._timelines)
+
+    def update(self, table: TablePath, snapshots: Iterable[object]) -> str:
+        """
+        Index the snapshot list of a table.
+
+        Snapshots without `committed_at` are ignored.
+
+        :param tuple table: The (catalog, schema, table) path.
+        :param snapshots: The snapshots, as listed by `list_table_snapshots`:
+               `dict`s or `TableSnapshot` models.
+        :return: `ADDED` for a table not indexed yet, `UNCHANGED` when the
+                 list is the one already indexed, `GROWN` when it only adds
+                 snapshots, and `REBUILT` otherwise.
+        :rtype: str
+        :raises ValueError: if a `committed_at` is not a time.
+        """
+        table = tuple(table)
+        snapshots = list(snapshots)
+        signature = (
+            (len(snapshots), result_field(snapshots[0], 'snapshot_id'), result_field(snapshots[-1], 'snapshot_id'))
+            if snapshots
+            else (0, None, None)
+        )
+        timeline = self._timelines.get(table)
+        if timeline is not None and timeline.signature == signature:
+            return UNCHANGED
+        result = ADDED if timeline is None else REBUILT
+        if timeline is not None:
+            known = set(timeline.snapshot_ids)
+            added = [snapshot for snapshot in snapshots if result_field(snapshot, 'snapshot_id') not in known]
+            if len(snapshots) - len(added) >= len(known):
+                snapshots, result = added, GROWN
+            else:
+                timeline = None
+        entries = sorted(
+            (
+                (
+                    parse_committed_at(committed_at),
+                    result_field(snapshot, 'snapshot_id'),
+                    result_field(snapshot, 'operation'),
+                )
+                for snapshot in snapshots
+                if (committed_at := result_field(snapshot, 'committed_at')) is not None
+            ),
+            key=lambda entry: entry[0],
+        )
+        if timeline is not None and entries and timeline.times and entries[0][0] < timeline.times[-1]:
+            # Some new snapshots are older than indexed ones: merge them.
+            entries = sorted(
+                list(zip(timeline.times, timeline.snapshot_ids, timeline.operations)) + entries, key=lambda e: e[0]
+            )
+            timeline = None
+        times = array('d', (entry[0] for entry in entries))
+        snapshot_ids = [entry[1] for entry in entries]
+        operations = [entry[2] for entry in entries]
+        if timeline is not None:
+            times = timeline.times + times
+            snapshot_ids = timeline.snapshot_ids + snapshot_ids
+            operations = timeline.operations + operations
+        new = _Timeline(times, snapshot_ids, operations, signature)
+        with self._lock:
+            self._timelines[table] = new
+            self.errors.pop(table, None)
+        return result
+
+    def remove(self, table: TablePath) -> None:
+        """
+        Remove a table from the index.
+
+        :param tuple table: The (catalog, schema, table) path.
+        """
+        with self._lock:
+            self._timelines.pop(tuple(table), None)
+            self.errors.pop(tuple(table), None)
+
+    def refresh(self, tables: Optional[Iterable[TablePath]] = None) -> Dict[str, int]:
+        """
+        List the snapshots of tables concurrently and index them.
+
+        Failed requests are recorded in `errors`, by table; the tables keep
+        their previous timeline.
+
+        :param tables: (optional) The (catalog, schema, table) paths to list,
+               added to the index if needed; by default, the indexed tables.
+        :return: The number of tables `ADDED`, `UNCHANGED`, `GROWN` and
+                 `REBUILT`, and of 'failed' tables.
+        :rtype: dict
+        """
+        tables = [tuple(table) for table in tables] if tables is not None else self.tables
+        counts = {ADDED: 0, UNCHANGED: 0, GROWN: 0, REBUILT: 0, 'failed': 0}
+        if not tables:
+            return counts
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(tables)), thread_name_prefix='watsonxdata-snapshots'
+        ) as executor:
+            futures = {executor.submit(self._list, table): table for table in tables}
+            for future in as_completed(futures):
+                table = futures.pop(future)
+                try:
+                    counts[self.update(table, future.result())] += 1
+                except Exception as err:  # pylint: disable=broad-except
+                    with self._lock:
+                        self.errors[table] = err
+                    counts['failed'] += 1
+        return counts
+
+    def history(self, table: TablePath) -> List[SnapshotRef]:
+        """
+        Return the indexed snapshots of a table, oldest first.
+
+        :param tuple table: The (catalog, schema, table) path.
+        :return: The snapshots.
+        :rtype: List[SnapshotRef]
+        :raises KeyError: if the table is not indexed.
+        """
+        table = tuple(table)
+        timeline = self._timelines[table]
+        return [
+            SnapshotRef(table, snapshot_id, committed_at, operation)
+            for committed_at, snapshot_id, operation in zip(timeline.times, timeline.snapshot_ids, timeline.operations)
+        ]
+
+    def latest(self, table: TablePath) -> Optional[SnapshotRef]:
+        """
+        Return the last snapshot committed to a table.
+
+        :param tuple table: The (catalog, schema, table) path.
+        :return: The snapshot, or None if the table has none.
+        :rtype: SnapshotRef
+        :raises KeyError: if the table is not indexed.
+        """
+        table = tuple(table)
+        return self._as_of(table, self._timelines[table], float('inf'))
+
+    def as_of(self, table: TablePath, when: Union[str, int, float, datetime]) -> Optional[SnapshotRef]:
+        """
+        Return the snapshot a table had at some time: the last one committed
+        at or before it.
+
+        :param tuple table: The (catalog, schema, table) path.
+        :param when: The time, see `parse_committed_at`.
+        :return: The snapshot, or None if the table had none yet.
+        :rtype: SnapshotRef
+        :raises KeyError: if the table is not indexed.
+        """
+        table = tuple(table)
+        return self._as_of(table, self._timelines[table], parse_committed_at(when))
+
+    def as_of_all(
+        self, when: Union[str, int, float, datetime], tables: Optional[Iterable[TablePath]] = None
+    ) -> Dict[TablePath, Optional[SnapshotRef]]:
+        """
+        Return the snapshot each table had at some time.
+
+        :param when: The time, see `parse_committed_at`.
+        :param tables: (optional) The (catalog, schema, table) paths; by
+               default, the indexed tables.
+        :return: The snapshots, None for tables that had none yet, by table.
+        :rtype: dict
+        :raises KeyError: if a table is not indexed.
+        """
+        seconds = parse_committed_at(when)
+        timelines = self._timelines
+        tables = [tuple(table) for table in tables] if tables is not None else list(timelines)
+        return {table: self._as_of(table, timelines[table], seconds) for table in tables}
+
+    def _as_of(self, table: TablePath, timeline: _Timeline, seconds: float) -> Optional[SnapshotRef]:
+        position = bisect_right(timeline.times, seconds) - 1
+        if position < 0:
+            return None
+        return SnapshotRef(
+            table, timeline.snapshot_ids[position], timeline.times[position], timeline.operations[position]
+        )
+
+    def _list(self, table: TablePath) -> List[object]:
+        """Return the snapshots of a table; runs in a worker thread."""
+        response = self.client.list_table_snapshots(
+            self.engine_id, *table, auth_instance_id=self.auth_instance_id, fresh=True
+        )
+        return result_field(response.get_result(), 'snapshots') or []
@@ -0,0 +1,320 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bulk submission of Spark applications.
+
+`SparkSubmitter` submits many applications to a Spark engine with
+`create_spark_engine_application`, at most `max_concurrency` requests at a
+time, and yields a `SubmissionResult` per application as soon as its
+submission completes:
+
+    submitter = SparkSubmitter(service, 'spark01', max_concurrency=8, max_running=200)
+    for result in submitter.submit_all(applications):
+        if result.error is not None:
+            ...
+    print(submitter.stats.throughput)
+
+With `max_running`, submissions pause while the engine runs that many
+applications, as counted by `list_spark_engine_applications` filtered on the
+active states. Submissions are not idempotent: only the failures that show
+an application was not created (HTTP 429 and 503, failures to connect) are
+retried with exponential backoff. Other failures, such as gateway errors,
+read timeouts and connections dropped after the request was sent, are
+returned since the application may have been accepted.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional
+import random
+import time
+
+from .watsonx_data_v2 import WatsonxDataV2, is_transient_error, result_field
+
+if TYPE_CHECKING:
+    from .models.spark import SparkApplicationDetails
+
+#: The states of an application that occupies the engine.
+ACTIVE_STATES = frozenset(['accepted', 'waiting', 'running'])
+
+
+class SubmissionResult:
+    """
+    The outcome of the submission of one application.
+
+    :attr int index: The position of the application in the submitted iterable.
+    :attr SparkApplicationDetails application_details: The application.
+    :attr application: The `SparkEngineApplicationStatus` returned by the
+          service, or None if the submission failed.
+    :attr Exception error: The error of the last attempt, or None.
+    :attr int attempts: Number of requests sent.
+    :attr float seconds: Duration of the submission, retries included.
+    """
+
+    __slots__ = ('index', 'application_details', 'application', 'error', 'attempts', 'seconds')
+
+    def __init__(self, index: int, application_details: 'SparkApplicationDetails') -> None:
+        self.index = index
+        self.application_details = application_details
+        self.application = None
+        self.error = None
+        self.attempts = 0
+        self.seconds = 0.0
+
+    @property
+    def application_id(self) -> Optional[str]:
+        """The id of the submitted application, or None."""
+        if self.application is None:
+            return None
+        return result_field(self.application, 'id') or result_field(self.application, 'application_id')
+
+
+class SubmissionStats:
+    """
+    Counters of a bulk submission.
+
+    :attr int submitted: Applications submitted.
+    :attr int failed: Applications whose submission failed.
+    :attr int retries: Requests retried after a transient failure.
+    :attr int throttled: Number of times submissions paused for `max_running`.
+    :attr float throttled_seconds: Time spent paused for `max_running`.
+    :attr int count_errors: Counts of the active applications that failed,
+          retries included, and were replaced by the last known count.
+    """
+
+    def __init__(self) -> None:
+        self.submitted = 0
+        self.failed = 0
+        self.retries = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+        self.count_errors = 0
+        self._started = time.perf_counter()
+        self._finished = None
+
+    @property
+    def elapsed(self) -> float:
+        """Wall-clock seconds since the submission started, until it finished."""
+        return (self._finished or time.perf_counter()) - self._started
+
+    @property
+    def throughput(self) -> float:
+        """Applications submitted per second."""
+        elapsed = self.elapsed
+        return self.submitted / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        """Return the statistics as a dict."""
+        return {
+            'submitted': self.submitted,
+            'failed': self.failed,
+            'retries': self.retries,
+            'throttled': self.throttled,
+            'throttled_seconds': self.throttled_seconds,
+            'count_errors': self.count_errors,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+        }
+
+
+class SparkSubmitter:
+    """
+    Submits Spark applications in bulk, with a concurrency cap and
+    backpressure on the number of running applications.
+
+    :attr SubmissionStats stats: The statistics of the current or last
+          submission.
+    """
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        engine_id: str,
+        *,
+        auth_instance_id: Optional[str] = None,
+        max_concurrency: int = 8,
+        max_running: Optional[int] = None,
+        active_states: Iterable[str] = ACTIVE_STATES,
+        running_check_interval: float = 5.0,
+        max_retries: int = 3,
+        retry_interval: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Initialize a SparkSubmitter object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str engine_id: The id of the Spark engine.
+        :param str auth_instance_id: (optional) CRN.
+        :param int max_concurrency: (optional) Maximum number of concurrent
+               submission requests.
+        :param int max_running: (optional) Pause submissions while the engine
+               has this many active applications.
+        :param active_states: (optional) The states of the applications counted
+               against `max_running`.
+        :param float running_check_interval: (optional) Seconds between two
+               counts of the active applications.
+        :param int max_retries: (optional) Maximum number of retries of a
+               submission the service rejected or never received, and of a
+               count of the active applications after transient failures.
+        :param float retry_interval: (optional) Seconds before the first retry;
+               doubled at each retry.
+        :param sleep: (optional) Function sleeping between retries.
+        """
+        if max_concurrency < 1 or (max_running is not None and max_running < 1):
+            raise ValueError('max_concurrency and max_running must be at least 1')
+        if max_retries < 0:
+            raise ValueError('max_retries must not be negative')
+        self.client = client
+        self.engine_id = engine_id
+        self.auth_instance_id = auth_instance_id
+        self.max_concurrency = max_concurrency
+        self.max_running = max_running
+        self.active_states = frozenset(active_states)
+        self.running_check_interval = running_check_interval
+        self.max_retries = max_retries
+        self.retry_interval = retry_interval
+        self._sleep = sleep
+        self.stats = SubmissionStats()
+
+    def submit_all(self, applications: Iterable['SparkApplicationDetails'], **kwargs) -> Iterator[SubmissionResult]:
+        """
+        Submit applications, yielding their results in completion order.
+
+        The iterable is consumed lazily, as capacity allows. Closing the
+        generator stops submitting; requests already sent complete.
+
+        When the active applications cannot be counted, even after retries,
+        the last known count is used while submissions are in flight. The
+        generator raises the error once nothing else is in flight. Before it
+        raises any error, it yields the results of the submissions in flight.
+
+        :param applications: The `SparkApplicationDetails` to submit.
+        :param kwargs: (optional) Further arguments of
+               `create_spark_engine_application`, such as `volumes`.
+        :return: A generator of `SubmissionResult`s.
+        :rtype: Iterator[SubmissionResult]
+        """
+        stats = self.stats = SubmissionStats()
+        pending = enumerate(applications)
+        exhausted = False
+        in_flight = set()
+        running = None
+        running_checked = None
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='watsonxdata-spark-submit')
+
+        def finish(future) -> SubmissionResult:
+            result = future.result()
+            stats.retries += result.attempts - 1
+            if result.error is None:
+                stats.submitted += 1
+            else:
+                stats.failed += 1
+            return result
+
+        try:
+            while True:
+                throttled_until = None
+                while not exhausted and len(in_flight) < self.max_concurrency:
+                    if self.max_running is not None:
+                        now = time.monotonic()
+                        if running is None or (
+                            running >= self.max_running and now >= running_checked + self.running_check_interval
+                        ):
+                            try:
+                                # Requests in flight may not be counted yet: count them as running.
+                                running = self._count_running() + len(in_flight)
+                            except Exception:  # pylint: disable=broad-except
+                                if running is None or not in_flight:
+                                    raise
+                                stats.count_errors += 1
+                            running_checked = now
+                        if running >= self.max_running:
+                            throttled_until = running_checked + self.running_check_interval
+                            break
+                    item = next(pending, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    in_flight.add(executor.submit(self._submit, SubmissionResult(*item), kwargs))
+                    if running is not None:
+                        running += 1
+
+                if not in_flight:
+                    if exhausted:
+                        return
+                    # Throttled with nothing in flight: wait for the engine to drain.
+                    paused = max(0.0, throttled_until - time.monotonic())
+                    stats.throttled += 1
+                    stats.throttled_seconds += paused
+                    self._sleep(paused)
+                    continue
+
+                timeout = None if throttled_until is None else max(0.0, throttled_until - time.monotonic())
+                done, in_flight = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield finish(future)
+        except Exception:
+            # The submissions in flight were sent and may create applications: report them first.
+            done, in_flight = in_flight, set()
+            for future in as_completed(done):
+                yield finish(future)
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False)
+            stats._finished = time.perf_counter()  # pylint: disable=protected-access
+
+    def _count_running(self) -> int:
+        """Return the number of active applications of the engine, retrying transient failures."""
+        attempts = 0
+        while True:
+            attempts += 1
+            try:
+                response = self.client.list_spark_engine_applications(
+                    self.engine_id,
+                    auth_instance_id=self.auth_instance_id,
+                    state=sorted(self.active_states),
+                    fresh=True,
+                )
+                return len(result_field(response.get_result(), 'applications') or [])
+            except Exception as error:  # pylint: disable=broad-except
+                if attempts > self.max_retries or not is_transient_error(error):
+                    raise
+            delay = self.retry_interval * 2 ** (attempts - 1)
+            self._sleep(delay * random.uniform(0.5, 1.0))
+
+    def _submit(self, result: SubmissionResult, kwargs: dict) -> SubmissionResult:
+        """Submit one application, retrying rejected submissions; runs in a worker thread and never raises."""
+        started = time.perf_counter()
+        while True:
+            result.attempts += 1
+            try:
+                response = self.client.create_spark_engine_application(
+                    self.engine_id, result.application_details, auth_instance_id=self.auth_instance_id, **kwargs
+                )
+                result.application = response.get_result()
+                result.error = None
+                break
+            except Exception as error:  # pylint: disable=broad-except
+                result.error = error
+                if result.attempts > self.max_retries or not is_transient_error(error, idempotent=False):
+                    break
+            delay = self.retry_interval * 2 ** (result.attempts - 1)
+            self._sleep(delay * random.uniform(0.5, 1.0))
+        result.seconds = time.perf_counter() - started
+        return result
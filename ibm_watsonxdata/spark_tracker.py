@@ -0,0 +1,147 @@
+# coding: utf-8
+
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Batched tracking of Spark applications.
+
+`SparkApplicationTracker` follows any number of Spark applications until they
+end, with one `list_spark_engine_applications` request per Spark engine and
+poll, filtered on the final states, instead of one
+`get_spark_engine_application_status` request per application:
+
+    tracker = SparkApplicationTracker(service)
+    futures = [tracker.submit('spark01', details) for details in applications]
+    for future in futures:
+        application = future.result()  # its state is 'finished', 'failed' or 'stopped'
+
+The polls of each engine back off while none of its applications ends, see
+`StatusPoller`.
+"""
+
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Callable, Dict, Hashable, Iterable, Optional
+
+from .polling import StatusPoller, _Target
+from .watsonx_data_v2 import WatsonxDataV2, result_field
+
+if TYPE_CHECKING:
+    from .models.spark import SparkApplicationDetails
+
+#: The states of an application that has ended.
+FINAL_STATES = frozenset(['finished', 'failed', 'stopped'])
+
+
+class SparkApplicationTracker(StatusPoller):
+    """
+    Tracks Spark applications until they reach a final state.
+
+    The futures returned by `track()` and `submit()` are resolved with the
+    `SparkEngineApplicationStatus` of the application (a `dict`, or a model
+    with typed results), whichever final state it reached; they only fail
+    when their timeout elapses.
+    """
+
+    status_field = 'state'
+
+    def __init__(
+        self,
+        client: WatsonxDataV2,
+        *,
+        auth_instance_id: Optional[str] = None,
+        final_states: Iterable[str] = FINAL_STATES,
+        initial_interval: float = 5.0,
+        max_interval: float = 60.0,
+        **kwargs,
+    ) -> None:
+        """
+        Initialize a SparkApplicationTracker object.
+
+        :param WatsonxDataV2 client: The client used for the requests.
+        :param str auth_instance_id: (optional) CRN.
+        :param final_states: (optional) The states that end the tracking of an
+               application.
+        :param float initial_interval: (optional) Seconds between the first
+               polls of an engine, and after an application ended.
+        :param float max_interval: (optional) Maximum seconds between polls.
+        :param kwargs: (optional) The other polling options, see `StatusPoller`.
+        """
+        StatusPoller.__init__(self, initial_interval=initial_interval, max_interval=max_interval, **kwargs)
+        self.client = client
+        self.auth_instance_id = auth_instance_id
+        self.final_states = frozenset(final_states)
+
+    def track(
+        self,
+        engine_id: str,
+        application_id: str,
+        *,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[Future], None]] = None,
+    ) -> Future:
+        """
+        Start tracking an application.
+
+        :param str engine_id: The id of the Spark engine running the application.
+        :param str application_id: The application id.
+        :param float timeout: (optional) Seconds after which the future fails.
+        :param callback: (optional) Function called with the future once done.
+        :return: A future resolved with the status of the ended application.
+        :rtype: Future
+        """
+        return self._watch(engine_id, application_id, self.final_states, timeout, callback)
+
+    def submit(
+        self,
+        engine_id: str,
+        application_details: 'SparkApplicationDetails',
+        *,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[Future], None]] = None,
+        **kwargs,
+    ) -> Future:
+        """
+        Submit an application with `create_spark_engine_application`, and track it.
+
+        :param str engine_id: The id of the Spark engine.
+        :param SparkApplicationDetails application_details: The application.
+        :param float timeout: (optional) Seconds after which the future fails.
+        :param callback: (optional) Function called with the future once done.
+        :param kwargs: (optional) Further arguments of
+               `create_spark_engine_application`.
+        :return: A future resolved with the status of the ended application.
+        :rtype: Future
+        """
+        response = self.client.create_spark_engine_application(
+            engine_id, application_details, auth_instance_id=self.auth_instance_id, **kwargs
+        )
+        return self.track(engine_id, _application_id(response.get_result()), timeout=timeout, callback=callback)
+
+    def _fetch(self, group: Hashable) -> Dict[str, object]:
+        response = self.client.list_spark_engine_applications(
+            group,
+            auth_instance_id=self.auth_instance_id,
+            state=sorted(self.final_states),
+            fresh=True,
+        )
+        applications = result_field(response.get_result(), 'applications') or []
+        return {_application_id(application): application for application in applications}
+
+    def _describe(self, target: _Target) -> str:
+        return 'spark application {0} of engine {1}'.format(target.resource_id, target.group)
+
+
+def _application_id(application: object) -> Optional[str]:
+    return result_field(application, 'id') or result_field(application, 'application_id')
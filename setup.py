@@ -47,13 +47,14 @@ setup(
     description=PACKAGE_DESC,
     license='Apache 2.0',
     install_requires=install_requires,
+    extras_require={'async': ['aiohttp>=3.8.0,<4.0.0'], 'fast-json': ['orjson>=3.6.0']},
     tests_require=tests_require,
     author='IBM',
     author_email='fanfei@cn.ibm.com',
     long_description=readme,
     long_description_content_type='text/markdown',
     url='https://github.com/IBM/watsonxdata-python-sdk',
-    packages=[PACKAGE_NAME],
+    packages=[PACKAGE_NAME, PACKAGE_NAME + '.models'],
     include_package_data=True,
     keywords=PACKAGE_NAME,
     classifiers=[
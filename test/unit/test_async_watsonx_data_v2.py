@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for AsyncWatsonxDataV2
+"""
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.authenticator import Authenticator
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import asyncio
+import pytest
+import threading
+
+aiohttp = pytest.importorskip('aiohttp')
+from aiohttp import web
+from aiohttp import test_utils
+
+from ibm_watsonxdata.async_watsonx_data_v2 import AsyncWatsonxDataV2
+
+
+class BlockingTokenAuthenticator(Authenticator):
+    """
+    A token authenticator recording the threads it authenticates requests in.
+    """
+
+    def __init__(self):
+        self.threads = []
+
+    def authentication_type(self):
+        return Authenticator.AUTHTYPE_IAM
+
+    def validate(self):
+        pass
+
+    def authenticate(self, req):
+        self.threads.append(threading.current_thread())
+        req['headers']['Authorization'] = 'Bearer token'
+
+
+def run_with_server(routes, scenario):
+    """
+    Start a local stub server with the given routes, point a new
+    AsyncWatsonxDataV2 at it and run the scenario coroutine.
+    """
+
+    async def main():
+        app = web.Application()
+        app.add_routes(routes)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        try:
+            async with AsyncWatsonxDataV2(authenticator=NoAuthAuthenticator()) as service:
+                service.set_service_url(str(server.make_url('/lakehouse/api/v2')))
+                return await scenario(service)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncWatsonxDataV2:
+    """
+    Test Class for AsyncWatsonxDataV2
+    """
+
+    def test_get_operation(self):
+        """
+        get_presto_engine()
+        """
+        seen = {}
+
+        async def handler(request):
+            seen['path'] = request.path
+            seen['headers'] = request.headers
+            return web.json_response({'engine_id': request.match_info['engine_id'], 'status': 'running'})
+
+        async def scenario(service):
+            return await service.get_presto_engine('presto 01', auth_instance_id='testString')
+
+        response = run_with_server([web.get('/lakehouse/api/v2/presto_engines/{engine_id}', handler)], scenario)
+        assert isinstance(response, DetailedResponse)
+        assert response.get_status_code() == 200
+        assert response.get_result() == {'engine_id': 'presto 01', 'status': 'running'}
+        assert response.get_headers()['content-type'].startswith('application/json')
+        assert seen['path'] == '/lakehouse/api/v2/presto_engines/presto 01'
+        assert seen['headers']['AuthInstanceId'] == 'testString'
+        assert seen['headers']['Accept'] == 'application/json'
+        assert 'watsonxdata-python-sdk' in seen['headers']['User-Agent']
+
+    def test_post_operation_with_query_and_body(self):
+        """
+        create_spark_engine_application()
+        """
+        seen = {}
+
+        async def handler(request):
+            seen['query'] = dict(request.query)
+            seen['body'] = await request.json()
+            return web.json_response({'id': 'app-1', 'state': 'accepted'}, status=201)
+
+        async def scenario(service):
+            return await service.create_spark_engine_application(
+                'spark1',
+                {'application': '/opt/app.py'},
+                state=['accepted', 'running'],
+            )
+
+        response = run_with_server(
+            [web.post('/lakehouse/api/v2/spark_engines/{engine_id}/applications', handler)], scenario
+        )
+        assert response.get_status_code() == 201
+        assert response.get_result() == {'id': 'app-1', 'state': 'accepted'}
+        assert seen['query'] == {'state': 'accepted,running'}
+        assert seen['body'] == {'application_details': {'application': '/opt/app.py'}}
+
+    def test_no_content(self):
+        """
+        delete_presto_engine_catalogs()
+        """
+
+        async def handler(request):
+            return web.Response(status=204)
+
+        async def scenario(service):
+            return await service.delete_presto_engine_catalogs('presto1', 'hive_data')
+
+        response = run_with_server(
+            [web.delete('/lakehouse/api/v2/presto_engines/{engine_id}/catalogs', handler)], scenario
+        )
+        assert response.get_status_code() == 204
+        assert response.get_result() is None
+
+    def test_error_raises_api_exception(self):
+        """
+        get_catalog() with an error response
+        """
+
+        async def handler(request):
+            return web.json_response({'message': 'catalog not found'}, status=404)
+
+        async def scenario(service):
+            with pytest.raises(ApiException) as err:
+                await service.get_catalog('missing')
+            return err.value
+
+        error = run_with_server([web.get('/lakehouse/api/v2/catalogs/{catalog_id}', handler)], scenario)
+        assert error.status_code == 404
+        assert error.message == 'catalog not found'
+        assert error.http_response.json() == {'message': 'catalog not found'}
+
+    def test_concurrent_calls_share_session(self):
+        """
+        many list_catalogs() calls in flight at once
+        """
+        in_flight = {'now': 0, 'max': 0}
+
+        async def handler(request):
+            in_flight['now'] += 1
+            in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            await asyncio.sleep(0.05)
+            in_flight['now'] -= 1
+            return web.json_response({'catalogs': []})
+
+        async def scenario(service):
+            results = await asyncio.gather(*(service.list_catalogs() for _ in range(20)))
+            return results, service._get_session()
+
+        results, session = run_with_server([web.get('/lakehouse/api/v2/catalogs', handler)], scenario)
+        assert [r.get_result() for r in results] == [{'catalogs': []}] * 20
+        assert in_flight['max'] > 1
+        assert session.closed
+
+    def test_session_per_event_loop(self):
+        """
+        A client used from several event loops has one session per loop
+        """
+        service = AsyncWatsonxDataV2(authenticator=NoAuthAuthenticator())
+
+        async def handler(request):
+            return web.json_response({'catalogs': []})
+
+        async def main():
+            app = web.Application()
+            app.add_routes([web.get('/lakehouse/api/v2/catalogs', handler)])
+            server = test_utils.TestServer(app)
+            await server.start_server()
+            try:
+                service.set_service_url(str(server.make_url('/lakehouse/api/v2')))
+                await service.list_catalogs()
+                await service.list_catalogs()
+                session = service._get_session()
+                await service.close()
+                return session
+            finally:
+                await server.close()
+
+        sessions = [asyncio.run(main()), asyncio.run(main())]
+        assert sessions[0] is not sessions[1]
+        assert sessions[0].closed and sessions[1].closed
+
+    def test_retries(self):
+        """
+        enable_retries() retries the retryable status codes, as many times as configured
+        """
+        calls = []
+
+        async def handler(request):
+            calls.append(request.method)
+            if len(calls) % 3:
+                return web.json_response({'message': 'busy'}, status=503, headers={'Retry-After': '0'})
+            return web.json_response({'catalogs': []})
+
+        async def scenario(service):
+            service.enable_retries(max_retries=2, retry_interval=0)
+            response = await service.list_catalogs()
+            service.enable_retries(max_retries=1, retry_interval=0)
+            with pytest.raises(ApiException) as error:
+                await service.list_catalogs()
+            service.disable_retries()
+            await service.list_catalogs()
+            return response, error.value
+
+        response, error = run_with_server([web.get('/lakehouse/api/v2/catalogs', handler)], scenario)
+        assert response.get_result() == {'catalogs': []}
+        assert error.status_code == 503
+        assert len(calls) == 6
+
+    def test_connection_retries(self):
+        """
+        enable_retries() retries the requests that could not connect
+        """
+        attempts = []
+
+        async def scenario():
+            service = AsyncWatsonxDataV2(authenticator=NoAuthAuthenticator())
+            service.set_service_url('http://127.0.0.1:1/lakehouse/api/v2')
+            service.enable_retries(max_retries=2, retry_interval=0)
+            session = service._get_session()
+
+            class CountingSession:
+                """The session of the service, recording the method of each attempt."""
+
+                def request(self, method, url, **kwargs):
+                    attempts.append(method)
+                    return session.request(method, url, **kwargs)
+
+            service._get_session = CountingSession
+            try:
+                with pytest.raises(aiohttp.ClientConnectorError):
+                    await service.list_catalogs()
+            finally:
+                await session.close()
+
+        asyncio.run(scenario())
+        assert attempts == ['GET'] * 3
+
+    def test_gzip_compression(self):
+        """
+        set_enable_gzip_compression() compresses the request bodies
+        """
+        seen = {}
+
+        async def handler(request):
+            seen['encoding'] = request.headers.get('Content-Encoding')
+            seen['body'] = await request.json()
+            return web.json_response({'id': 'app-1', 'state': 'accepted'}, status=201)
+
+        async def scenario(service):
+            service.set_enable_gzip_compression(True)
+            return await service.create_spark_engine_application('spark1', {'application': '/opt/app.py'})
+
+        response = run_with_server(
+            [web.post('/lakehouse/api/v2/spark_engines/{engine_id}/applications', handler)], scenario
+        )
+        assert response.get_status_code() == 201
+        assert seen['encoding'] == 'gzip'
+        assert seen['body'] == {'application_details': {'application': '/opt/app.py'}}
+
+    def test_token_fetch_off_event_loop(self):
+        """
+        Token-based authenticators run in the executor, not on the event loop
+        """
+        authenticator = BlockingTokenAuthenticator()
+        seen = {}
+
+        async def handler(request):
+            seen['authorization'] = request.headers['Authorization']
+            return web.json_response({'catalogs': []})
+
+        async def scenario(service):
+            service.authenticator = authenticator
+            await service.list_catalogs()
+            return threading.current_thread()
+
+        loop_thread = run_with_server([web.get('/lakehouse/api/v2/catalogs', handler)], scenario)
+        assert len(authenticator.threads) == 1 and authenticator.threads[0] is not loop_thread
+        assert seen['authorization'] == 'Bearer token'
+
+    def test_value_error(self):
+        """
+        get_presto_engine() without engine_id
+        """
+        service = AsyncWatsonxDataV2(authenticator=NoAuthAuthenticator())
+        with pytest.raises(ValueError, match='engine_id must be provided'):
+            service.get_presto_engine(None)
+
+    def test_typed_results(self):
+        """
+        get_catalog() with typed_results
+        """
+
+        async def handler(request):
+            return web.json_response({'catalog_name': 'sampleCatalog', 'catalog_type': 'iceberg'})
+
+        async def scenario(service):
+            service.typed_results = True
+            return await service.get_catalog('sampleCatalog')
+
+        response = run_with_server([web.get('/lakehouse/api/v2/catalogs/{catalog_id}', handler)], scenario)
+        catalog = response.get_result()
+        assert type(catalog).__name__ == 'Catalog'
+        assert catalog.catalog_type == 'iceberg'
+
+    def test_iter_bucket_objects(self):
+        """
+        iter_bucket_objects()
+        """
+
+        async def handler(request):
+            response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+            await response.prepare(request)
+            await response.write(b'{"objects": ["a.csv", "b.')
+            await response.write(b'csv", "c.csv"]}')
+            return response
+
+        async def scenario(service):
+            return [key async for key in service.iter_bucket_objects('bucket1', chunk_size=8)]
+
+        keys = run_with_server(
+            [web.get('/lakehouse/api/v2/bucket_registrations/{bucket_id}/objects', handler)], scenario
+        )
+        assert keys == ['a.csv', 'b.csv', 'c.csv']
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for single-flight request coalescing
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.coalescing import RequestCoalescer
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll condition until it is true or the timeout elapses."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'condition not met'
+        time.sleep(0.001)
+
+
+class TestRequestCoalescer:
+    """
+    Test Class for RequestCoalescer
+    """
+
+    def test_concurrent_calls_share_one_request(self):
+        """
+        Calls with the same key made while a request is in flight share its response
+        """
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        sent = []
+
+        def send():
+            sent.append(1)
+            release.wait()
+            return DetailedResponse(response={'status': 'running'}, status_code=200)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(coalescer.call, 'key', send) for _ in range(8)]
+            wait_until(lambda: coalescer.coalesced == 7)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(sent) == 1
+        assert all(result is results[0] for result in results)
+        assert coalescer.stats() == {'requests': 1, 'coalesced': 7, 'in_flight': 0}
+
+        coalescer.call('key', lambda: DetailedResponse(response='again', status_code=200))
+        assert coalescer.requests == 2
+
+    def test_errors_are_shared(self):
+        """
+        The exception of the request in flight is raised to every waiter
+        """
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+
+        def send():
+            release.wait()
+            raise ApiException(503, message='unavailable')
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(coalescer.call, 'key', send) for _ in range(3)]
+            wait_until(lambda: coalescer.coalesced == 2)
+            release.set()
+            for future in futures:
+                with pytest.raises(ApiException, match='unavailable'):
+                    future.result()
+        assert coalescer.stats()['in_flight'] == 0
+
+
+class TestServiceCoalescing:
+    """
+    Test Class for WatsonxDataV2(coalesce_requests=True)
+    """
+
+    @responses.activate
+    def test_identical_gets_are_coalesced(self):
+        """
+        Identical concurrent get_presto_engine() calls send one request
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), coalesce_requests=True)
+        service.set_service_url(_base_url)
+        release = threading.Event()
+
+        def callback(request):
+            release.wait()
+            return (200, {}, json.dumps({'engine_id': request.url.rsplit('/', 1)[-1]}))
+
+        responses.add_callback(
+            responses.GET, _base_url + '/presto_engines/presto1', callback=callback, content_type='application/json'
+        )
+        responses.add_callback(
+            responses.GET, _base_url + '/presto_engines/presto2', callback=callback, content_type='application/json'
+        )
+
+        with ThreadPoolExecutor(max_workers=12) as executor:
+            futures = [executor.submit(service.get_presto_engine, 'presto1') for _ in range(8)]
+            futures += [executor.submit(service.get_presto_engine, 'presto2') for _ in range(2)]
+            futures += [executor.submit(service.get_presto_engine, 'presto1', auth_instance_id='crn') for _ in range(2)]
+            wait_until(lambda: service.request_coalescer.coalesced == 9)
+            release.set()
+            results = [future.result().get_result()['engine_id'] for future in futures]
+
+        assert results == ['presto1'] * 8 + ['presto2'] * 2 + ['presto1'] * 2
+        assert len(responses.calls) == 3
+        assert service.request_coalescer.requests == 3
+
+    @responses.activate
+    def test_only_plain_gets_are_coalesced(self):
+        """
+        Mutations, calls with custom headers and fresh calls are always sent
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), coalesce_requests=True)
+        service.set_service_url(_base_url)
+        responses.add(responses.DELETE, _base_url + '/presto_engines/presto1', status=204)
+        responses.add(responses.GET, _base_url + '/presto_engines/presto1', json={'engine_id': 'presto1'})
+
+        service.delete_engine('presto1')
+        service.get_presto_engine('presto1', headers={'X-Request-Id': '1'})
+        service.get_presto_engine('presto1', fresh=True)
+        assert service.request_coalescer.requests == 0
+        assert len(responses.calls) == 3
+
+        assert WatsonxDataV2(authenticator=NoAuthAuthenticator()).request_coalescer is None
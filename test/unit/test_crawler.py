@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for MetadataCrawler
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import re
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.crawler import LakehouseSnapshot, MetadataCrawler
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+def add_lakehouse(tree, failing=(), delay=0.0):
+    """
+    Serve a lakehouse of {catalog: {schema: {table: [column names]}}}; the paths in
+    failing answer with a 500 error. Return the maximum number of concurrent requests
+    seen per level.
+    """
+    lock = threading.Lock()
+    running = {}
+    peaks = {}
+
+    def callback(request):
+        path = request.path_url.split('?')[0][len('/lakehouse/api/v2/') :]
+        parts = path.split('/')
+        names = tuple(parts[1::2])
+        level = parts[-1]
+        with lock:
+            running[level] = running.get(level, 0) + 1
+            peaks[level] = max(peaks.get(level, 0), running[level])
+        try:
+            time.sleep(delay)
+            if path in failing:
+                return (500, {}, json.dumps({'message': 'failed'}))
+            if level == 'catalogs':
+                body = {'catalogs': [{'catalog_name': name, 'associated_engines': ['presto1']} for name in tree]}
+            elif level == 'schemas':
+                body = {'schemas': list(tree[names[0]])}
+            elif level == 'tables':
+                body = {'tables': list(tree[names[0]][names[1]])}
+            elif level == 'columns':
+                columns = tree[names[0]][names[1]][names[2]]
+                body = {'columns': [{'column_name': name, 'type': 'varchar'} for name in columns]}
+            else:
+                body = {'snapshots': [{'snapshot_id': names[2] + '-1', 'operation': 'append'}]}
+            return (200, {}, json.dumps(body))
+        finally:
+            with lock:
+                running[level] -= 1
+
+    responses.add_callback(
+        responses.GET, re.compile(_base_url + '/.*'), callback=callback, content_type='application/json'
+    )
+    return peaks
+
+
+def new_service(**kwargs):
+    """Return a service for the mocked lakehouse."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), **kwargs)
+    service.set_service_url(_base_url)
+    return service
+
+
+_TREE = {
+    'iceberg': {
+        'sales': {'orders': ['id', 'total'], 'customers': ['id']},
+        'hr': {'people': ['name']},
+    },
+    'hive': {'default': {}},
+}
+
+
+class TestMetadataCrawler:
+    """
+    Test Class for MetadataCrawler
+    """
+
+    @responses.activate
+    def test_snapshot(self):
+        """
+        snapshot() collects the whole tree as typed models
+        """
+        add_lakehouse(_TREE)
+        progress = []
+        crawler = MetadataCrawler(new_service(), include_snapshots=True, progress=progress.append)
+        snapshot = crawler.snapshot()
+
+        assert snapshot.complete
+        assert sorted(snapshot.catalogs) == ['hive', 'iceberg']
+        assert isinstance(snapshot.catalogs['iceberg'], Catalog)
+        assert snapshot.schemas == {'iceberg': ['sales', 'hr'], 'hive': ['default']}
+        assert snapshot.tables[('iceberg', 'sales')] == ['orders', 'customers']
+        assert snapshot.tables[('hive', 'default')] == []
+        orders = snapshot.table_details[('iceberg', 'sales', 'orders')]
+        assert isinstance(orders, Table)
+        assert orders.table_name == 'orders'
+        assert [column.column_name for column in orders.columns] == ['id', 'total']
+        assert all(isinstance(column, Column) for column in orders.columns)
+        assert len(snapshot.table_details) == 3
+        assert snapshot.snapshots[('iceberg', 'hr', 'people')][0].snapshot_id == 'people-1'
+
+        stats = snapshot.stats
+        assert stats.requests == {'catalogs': 1, 'schemas': 2, 'tables': 3, 'columns': 3, 'snapshots': 3}
+        assert sum(stats.errors.values()) == 0
+        assert stats.queued == stats.in_flight == 0
+        assert stats.elapsed >= sum(stats.max_request_seconds.values()) / len(stats.requests)
+        assert len(progress) == 12
+        assert stats.to_dict()['requests']['columns'] == 3
+
+    @responses.activate
+    def test_errors_and_filters(self):
+        """
+        Failed requests are reported and only skip their subtree
+        """
+        add_lakehouse(_TREE, failing=('catalogs/iceberg/schemas/sales/tables/orders/columns',))
+        events = list(MetadataCrawler(new_service(), engine_id='presto2', catalog_names=['iceberg']).crawl())
+
+        errors = [event for event in events if event.error is not None]
+        assert len(errors) == 1
+        assert errors[0].kind == 'table'
+        assert errors[0].path == ('iceberg', 'sales', 'orders')
+        assert isinstance(errors[0].error, ApiException)
+        assert 'error=' in repr(errors[0])
+
+        snapshot = LakehouseSnapshot()
+        for event in events:
+            snapshot.add(event)
+        assert not snapshot.complete
+        assert list(snapshot.catalogs) == ['iceberg']
+        assert sorted(snapshot.table_details) == [('iceberg', 'hr', 'people'), ('iceberg', 'sales', 'customers')]
+        assert all('engine_id=presto2' in call.request.url for call in responses.calls[1:])
+
+    @responses.activate
+    def test_catalog_without_engine(self):
+        """
+        A catalog without associated engine cannot be crawled without engine_id
+        """
+        responses.add(
+            responses.GET, _base_url + '/catalogs', json={'catalogs': [{'catalog_name': 'lonely'}]}, status=200
+        )
+        snapshot = MetadataCrawler(new_service()).snapshot()
+        assert list(snapshot.catalogs) == ['lonely']
+        assert [(event.kind, event.path) for event in snapshot.errors] == [('schemas', ('lonely',))]
+
+    @responses.activate
+    def test_concurrency_limits(self):
+        """
+        Requests respect the per-level limits and the number of workers
+        """
+        tree = {'c': {'s%d' % s: {'t%d' % t: ['x'] for t in range(6)} for s in range(6)}}
+        peaks = add_lakehouse(tree, delay=0.01)
+        crawler = MetadataCrawler(
+            new_service(), max_workers=5, level_limits={'tables': 2, 'columns': 3}, include_snapshots=True
+        )
+        snapshot = crawler.snapshot()
+
+        assert len(snapshot.table_details) == 36
+        assert peaks['tables'] <= 2
+        assert peaks['columns'] <= 3
+        assert peaks['columns'] + peaks['snapshots'] >= 4
+
+    @responses.activate
+    def test_streaming_and_close(self):
+        """
+        Results are yielded as they arrive, and closing the crawl stops it
+        """
+        add_lakehouse(_TREE)
+        crawler = MetadataCrawler(new_service())
+        events = crawler.crawl()
+        first = next(events)
+        assert first.kind == 'catalog'
+        assert crawler.stats.requests['catalogs'] == 1
+        events.close()
+        assert crawler.stats.in_flight <= 2
+        assert crawler.stats.requests['columns'] == 0
+
+    @responses.activate
+    def test_descend(self):
+        """
+        Subtrees are skipped when descend() returns False
+        """
+        add_lakehouse(_TREE)
+        seen = []
+
+        def descend(event):
+            seen.append((event.kind, event.path))
+            return event.path != ('iceberg', 'sales')
+
+        snapshot = MetadataCrawler(new_service(), descend=descend).snapshot()
+        assert list(snapshot.table_details) == [('iceberg', 'hr', 'people')]
+        assert ('tables', ('iceberg', 'sales')) in seen
+        assert ('catalog', ('hive',)) in seen
+
+    @responses.activate
+    def test_typed_results(self):
+        """
+        The crawler works with typed results
+        """
+        add_lakehouse(_TREE)
+        snapshot = MetadataCrawler(new_service(typed_results=True)).snapshot()
+        assert isinstance(snapshot.catalogs['hive'], Catalog)
+        assert snapshot.schemas['iceberg'] == ['sales', 'hr']
+        orders = snapshot.table_details[('iceberg', 'sales', 'orders')]
+        assert [column.type for column in orders.columns] == ['varchar', 'varchar']
+
+    def test_invalid_arguments(self):
+        """
+        MetadataCrawler() with invalid limits
+        """
+        with pytest.raises(ValueError, match='level_limits keys must be in'):
+            MetadataCrawler(new_service(), level_limits={'views': 2})
+        with pytest.raises(ValueError, match='must be at least 1'):
+            MetadataCrawler(new_service(), max_workers=0)
+        with pytest.raises(ValueError, match='must be at least 1'):
+            MetadataCrawler(new_service(), level_limits={'columns': 0})
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for EngineWaiter
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import responses
+
+from ibm_watsonxdata.engine_waiter import EngineWaiter, wait_for_engines
+from ibm_watsonxdata.metadata_store import MetadataStore
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+def add_engine_list(path, field, statuses, id_field='engine_id'):
+    """
+    Serve an engine list whose engines go through the given statuses, one per request:
+    statuses is {engine id: [status, ...]}, the last status is kept.
+    """
+    calls = []
+
+    def callback(request):
+        calls.append(request)
+        engines = [
+            {id_field: engine_id, 'status': sequence[min(len(calls), len(sequence)) - 1]}
+            for engine_id, sequence in statuses.items()
+        ]
+        return (200, {}, json.dumps({field: engines}))
+
+    responses.add_callback(responses.GET, _base_url + path, callback=callback, content_type='application/json')
+    return calls
+
+
+def new_service(**kwargs):
+    """Return a service for the mocked engines."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), **kwargs)
+    service.set_service_url(_base_url)
+    return service
+
+
+_FAST = {'initial_interval': 0.01, 'max_interval': 0.05}
+
+
+class TestEngineWaiter:
+    """
+    Test Class for EngineWaiter
+    """
+
+    @responses.activate
+    def test_mixed_engine_types(self):
+        """
+        Engines of several types are waited for with one list request per type and poll
+        """
+        presto_calls = add_engine_list(
+            '/presto_engines',
+            'presto_engines',
+            {
+                'presto1': ['resuming', 'resuming', 'running'],
+                'presto2': ['pausing', 'paused'],
+                'presto3': ['running'],
+            },
+        )
+        add_engine_list('/spark_engines', 'spark_engines', {'spark1': ['starting', 'running']})
+        add_engine_list('/milvus_services', 'milvus_services', {'milvus1': ['running']}, id_field='service_id')
+        done = []
+
+        futures = wait_for_engines(
+            new_service(metadata_cache=MetadataStore(':memory:'), coalesce_requests=True),
+            [
+                ('presto', 'presto1', 'running'),
+                ('presto', 'presto2', ['paused', 'stopped']),
+                ('spark', 'spark1', 'running'),
+                ('milvus', 'milvus1', 'running'),
+            ],
+            timeout=5,
+            **_FAST
+        )
+        futures[('presto', 'presto1')].add_done_callback(done.append)
+
+        assert futures[('presto', 'presto1')].result(timeout=5)['status'] == 'running'
+        assert futures[('presto', 'presto2')].result(timeout=5)['status'] == 'paused'
+        assert futures[('spark', 'spark1')].result(timeout=5)['engine_id'] == 'spark1'
+        assert futures[('milvus', 'milvus1')].result(timeout=5)['service_id'] == 'milvus1'
+        assert done == [futures[('presto', 'presto1')]]
+        assert len(presto_calls) == 3
+
+    @responses.activate
+    def test_failures_and_timeouts(self):
+        """
+        Waits fail on failure states and timeouts, and survive failed polls
+        """
+        add_engine_list('/presto_engines', 'presto_engines', {'presto1': ['starting', 'failed'], 'presto2': ['paused']})
+        responses.add(responses.GET, _base_url + '/spark_engines', status=503, json={'message': 'unavailable'})
+        waiter = EngineWaiter(new_service(typed_results=True), **_FAST)
+        callbacks = []
+
+        failed = waiter.wait('presto', 'presto1', 'running', timeout=5)
+        stuck = waiter.wait('presto', 'presto2', 'running', timeout=0.2, callback=callbacks.append)
+        missing = waiter.wait('spark', 'spark9', 'running', timeout=0.2)
+
+        with pytest.raises(RuntimeError, match='presto engine presto1 is failed'):
+            failed.result(timeout=5)
+        with pytest.raises(TimeoutError, match='presto2 did not reach running; last status: paused'):
+            stuck.result(timeout=5)
+        with pytest.raises(TimeoutError, match='last status: None'):
+            missing.result(timeout=5)
+        assert callbacks == [stuck]
+        assert waiter.poll_errors >= 1
+
+        engine = waiter.wait('presto', 'presto2', 'paused').result(timeout=5)
+        assert isinstance(engine, PrestoEngine)
+
+    @responses.activate
+    def test_close(self):
+        """
+        close() cancels the pending waits
+        """
+        add_engine_list('/db2_engines', 'db2_engines', {'db2': ['starting']})
+        waiter = EngineWaiter(new_service(), **_FAST)
+        future = waiter.wait('db2', 'db2', 'running')
+        waiter.close()
+        assert future.cancelled()
+        with pytest.raises(RuntimeError, match='closed'):
+            waiter.wait('db2', 'db2', 'running')
+
+    def test_invalid_arguments(self):
+        """
+        EngineWaiter with invalid arguments
+        """
+        with pytest.raises(ValueError, match='initial_interval must be positive'):
+            EngineWaiter(new_service(), initial_interval=10, max_interval=5)
+        with pytest.raises(ValueError, match='backoff must be at least 1'):
+            EngineWaiter(new_service(), jitter=1)
+        with pytest.raises(ValueError, match='engine_type must be one of'):
+            EngineWaiter(new_service()).wait('hive', 'e', 'running')
+        with pytest.raises(ValueError, match='timeout must be provided'):
+            wait_for_engines(new_service(), [('presto', 'presto1', 'running')], None)
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for ExplainCache
+"""
+
+from ibm_cloud_sdk_core import DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_watsonxdata.explain_cache import ExplainCache, normalize_statement
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1700000000.0
+
+    def __call__(self):
+        return self.now
+
+
+def new_service(cache, **kwargs):
+    """Return a service using cache."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), explain_cache=cache, **kwargs)
+    service.set_service_url(_base_url)
+    return service
+
+
+def add_explain(engine_type, engine_id):
+    """Mock the explain endpoint of an engine."""
+    responses.add(
+        responses.POST,
+        '{0}/{1}_engines/{2}/query_explain'.format(_base_url, engine_type, engine_id),
+        json={'result': 'plan of ' + engine_id},
+    )
+
+
+def response(result):
+    """Return a function that returns a new DetailedResponse with result."""
+    return lambda: DetailedResponse(response=result, status_code=200)
+
+
+class TestNormalizeStatement:
+    """
+    Test Class for normalize_statement
+    """
+
+    def test_layout_and_case(self):
+        """
+        Whitespace, comments and keyword case are normalized; quoted text is kept
+        """
+        statement = 'SELECT  a,\n\tB -- the columns\nFROM "T" /* quoted\n*/ WHERE c = \'X  y\';\n'
+        assert normalize_statement(statement) == 'select a, b from "T" where c = \'X  y\''
+        assert normalize_statement('select a.b>=1') == 'select a.b>=1'
+
+    def test_parameterize_literals(self):
+        """
+        Literals become parameters, column positions do not
+        """
+        statement = "select a, count(*) from t where b = 'x''s' and c > 1.5e3 and d in (1, 2) group by 1 order by 2, 1"
+        assert normalize_statement(statement, True) == (
+            'select a, count(*) from t where b = ? and c > ? and d in (?, ?) group by 1 order by 2, 1'
+        )
+        assert normalize_statement('select * from t2 order by substr(a, 1), 2 limit 10', True) == (
+            'select * from t2 order by substr(a, ?), 2 limit ?'
+        )
+
+
+class TestExplainCache:
+    """
+    Test Class for ExplainCache
+    """
+
+    @responses.activate
+    def test_cached_explains(self):
+        """
+        Explains of equivalent statements share a response, per engine, format and type
+        """
+        add_explain('presto', 'presto1')
+        add_explain('prestissimo', 'prestissimo1')
+        cache = ExplainCache(parameterize_literals=True)
+        service = new_service(cache)
+
+        first = service.run_explain_statement('presto1', 'SELECT * FROM t WHERE a = 1')
+        assert service.run_explain_statement('presto1', 'select *\nfrom t where a = 2;') is first
+        assert len(responses.calls) == 1
+        service.run_explain_statement('presto1', 'select * from t where a = 1', format='graphviz')
+        service.run_explain_statement('presto1', 'select * from t where a = 1', headers={'X-Trace': '1'})
+        result = service.run_prestissimo_explain_statement('prestissimo1', 'select * from t where a = 1').get_result()
+        assert result == {'result': 'plan of prestissimo1'}
+        assert len(responses.calls) == 4
+        assert cache.stats() == {
+            'hits': 1,
+            'disk_hits': 0,
+            'misses': 3,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'entries': 3,
+        }
+
+    @responses.activate
+    def test_engine_invalidation(self):
+        """
+        Engine changes drop the plans of that engine only
+        """
+        add_explain('presto', 'presto1')
+        add_explain('presto', 'presto2')
+        responses.add(responses.POST, _base_url + '/presto_engines/presto1/restart', json={})
+        responses.add(responses.POST, _base_url + '/presto_engines/presto1/catalogs', json={})
+        responses.add(responses.PATCH, _base_url + '/presto_engines/presto1', json={})
+        cache = ExplainCache()
+        service = new_service(cache)
+        service.run_explain_statement('presto1', 'select 1')
+        service.run_explain_statement('presto2', 'select 1')
+
+        service.restart_presto_engine('presto1')
+        assert len(cache) == 1
+        service.run_explain_statement('presto1', 'select 1')
+        service.run_explain_statement('presto2', 'select 1')
+        assert len(responses.calls) == 4
+
+        service.add_presto_engine_catalogs('presto1', catalog_names='iceberg')
+        service.run_explain_statement('presto1', 'select 1')
+        service.update_presto_engine('presto1', {'description': 'x'})
+        service.run_explain_statement('presto1', 'select 1')
+        assert len(responses.calls) == 8
+        assert cache.invalidations == 3
+
+    def test_ttl_and_lru(self):
+        """
+        Plans expire after the TTL, and the least recently used one is evicted
+        """
+        clock = FakeClock()
+        cache = ExplainCache(ttl=10, max_entries=2, clock=clock)
+        key = lambda statement: cache.key('run_explain_statement', None, 'presto1', statement, None, None)
+        cache.call(key('select 1'), response('1'))
+        cache.call(key('select 2'), response('2'))
+        cache.call(key('SELECT 1'), response('unused'))
+        cache.call(key('select 3'), response('3'))
+        assert cache.call(key('select 1'), response('unused')).get_result() == '1'
+        assert cache.call(key('select 2'), response('2 again')).get_result() == '2 again'
+        assert cache.evictions == 2
+
+        clock.now += 10
+        assert cache.call(key('select 2'), response('expired')).get_result() == 'expired'
+        assert cache.expirations == 1
+
+    @responses.activate
+    def test_disk_tier(self, tmp_path):
+        """
+        A new process answers from the plans stored by a previous one, until their TTL elapses
+        """
+        path = str(tmp_path / 'cache' / 'plans.sqlite')
+        clock = FakeClock()
+        add_explain('presto', 'presto1')
+        cache = ExplainCache(path=path, clock=clock)
+        new_service(cache).run_explain_statement('presto1', 'select 1')
+        cache.close()
+
+        cache = ExplainCache(path=path, clock=clock)
+        service = new_service(cache, typed_results=True)
+        plan = service.run_explain_statement('presto1', 'SELECT 1').get_result()
+        assert isinstance(plan, RunExplainStatementOKBody)
+        assert plan.result == 'plan of presto1'
+        assert service.run_explain_statement('presto1', 'select 1').get_result() is plan
+        assert len(responses.calls) == 1
+        assert cache.stats()['disk_hits'] == 1
+
+        cache.invalidate('presto2')
+        assert cache.stats()['disk_entries'] == 1
+        clock.now += 3600
+        assert cache.prune() == 1
+        cache.clear()
+        new_service(cache).run_explain_statement('presto1', 'select 1')
+        assert len(responses.calls) == 2
+        cache.close()
+
+    def test_invalid_arguments(self):
+        """
+        ExplainCache with invalid limits
+        """
+        with pytest.raises(ValueError, match='ttl must be positive'):
+            ExplainCache(ttl=0)
+        with pytest.raises(ValueError, match='max_entries must be at least 1'):
+            ExplainCache(max_entries=0)
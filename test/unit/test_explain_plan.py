@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the plan parser
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_watsonxdata.explain_plan import AGGREGATE, EXCHANGE, JOIN, SCAN, parse_plan
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+EXPLAIN = """\
+- Output[PlanNodeId 9][orderkey, revenue] => [orderkey:bigint, sum:double]
+        Estimates: {source: CostBasedSourceInfo, rows: 10 (180B), cpu: 94567.50, memory: 0.00, network: 0.00}
+        revenue := sum
+    - TopN[PlanNodeId 8][10 by (sum DESC_NULLS_LAST)] => [orderkey:bigint, sum:double]
+            Estimates: {source: CostBasedSourceInfo, rows: 10 (180B), cpu: 94567.50, memory: 180.00, network: 0.00}
+        - Aggregate(FINAL)[orderkey][PlanNodeId 5] => [orderkey:bigint, sum:double]
+                Estimates: {source: CostBasedSourceInfo, rows: ? (?), cpu: ?, memory: ?, network: ?}
+            - InnerJoin[PlanNodeId 4][("orderkey" = "orderkey_0")] => [orderkey:bigint, expr:double]
+                    Estimates: {source: CostBasedSourceInfo, rows: 60175 (1.03MB), cpu: 91234.00, memory: 5.0E4, network: 0.00}
+                    Distribution: PARTITIONED
+                - ScanFilterProject[PlanNodeId 0,1,2][table = hive:tpch:lineitem, filterPredicate = (shipdate) > (DATE 1995-03-15)] => [orderkey:bigint, expr:double]
+                        Estimates: {rows: 60175 (1.03MB), cpu: 1,500,000.00, memory: 0.00, network: 0.00}/{rows: 32000 (562kB), cpu: 2,000,000.00, memory: 0.00, network: 0.00}/{rows: 32000 (562kB), cpu: 2,100,000.00, memory: 0.00, network: 0.00}
+                - LocalExchange[PlanNodeId 3][HASH] (orderkey_0) => [orderkey_0:bigint]
+                    - TableScan[PlanNodeId 6][TableHandle {connectorId='hive', schemaTableName='tpch.orders'}] => [orderkey_0:bigint]
+                            Estimates: {rows: 15000 (131.84kB), cpu: 135000.00, memory: 0.00, network: 0.00}
+"""
+
+EXPLAIN_ANALYZE = """\
+Fragment 1 [SINGLE]
+    CPU: 9.64ms, Scheduled: 11.51ms, Input: 4 rows (148B); per task: avg.: 4.00 std.dev.: 0.00, Output: 2 rows (74B)
+    Output layout: [orderstatus, count]
+    Output partitioning: SINGLE []
+    - Aggregate(FINAL)[orderstatus][$hashvalue] => [orderstatus:varchar(1), $hashvalue:bigint, count:bigint]
+            CPU: 3.00ms (0.40%), Scheduled: 4.00ms (0.33%), Output: 2 rows (74B)
+            Input avg.: 0.25 rows, Input std.dev.: 264.58%
+            count := "count"("count_0")
+        - RemoteSource[2] => [orderstatus:varchar(1), $hashvalue:bigint, count_0:bigint]
+                CPU: 0.00ns (0.00%), Scheduled: 0.00ns (0.00%), Output: 4 rows (148B)
+
+Fragment 2 [SOURCE]
+    CPU: 746.31ms, Scheduled: 1.08s, Input: 15000 rows (0B); per task: avg.: 15000.00 std.dev.: 0.00, Output: 4 rows (148B)
+    Output layout: [orderstatus, $hashvalue, count_0]
+    - Aggregate(PARTIAL)[orderstatus][$hashvalue] => [orderstatus:varchar(1), $hashvalue:bigint, count_0:bigint]
+            CPU: 12.00ms (1.59%), Scheduled: 12.50ms (1.14%), Output: 4 rows (148B)
+        - TableScan[tpch:orders:sf0.01, grouped = false] => [orderstatus:varchar(1)]
+                Estimates: {rows: 15000 (73.24kB), cpu: 75000.00, memory: 0.00, network: 0.00}
+                CPU: 1.20s (95.50%), Scheduled: 1.50s (96.00%), Output: 1.5M rows (17.58MB)
+"""
+
+GRAPHVIZ = r"""digraph logical_plan {
+subgraph cluster_0 {
+label = "SINGLE"
+plannode_1[label="{Output[_col0]}", style="rounded, filled", shape=record, fillcolor=white];
+plannode_2[label="{Aggregate[FINAL]|count_0 := \"count\"(\"count_2\")}", style="rounded, filled", shape=record, fillcolor=yellow];
+plannode_3[label="{ExchangeNode[GATHER]|\"count_2\"}", style="rounded, filled", shape=record, fillcolor=gold];
+}
+subgraph cluster_1 {
+label = "SOURCE"
+plannode_4[label="{Aggregate[PARTIAL]|count_2 := \"count\"(*)}", style="rounded, filled", shape=record, fillcolor=yellow];
+plannode_5[label="{TableScan|[hive:tpch:orders]}", style="rounded, filled", shape=record, fillcolor=deepskyblue];
+}
+plannode_1 -> plannode_2;
+plannode_2 -> plannode_3;
+plannode_3 -> plannode_4;
+plannode_4 -> plannode_5;
+}
+"""
+
+
+class TestParsePlan:
+    """
+    Test Class for parse_plan
+    """
+
+    def test_explain_text(self):
+        """
+        A text plan becomes a tree with the estimates of each operator
+        """
+        plan = parse_plan(EXPLAIN)
+        assert [(node.id, node.operator, len(node.children)) for node in plan.walk()] == [
+            ('9', 'Output', 1),
+            ('8', 'TopN', 1),
+            ('5', 'Aggregate', 1),
+            ('4', 'InnerJoin', 2),
+            ('0,1,2', 'ScanFilterProject', 0),
+            ('3', 'LocalExchange', 1),
+            ('6', 'TableScan', 0),
+        ]
+        assert not plan.analyzed and plan.total_cpu_ms is None
+        aggregate = plan.find(kind=AGGREGATE)[0]
+        assert aggregate.qualifier == 'FINAL'
+        assert aggregate.estimated_rows is None and aggregate.estimated_cpu is None
+        join = plan.find(kind=JOIN)[0]
+        assert (join.estimated_rows, join.estimated_memory) == (60175, 50000)
+        scan = plan.find(operator='ScanFilterProject')[0]
+        assert scan.parent is join and scan.kind == SCAN
+        assert (scan.estimated_rows, scan.estimated_cpu) == (32000, 2100000)
+        assert [node.id for node in plan.flag(cpu=100000)] == ['0,1,2', '6']
+        assert [node.id for node in plan.flag(rows=20000)] == ['4', '0,1,2']
+        assert [node.id for node in plan.hotspots(2, metric='estimated_cpu')] == ['0,1,2', '6']
+
+    def test_explain_analyze_fragments(self):
+        """
+        The fragments of an analyzed plan are joined under their remote sources
+        """
+        plan = parse_plan({'result': EXPLAIN_ANALYZE, 'response': {}})
+        assert [(node.operator, node.fragment) for node in plan.walk()] == [
+            ('Aggregate', '1'),
+            ('RemoteSource', '1'),
+            ('Aggregate', '2'),
+            ('TableScan', '2'),
+        ]
+        assert plan.root.operator == 'Aggregate' and len(plan.roots) == 1
+        scan = plan.nodes[-1]
+        assert (scan.cpu_ms, scan.wall_ms, scan.output_rows) == (1200, 1500, 1500000)
+        assert scan.estimated_rows == 15000
+        assert plan.find(kind=EXCHANGE)[0].cpu_ms == 0
+        assert plan.analyzed and plan.total_cpu_ms == pytest.approx(1215)
+        assert plan.hotspots(1) == [scan]
+        assert plan.flag(rows=10**6) == [scan]
+        assert scan.to_dict()['output_rows'] == 1500000
+
+    def test_graphviz(self):
+        """
+        A graphviz plan becomes a tree of its record nodes
+        """
+        plan = parse_plan(GRAPHVIZ)
+        assert [(node.id, node.operator, node.fragment) for node in plan.walk()] == [
+            ('plannode_1', 'Output', '0'),
+            ('plannode_2', 'Aggregate', '0'),
+            ('plannode_3', 'ExchangeNode', '0'),
+            ('plannode_4', 'Aggregate', '1'),
+            ('plannode_5', 'TableScan', '1'),
+        ]
+        assert plan.nodes[1].label == 'Aggregate[FINAL] | count_0 := "count"("count_2")'
+        assert plan.find(kind=SCAN)[0].parent.operator == 'Aggregate'
+
+    def test_invalid_plans(self):
+        """
+        parse_plan with results that are not plans
+        """
+        with pytest.raises(ValueError, match='no plan operator found'):
+            parse_plan('Valid: true')
+        with pytest.raises(ValueError, match='plan must be a string'):
+            parse_plan({})
+        with pytest.raises(ValueError, match='format must be text or graphviz'):
+            parse_plan(EXPLAIN, format='json')
+
+    @responses.activate
+    def test_typed_result(self):
+        """
+        parse_plan accepts the model of an explain result
+        """
+        responses.add(
+            responses.POST,
+            _base_url + '/prestissimo_engines/prestissimo1/query_explain',
+            json={'result': GRAPHVIZ},
+        )
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), typed_results=True)
+        service.set_service_url(_base_url)
+        result = service.run_prestissimo_explain_statement('prestissimo1', 'select count(*) from orders').get_result()
+        assert isinstance(result, ResultPrestissimoExplainStatement)
+        assert len(parse_plan(result)) == 5
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for the pluggable JSON codecs
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import responses
+
+from ibm_watsonxdata.json_codec import CODEC_NAMES, JsonCodec, get_json_codec
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+available_codecs = []
+for _name in CODEC_NAMES:
+    try:
+        get_json_codec(_name)
+        available_codecs.append(_name)
+    except ImportError:
+        pass
+
+
+class TestJsonCodec:
+    """
+    Test Class for the JSON codecs
+    """
+
+    @pytest.mark.parametrize('name', available_codecs)
+    def test_round_trip(self, name):
+        """
+        dumps() and loads() round trip, with models encoded through to_dict()
+        """
+        codec = get_json_codec(name)
+        assert codec.name == name
+        value = {'columns': [Column(column_name='expenses', type='varchar')], 'name': 'café /data', 'n': 1.5}
+        document = codec.dumps(value)
+        assert json.loads(document) == {
+            'columns': [{'column_name': 'expenses', 'type': 'varchar'}],
+            'name': 'café /data',
+            'n': 1.5,
+        }
+        assert codec.loads(document) == json.loads(document)
+
+    @pytest.mark.parametrize('name', available_codecs)
+    def test_lenient_and_invalid_documents(self, name):
+        """
+        loads() accepts control characters in strings and raises ValueError for invalid JSON
+        """
+        codec = get_json_codec(name)
+        assert codec.loads(b'{"text": "a\tb"}') == {'text': 'a\tb'}
+        with pytest.raises(ValueError):
+            codec.loads(b'{"text": ')
+        with pytest.raises(TypeError):
+            codec.dumps({'value': object()})
+
+    def test_get_json_codec(self):
+        """
+        get_json_codec()
+        """
+        assert type(get_json_codec()) is JsonCodec
+        fastest = next((name for name in ('orjson', 'ujson') if name in available_codecs), 'json')
+        assert get_json_codec('auto').name == fastest
+        codec = JsonCodec()
+        assert get_json_codec(codec) is codec
+        with pytest.raises(ValueError, match='json_codec must be one of'):
+            get_json_codec('simplejson')
+
+
+@pytest.mark.parametrize('name', available_codecs)
+class TestServiceJsonCodec:
+    """
+    Test Class for WatsonxDataV2(json_codec=...)
+    """
+
+    @responses.activate
+    def test_request_body(self, name):
+        """
+        create_columns() encodes its body with the codec
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), json_codec=name)
+        service.set_service_url(_base_url)
+        url = _base_url + '/catalogs/c/schemas/s/tables/t/columns'
+        responses.add(responses.POST, url, body='{"columns": []}', content_type='application/json', status=201)
+
+        response = service.create_columns('presto1', 'c', 's', 't', columns=[Column(column_name='expenses')])
+        assert response.get_status_code() == 201
+        assert response.get_result() == {'columns': []}
+        assert json.loads(responses.calls[0].request.body) == {'columns': [{'column_name': 'expenses'}]}
+
+    @responses.activate
+    def test_response_body(self, name):
+        """
+        list_tables() decodes its result with the codec, and empty or non-JSON bodies as before
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), json_codec=name)
+        service.set_service_url(_base_url)
+        url = _base_url + '/catalogs/c/schemas/s/tables'
+        responses.add(responses.GET, url, body='{"tables": [{"table_name": "t1"}]}', content_type='application/json')
+        responses.add(responses.GET, url, body='', content_type='application/json')
+        responses.add(responses.GET, url, body='plain', content_type='text/plain')
+
+        assert service.list_tables('c', 's', 'presto1').get_result() == {'tables': [{'table_name': 't1'}]}
+        assert service.list_tables('c', 's', 'presto1').get_result() is None
+        assert service.list_tables('c', 's', 'presto1').get_result().text == 'plain'
+
+    @responses.activate
+    def test_errors(self, name):
+        """
+        Invalid JSON and error status codes raise ApiException
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), json_codec=name)
+        service.set_service_url(_base_url)
+        url = _base_url + '/catalogs/c/schemas/s/tables'
+        responses.add(responses.GET, url, body='{"tables": ', content_type='application/json')
+        responses.add(responses.GET, url, body='{"errors": [{"message": "missing"}]}', status=404)
+
+        with pytest.raises(ApiException, match='Error processing the HTTP response'):
+            service.list_tables('c', 's', 'presto1')
+        with pytest.raises(ApiException) as exc_info:
+            service.list_tables('c', 's', 'presto1')
+        assert exc_info.value.status_code == 404
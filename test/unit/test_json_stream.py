@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for incremental JSON parsing and iter_bucket_objects()
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import responses
+
+from ibm_watsonxdata.json_stream import JsonArrayParser
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+def parse(document, key='objects', chunk_size=1):
+    """Feed the encoded document to a JsonArrayParser in chunks of chunk_size bytes."""
+    data = document.encode('utf-8')
+    parser = JsonArrayParser(key)
+    items = []
+    for start in range(0, len(data), chunk_size):
+        items.extend(parser.feed(data[start : start + chunk_size]))
+    items.extend(parser.close())
+    return items
+
+
+class TestJsonArrayParser:
+    """
+    Test Class for JsonArrayParser
+    """
+
+    @pytest.mark.parametrize('separators', [(',', ':'), (', ', ': '), (' ,\n ', ' :\t')])
+    @pytest.mark.parametrize('chunk_size', [1, 2, 7, 4096])
+    def test_items(self, chunk_size, separators):
+        """
+        Items are returned whatever the chunk boundaries
+        """
+        document = json.dumps(
+            {
+                'first': {'nested': ['objects', 1, {'objects': []}]},
+                'objects': ['a.csv', 'dir/é "quoted" \\ b.parquet', 12, 1.5e3, None, True, {'k': [1]}, []],
+                'last': 'value',
+            },
+            ensure_ascii=False,
+            separators=separators,
+        )
+        assert parse(document, chunk_size=chunk_size) == json.loads(document)['objects']
+
+    def test_items_are_returned_as_they_complete(self):
+        """
+        feed() returns each item once the next chunk shows it is complete
+        """
+        parser = JsonArrayParser('objects')
+        assert parser.feed(b' {"objects" : [ "a", "b') == ['a']
+        assert parser.feed(b'", 1') == ['b']
+        assert parser.feed(b'0') == []
+        assert parser.feed(b' ]}') == [10]
+        assert parser.close() == []
+
+    def test_missing_and_empty_arrays(self):
+        """
+        Documents without items
+        """
+        assert parse('{"objects": []}') == []
+        assert parse('{"objects": null}') == []
+        assert parse('{"other": ["a"]}') == []
+        assert parse('{}') == []
+        assert parse('') == []
+
+    @pytest.mark.parametrize(
+        'document',
+        ['["a"]', '{"objects": ["a"', '{"objects": ["a" "b"]}', '{"objects": [tru]}', '{"objects": []} x', '{"a" 1}'],
+    )
+    def test_invalid_documents(self, document):
+        """
+        Invalid or truncated documents raise ValueError
+        """
+        with pytest.raises(ValueError):
+            parse(document)
+
+
+class TestIterBucketObjects:
+    """
+    Test Class for iter_bucket_objects
+    """
+
+    @responses.activate
+    def test_iter_bucket_objects(self):
+        """
+        iter_bucket_objects()
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), json_codec='json')
+        service.set_service_url(_base_url)
+        keys = ['data/part-{0:05d}.parquet'.format(i) for i in range(1000)]
+        responses.add(
+            responses.GET,
+            _base_url + '/bucket_registrations/bucket1/objects',
+            body=json.dumps({'objects': keys}),
+            content_type='application/json',
+            status=200,
+        )
+
+        objects = service.iter_bucket_objects('bucket1', auth_instance_id='testString', chunk_size=100)
+        assert next(objects) == keys[0]
+        assert list(objects) == keys[1:]
+        assert responses.calls[0].request.headers['AuthInstanceId'] == 'testString'
+
+    @responses.activate
+    def test_iter_bucket_objects_errors(self):
+        """
+        iter_bucket_objects() with a missing bucket_id or an error response
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        responses.add(responses.GET, _base_url + '/bucket_registrations/bucket1/objects', status=404)
+
+        with pytest.raises(ValueError, match='bucket_id must be provided'):
+            service.iter_bucket_objects(None)
+        with pytest.raises(ApiException):
+            service.iter_bucket_objects('bucket1')
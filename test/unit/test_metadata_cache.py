@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for MetadataCache
+"""
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_watsonxdata.metadata_cache import MetadataCache
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def key(operation_id, *path, engine_id='presto1'):
+    """Return the cache key of an operation on the given catalog, schema and table."""
+    names = ('catalog_id', 'schema_id', 'table_id')
+    return MetadataCache.key(operation_id, 'crn', engine_id, dict(zip(names, path)))
+
+
+def response(result):
+    """Return a function that returns a new DetailedResponse with result."""
+    return lambda: DetailedResponse(response=result, status_code=200)
+
+
+class TestMetadataCache:
+    """
+    Test Class for MetadataCache
+    """
+
+    def test_hits_and_ttl(self):
+        """
+        Responses are reused until their TTL elapses
+        """
+        clock = FakeClock()
+        cache = MetadataCache(ttl=10, clock=clock)
+        first = cache.call(key('list_catalogs'), response({'catalogs': []}))
+        assert cache.call(key('list_catalogs'), response('unused')) is first
+        clock.now = 10
+        assert cache.call(key('list_catalogs'), response('refreshed')).get_result() == 'refreshed'
+        assert cache.stats() == {
+            'hits': 1,
+            'misses': 2,
+            'evictions': 0,
+            'expirations': 1,
+            'invalidations': 0,
+            'entries': 1,
+        }
+
+    def test_lru_eviction(self):
+        """
+        The least recently used entry is evicted when the cache is full
+        """
+        cache = MetadataCache(max_entries=2)
+        cache.call(key('get_table', 'c', 's', 't1'), response(1))
+        cache.call(key('get_table', 'c', 's', 't2'), response(2))
+        cache.call(key('get_table', 'c', 's', 't1'), response('unused'))
+        cache.call(key('get_table', 'c', 's', 't3'), response(3))
+        assert len(cache) == 2
+        assert cache.evictions == 1
+        assert cache.call(key('get_table', 'c', 's', 't1'), response('unused')).get_result() == 1
+        assert cache.call(key('get_table', 'c', 's', 't2'), response('again')).get_result() == 'again'
+
+    def test_invalidate(self):
+        """
+        invalidate() drops the object, its contents and the listing of its parent, for every engine
+        """
+        cache = MetadataCache()
+        keys = {
+            'catalogs': key('list_catalogs', engine_id=None),
+            'schemas': key('list_schemas', 'c'),
+            'tables': key('list_tables', 'c', 's'),
+            'tables_other_engine': key('list_tables', 'c', 's', engine_id='spark1'),
+            'table': key('get_table', 'c', 's', 't'),
+            'columns': key('list_columns', 'c', 's', 't'),
+            'other_table': key('get_table', 'c', 's', 'u'),
+            'other_schema': key('list_tables', 'c', 's2'),
+        }
+        for name, cache_key in keys.items():
+            cache.call(cache_key, response(name))
+
+        cache.invalidate('c', 's', 't')
+        remaining = {name for name, cache_key in keys.items() if cache_key in cache._entries}
+        assert remaining == {'catalogs', 'schemas', 'other_table', 'other_schema'}
+        assert cache.invalidations == 4
+
+        cache.invalidate('c', 's')
+        remaining = {name for name, cache_key in keys.items() if cache_key in cache._entries}
+        assert remaining == {'catalogs', 'other_schema'}
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_invalidation_during_fetch(self):
+        """
+        A response fetched while an invalidation happens is not cached
+        """
+        cache = MetadataCache()
+
+        def send():
+            cache.invalidate('c')
+            return DetailedResponse(response='stale', status_code=200)
+
+        cache.call(key('list_schemas', 'c'), send)
+        assert len(cache) == 0
+
+    def test_invalid_arguments(self):
+        """
+        MetadataCache() with invalid limits
+        """
+        with pytest.raises(ValueError, match='ttl must be positive'):
+            MetadataCache(ttl=0)
+        with pytest.raises(ValueError, match='max_entries must be at least 1'):
+            MetadataCache(max_entries=0)
+
+
+class TestServiceMetadataCache:
+    """
+    Test Class for WatsonxDataV2(metadata_cache=...)
+    """
+
+    def new_service(self):
+        """Return a service with a metadata cache."""
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), metadata_cache=MetadataCache())
+        service.set_service_url(_base_url)
+        return service
+
+    @responses.activate
+    def test_cached_operations(self):
+        """
+        Metadata reads are answered from the cache, per engine and AuthInstanceId
+        """
+        service = self.new_service()
+        url = _base_url + '/catalogs/c/schemas/s/tables/t'
+        responses.add(responses.GET, url, json={'table_name': 't'}, status=200)
+
+        for _ in range(3):
+            assert service.get_table('c', 's', 't', 'presto1').get_result() == {'table_name': 't'}
+        service.get_table('c', 's', 't', 'spark1')
+        service.get_table('c', 's', 't', 'presto1', auth_instance_id='crn')
+        assert len(responses.calls) == 3
+        assert service.metadata_cache.hits == 2
+
+        service.get_table('c', 's', 't', 'presto1', headers={'X-Request-Id': '1'})
+        assert len(responses.calls) == 4
+        service.get_table('c', 's', 't', 'presto1', fresh=True)
+        assert len(responses.calls) == 5
+        assert 'fresh' not in responses.calls[4].request.url
+
+    @responses.activate
+    def test_mutations_invalidate(self):
+        """
+        Mutations invalidate the entries they may change, even when they fail
+        """
+        service = self.new_service()
+        responses.add(responses.GET, _base_url + '/catalogs/c/schemas/s/tables', json={'tables': []})
+        responses.add(responses.GET, _base_url + '/catalogs/c/schemas/s/tables/t/columns', json={'columns': []})
+        responses.add(responses.GET, _base_url + '/catalogs/c/schemas', json={'schemas': []})
+        responses.add(responses.DELETE, _base_url + '/catalogs/c/schemas/s/tables/t/columns/col', status=204)
+        responses.add(responses.POST, _base_url + '/catalogs/c/schemas', status=500)
+
+        def read_all():
+            service.list_tables('c', 's', 'presto1')
+            service.list_columns('presto1', 'c', 's', 't')
+            service.list_schemas('presto1', 'c')
+
+        read_all()
+        read_all()
+        assert len(responses.calls) == 3
+
+        service.delete_column('presto1', 'c', 's', 't', 'col')
+        read_all()
+        assert len(responses.calls) == 6
+
+        with pytest.raises(ApiException):
+            service.create_schema('presto1', 'c', 'path', 'new_schema')
+        read_all()
+        assert len(responses.calls) == 8
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for MetadataStore
+"""
+
+from ibm_cloud_sdk_core import ApiException, DetailedResponse
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import pytest
+import responses
+
+from ibm_watsonxdata.metadata_store import MetadataStore
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+class FakeClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1700000000.0
+
+    def __call__(self):
+        return self.now
+
+
+def new_service(store, **kwargs):
+    """Return a service using store."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), metadata_cache=store, **kwargs)
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestMetadataStore:
+    """
+    Test Class for MetadataStore
+    """
+
+    @responses.activate
+    def test_persistence(self, tmp_path):
+        """
+        A new process answers from the responses stored by a previous one
+        """
+        path = str(tmp_path / 'cache' / 'metadata.sqlite')
+        responses.add(responses.GET, _base_url + '/catalogs', json={'catalogs': [{'catalog_name': 'iceberg'}]})
+        responses.add(responses.GET, _base_url + '/presto_engines', json={'presto_engines': []})
+
+        store = MetadataStore(path)
+        service = new_service(store)
+        service.list_catalogs()
+        service.list_presto_engines()
+        store.close()
+
+        store = MetadataStore(path)
+        service = new_service(store, typed_results=True)
+        assert new_service(MetadataStore(path)).list_catalogs().get_result() == {
+            'catalogs': [{'catalog_name': 'iceberg'}]
+        }
+        response = service.list_presto_engines()
+        assert 'X-Stored-At' in response.get_headers()
+        assert len(responses.calls) == 2
+
+        catalogs = service.list_catalogs().get_result()
+        assert isinstance(catalogs, CatalogCollection)
+        assert catalogs.catalogs[0].catalog_name == 'iceberg'
+        assert len(responses.calls) == 2
+        store.close()
+        assert len(MetadataStore(path)) == 2
+
+    def test_freshness(self):
+        """
+        Aging entries are returned and refreshed in the background, expired ones are fetched
+        """
+        clock = FakeClock()
+        store = MetadataStore(':memory:', refresh_after=10, max_age=100, clock=clock)
+        key = MetadataStore.key('list_catalogs', None, None, {})
+        calls = []
+
+        def send():
+            calls.append(clock.now)
+            return DetailedResponse(response={'version': len(calls)}, status_code=200)
+
+        assert store.call(key, send).get_result() == {'version': 1}
+        clock.now += 5
+        assert store.call(key, send).get_result() == {'version': 1}
+        assert len(calls) == 1
+
+        clock.now += 10
+        assert store.call(key, send).get_result() == {'version': 1}
+        store._executor.shutdown(wait=True)
+        assert store.call(key, send).get_result() == {'version': 2}
+        assert store.refreshes == 1
+
+        clock.now += 100
+        assert store.call(key, send).get_result() == {'version': 3}
+        assert store.stats() == {
+            'hits': 3,
+            'misses': 2,
+            'refreshes': 1,
+            'refresh_errors': 0,
+            'invalidations': 0,
+            'entries': 1,
+        }
+        clock.now += 100
+        assert store.prune() == 1
+        assert len(store) == 0
+
+    def test_refresh_errors(self):
+        """
+        A failed background refresh keeps the stored entry
+        """
+        clock = FakeClock()
+        store = MetadataStore(':memory:', refresh_after=0, clock=clock)
+        key = MetadataStore.key('list_catalogs', None, None, {})
+        store.call(key, lambda: DetailedResponse(response={'catalogs': []}, status_code=200))
+
+        def fail():
+            raise ApiException(503, message='unavailable')
+
+        assert store.call(key, fail).get_result() == {'catalogs': []}
+        store.close()
+        assert store.refresh_errors == 1
+
+    @responses.activate
+    def test_mutations_invalidate(self):
+        """
+        Table mutations drop the table, its columns and the table list of its schema
+        """
+        store = MetadataStore(':memory:')
+        service = new_service(store)
+        responses.add(responses.GET, _base_url + '/catalogs/c/schemas/s/tables', json={'tables': ['t']})
+        responses.add(responses.GET, _base_url + '/catalogs/c/schemas/s/tables/t/columns', json={'columns': []})
+        responses.add(responses.GET, _base_url + '/catalogs/c/schemas/s2/tables', json={'tables': []})
+        responses.add(responses.GET, _base_url + '/spark_engines', json={'spark_engines': []})
+        responses.add(responses.DELETE, _base_url + '/catalogs/c/schemas/s/tables/t', status=204)
+
+        def read_all():
+            service.list_tables('c', 's', 'presto1')
+            service.list_columns('presto1', 'c', 's', 't')
+            service.list_tables('c', 's2', 'presto1')
+            service.list_spark_engines()
+
+        read_all()
+        service.delete_table('c', 's', 't', 'presto1')
+        read_all()
+        assert len(responses.calls) == 7
+        assert store.invalidations == 2
+
+        store.clear()
+        assert len(store) == 0
+
+    @responses.activate
+    def test_engine_mutations_invalidate(self):
+        """
+        Engine mutations drop the list of the engines of their type
+        """
+        store = MetadataStore(':memory:')
+        service = new_service(store)
+        responses.add(responses.GET, _base_url + '/presto_engines', json={'presto_engines': [{'status': 'running'}]})
+        responses.add(responses.GET, _base_url + '/presto_engines', json={'presto_engines': [{'status': 'pausing'}]})
+        responses.add(responses.GET, _base_url + '/spark_engines', json={'spark_engines': []})
+        responses.add(responses.GET, _base_url + '/catalogs', json={'catalogs': []})
+        responses.add(responses.POST, _base_url + '/presto_engines/presto1/pause', json={}, status=201)
+
+        assert service.list_presto_engines().get_result()['presto_engines'][0]['status'] == 'running'
+        service.list_spark_engines()
+        service.list_catalogs()
+        service.pause_presto_engine('presto1')
+        assert service.list_presto_engines().get_result()['presto_engines'][0]['status'] == 'pausing'
+        service.list_spark_engines()
+        service.list_catalogs()
+        assert len(responses.calls) == 5
+        assert store.invalidations == 1
+
+    def test_operations_exist(self):
+        """
+        The cached and invalidating operations are operations of the service
+        """
+        from ibm_watsonxdata.watsonx_data_v2 import _OPERATIONS
+
+        assert MetadataStore.CACHED_OPERATIONS <= set(_OPERATIONS)
+        assert MetadataStore.INVALIDATING_OPERATIONS <= set(_OPERATIONS)
+        assert set(MetadataStore.ENGINE_MUTATIONS) <= set(_OPERATIONS)
+        assert set(MetadataStore.ENGINE_MUTATIONS.values()) <= MetadataStore.CACHED_OPERATIONS
+
+    def test_invalid_arguments(self):
+        """
+        MetadataStore() with invalid ages
+        """
+        with pytest.raises(ValueError, match='refresh_after must be between 0 and max_age'):
+            MetadataStore(':memory:', refresh_after=10, max_age=5)
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for MetadataSync
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import re
+import responses
+
+from ibm_watsonxdata.metadata_sync import MetadataSync, SyncState
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+def add_lakehouse(tree, failing):
+    """
+    Serve the lakehouse of {catalog: {schema: {table: {column: type}}}}, read at
+    request time; the paths in the failing set answer with a 500 error.
+    """
+
+    def callback(request):
+        path = request.path_url.split('?')[0][len('/lakehouse/api/v2/') :]
+        parts = path.split('/')
+        names = tuple(parts[1::2])
+        if path in failing:
+            return (500, {}, json.dumps({'message': 'failed'}))
+        if parts[-1] == 'catalogs':
+            body = {'catalogs': [{'catalog_name': name, 'associated_engines': ['presto1']} for name in tree]}
+        elif parts[-1] == 'schemas':
+            body = {'schemas': list(tree[names[0]])}
+        elif parts[-1] == 'tables':
+            body = {'tables': list(tree[names[0]][names[1]])}
+        else:
+            columns = tree[names[0]][names[1]][names[2]]
+            body = {'columns': [{'column_name': name, 'type': kind} for name, kind in columns.items()]}
+        return (200, {}, json.dumps(body))
+
+    responses.add_callback(
+        responses.GET, re.compile(_base_url + '/.*'), callback=callback, content_type='application/json'
+    )
+
+
+def new_tree():
+    """Return a small lakehouse."""
+    return {
+        'iceberg': {
+            'sales': {'orders': {'id': 'bigint', 'total': 'double'}, 'customers': {'id': 'bigint'}},
+            'hr': {'people': {'name': 'varchar'}},
+        },
+        'hive': {'default': {'logs': {'line': 'varchar'}}},
+    }
+
+
+def new_sync(**kwargs):
+    """Return a MetadataSync for the mocked lakehouse."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return MetadataSync(service, **kwargs)
+
+
+class TestMetadataSync:
+    """
+    Test Class for MetadataSync
+    """
+
+    @responses.activate
+    def test_first_sync_and_no_changes(self):
+        """
+        The first sync adds every table; the next one does not list any column
+        """
+        add_lakehouse(new_tree(), set())
+        sync = new_sync()
+        changes = sync.sync()
+        assert sorted(changes.added_tables) == [
+            ('hive', 'default', 'logs'),
+            ('iceberg', 'hr', 'people'),
+            ('iceberg', 'sales', 'customers'),
+            ('iceberg', 'sales', 'orders'),
+        ]
+        assert isinstance(changes.added_tables[('iceberg', 'sales', 'orders')], Table)
+        assert changes.stats.requests['columns'] == 4
+
+        changes = sync.sync()
+        assert not changes
+        assert not changes.errors
+        assert changes.stats.requests['columns'] == 0
+        assert changes.stats.requests['tables'] == 3
+
+    @responses.activate
+    def test_table_and_column_changes(self):
+        """
+        Only the schemas whose table list changed are descended into
+        """
+        tree = new_tree()
+        add_lakehouse(tree, set())
+        sync = new_sync()
+        sync.sync()
+
+        sales = tree['iceberg']['sales']
+        sales['orders'] = {'id': 'varchar', 'amount': 'double'}
+        del sales['customers']
+        sales['returns'] = {'id': 'bigint'}
+        tree['iceberg']['hr']['people']['age'] = 'integer'
+        changes = sync.sync()
+
+        assert list(changes.added_tables) == [('iceberg', 'sales', 'returns')]
+        assert changes.removed_tables == [('iceberg', 'sales', 'customers')]
+        assert list(changes.altered_tables) == [('iceberg', 'sales', 'orders')]
+        assert changes.added_columns[('iceberg', 'sales', 'orders')] == ['amount']
+        assert changes.removed_columns[('iceberg', 'sales', 'orders')] == ['total']
+        assert changes.altered_columns[('iceberg', 'sales', 'orders')] == ['id']
+        assert changes.stats.requests['columns'] == 2
+
+        changes = sync.sync(deep=True)
+        assert list(changes.altered_tables) == [('iceberg', 'hr', 'people')]
+        assert changes.added_columns[('iceberg', 'hr', 'people')] == ['age']
+
+    @responses.activate
+    def test_removed_schemas_and_catalogs(self):
+        """
+        The tables of removed schemas and catalogs are removed
+        """
+        tree = new_tree()
+        add_lakehouse(tree, set())
+        sync = new_sync()
+        sync.sync()
+
+        del tree['hive']
+        del tree['iceberg']['hr']
+        changes = sync.sync()
+        assert sorted(changes.removed_tables) == [('hive', 'default', 'logs'), ('iceberg', 'hr', 'people')]
+        assert sorted(sync.state.table_lists) == [('iceberg', 'sales')]
+        assert len(sync.state.column_lists) == 2
+
+    @responses.activate
+    def test_failures_are_retried(self):
+        """
+        Subtrees whose requests failed keep their state and are checked again
+        """
+        tree = new_tree()
+        failing = {'catalogs/iceberg/schemas/sales/tables/orders/columns', 'catalogs/hive/schemas'}
+        add_lakehouse(tree, failing)
+        sync = new_sync()
+        changes = sync.sync()
+        assert sorted(event.path for event in changes.errors) == [('hive',), ('iceberg', 'sales', 'orders')]
+        assert sorted(changes.added_tables) == [('iceberg', 'hr', 'people'), ('iceberg', 'sales', 'customers')]
+        assert sync.state.table_lists[('iceberg', 'sales')][0] is None
+
+        failing.clear()
+        changes = sync.sync()
+        assert sorted(changes.added_tables) == [('hive', 'default', 'logs'), ('iceberg', 'sales', 'orders')]
+        assert not changes.removed_tables
+        assert changes.stats.requests['columns'] == 3
+
+        failing.add('catalogs')
+        changes = sync.sync()
+        assert not changes
+        assert len(sync.state.column_lists) == 4
+
+    @responses.activate
+    def test_state_round_trip(self):
+        """
+        A state saved as json resumes the sync
+        """
+        tree = new_tree()
+        add_lakehouse(tree, set())
+        sync = new_sync(catalog_names=['iceberg'])
+        sync.sync()
+
+        saved = json.loads(json.dumps(sync.state.to_dict()))
+        tree['iceberg']['sales']['refunds'] = {'id': 'bigint'}
+        changes = new_sync(catalog_names=['iceberg'], state=SyncState.from_dict(saved)).sync()
+        assert list(changes.added_tables) == [('iceberg', 'sales', 'refunds')]
+        assert not changes.removed_tables
+        assert SyncState.from_dict(saved).to_dict() == saved
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for lazily deserialized models and the typed_results client mode
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pickle
+import pytest
+import responses
+
+from ibm_watsonxdata.models.lazy import lazy_from_dict
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+presto_engine_json = json.loads(
+    '{"actions": ["actions"], "associated_catalogs": ["associated_catalogs"], "build_version": "1.0.3.0.0", "coordinator": {"node_type": "worker", "quantity": 8}, "created_by": "<username>@<domain>.com", "created_on": 10, "description": "presto engine for running sql queries", "drivers": [{"connection_type": "saphana", "driver_id": "saphanadriver123", "driver_name": "saphanadriver-1.2.3", "driver_version": "1.2.3"}], "engine_details": {"api_key": "<api_key>", "connection_string": "1.2.3.4", "coordinator": {"node_type": "worker", "quantity": 8}, "instance_id": "instance_id", "managed_by": "fully/self", "size_config": "starter", "worker": {"node_type": "worker", "quantity": 8}}, "engine_display_name": "sampleEngine", "engine_id": "sampleEngine123", "engine_properties": {"catalog": {"catalog_name": "catalog_name"}, "configuration": {"coordinator": {"node_type": "worker", "quantity": 8}, "worker": {"node_type": "worker", "quantity": 8}}, "global": {"global_property": "enable-mixed-case-support:true"}, "jvm": {"coordinator": {"node_type": "worker", "quantity": 8}, "worker": {"node_type": "worker", "quantity": 8}}}, "engine_restart": "force", "external_host_name": "your-hostname.apps.your-domain.com", "group_id": "new_group_id", "host_name": "ibm-lh-lakehouse-presto-01-presto-svc", "origin": "native", "port": 4, "region": "us-south", "remove_engine_properties": {"configuration": {"coordinator": ["coordinator"], "worker": ["worker"]}, "jvm": {"coordinator": ["coordinator"], "worker": ["worker"]}, "catalog": {"catalog_name": "catalog_name"}}, "size_config": "starter", "status": "running", "status_code": 11, "tags": ["tags"], "type": "presto", "version": "1.2.0", "worker": {"node_type": "worker", "quantity": 8}}'
+)
+
+
+def is_materialized(model, name):
+    """Return true when the slot called name has been filled."""
+    try:
+        object.__getattribute__(model, name)
+    except AttributeError:
+        return False
+    return True
+
+
+class TestLazyFromDict:
+    """
+    Test Class for lazy_from_dict
+    """
+
+    def test_attributes_are_built_on_first_access(self):
+        """
+        Only the attributes that are read get deserialized
+        """
+        engine = lazy_from_dict(PrestoEngine, presto_engine_json)
+        assert isinstance(engine, PrestoEngine)
+        assert type(engine).__name__ == 'PrestoEngine'
+        assert not is_materialized(engine, 'status')
+
+        assert engine.status == 'running'
+        assert is_materialized(engine, 'status')
+        assert not is_materialized(engine, 'engine_details')
+        assert not is_materialized(engine, 'coordinator')
+        assert not is_materialized(engine, 'drivers')
+
+        details = engine.engine_details
+        assert isinstance(details, EngineDetailsBody)
+        assert not is_materialized(details, 'worker')
+        assert details.worker == NodeDescriptionBody(node_type='worker', quantity=8)
+        assert engine.drivers[0].driver_id == 'saphanadriver123'
+        assert isinstance(engine.drivers[0], Driver)
+
+    def test_matches_from_dict(self):
+        """
+        A lazy model equals and serializes like the model built by from_dict()
+        """
+        eager = PrestoEngine.from_dict(presto_engine_json)
+        assert lazy_from_dict(PrestoEngine, presto_engine_json) == eager
+        assert eager == lazy_from_dict(PrestoEngine, presto_engine_json)
+        assert lazy_from_dict(PrestoEngine, presto_engine_json).to_dict() == eager.to_dict()
+        assert str(lazy_from_dict(PrestoEngine, presto_engine_json)) == str(eager)
+        assert lazy_from_dict(PrestoEngine, dict(presto_engine_json, status='stopped')) != eager
+
+    def test_keyword_attribute(self):
+        """
+        Attributes renamed because of Python keywords read their json key
+        """
+        engine = lazy_from_dict(PrestoEngine, presto_engine_json)
+        assert engine.engine_properties.global_.global_property == 'enable-mixed-case-support:true'
+
+    def test_missing_and_unknown_attributes(self):
+        """
+        Absent properties read as None, unknown names raise AttributeError
+        """
+        engine = lazy_from_dict(PrestoEngine, {'engine_id': 'presto1'})
+        assert engine.coordinator is None
+        assert engine.to_dict() == {'engine_id': 'presto1'}
+        with pytest.raises(AttributeError, match='not_an_attribute'):
+            engine.not_an_attribute
+
+    def test_pickle(self):
+        """
+        A lazy model survives a pickle round trip
+        """
+        engine = lazy_from_dict(PrestoEngine, presto_engine_json)
+        assert pickle.loads(pickle.dumps(engine)) == PrestoEngine.from_dict(presto_engine_json)
+
+
+class TestTypedResults:
+    """
+    Test Class for WatsonxDataV2(typed_results=True)
+    """
+
+    @responses.activate
+    def test_typed_result(self):
+        """
+        get_presto_engine() returns a PrestoEngine
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), typed_results=True)
+        service.set_service_url(_base_url)
+        responses.add(
+            responses.GET,
+            _base_url + '/presto_engines/sampleEngine123',
+            body=json.dumps(presto_engine_json),
+            content_type='application/json',
+            status=200,
+        )
+
+        response = service.get_presto_engine('sampleEngine123')
+        engine = response.get_result()
+        assert isinstance(engine, PrestoEngine)
+        assert engine.engine_id == 'sampleEngine123'
+        assert engine.coordinator.quantity == 8
+
+    @responses.activate
+    def test_collection_result(self):
+        """
+        list_columns() returns a ColumnCollection of Column models
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), typed_results=True)
+        service.set_service_url(_base_url)
+        responses.add(
+            responses.GET,
+            _base_url + '/catalogs/c/schemas/s/tables/t/columns',
+            body='{"columns": [{"column_name": "expenses", "type": "varchar"}]}',
+            content_type='application/json',
+            status=200,
+        )
+
+        columns = service.list_columns('presto1', 'c', 's', 't').get_result()
+        assert isinstance(columns, ColumnCollection)
+        assert columns.columns == [Column(column_name='expenses', type='varchar')]
+
+    @responses.activate
+    def test_untyped_and_empty_results(self):
+        """
+        Results stay untouched by default and for operations without a result model
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+        service.set_service_url(_base_url)
+        responses.add(
+            responses.GET,
+            _base_url + '/catalogs',
+            body='{"catalogs": []}',
+            content_type='application/json',
+            status=200,
+        )
+        assert service.list_catalogs().get_result() == {'catalogs': []}
+
+        service.typed_results = True
+        responses.add(responses.DELETE, _base_url + '/presto_engines/presto1', status=204)
+        assert service.delete_engine('presto1').get_result() is None
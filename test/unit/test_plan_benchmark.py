@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for PlanBenchmark
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import csv
+import json
+import pytest
+import re
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.plan_benchmark import BenchmarkRun, PlanBenchmark, PlanTiming, compare_runs, load_corpus
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+_PLAN = """\
+Fragment 0 [SINGLE]
+    - Output[PlanNodeId 2][_col0] => [count:bigint]
+            CPU: {output_ms}ms (1.00%), Scheduled: {output_ms}ms (1.00%), Output: 1 row (9B)
+        - TableScan[PlanNodeId 1][tpch:{table}] => [orderkey:bigint]
+                Estimates: {{rows: 15000 (131.84kB), cpu: 135000.00, memory: 0.00, network: 0.00}}
+                CPU: {scan_ms}ms (99.00%), Scheduled: {scan_ms}ms (99.00%), Output: 15000 rows (131.84kB)
+"""
+
+
+class FakeEngines:
+    """
+    Presto and Prestissimo engines whose explain analyze of 'select ... from <table>'
+    reports scan_ms[table] of CPU time; tables missing from scan_ms fail.
+    """
+
+    def __init__(self, scan_ms, delay=0.0):
+        self.lock = threading.Lock()
+        self.scan_ms = scan_ms
+        self.delay = delay
+        self.running = {}
+        self.peak_running = {}
+        self.peak_total = 0
+        self.statements = []
+        responses.add_callback(
+            responses.POST,
+            re.compile(_base_url + '/(presto|prestissimo)_engines/[^/]+/query_explain_analyze'),
+            callback=self.explain_analyze,
+            content_type='application/json',
+        )
+
+    def explain_analyze(self, request):
+        engine_id = request.path_url.split('/')[-2]
+        statement = json.loads(request.body)['statement']
+        table = statement.split()[-1]
+        with self.lock:
+            self.statements.append((engine_id, statement))
+            self.running[engine_id] = self.running.get(engine_id, 0) + 1
+            self.peak_running[engine_id] = max(self.peak_running.get(engine_id, 0), self.running[engine_id])
+            self.peak_total = max(self.peak_total, sum(self.running.values()))
+        time.sleep(self.delay)
+        with self.lock:
+            self.running[engine_id] -= 1
+        if table not in self.scan_ms:
+            return (400, {}, json.dumps({'message': 'table {0} does not exist'.format(table)}))
+        plan = _PLAN.format(output_ms=1, scan_ms=self.scan_ms[table], table=table)
+        return (200, {}, json.dumps({'response': {}, 'result': plan}))
+
+
+def new_service():
+    """Return a service for the mocked engines."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+_TARGETS = [('presto', 'presto1'), ('presto', 'presto2'), ('prestissimo', 'prestissimo1')]
+_CORPUS = {'q%d' % i: 'select count(*) from t%d' % i for i in range(5)}
+
+
+class TestPlanBenchmark:
+    """
+    Test Class for PlanBenchmark
+    """
+
+    @responses.activate
+    def test_run(self, tmp_path):
+        """
+        Every statement runs on every engine, one at a time per engine
+        """
+        engines = FakeEngines({'t%d' % i: 100 * (i + 1) for i in range(5)}, delay=0.01)
+        benchmark = PlanBenchmark(new_service(), _TARGETS, repetitions=2, max_concurrency=2)
+        progress = []
+        run = benchmark.run(_CORPUS, label='baseline', progress=progress.append)
+
+        assert len(run.timings) == len(progress) == 30
+        assert sorted(engines.statements) == sorted(
+            (engine_id, statement) for _ in range(2) for _, engine_id in _TARGETS for statement in _CORPUS.values()
+        )
+        assert max(engines.peak_running.values()) == 1 and engines.peak_total <= 2
+        assert not run.errors
+        timing = next(t for t in run.timings if t.key == ('q2', 'prestissimo', 'prestissimo1'))
+        assert (timing.cpu_ms, timing.scheduled_ms, timing.output_rows) == (301, 301, 1)
+        assert (timing.estimated_cpu, timing.operators, timing.hotspot) == (135000, 2, 'TableScan[1]')
+        assert timing.elapsed_ms >= 10
+        assert run.medians('cpu_ms')[('q4', 'presto', 'presto2')] == 501
+
+        path = str(tmp_path / 'baseline.json')
+        run.save(path)
+        loaded = BenchmarkRun.load(path)
+        assert loaded.label == 'baseline' and loaded.to_dict() == run.to_dict()
+        run.to_csv(str(tmp_path / 'baseline.csv'))
+        with open(str(tmp_path / 'baseline.csv'), encoding='utf-8') as file:
+            rows = list(csv.DictReader(file))
+        assert len(rows) == 30 and rows[0].keys() == set(PlanTiming.__slots__)
+
+    @responses.activate
+    def test_compare_runs(self, tmp_path):
+        """
+        Slower and newly failing statements are flagged
+        """
+        scan_ms = {'t%d' % i: 100.0 for i in range(5)}
+        FakeEngines(scan_ms)
+        benchmark = PlanBenchmark(new_service(), [('presto', 'presto1')])
+        baseline = benchmark.run(_CORPUS)
+        scan_ms.update({'t1': 200.0, 't2': 105.0})
+        del scan_ms['t3']
+        candidate = benchmark.run(_CORPUS, label='candidate')
+        assert len(candidate.errors) == 1 and 'does not exist' in candidate.errors[0].error
+
+        comparison = compare_runs(baseline, candidate, metrics=['cpu_ms'], threshold=0.2)
+        assert [(delta.name, delta.candidate) for delta in comparison.regressions] == [('q1', 201.0), ('q3', None)]
+        assert comparison.regressions[0].change == pytest.approx(100 / 101)
+        (summary,) = comparison.summary()
+        assert summary['statements'] == 4 and summary['regressions'] == 2
+        assert summary['p50_baseline'] == 101 and summary['p50_candidate'] == pytest.approx(103.5)
+        assert summary['p95_change'] == pytest.approx(186.75 / 101 - 1)
+        table = comparison.summary_table().splitlines()
+        assert table[0].split()[:4] == ['engine', 'metric', 'n', 'p50']
+        assert table[1].split() == [
+            'presto:presto1',
+            'cpu_ms',
+            '4',
+            '101.0',
+            '103.5',
+            '+2.5%',
+            '101.0',
+            '186.8',
+            '+84.9%',
+            '2',
+        ]
+
+        comparison.to_csv(str(tmp_path / 'comparison.csv'))
+        with open(str(tmp_path / 'comparison.csv'), encoding='utf-8') as file:
+            assert len(list(csv.DictReader(file))) == 5
+        assert json.loads(json.dumps(comparison.to_dict()))['candidate'] == 'candidate'
+
+    def test_load_corpus(self, tmp_path):
+        """
+        A corpus is loaded from the .sql files of a directory
+        """
+        (tmp_path / 'b.sql').write_text('select 2;\n')
+        (tmp_path / 'a.sql').write_text('select 1\n')
+        (tmp_path / 'notes.txt').write_text('not a statement')
+        assert load_corpus(str(tmp_path)) == {'a': 'select 1', 'b': 'select 2'}
+
+    def test_invalid_arguments(self):
+        """
+        PlanBenchmark and compare_runs with invalid arguments
+        """
+        with pytest.raises(ValueError, match='unsupported engine type: spark'):
+            PlanBenchmark(new_service(), [('spark', 'spark1')])
+        with pytest.raises(ValueError, match='must be at least 1'):
+            PlanBenchmark(new_service(), _TARGETS, max_per_engine=0)
+        with pytest.raises(ValueError, match='unsupported metric: rows'):
+            compare_runs(BenchmarkRun('a', 0), BenchmarkRun('b', 0), metrics=['rows'])
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for EngineComparator
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import re
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.explain_plan import parse_plan
+from ibm_watsonxdata.plan_comparison import EngineComparator, StatementComparison, diff_plans
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+PRESTO_PLAN = """\
+- Output[PlanNodeId 4][_col0] => [count:bigint]
+        Estimates: {rows: 1 (9B), cpu: 100.00, memory: 0.00, network: 0.00}
+        CPU: 1.00ms (0.10%), Scheduled: 1.00ms (0.10%), Output: 1 row (9B)
+    - Aggregate(FINAL)[PlanNodeId 3] => [count:bigint]
+            Estimates: {rows: 1 (9B), cpu: 200.00, memory: 9.00, network: 0.00}
+            CPU: 9.00ms (0.90%), Scheduled: 9.00ms (0.90%), Output: 1 row (9B)
+        - ScanFilterProject[PlanNodeId 0,1,2][table = tpch:orders, filterPredicate = (totalprice > 100)] => []
+                Estimates: {rows: 15000 (0B), cpu: 9700.00, memory: 0.00, network: 0.00}
+                CPU: {scan_ms}ms (99.00%), Scheduled: {scan_ms}ms (99.00%), Output: 12000 rows (0B)
+"""
+
+PRESTISSIMO_PLAN = """\
+- Output[PlanNodeId 4][_col0] => [count:bigint]
+        Estimates: {rows: 1 (9B), cpu: 100.00, memory: 0.00, network: 0.00}
+        CPU: 1.00ms (0.30%), Scheduled: 1.00ms (0.30%), Output: 1 row (9B)
+    - Aggregate(FINAL)[PlanNodeId 3] => [count:bigint]
+            Estimates: {rows: 1 (9B), cpu: 200.00, memory: 9.00, network: 0.00}
+            CPU: 4.00ms (1.20%), Scheduled: 4.00ms (1.20%), Output: 1 row (9B)
+        - Filter[PlanNodeId 1][filterPredicate = (totalprice > 100)] => []
+                Estimates: {rows: 12000 (0B), cpu: 4000.00, memory: 0.00, network: 0.00}
+                CPU: 15.00ms (4.50%), Scheduled: 15.00ms (4.50%), Output: 12000 rows (0B)
+            - TableScan[PlanNodeId 0][table = tpch:orders] => []
+                    Estimates: {rows: 15000 (0B), cpu: 2700.00, memory: 0.00, network: 0.00}
+                    CPU: {scan_ms}ms (94.00%), Scheduled: {scan_ms}ms (94.00%), Output: 15000 rows (0B)
+"""
+
+
+class FakeEngines:
+    """
+    A Presto and a Prestissimo engine; the scan of 'select ... <scan_ms>' takes scan_ms
+    on Presto and a third of it on Prestissimo, and statements containing 'fail' fail
+    on Prestissimo. Explain plans have no actual metrics.
+    """
+
+    def __init__(self, delay=0.0):
+        self.lock = threading.Lock()
+        self.delay = delay
+        self.running = 0
+        self.peak_running = 0
+        self.requests = []
+        responses.add_callback(
+            responses.POST,
+            re.compile(_base_url + '/(presto|prestissimo)_engines/[^/]+/query_explain(_analyze)?'),
+            callback=self.explain,
+            content_type='application/json',
+        )
+
+    def explain(self, request):
+        engine_type = request.path_url.split('/')[-3]
+        body = json.loads(request.body)
+        statement = body['statement']
+        with self.lock:
+            self.requests.append((engine_type, request.path_url.rsplit('/', 1)[-1], body))
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if engine_type == 'prestissimo_engines' and 'fail' in statement:
+            return (500, {}, json.dumps({'message': 'unsupported function'}))
+        scan_ms = float(statement.split()[-1])
+        if engine_type == 'presto_engines':
+            plan = PRESTO_PLAN.replace('{scan_ms}', str(scan_ms))
+        else:
+            plan = PRESTISSIMO_PLAN.replace('{scan_ms}', str(scan_ms / 3))
+        if request.path_url.endswith('query_explain'):
+            plan = '\n'.join(line for line in plan.splitlines() if 'CPU:' not in line)
+        return (200, {}, json.dumps({'response': {}, 'result': plan}))
+
+
+def new_service():
+    """Return a service for the mocked engines."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestEngineComparator:
+    """
+    Test Class for EngineComparator
+    """
+
+    def test_diff_plans(self):
+        """
+        Operators are aligned by name; the others are reported per engine
+        """
+        diff = diff_plans(
+            parse_plan(PRESTO_PLAN.replace('{scan_ms}', '90')), parse_plan(PRESTISSIMO_PLAN.replace('{scan_ms}', '30'))
+        )
+        assert [pair.operator for pair in diff.matched] == ['Output', 'Aggregate']
+        assert [node.operator for node in diff.presto_only] == ['ScanFilterProject']
+        assert [node.operator for node in diff.prestissimo_only] == ['Filter', 'TableScan']
+        assert not diff.same_shape
+        assert diff.operator_counts() == {'ScanFilterProject': (1, 0), 'Filter': (0, 1), 'TableScan': (0, 1)}
+        aggregate = diff.matched[1]
+        assert aggregate.delta('cpu_ms') == -5 and aggregate.delta('estimated_cpu') == 0
+        assert aggregate.to_dict()['cpu_ms_delta'] == -5
+        assert diff.total_delta('cpu_ms') == (1 + 4 + 15 + 30) - (1 + 9 + 90)
+        assert diff.total_delta('estimated_cpu') == -3000
+        assert diff.to_dict()['totals']['output_rows'] == {'presto': 12002, 'prestissimo': 27002}
+
+    @responses.activate
+    def test_compare_all(self):
+        """
+        Each statement runs on both engines at the same time, within the concurrency limit
+        """
+        engines = FakeEngines(delay=0.02)
+        comparator = EngineComparator(new_service(), 'presto1', 'prestissimo1', analyze=True, max_concurrency=4)
+        statements = {'q%d' % i: 'select count(*) from orders -- %d' % (300 * (i + 1)) for i in range(6)}
+        statements['q6'] = 'select fail(x) from orders -- 300'
+        comparisons = {comparison.name: comparison for comparison in comparator.compare_all(statements)}
+
+        assert sorted(comparisons) == sorted(statements)
+        assert 2 <= engines.peak_running <= 4
+        assert {path for _, path, _ in engines.requests} == {'query_explain_analyze'}
+        q1 = comparisons['q1']
+        assert q1.presto_cost == 610 and q1.prestissimo_cost == 220
+        assert q1.cost_change == pytest.approx(220 / 610 - 1)
+        assert q1.presto_elapsed_ms >= 20 and q1.elapsed_change is not None
+        assert len(q1.diff.matched) == 2
+
+        failed = comparisons['q6']
+        assert isinstance(failed.prestissimo_error, ApiException) and failed.presto_error is None
+        assert failed.diff is None and failed.cost_change is None
+        assert failed.to_dict()['prestissimo_error'] == 'Error: unsupported function, Status code: 500'
+
+    @responses.activate
+    def test_compare_explain(self):
+        """
+        Without analyze, plans are explained and compared on their estimated cost
+        """
+        engines = FakeEngines()
+        comparator = EngineComparator(new_service(), 'presto1', 'prestissimo1', plan_type='distributed')
+        comparison = comparator.compare('select count(*) from orders -- 30', name='count')
+
+        assert comparison.name == 'count'
+        assert sorted((engine, path) for engine, path, _ in engines.requests) == [
+            ('prestissimo_engines', 'query_explain'),
+            ('presto_engines', 'query_explain'),
+        ]
+        assert all(body['type'] == 'distributed' for _, _, body in engines.requests)
+        assert comparison.presto_cost == 10000 and comparison.prestissimo_cost == 7000
+
+    def test_cost_units(self):
+        """
+        Costs are estimates on both engines unless both plans are analyzed
+        """
+        comparison = StatementComparison('count', 'select count(*) from orders')
+        comparison.presto_plan = parse_plan(PRESTO_PLAN.replace('{scan_ms}', '600'))
+        comparison.prestissimo_plan = parse_plan(
+            '\n'.join(line for line in PRESTISSIMO_PLAN.splitlines() if 'CPU:' not in line)
+        )
+        assert comparison.presto_cost == 10000 and comparison.prestissimo_cost == 7000
+        assert comparison.cost_change == pytest.approx(-0.3)
+
+    def test_invalid_arguments(self):
+        """
+        EngineComparator with too little concurrency
+        """
+        with pytest.raises(ValueError, match='max_concurrency must be at least 2'):
+            EngineComparator(new_service(), 'presto1', 'prestissimo1', max_concurrency=1)
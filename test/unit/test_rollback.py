@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for PointInTimeRollback
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import re
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.rollback import PointInTimeRollback, RollbackJournal
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+class FakeLakehouse:
+    """
+    Tables of the 'iceberg' catalog with snapshots committed at the times of
+    `commits[table]`, named '<table>-<time>'; a rollback drops the snapshots
+    after its target. Rollbacks of the tables in `failures` fail with the listed
+    status codes first; `apply` is False to answer them without rolling back.
+    """
+
+    def __init__(self, commits, delay=0.0):
+        self.lock = threading.Lock()
+        self.commits = commits
+        self.failures = {}
+        self.apply = True
+        self.delay = delay
+        self.rollbacks = []
+        self.running = 0
+        self.peak_running = 0
+        responses.add_callback(
+            responses.GET,
+            re.compile(_base_url + '/catalogs/iceberg/schemas/[^/]+/tables/[^/]+/snapshots'),
+            callback=self.list_snapshots,
+            content_type='application/json',
+        )
+        responses.add_callback(
+            responses.POST,
+            re.compile(_base_url + '/catalogs/iceberg/schemas/[^/]+/tables/[^/]+/rollback'),
+            callback=self.rollback,
+            content_type='application/json',
+        )
+        responses.add_callback(
+            responses.GET,
+            re.compile(_base_url + '/catalogs(/iceberg/schemas(/[^/]+/tables)?)?(\\?.*)?$'),
+            callback=self.list_tree,
+            content_type='application/json',
+        )
+
+    def list_tree(self, request):
+        parts = request.path_url.split('?')[0].split('/')
+        if parts[-1] == 'catalogs':
+            body = {'catalogs': [{'catalog_name': 'iceberg', 'associated_engines': ['presto1']}]}
+        elif parts[-1] == 'schemas':
+            body = {'schemas': sorted({schema for schema, _ in self.commits})}
+        else:
+            body = {'tables': sorted(table for schema, table in self.commits if schema == parts[-2])}
+        return (200, {}, json.dumps(body))
+
+    def list_snapshots(self, request):
+        parts = request.path_url.split('?')[0].split('/')
+        table = (parts[-4], parts[-2])
+        snapshots = [
+            {'snapshot_id': '{0}-{1}'.format(table[1], at), 'committed_at': str(at), 'operation': 'append'}
+            for at in reversed(self.commits[table])
+        ]
+        return (200, {}, json.dumps({'snapshots': snapshots}))
+
+    def rollback(self, request):
+        parts = request.path_url.split('?')[0].split('/')
+        table = (parts[-4], parts[-2])
+        with self.lock:
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+            self.rollbacks.append((table, json.loads(request.body)['snapshot_id']))
+            if self.failures.get(table):
+                status_code = self.failures[table].pop(0)
+                return (status_code, {}, json.dumps({'message': 'rollback failed'}))
+            if self.apply:
+                target = int(json.loads(request.body)['snapshot_id'].split('-')[1])
+                self.commits[table] = [at for at in self.commits[table] if at <= target]
+        return (200, {}, json.dumps({}))
+
+
+def new_service():
+    """Return a service for the mocked lakehouse."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+_COMMITS = {
+    ('sales', 'orders'): [100, 200, 300],
+    ('sales', 'items'): [100, 150],
+    ('sales', 'returns'): [250, 300],
+    ('hr', 'people'): [50, 250],
+    ('hr', 'teams'): [120, 180, 240],
+}
+
+
+def tables(names):
+    """Return the paths of the tables of the 'iceberg' catalog."""
+    return [('iceberg',) + name for name in names]
+
+
+class TestPointInTimeRollback:
+    """
+    Test Class for PointInTimeRollback
+    """
+
+    @responses.activate
+    def test_run(self):
+        """
+        Tables are rolled back concurrently to their last snapshot before the time
+        """
+        lakehouse = FakeLakehouse(dict(_COMMITS), delay=0.02)
+        lakehouse.failures = {('hr', 'people'): [503], ('hr', 'teams'): [400]}
+        rollback = PointInTimeRollback(new_service(), 'presto1', 200, max_concurrency=2, sleep=lambda _: None)
+        results = {result.table[1:]: result for result in rollback.run(tables(_COMMITS))}
+
+        assert {name: result.status for name, result in results.items()} == {
+            ('sales', 'orders'): 'rolled_back',
+            ('sales', 'items'): 'current',
+            ('sales', 'returns'): 'no_snapshot',
+            ('hr', 'people'): 'rolled_back',
+            ('hr', 'teams'): 'failed',
+        }
+        assert sorted(lakehouse.rollbacks) == [
+            (('hr', 'people'), 'people-50'),
+            (('hr', 'people'), 'people-50'),
+            (('hr', 'teams'), 'teams-180'),
+            (('sales', 'orders'), 'orders-200'),
+        ]
+        assert lakehouse.peak_running == 2
+        orders = results[('sales', 'orders')]
+        assert (orders.snapshot_id, orders.committed_at, orders.attempts) == ('orders-200', 200, 3)
+        assert results[('sales', 'items')].snapshot_id == 'items-150'
+        assert results[('hr', 'people')].attempts == 4
+        assert isinstance(results[('hr', 'teams')].error, ApiException)
+        assert results[('hr', 'teams')].to_dict()['error'] == 'Error: rollback failed, Status code: 400'
+        assert rollback.journal.counts() == {'rolled_back': 2, 'current': 1, 'no_snapshot': 1, 'failed': 1}
+
+    @responses.activate
+    def test_resume(self, tmp_path):
+        """
+        A rollback resumed from its journal only retries the unfinished tables
+        """
+        lakehouse = FakeLakehouse(dict(_COMMITS))
+        lakehouse.failures = {('sales', 'orders'): [409]}
+        path = str(tmp_path / 'journal' / 'rollback.sqlite')
+        rollback = PointInTimeRollback(new_service(), 'presto1', '1970-01-01T00:03:20Z', journal=path)
+        assert [result.status for result in rollback.run(tables(_COMMITS)) if result.status == 'failed'] == ['failed']
+        rollback.journal.close()
+
+        lakehouse.rollbacks.clear()
+        resumed = PointInTimeRollback(new_service(), 'presto1', 200, journal=path)
+        (result,) = resumed.run(tables(_COMMITS))
+        assert (result.table, result.status) == (('iceberg', 'sales', 'orders'), 'rolled_back')
+        assert resumed.skipped == 4
+        assert lakehouse.rollbacks == [(('sales', 'orders'), 'orders-200')]
+        assert resumed.journal.counts() == {'rolled_back': 3, 'current': 1, 'no_snapshot': 1}
+        (people,) = [result for result in resumed.journal.results('rolled_back') if result.table[2] == 'people']
+        assert people.to_dict()['snapshot_id'] == 'people-50'
+
+        with pytest.raises(ValueError, match='the journal records the rollback of presto1 to 200'):
+            PointInTimeRollback(new_service(), 'presto1', 300, journal=resumed.journal)
+
+    @responses.activate
+    def test_close(self):
+        """
+        Closing the generator journals the rollbacks already started
+        """
+        lakehouse = FakeLakehouse(dict(_COMMITS), delay=0.05)
+        rollback = PointInTimeRollback(new_service(), 'presto1', 200, max_concurrency=2)
+        results = rollback.run(tables(_COMMITS))
+        next(results)
+        results.close()
+        journaled = rollback.journal.statuses()
+        assert 2 <= len(journaled) < len(_COMMITS)
+        assert {('iceberg',) + table for table, _ in lakehouse.rollbacks} <= set(journaled)
+
+    @responses.activate
+    def test_unapplied(self):
+        """
+        A rollback that leaves another snapshot current fails
+        """
+        lakehouse = FakeLakehouse({('sales', 'orders'): [100, 200]})
+        lakehouse.apply = False
+        rollback = PointInTimeRollback(new_service(), 'presto1', 150, journal=RollbackJournal())
+        (result,) = rollback.run(tables([('sales', 'orders')]))
+        assert result.status == 'failed' and isinstance(result.error, RuntimeError)
+        assert (
+            str(result.error)
+            == 'the rollback of iceberg.sales.orders left snapshot orders-200 current instead of orders-100'
+        )
+        assert rollback.journal.counts() == {'failed': 1}
+
+    @responses.activate
+    def test_list_tables(self):
+        """
+        The tables of a schema or of a whole catalog
+        """
+        FakeLakehouse(dict(_COMMITS))
+        rollback = PointInTimeRollback(new_service(), 'presto1', 200)
+        assert rollback.list_tables('iceberg', 'hr') == tables([('hr', 'people'), ('hr', 'teams')])
+        assert rollback.list_tables('iceberg') == sorted(tables(_COMMITS))
+
+    def test_invalid_arguments(self):
+        """
+        PointInTimeRollback with invalid arguments
+        """
+        with pytest.raises(ValueError, match='max_concurrency must be at least 1'):
+            PointInTimeRollback(new_service(), 'presto1', 200, max_concurrency=0)
+        with pytest.raises(ValueError):
+            PointInTimeRollback(new_service(), 'presto1', 'yesterday')
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for RoutingAdvisor
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import re
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.routing_advisor import RoutingAdvisor
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+_PLAN = """\
+- Output[PlanNodeId 2][_col0] => [count:bigint]
+        Estimates: {{rows: 1 (9B), cpu: 10.00, memory: 0.00, network: 0.00}}
+    - TableScan[PlanNodeId 1][tpch:orders] => [orderkey:bigint]
+            Estimates: {{rows: 15000 (131.84kB), cpu: {cpu}, memory: 0.00, network: 0.00}}
+"""
+
+
+class FakeEngines:
+    """
+    Presto and Prestissimo engines; engines explain statements with a cost of
+    costs[engine_id], and fail with errors[engine_id] when set.
+    """
+
+    def __init__(self, engines, costs, delay=0.0):
+        self.lock = threading.Lock()
+        self.engines = engines
+        self.costs = costs
+        self.errors = {}
+        self.delay = delay
+        self.running = 0
+        self.peak_running = 0
+        self.requests = []
+        responses.add_callback(
+            responses.GET,
+            re.compile(_base_url + '/(presto|prestissimo)_engines'),
+            callback=self.list,
+            content_type='application/json',
+        )
+        responses.add_callback(
+            responses.POST,
+            re.compile(_base_url + '/(presto|prestissimo)_engines/[^/]+/query_explain'),
+            callback=self.explain,
+            content_type='application/json',
+        )
+
+    def list(self, request):
+        engine_type = request.path_url.split('/')[-1].split('?')[0]
+        self.requests.append(('list', engine_type))
+        return (200, {}, json.dumps({engine_type: self.engines[engine_type]}))
+
+    def explain(self, request):
+        engine_id = request.path_url.split('/')[-2]
+        with self.lock:
+            self.requests.append(('explain', engine_id))
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if engine_id in self.errors:
+            return (self.errors[engine_id], {}, json.dumps({'message': 'explain failed'}))
+        return (200, {}, json.dumps({'response': {}, 'result': _PLAN.format(cpu=self.costs[engine_id])}))
+
+    def explained(self):
+        """Return and forget the ids of the explained engines."""
+        explained = sorted(engine_id for kind, engine_id in self.requests if kind == 'explain')
+        self.requests = [request for request in self.requests if request[0] != 'explain']
+        return explained
+
+
+def engine(engine_id, status='running', workers=1, node_type='worker'):
+    """Return an engine of an engine list."""
+    return {
+        'engine_id': engine_id,
+        'status': status,
+        'status_code': 0,
+        'external_host_name': 'host',
+        'coordinator': {'node_type': 'coordinator', 'quantity': 1},
+        'worker': {'node_type': node_type, 'quantity': workers},
+    }
+
+
+def new_service():
+    """Return a service for the mocked engines."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+class FakeClock:
+    """A clock advanced by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRoutingAdvisor:
+    """
+    Test Class for RoutingAdvisor
+    """
+
+    @responses.activate
+    def test_recommend(self):
+        """
+        Running engines are explained concurrently and ranked by cost per capacity
+        """
+        fake = FakeEngines(
+            {
+                'presto_engines': [engine('presto1', workers=4), engine('presto2', status='paused', workers=8)],
+                'prestissimo_engines': [
+                    engine('prestissimo1', workers=2, node_type='large'),
+                    engine('prestissimo2', workers=16),
+                ],
+            },
+            {'presto1': 990, 'presto2': 10, 'prestissimo1': 590, 'prestissimo2': 590},
+            delay=0.02,
+        )
+        fake.errors['prestissimo2'] = 404
+        advisor = RoutingAdvisor(new_service(), node_weights={'large': 4})
+        recommendation = advisor.recommend('SELECT count(*)\n  FROM orders -- hot path')
+
+        assert fake.explained() == ['prestissimo1', 'prestissimo2', 'presto1']
+        assert fake.peak_running >= 2
+        assert recommendation.fingerprint == 'select count(*) from orders'
+        assert recommendation.explains == 3
+        assert (recommendation.engine.engine_type, recommendation.engine.engine_id) == ('prestissimo', 'prestissimo1')
+        assert [(c.engine_id, c.capacity, c.cost, c.score) for c in recommendation.candidates] == [
+            ('prestissimo1', 8, 600, 75),
+            ('presto1', 4, 1000, 250),
+            ('prestissimo2', 16, None, None),
+            ('presto2', 8, None, None),
+        ]
+        failed = recommendation.candidates[2]
+        assert isinstance(failed.error, ApiException) and not failed.available
+        assert recommendation.to_dict()['engine_id'] == 'prestissimo1'
+
+        # The same statement, differently formatted, sends no request at all.
+        fake.requests.clear()
+        again = advisor.recommend('select COUNT(*) from orders;')
+        assert fake.requests == [] and again.explains == 0
+        assert again.engine.engine_id == 'prestissimo1' and isinstance(again.candidates[2].error, ApiException)
+        assert advisor.stats() == {'hits': 1, 'misses': 1, 'explains': 3, 'list_requests': 2, 'entries': 1}
+
+    @responses.activate
+    def test_cache_expiry(self):
+        """
+        Stale engine lists are listed again, and only new engines or stale estimates are explained
+        """
+        engines = {'presto_engines': [engine('presto1', workers=2)], 'prestissimo_engines': []}
+        costs = {'presto1': 90, 'prestissimo1': 90}
+        fake = FakeEngines(engines, costs)
+        clock = FakeClock()
+        advisor = RoutingAdvisor(new_service(), ttl=600, engine_ttl=60, clock=clock)
+        assert advisor.recommend('select 1').engine.engine_id == 'presto1'
+        assert fake.explained() == ['presto1']
+
+        engines['prestissimo_engines'].append(engine('prestissimo1', workers=4))
+        clock.now = 30
+        assert advisor.recommend('select 1').engine.engine_id == 'presto1'
+        assert fake.explained() == []
+        clock.now = 61
+        assert advisor.recommend('select 1').engine.engine_id == 'prestissimo1'
+        assert fake.explained() == ['prestissimo1']
+
+        # Transient failures are not cached.
+        fake.errors['presto1'] = 503
+        clock.now = 601
+        recommendation = advisor.recommend('select 1')
+        assert fake.explained() == ['prestissimo1', 'presto1']
+        assert recommendation.engine.engine_id == 'prestissimo1'
+        assert recommendation.candidates[1].error.status_code == 503
+        del fake.errors['presto1']
+        costs['presto1'] = 10
+        assert advisor.recommend('select 1').engine.engine_id == 'presto1'
+        assert fake.explained() == ['presto1']
+
+        advisor.clear()
+        assert advisor.recommend('select 1').explains == 2
+
+    @responses.activate
+    def test_no_engine(self):
+        """
+        Without a running engine, nothing is recommended
+        """
+        FakeEngines({'presto_engines': [engine('presto1', status='stopped')]}, {})
+        advisor = RoutingAdvisor(new_service(), engine_types=['presto'])
+        recommendation = advisor.recommend('select 1')
+        assert recommendation.engine is None and recommendation.explains == 0
+        assert recommendation.to_dict()['engine_id'] is None
+
+    def test_invalid_arguments(self):
+        """
+        RoutingAdvisor with invalid arguments
+        """
+        with pytest.raises(ValueError, match='unsupported engine type: spark'):
+            RoutingAdvisor(new_service(), engine_types=['spark'])
+        with pytest.raises(ValueError, match='max_concurrency must be at least 1'):
+            RoutingAdvisor(new_service(), max_concurrency=0)
+        with pytest.raises(ValueError, match='must be positive'):
+            RoutingAdvisor(new_service(), engine_ttl=0)
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for SnapshotAnalyzer
+"""
+
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import csv
+import json
+import pytest
+import re
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.models.catalogs import TableSnapshot
+from ibm_watsonxdata.snapshot_analyzer import SnapshotAnalyzer
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+_DAY = 86400
+_NOW = 1700000000
+_GIB = 1024**3
+
+
+class FakeCatalog:
+    """
+    A catalog whose tables have the snapshots of `snapshots`, by table name; tables
+    missing from it do not exist.
+    """
+
+    def __init__(self, snapshots, delay=0.0):
+        self.lock = threading.Lock()
+        self.snapshots = snapshots
+        self.delay = delay
+        self.running = 0
+        self.peak_running = 0
+        responses.add_callback(
+            responses.GET,
+            re.compile(_base_url + '/catalogs/[^/]+/schemas/[^/]+/tables/[^/]+/snapshots'),
+            callback=self.list_snapshots,
+            content_type='application/json',
+        )
+
+    def list_snapshots(self, request):
+        table = request.path_url.split('?')[0].split('/')[-2]
+        with self.lock:
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if table not in self.snapshots:
+            return (404, {}, json.dumps({'message': 'table not found'}))
+        return (200, {}, json.dumps({'snapshots': self.snapshots[table]}))
+
+
+def new_service():
+    """Return a service for the mocked catalog."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+def hourly_snapshots():
+    """Return 300 hourly snapshots up to now, newest first, with a JSON summary."""
+    snapshots = [
+        {
+            'snapshot_id': str(k),
+            'committed_at': str(_NOW - k * 3600),
+            'operation': 'overwrite' if k % 10 == 0 else 'append',
+            'summary': '{}',
+        }
+        for k in range(300)
+    ]
+    snapshots[0]['summary'] = json.dumps(
+        {'total-data-files': '2000', 'total-delete-files': '5', 'total-files-size': str(10 * _GIB)}
+    )
+    return snapshots
+
+
+def path(table):
+    """Return the path of a table of the 'iceberg.sales' schema."""
+    return ('iceberg', 'sales', table)
+
+
+class TestSnapshotAnalyzer:
+    """
+    Test Class for SnapshotAnalyzer
+    """
+
+    @responses.activate
+    def test_analyze(self, tmp_path):
+        """
+        Snapshot lists are fetched concurrently, analyzed and ranked
+        """
+        catalog = FakeCatalog(
+            {
+                'events': hourly_snapshots(),
+                'customers': [
+                    {
+                        'snapshot_id': str(k),
+                        'committed_at': str((_NOW - (10 + k) * _DAY) * 1000),
+                        'operation': 'append',
+                        'summary': '{total-data-files=3, total-files-size=%d, total-records=90}' % (3 * _GIB // 2),
+                    }
+                    for k in range(3)
+                ],
+            },
+            delay=0.02,
+        )
+        analyzer = SnapshotAnalyzer(new_service(), 'presto01', max_concurrency=3, clock=lambda: _NOW)
+        report = analyzer.analyze([path('events'), path('customers'), path('returns')])
+        assert catalog.peak_running >= 2
+
+        events = report.tables[path('events')]
+        assert (events.snapshots, events.expirable, events.first_commit, events.last_commit) == (
+            300,
+            179,
+            _NOW - 299 * 3600,
+            _NOW,
+        )
+        assert events.commits_per_day == pytest.approx(169 / 7)
+        assert events.operations == {'append': 270, 'overwrite': 30}
+        assert (events.data_files, events.delete_files, events.total_size) == (2000, 5, 10 * _GIB)
+        assert events.compactable_files == 2000 - 20 + 5
+        assert events.average_file_size == 10 * _GIB / 2000
+
+        customers = report.tables[path('customers')]
+        assert (customers.snapshots, customers.expirable, customers.commits_per_day) == (3, 2, 0)
+        assert customers.last_commit == _NOW - 10 * _DAY
+        assert (customers.data_files, customers.records, customers.compactable_files) == (3, 90, 0)
+        assert isinstance(report.tables[path('returns')].error, ApiException)
+
+        assert report.expiry_candidates() == [events, customers]
+        assert report.expiry_candidates(1) == [events]
+        assert report.compaction_candidates() == [events]
+        assert report.totals() == {
+            'tables': 3,
+            'errors': 1,
+            'snapshots': 303,
+            'expirable': 181,
+            'expiry_candidates': 2,
+            'compaction_candidates': 1,
+            'operations': {'append': 273, 'overwrite': 30},
+        }
+        report.to_csv(str(tmp_path / 'bloat.csv'))
+        with open(str(tmp_path / 'bloat.csv'), encoding='utf-8') as file:
+            rows = {row['table']: row for row in csv.DictReader(file)}
+        assert rows['events']['expirable'] == '179' and json.loads(rows['events']['operations'])['overwrite'] == 30
+        assert rows['returns']['error'] == 'Error: table not found, Status code: 404'
+        assert json.loads(json.dumps(report.to_dict()))['totals']['expirable'] == 181
+
+    def test_analyze_lists(self):
+        """
+        Snapshot lists already fetched are analyzed as models
+        """
+        analyzer = SnapshotAnalyzer(
+            new_service(), 'presto01', retention=0, min_snapshots_to_keep=2, min_compaction_files=1, clock=lambda: _NOW
+        )
+        report = analyzer.analyze_lists(
+            {
+                path('orders'): [
+                    TableSnapshot(snapshot_id='1', committed_at='1970-04-01T00:00:00Z', operation='append'),
+                    TableSnapshot(
+                        snapshot_id='3',
+                        committed_at='1970-04-10T00:00:00Z',
+                        operation='delete',
+                        summary='{"total-data-files": "4", "total-delete-files": "2", "total-files-size": "400"}',
+                    ),
+                    TableSnapshot(snapshot_id='2', committed_at='1970-04-05T00:00:00Z', operation='append'),
+                    TableSnapshot(snapshot_id='pending', operation='append'),
+                ],
+                path('empty'): [],
+            }
+        )
+        orders = report.tables[path('orders')]
+        assert (orders.snapshots, orders.expirable, orders.compactable_files) == (4, 1, 3 + 2)
+        assert orders.operations == {'append': 3, 'delete': 1}
+        assert report.compaction_candidates() == [orders]
+        empty = report.tables[path('empty')]
+        assert (empty.snapshots, empty.last_commit, empty.compactable_files) == (0, None, None)
+        assert report.expiry_candidates() == [orders]
+
+    def test_invalid_arguments(self):
+        """
+        SnapshotAnalyzer with invalid arguments
+        """
+        with pytest.raises(ValueError, match='max_concurrency must be at least 1'):
+            SnapshotAnalyzer(new_service(), 'presto01', max_concurrency=0)
+        with pytest.raises(ValueError, match='window and target_file_size must be positive'):
+            SnapshotAnalyzer(new_service(), 'presto01', window=0)
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for SnapshotIndex
+"""
+
+from datetime import datetime, timezone
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import re
+import responses
+import threading
+import time
+
+from ibm_watsonxdata.models.catalogs import TableSnapshot
+from ibm_watsonxdata.snapshot_index import SnapshotIndex, parse_committed_at
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+
+class FakeCatalog:
+    """
+    A catalog whose tables have the snapshots of `snapshots`, by (catalog, schema,
+    table); tables missing from it do not exist.
+    """
+
+    def __init__(self, snapshots, delay=0.0):
+        self.lock = threading.Lock()
+        self.snapshots = snapshots
+        self.delay = delay
+        self.requests = []
+        self.running = 0
+        self.peak_running = 0
+        responses.add_callback(
+            responses.GET,
+            re.compile(_base_url + '/catalogs/[^/]+/schemas/[^/]+/tables/[^/]+/snapshots'),
+            callback=self.list_snapshots,
+            content_type='application/json',
+        )
+
+    def list_snapshots(self, request):
+        parts = request.path_url.split('?')[0].split('/')
+        table = (parts[-6], parts[-4], parts[-2])
+        with self.lock:
+            self.requests.append(table)
+            self.running += 1
+            self.peak_running = max(self.peak_running, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if table not in self.snapshots:
+            return (404, {}, json.dumps({'message': 'table not found'}))
+        return (200, {}, json.dumps({'snapshots': self.snapshots[table]}))
+
+
+def snapshot(snapshot_id, committed_at, operation='append'):
+    """Return a snapshot of a snapshot list."""
+    return {'snapshot_id': snapshot_id, 'committed_at': committed_at, 'operation': operation, 'summary': '{}'}
+
+
+def new_service():
+    """Return a service for the mocked catalog."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+_ORDERS = ('iceberg', 'sales', 'orders')
+_ITEMS = ('iceberg', 'sales', 'items')
+_PEOPLE = ('iceberg', 'hr', 'people')
+
+
+class TestSnapshotIndex:
+    """
+    Test Class for SnapshotIndex
+    """
+
+    @responses.activate
+    def test_as_of(self):
+        """
+        Snapshot lists are fetched concurrently and looked up by time
+        """
+        catalog = FakeCatalog(
+            {
+                # Newest first, as listed by the service.
+                _ORDERS: [snapshot('o3', '3000', 'overwrite'), snapshot('o2', '2000'), snapshot('o1', '1000')],
+                _ITEMS: [snapshot('i1', '1500.0'), snapshot('i2', 2500)],
+                _PEOPLE: [snapshot('p1', '1970-01-01T00:50:00Z', 'replace')],
+            },
+            delay=0.02,
+        )
+        index = SnapshotIndex(new_service(), 'presto01', max_concurrency=3)
+        assert index.refresh([_ORDERS, _ITEMS, _PEOPLE]) == {
+            'added': 3,
+            'unchanged': 0,
+            'grown': 0,
+            'rebuilt': 0,
+            'failed': 0,
+        }
+        assert len(index) == 3 and _ORDERS in index
+        assert catalog.peak_running >= 2
+
+        ref = index.as_of(_ORDERS, 2500)
+        assert (ref.table, ref.snapshot_id, ref.committed_at, ref.operation) == (_ORDERS, 'o2', 2000, 'append')
+        assert index.as_of(_ORDERS, 2000).snapshot_id == 'o2'
+        assert index.as_of(_ORDERS, 999) is None
+        assert index.as_of(_ORDERS, datetime(1970, 1, 1, 1, tzinfo=timezone.utc)).snapshot_id == 'o3'
+        assert {table: ref and ref.snapshot_id for table, ref in index.as_of_all('1970-01-01T00:41:40').items()} == {
+            _ORDERS: 'o2',
+            _ITEMS: 'i2',
+            _PEOPLE: None,
+        }
+        assert [ref.snapshot_id for ref in index.history(_ORDERS)] == ['o1', 'o2', 'o3']
+        assert index.history(_ITEMS)[0].to_dict() == {
+            'catalog': 'iceberg',
+            'schema': 'sales',
+            'table': 'items',
+            'snapshot_id': 'i1',
+            'committed_at': 1500,
+            'operation': 'append',
+        }
+        with pytest.raises(KeyError):
+            index.as_of(('iceberg', 'sales', 'returns'), 0)
+
+    @responses.activate
+    def test_refresh(self):
+        """
+        Refreshing only parses the snapshots of tables whose list changed
+        """
+        snapshots = {
+            _ORDERS: [snapshot('o2', '2000'), snapshot('o1', '1000')],
+            _ITEMS: [snapshot('i2', '2000'), snapshot('i1', '1000')],
+            _PEOPLE: [snapshot('p1', '1000')],
+        }
+        catalog = FakeCatalog(snapshots)
+        index = SnapshotIndex(new_service(), 'presto01')
+        index.refresh(snapshots)
+        assert index.refresh() == {'added': 0, 'unchanged': 3, 'grown': 0, 'rebuilt': 0, 'failed': 0}
+
+        snapshots[_ORDERS].insert(0, snapshot('o3', '3000'))
+        snapshots[_ORDERS].append(snapshot('o0', '500'))
+        snapshots[_ITEMS] = [snapshot('i3', '3000'), snapshot('i2', '2000')]
+        del snapshots[_PEOPLE]
+        catalog.requests.clear()
+        assert index.refresh() == {'added': 0, 'unchanged': 0, 'grown': 1, 'rebuilt': 1, 'failed': 1}
+        assert sorted(catalog.requests) == sorted([_ORDERS, _ITEMS, _PEOPLE])
+        assert [ref.snapshot_id for ref in index.history(_ORDERS)] == ['o0', 'o1', 'o2', 'o3']
+        assert [ref.snapshot_id for ref in index.history(_ITEMS)] == ['i2', 'i3']
+        assert index.as_of(_ITEMS, 1500) is None
+
+        # A failed table keeps its timeline until it is listed again.
+        assert isinstance(index.errors[_PEOPLE], ApiException)
+        assert index.as_of(_PEOPLE, 1000).snapshot_id == 'p1'
+        index.remove(_PEOPLE)
+        assert _PEOPLE not in index and not index.errors
+
+    def test_update(self):
+        """
+        Snapshot lists already fetched are indexed as models or dicts
+        """
+        index = SnapshotIndex(new_service(), 'presto01')
+        models = [
+            TableSnapshot(snapshot_id='b', committed_at='2024-06-01 12:00:00'),
+            TableSnapshot(snapshot_id='a', committed_at='2024-05-01T00:00:00+02:00'),
+            TableSnapshot(snapshot_id='pending'),
+        ]
+        assert index.update(_ORDERS, models) == 'added'
+        assert index.update(_ORDERS, models) == 'unchanged'
+        assert [ref.snapshot_id for ref in index.history(_ORDERS)] == ['a', 'b']
+        assert index.as_of(_ORDERS, '2024-05-31').snapshot_id == 'a'
+        assert index.update(_ORDERS, []) == 'rebuilt'
+        assert index.as_of(_ORDERS, '2024-07-01') is None
+        with pytest.raises(ValueError):
+            index.update(_ITEMS, [snapshot('x', 'yesterday')])
+        assert _ITEMS not in index
+
+    def test_parse_committed_at(self):
+        """
+        Times are seconds or milliseconds since the epoch, or ISO 8601
+        """
+        assert parse_committed_at('1609379392') == 1609379392
+        assert parse_committed_at(1609379392123) == 1609379392.123
+        assert parse_committed_at('2020-12-31T01:49:52Z') == 1609379392
+        assert parse_committed_at('2020-12-31T02:49:52.5+01:00') == 1609379392.5
+        assert parse_committed_at(datetime(2020, 12, 31, 1, 49, 52)) == 1609379392
+        for value in ('', 'yesterday', None, True):
+            with pytest.raises(ValueError):
+                parse_committed_at(value)
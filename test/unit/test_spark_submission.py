@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for SparkSubmitter
+"""
+
+from http.client import RemoteDisconnected
+from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+import json
+import pytest
+import requests
+import responses
+import threading
+import time
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from ibm_watsonxdata.spark_submission import SparkSubmitter
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+_applications_url = _base_url + '/spark_engines/spark1/applications'
+
+
+class FakeSparkEngine:
+    """
+    A Spark engine counting its active applications; each list request lets `drain`
+    of them finish. Applications named 'flaky*' fail twice with a 503 error,
+    'refused*' once with a refused connection, 'aborted*' with a connection
+    closed after the request was sent, 'lost*' with a 502 error, 'slow*' with
+    a read timeout and 'bad*' with a 400 error. The list requests numbered in
+    `failing_counts` fail with a 503 error.
+    """
+
+    def __init__(self, delay=0.0, drain=0):
+        self.lock = threading.Lock()
+        self.delay = delay
+        self.drain = drain
+        self.active = 0
+        self.peak_active = 0
+        self.concurrent = 0
+        self.peak_concurrent = 0
+        self.attempts = {}
+        self.counts = 0
+        self.failing_counts = ()
+        responses.add_callback(responses.POST, _applications_url, callback=self.create, content_type='application/json')
+        responses.add_callback(responses.GET, _applications_url, callback=self.list, content_type='application/json')
+
+    def create(self, request):
+        name = json.loads(request.body)['application_details']['application']
+        with self.lock:
+            self.concurrent += 1
+            self.peak_concurrent = max(self.peak_concurrent, self.concurrent)
+            attempt = self.attempts[name] = self.attempts.get(name, 0) + 1
+        time.sleep(self.delay)
+        with self.lock:
+            self.concurrent -= 1
+            if name.startswith('bad'):
+                return (400, {}, json.dumps({'message': 'invalid application'}))
+            if name.startswith('flaky') and attempt <= 2:
+                return (503, {}, json.dumps({'message': 'unavailable'}))
+            if name.startswith('refused') and attempt == 1:
+                refused = NewConnectionError(None, 'Connection refused')
+                return (0, {}, requests.exceptions.ConnectionError(MaxRetryError(None, request.url, refused)))
+            if name.startswith('aborted'):
+                aborted = ProtocolError('Connection aborted.', RemoteDisconnected('Remote end closed connection'))
+                return (0, {}, requests.exceptions.ConnectionError(aborted))
+            if name.startswith('lost'):
+                return (502, {}, json.dumps({'message': 'bad gateway'}))
+            if name.startswith('slow'):
+                return (0, {}, requests.exceptions.ReadTimeout('read timed out'))
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+        return (202, {}, json.dumps({'id': 'id-' + name, 'state': 'accepted'}))
+
+    def list(self, request):
+        assert 'state=accepted%2Crunning%2Cwaiting' in request.url
+        with self.lock:
+            self.counts += 1
+            if self.counts in self.failing_counts:
+                return (503, {}, json.dumps({'message': 'busy'}))
+            applications = [{'id': str(i), 'state': 'running'} for i in range(self.active)]
+            self.active = max(0, self.active - self.drain)
+        return (200, {}, json.dumps({'applications': applications}))
+
+
+def new_service():
+    """Return a service for the mocked Spark engine."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator())
+    service.set_service_url(_base_url)
+    return service
+
+
+def applications(*names):
+    """Return the details of applications with the given names."""
+    return [SparkApplicationDetails(application=name) for name in names]
+
+
+class TestSparkSubmitter:
+    """
+    Test Class for SparkSubmitter
+    """
+
+    @responses.activate
+    def test_concurrency_cap(self):
+        """
+        At most max_concurrency submissions are in flight
+        """
+        engine = FakeSparkEngine(delay=0.01)
+        submitter = SparkSubmitter(new_service(), 'spark1', max_concurrency=4)
+        results = list(submitter.submit_all(applications(*('app%d' % i for i in range(40)))))
+
+        assert sorted(result.index for result in results) == list(range(40))
+        assert all(result.application_id == 'id-app%d' % result.index for result in results)
+        assert engine.peak_concurrent <= 4
+        assert engine.counts == 0
+        stats = submitter.stats.to_dict()
+        assert stats['submitted'] == 40
+        assert stats['throughput'] > 0
+
+    @responses.activate
+    def test_retries(self):
+        """
+        Transient failures are retried, others are reported
+        """
+        FakeSparkEngine()
+        sleeps = []
+        submitter = SparkSubmitter(new_service(), 'spark1', retry_interval=0.5, sleep=sleeps.append)
+        results = {
+            result.application_details.application: result
+            for result in submitter.submit_all(applications('ok', 'flaky', 'bad'))
+        }
+
+        assert results['flaky'].application_id == 'id-flaky'
+        assert results['flaky'].attempts == 3
+        assert isinstance(results['bad'].error, ApiException)
+        assert results['bad'].attempts == 1
+        assert results['bad'].application is None
+        assert len(sleeps) == 2 and 0.25 <= sleeps[0] <= 0.5 and 0.5 <= sleeps[1] <= 1.0
+        assert submitter.stats.to_dict()['retries'] == 2
+        assert submitter.stats.failed == 1
+
+        submitter = SparkSubmitter(new_service(), 'spark1', max_retries=1, sleep=sleeps.append)
+        (result,) = submitter.submit_all(applications('flaky2'))
+        assert result.error.status_code == 503
+        assert result.attempts == 2
+
+    @responses.activate
+    def test_no_duplicate_retries(self):
+        """
+        Failures after which the application may exist are not retried
+        """
+        engine = FakeSparkEngine()
+        submitter = SparkSubmitter(new_service(), 'spark1', sleep=lambda _: None)
+        results = {
+            result.application_details.application: result
+            for result in submitter.submit_all(applications('refused', 'aborted', 'lost', 'slow'))
+        }
+
+        assert (results['refused'].application_id, results['refused'].attempts) == ('id-refused', 2)
+        assert results['lost'].error.status_code == 502
+        assert isinstance(results['slow'].error, requests.exceptions.ReadTimeout)
+        assert isinstance(results['aborted'].error, requests.exceptions.ConnectionError)
+        assert engine.attempts == {'refused': 2, 'aborted': 1, 'lost': 1, 'slow': 1}
+
+    @responses.activate
+    def test_backpressure(self):
+        """
+        Submissions pause while the engine runs max_running applications
+        """
+        engine = FakeSparkEngine(drain=2)
+        submitter = SparkSubmitter(
+            new_service(), 'spark1', max_concurrency=8, max_running=3, running_check_interval=0.01
+        )
+        results = list(submitter.submit_all(applications(*('app%d' % i for i in range(12)))))
+
+        assert len(results) == 12
+        assert engine.peak_active <= 3
+        assert engine.counts >= 5
+        assert submitter.stats.throttled >= 1
+
+    @responses.activate
+    def test_count_errors(self):
+        """
+        Failed counts are retried, then replaced by the last count while submissions are in flight
+        """
+        engine = FakeSparkEngine(delay=0.05)
+        submitter = SparkSubmitter(
+            new_service(), 'spark1', max_concurrency=3, max_running=3, running_check_interval=0.01, sleep=lambda _: None
+        )
+        results = []
+        engine.failing_counts = range(2, 100)
+        with pytest.raises(ApiException, match='busy'):
+            for result in submitter.submit_all(applications('a', 'b', 'c', 'd')):
+                results.append(result)
+
+        assert sorted(result.application_id for result in results) == ['id-a', 'id-b', 'id-c']
+        assert submitter.stats.count_errors >= 1
+        assert (engine.counts - 1) % 4 == 0
+
+        responses.calls.reset()
+        engine.active, engine.counts, engine.failing_counts = 0, 0, [1]
+        submitter = SparkSubmitter(new_service(), 'spark1', max_running=3, sleep=lambda _: None)
+        assert len(list(submitter.submit_all(applications('e', 'f')))) == 2
+        assert engine.counts == 2 and submitter.stats.count_errors == 0
+
+    @responses.activate
+    def test_error_drains_in_flight(self):
+        """
+        An error of the applications iterable is raised after the results of the submissions in flight
+        """
+        FakeSparkEngine(delay=0.05)
+
+        def failing_applications():
+            yield from applications('a', 'b')
+            raise RuntimeError('no more applications')
+
+        submitter = SparkSubmitter(new_service(), 'spark1', max_concurrency=4)
+        results = []
+        with pytest.raises(RuntimeError, match='no more applications'):
+            for result in submitter.submit_all(failing_applications()):
+                results.append(result)
+        assert sorted(result.application_id for result in results) == ['id-a', 'id-b']
+
+    def test_invalid_arguments(self):
+        """
+        SparkSubmitter with invalid limits
+        """
+        with pytest.raises(ValueError, match='must be at least 1'):
+            SparkSubmitter(new_service(), 'spark1', max_concurrency=0)
+        with pytest.raises(ValueError, match='must be at least 1'):
+            SparkSubmitter(new_service(), 'spark1', max_running=0)
+        with pytest.raises(ValueError, match='max_retries must not be negative'):
+            SparkSubmitter(new_service(), 'spark1', max_retries=-1)
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# (C) Copyright IBM Corp. 2024.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit Tests for SparkApplicationTracker
+"""
+
+from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
+from urllib.parse import parse_qs, urlparse
+import json
+import pytest
+import re
+import responses
+import threading
+
+from ibm_watsonxdata.spark_tracker import SparkApplicationTracker
+from ibm_watsonxdata.watsonx_data_v2 import *
+
+_base_url = 'https://region.lakehouse.cloud.ibm.com/lakehouse/api/v2'
+
+_FAST = {'initial_interval': 0.01, 'max_interval': 0.05}
+
+
+class FakeSparkEngines:
+    """
+    Spark engines whose applications end after a given number of polls of their engine.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.applications = {}
+        self.polls = {}
+        self.requested_states = []
+        responses.add_callback(
+            responses.POST,
+            re.compile(_base_url + '/spark_engines/[^/]+/applications'),
+            callback=self.create,
+            content_type='application/json',
+        )
+        responses.add_callback(
+            responses.GET,
+            re.compile(_base_url + '/spark_engines/[^/]+/applications.*'),
+            callback=self.list,
+            content_type='application/json',
+        )
+
+    def add(self, engine_id, application_id, final_state, polls):
+        """Add an application that reaches final_state at the given poll of its engine."""
+        with self.lock:
+            self.applications[application_id] = (engine_id, final_state, polls)
+
+    def create(self, request):
+        engine_id = request.path_url.split('/')[-2]
+        body = json.loads(request.body)
+        application_id = body['application_details']['application']
+        self.add(engine_id, application_id, 'finished', 2)
+        return (202, {}, json.dumps({'id': application_id, 'state': 'accepted'}))
+
+    def list(self, request):
+        engine_id = request.path_url.split('/')[-2]
+        self.requested_states.append(parse_qs(urlparse(request.url).query)['state'][0])
+        with self.lock:
+            poll = self.polls[engine_id] = self.polls.get(engine_id, 0) + 1
+            applications = [
+                {'id': application_id, 'state': state}
+                for application_id, (engine, state, polls) in self.applications.items()
+                if engine == engine_id and polls <= poll
+            ]
+        return (200, {}, json.dumps({'applications': applications}))
+
+
+def new_service(**kwargs):
+    """Return a service for the mocked Spark engines."""
+    service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), **kwargs)
+    service.set_service_url(_base_url)
+    return service
+
+
+class TestSparkApplicationTracker:
+    """
+    Test Class for SparkApplicationTracker
+    """
+
+    @responses.activate
+    def test_track(self):
+        """
+        Applications of several engines are tracked with one list request per engine and poll
+        """
+        engines = FakeSparkEngines()
+        for i in range(200):
+            engines.add('spark%d' % (i % 2), 'app%d' % i, ('finished', 'failed', 'stopped')[i % 3], 1 + i % 4)
+        tracker = SparkApplicationTracker(new_service(), **_FAST)
+        ended = []
+        futures = [
+            tracker.track('spark%d' % (i % 2), 'app%d' % i, callback=ended.append, timeout=10) for i in range(200)
+        ]
+
+        states = [future.result(timeout=10)['state'] for future in futures]
+        assert states == [('finished', 'failed', 'stopped')[i % 3] for i in range(200)]
+        assert len(ended) == 200
+        # Applications end by the 3rd poll of spark0 and the 4th of spark1, give or take
+        # a poll started while they were being registered.
+        assert 3 <= engines.polls['spark0'] <= 4 and 4 <= engines.polls['spark1'] <= 5
+        assert tracker.polls == engines.polls['spark0'] + engines.polls['spark1']
+        assert set(engines.requested_states) == {'failed,finished,stopped'}
+
+    @responses.activate
+    def test_submit_and_timeout(self):
+        """
+        submit() creates and tracks an application; unfinished applications time out
+        """
+        FakeSparkEngines()
+        tracker = SparkApplicationTracker(new_service(typed_results=True), **_FAST)
+        details = SparkApplicationDetails(application='/opt/job.py')
+        future = tracker.submit('spark1', details, timeout=10)
+        application = future.result(timeout=10)
+        assert isinstance(application, SparkEngineApplicationStatus)
+        assert application.state == 'finished'
+
+        lost = tracker.track('spark1', 'lost', timeout=0.1)
+        with pytest.raises(TimeoutError, match='spark application lost of engine spark1 did not reach'):
+            lost.result(timeout=10)
+        tracker.close()
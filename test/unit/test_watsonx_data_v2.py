@@ -17,6 +17,7 @@
 Unit Tests for WatsonxDataV2
 """
 
+from ibm_cloud_sdk_core import ApiException
 from ibm_cloud_sdk_core.authenticators.no_auth_authenticator import NoAuthAuthenticator
 import inspect
 import json
@@ -25,6 +26,8 @@ import pytest
 import re
 import requests
 import responses
+import threading
+import time
 import urllib
 from ibm_watsonxdata.watsonx_data_v2 import *
 
@@ -13801,6 +13804,324 @@ class TestListIngestionJobs:
 ##############################################################################
 
 
+##############################################################################
+# Start of Operation Table
+##############################################################################
+# region
+
+
+class TestOperationTable:
+    """
+    Test Class for the operation table behind the service methods
+    """
+
+    def test_every_operation_has_a_descriptor(self):
+        """
+        Every public operation of WatsonxDataV2 is described in the operation table
+        """
+        from ibm_watsonxdata.watsonx_data_v2 import _OPERATIONS
+
+        operation_ids = {
+            name
+            for name, member in inspect.getmembers(WatsonxDataV2, inspect.isfunction)
+            if not name.startswith('_') and name in WatsonxDataV2.__dict__
+            and name not in ('new_instance', 'send', 'iter_bucket_objects')
+        }
+        assert operation_ids == set(_OPERATIONS)
+
+    def test_format_path(self):
+        """
+        _Operation.format_path()
+        """
+        from ibm_watsonxdata.watsonx_data_v2 import _OPERATIONS
+
+        operation = _OPERATIONS['get_table']
+        assert operation.path_params == ('catalog_id', 'schema_id', 'table_id')
+        assert operation.format_path(['a', 'b%2Fc', 'd']) == '/catalogs/a/schemas/b%2Fc/tables/d'
+        assert _OPERATIONS['list_catalogs'].format_path([]) == '/catalogs'
+
+    def test_path_params_must_match_template(self):
+        """
+        _Operation() with path_params that do not match the template
+        """
+        from ibm_watsonxdata.watsonx_data_v2 import _Operation
+
+        with pytest.raises(ValueError, match='path_params do not match'):
+            _Operation('get_thing', 'GET', '/things/{thing_id}', path_params=('other_id',))
+
+    @responses.activate
+    def test_request_headers(self):
+        """
+        Caller headers are merged, but the Accept header of the operation wins
+        """
+        url = preprocess_url('/catalogs/testString')
+        responses.add(responses.GET, url, body='{}', content_type='application/json', status=200)
+
+        _service.get_catalog('testString', headers={'X-Custom': 'yes', 'Accept': 'text/plain'})
+
+        request_headers = responses.calls[0].request.headers
+        assert request_headers['X-Custom'] == 'yes'
+        assert request_headers['Accept'] == 'application/json'
+        assert 'watsonxdata-python-sdk' in request_headers['User-Agent']
+        assert 'AuthInstanceId' not in request_headers
+
+
+    def test_models_are_imported_lazily(self):
+        """
+        Importing the service does not import the model modules
+        """
+        import subprocess
+        import sys
+
+        statement = (
+            'import sys, ibm_watsonxdata.watsonx_data_v2 as m;'
+            'assert not any(n.startswith("ibm_watsonxdata.models.") for n in sys.modules);'
+            'assert m.PrestoEngine.__module__ == "ibm_watsonxdata.models.engines";'
+            'assert "ibm_watsonxdata.models.engines" in sys.modules;'
+            'assert "ibm_watsonxdata.models.spark" not in sys.modules'
+        )
+        subprocess.run([sys.executable, '-c', statement], check=True)
+
+    def test_unknown_attribute(self):
+        """
+        Unknown names still raise AttributeError
+        """
+        import ibm_watsonxdata.watsonx_data_v2 as watsonx_data_v2
+
+        with pytest.raises(AttributeError, match='NotAModel'):
+            watsonx_data_v2.NotAModel
+        assert 'ColumnCollection' in dir(watsonx_data_v2)
+        assert 'ColumnCollection' in watsonx_data_v2.__all__
+
+
+# endregion
+##############################################################################
+# End of Operation Table
+##############################################################################
+
+
+##############################################################################
+# Start of Pagers
+##############################################################################
+# region
+
+
+def add_ingestion_job_pages(count):
+    """Register count pages of one ingestion job each, linked through next.href."""
+    url = preprocess_url('/ingestion_jobs')
+    for page in range(count):
+        result = {'ingestion_jobs': [{'job_id': 'job{0}'.format(page)}]}
+        if page < count - 1:
+            result['next'] = {'href': 'https://myhost.com/somePath?start={0}'.format(page + 1)}
+        responses.add(responses.GET, url, body=json.dumps(result), content_type='application/json', status=200)
+
+
+class TestPagers:
+    """
+    Test Class for Pager, ListPager and IngestionJobsPager
+    """
+
+    @responses.activate
+    def test_iterator_protocol(self):
+        """
+        Iterating over a pager returns its pages
+        """
+        add_ingestion_job_pages(3)
+        pager = IngestionJobsPager(client=_service, auth_instance_id='testString', jobs_per_page=1)
+        assert iter(pager) is pager
+        assert [page for page in pager] == [[{'job_id': 'job0'}], [{'job_id': 'job1'}], [{'job_id': 'job2'}]]
+        assert not pager.has_next()
+        with pytest.raises(StopIteration):
+            pager.get_next()
+        assert [
+            urllib.parse.parse_qs(urllib.parse.urlparse(call.request.url).query).get('start')
+            for call in responses.calls
+        ] == [
+            None,
+            ['1'],
+            ['2'],
+        ]
+
+    @responses.activate
+    def test_iter_all(self):
+        """
+        iter_all() requests a page only when the previous one is consumed
+        """
+        add_ingestion_job_pages(3)
+        pager = IngestionJobsPager(client=_service, auth_instance_id='testString')
+        items = pager.iter_all()
+        assert len(responses.calls) == 0
+        assert next(items) == {'job_id': 'job0'}
+        assert len(responses.calls) == 1
+        assert list(items) == [{'job_id': 'job1'}, {'job_id': 'job2'}]
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_prefetch(self):
+        """
+        With prefetch, the next page is requested while the current one is processed
+        """
+        add_ingestion_job_pages(3)
+        pager = IngestionJobsPager(client=_service, auth_instance_id='testString', prefetch=True)
+        assert pager.get_next() == [{'job_id': 'job0'}]
+        pager._pending.result()
+        assert len(responses.calls) == 2
+        assert pager.get_all() == [{'job_id': 'job1'}, {'job_id': 'job2'}]
+        assert len(responses.calls) == 3
+        assert pager._executor is None
+
+    @responses.activate
+    def test_prefetch_early_exit(self):
+        """
+        Closing iter_all() or leaving a with block stops the prefetch thread
+        """
+        add_ingestion_job_pages(3)
+        pager = IngestionJobsPager(client=_service, auth_instance_id='testString', prefetch=True)
+        items = pager.iter_all()
+        assert next(items) == {'job_id': 'job0'}
+        executor = pager._executor
+        assert executor is not None
+        items.close()
+        assert pager._executor is None and pager._pending is None
+        assert executor._shutdown and pager.has_next()
+
+        responses.reset()
+        add_ingestion_job_pages(3)
+        with IngestionJobsPager(client=_service, auth_instance_id='testString', prefetch=True) as pager:
+            for page in pager:
+                executor = pager._executor
+                break
+        assert pager._executor is None and executor._shutdown
+
+    @responses.activate
+    def test_prefetch_error(self):
+        """
+        A failed prefetch is raised by get_next() and the page can be retried
+        """
+        url = preprocess_url('/ingestion_jobs')
+        responses.add(
+            responses.GET,
+            url,
+            body='{"ingestion_jobs": [{"job_id": "job0"}], "next": {"href": "https://myhost.com/somePath?start=1"}}',
+            content_type='application/json',
+        )
+        responses.add(responses.GET, url, status=500)
+        responses.add(
+            responses.GET, url, body='{"ingestion_jobs": [{"job_id": "job1"}]}', content_type='application/json'
+        )
+        pager = IngestionJobsPager(client=_service, auth_instance_id='testString', prefetch=True)
+        assert pager.get_next() == [{'job_id': 'job0'}]
+        with pytest.raises(ApiException):
+            pager.get_next()
+        assert pager.get_next() == [{'job_id': 'job1'}]
+        assert not pager.has_next()
+
+    @pytest.mark.parametrize('total_count', [10, None])
+    @pytest.mark.parametrize('max_workers', [2, 4, 16])
+    @responses.activate
+    def test_parallel_pages(self, max_workers, total_count):
+        """
+        get_all(max_workers) fetches numbered pages concurrently and returns them in order
+        """
+
+        def callback(request):
+            page = int(urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query).get('start', ['0'])[0])
+            result = {'ingestion_jobs': [{'job_id': 'job{0}'.format(page)}] if page < 10 else []}
+            if total_count is not None:
+                result['total_count'] = total_count
+            if page < 9:
+                result['next'] = {'href': 'https://myhost.com/somePath?start={0}'.format(page + 1)}
+            with lock:
+                running.append(page)
+                peak_running[0] = max(peak_running[0], len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(page)
+            return (200, {}, json.dumps(result))
+
+        lock = threading.Lock()
+        running, peak_running = [], [0]
+        responses.add_callback(
+            responses.GET, preprocess_url('/ingestion_jobs'), callback=callback, content_type='application/json'
+        )
+        pager = IngestionJobsPager(client=_service, auth_instance_id='testString', jobs_per_page=1)
+        assert pager.get_all(max_workers=max_workers) == [{'job_id': 'job{0}'.format(page)} for page in range(10)]
+        assert not pager.has_next()
+        assert peak_running[0] > 1
+        if total_count is None:
+            # The pages requested ahead of the last one are cancelled or their responses ignored.
+            for thread in threading.enumerate():
+                if thread.name.startswith('watsonxdata-pager'):
+                    thread.join()
+            assert 10 <= len(responses.calls) <= 10 + max_workers - 1
+        else:
+            assert len(responses.calls) == 10
+
+    @responses.activate
+    def test_parallel_pages_fallback(self):
+        """
+        get_all(max_workers) follows the next links when they are not page numbers
+        """
+        pages = {None: ('job0', '1'), '1': ('job1', 'cursor-b'), 'cursor-b': ('job2', None)}
+
+        def callback(request):
+            start = urllib.parse.parse_qs(urllib.parse.urlparse(request.url).query).get('start', [None])[0]
+            if start not in pages:
+                return (400, {}, '{"errors": [{"message": "invalid start"}]}')
+            job_id, next_start = pages[start]
+            result = {'ingestion_jobs': [{'job_id': job_id}]}
+            if next_start is not None:
+                result['next'] = {'href': 'https://myhost.com/somePath?start=' + next_start}
+            return (200, {}, json.dumps(result))
+
+        responses.add_callback(
+            responses.GET, preprocess_url('/ingestion_jobs'), callback=callback, content_type='application/json'
+        )
+        pager = IngestionJobsPager(client=_service, auth_instance_id='testString')
+        assert pager.get_all(max_workers=4) == [{'job_id': 'job0'}, {'job_id': 'job1'}, {'job_id': 'job2'}]
+
+    @responses.activate
+    def test_list_pager(self):
+        """
+        ListPager over a list operation without pagination
+        """
+        url = preprocess_url('/catalogs/sampleCatalog/schemas/s1/tables')
+        responses.add(
+            responses.GET,
+            url,
+            body='{"tables": [{"table_name": "t1"}, {"table_name": "t2"}]}',
+            content_type='application/json',
+            status=200,
+        )
+        pager = ListPager(
+            client=_service, operation_id='list_tables', catalog_id='sampleCatalog', schema_id='s1', engine_id='presto1'
+        )
+        assert pager.get_all() == [{'table_name': 't1'}, {'table_name': 't2'}]
+        assert not pager.has_next()
+        assert 'start' not in responses.calls[0].request.url
+        assert 'engine_id=presto1' in responses.calls[0].request.url
+
+        with pytest.raises(ValueError, match='get_catalog is not a list operation'):
+            ListPager(client=_service, operation_id='get_catalog')
+
+    @responses.activate
+    def test_typed_results(self):
+        """
+        Pagers return models when the client has typed_results
+        """
+        service = WatsonxDataV2(authenticator=NoAuthAuthenticator(), typed_results=True)
+        service.set_service_url(_base_url)
+        add_ingestion_job_pages(2)
+        jobs = IngestionJobsPager(client=service, auth_instance_id='testString').get_all()
+        assert [job.job_id for job in jobs] == ['job0', 'job1']
+
+
+# endregion
+##############################################################################
+# End of Pagers
+##############################################################################
+
+
 ##############################################################################
 # Start of Model Tests
 ##############################################################################
@@ -18600,6 +18921,44 @@ class TestModel_UpdateSyncCatalogOKBody:
         assert update_sync_catalog_ok_body_model_json2 == update_sync_catalog_ok_body_model_json
 
 
+class TestModel_Slots:
+    """
+    Test Class for the __slots__ layout shared by all models
+    """
+
+    def test_models_have_no_instance_dict(self):
+        """
+        Every model declares __slots__ and exposes its attributes through __dict__
+        """
+        import ibm_watsonxdata.watsonx_data_v2 as watsonx_data_v2
+
+        for name in watsonx_data_v2.__all__:
+            model_class = getattr(watsonx_data_v2, name)
+            if model_class in (WatsonxDataV2, Pager, ListPager, IngestionJobsPager):
+                continue
+            assert '__slots__' in model_class.__dict__, name
+            model = model_class.__new__(model_class)
+            assert not hasattr(model, '__weakref__'), name
+
+    def test_column_slots(self):
+        """
+        Column attributes, __dict__ and equality with __slots__
+        """
+        column_model = Column(column_name='expenses', type='varchar', length='30')
+        assert column_model.__dict__ == {
+            'column_name': 'expenses',
+            'comment': None,
+            'extra': None,
+            'length': '30',
+            'scale': None,
+            'type': 'varchar',
+        }
+        assert Column(**column_model.__dict__) == column_model
+        assert Column(column_name='income') != column_model
+        with pytest.raises(AttributeError):
+            column_model.unknown = 'value'
+
+
 # endregion
 ##############################################################################
 # End of Model Tests